@@ -3,14 +3,18 @@ AI Model interfaces for JobHire.AI
 Handles Replicate API integration and model management
 """
 
-import replicate
 import openai
-from typing import Dict, Any, Optional, List
+from contextlib import aclosing
+from typing import Dict, Any, Optional, List, AsyncIterator
 import json
 import time
 import asyncio
 from app.core.config import settings
 from app.core.monitoring import performance_monitor
+from app.core.tracing import traced_llm_call
+from app.ai.replicate_client import replicate_client, output_text
+from app.ai.response_cache import create_response_cache
+from app.ai.quality_validator import ai_quality_validator
 import structlog
 
 logger = structlog.get_logger()
@@ -32,8 +36,9 @@ class AIModelManager:
     """Manages AI model interactions with cost optimization"""
     
     def __init__(self):
-        self.replicate_client = replicate.Client(api_token=settings.REPLICATE_API_TOKEN)
+        self.replicate_client = replicate_client
         self.openai_client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        self.response_cache = create_response_cache()
         
         # Model configurations
         self.models = {
@@ -60,6 +65,7 @@ class AIModelManager:
             }
         }
     
+    @traced_llm_call("llm.generate")
     async def generate_response(
         self,
         prompt: str,
@@ -67,30 +73,63 @@ class AIModelManager:
         model_tier: str = ModelTier.BALANCED,
         provider: str = "replicate",
         temperature: float = 0.7,
-        max_tokens: int = None
+        max_tokens: int = None,
+        operation: Optional[str] = None,
+        bypass_cache: bool = False
     ) -> Dict[str, Any]:
-        """Generate AI response with monitoring and error handling"""
+        """
+        Generate AI response with monitoring and error handling
+        Responses are cached by (model, tier, prompt hash, temperature); operation selects
+        the cache TTL and bypass_cache forces a fresh generation
+        """
         
         start_time = time.time()
-        operation = f"{provider}_{model_tier}"
+        operation_label = f"{provider}_{model_tier}"
         
         try:
+            if provider not in ("replicate", "openai"):
+                raise AIModelError(f"Unsupported provider: {provider}")
+            
+            model_name = self.models[model_tier][provider]
+            use_cache = self.response_cache.enabled and not bypass_cache
+            cache_key = None
+            
+            if use_cache:
+                cache_key = self.response_cache.make_key(
+                    model_name, model_tier, prompt, temperature, max_tokens
+                )
+                cached = await self.response_cache.get(cache_key)
+                if cached is not None:
+                    return {
+                        "success": True,
+                        "response": cached["response"],
+                        "metadata": {
+                            "model": model_name,
+                            "processing_time": time.time() - start_time,
+                            "estimated_tokens": cached["estimated_tokens"],
+                            "cost_usd": 0.0,
+                            "provider": provider,
+                            "tier": model_tier,
+                            "cache_hit": True,
+                            "cost_saved_usd": cached["cost_usd"],
+                            **self.response_cache.stats()
+                        }
+                    }
+            
             if provider == "replicate":
                 response = await self._generate_replicate_response(
                     prompt, model_tier, temperature, max_tokens
                 )
-            elif provider == "openai":
+            else:
                 response = await self._generate_openai_response(
                     prompt, model_tier, temperature, max_tokens
                 )
-            else:
-                raise AIModelError(f"Unsupported provider: {provider}")
             
             # Record performance metrics
             processing_time = time.time() - start_time
             performance_monitor.record_ai_processing_time(
-                model=self.models[model_tier][provider],
-                operation=operation,
+                model=model_name,
+                operation=operation_label,
                 duration=processing_time
             )
             
@@ -98,21 +137,31 @@ class AIModelManager:
             estimated_tokens = len(prompt.split()) + len(response.get("text", "").split())
             cost = estimated_tokens * self.models[model_tier]["cost_per_token"]
             
+            if use_cache:
+                await self.response_cache.set(
+                    cache_key,
+                    {"response": response, "estimated_tokens": estimated_tokens, "cost_usd": cost},
+                    operation
+                )
+            
             return {
                 "success": True,
                 "response": response,
                 "metadata": {
-                    "model": self.models[model_tier][provider],
+                    "model": model_name,
                     "processing_time": processing_time,
                     "estimated_tokens": estimated_tokens,
                     "cost_usd": cost,
                     "provider": provider,
-                    "tier": model_tier
+                    "tier": model_tier,
+                    "cache_hit": False,
+                    "cost_saved_usd": 0.0,
+                    **self.response_cache.stats()
                 }
             }
             
         except Exception as e:
-            logger.error("AI model error", error=str(e), operation=operation)
+            logger.error("AI model error", error=str(e), operation=operation_label)
             return {
                 "success": False,
                 "error": str(e),
@@ -123,6 +172,198 @@ class AIModelManager:
                 }
             }
     
+    @traced_llm_call("llm.stream")
+    async def stream_response(
+        self,
+        prompt: str,
+        user_data: Dict[str, Any],
+        model_tier: str = ModelTier.BALANCED,
+        provider: str = "replicate",
+        temperature: float = 0.7,
+        max_tokens: int = None,
+        operation: Optional[str] = None,
+        bypass_cache: bool = False,
+        messages: Optional[List[Dict[str, str]]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream an AI response as it is generated
+        Yields {"type": "token", "text"} events followed by one {"type": "done"} event with the
+        same response/metadata as generate_response, or {"type": "error"} on failure.
+        messages sends a chat history instead of a single user prompt (flattened for Replicate)
+        """
+        
+        start_time = time.time()
+        operation_label = f"{provider}_{model_tier}"
+        chunks: List[str] = []
+        
+        try:
+            if provider not in ("replicate", "openai"):
+                raise AIModelError(f"Unsupported provider: {provider}")
+            
+            model_name = self.models[model_tier][provider]
+            if messages is not None:
+                prompt = self._messages_to_prompt(messages)
+            use_cache = self.response_cache.enabled and not bypass_cache
+            cache_key = None
+            
+            if use_cache:
+                cache_key = self.response_cache.make_key(
+                    model_name, model_tier, prompt, temperature, max_tokens
+                )
+                cached = await self.response_cache.get(cache_key)
+                if cached is not None:
+                    yield {"type": "token", "text": cached["response"]["text"]}
+                    yield {
+                        "type": "done",
+                        "response": cached["response"],
+                        "metadata": {
+                            "model": model_name,
+                            "processing_time": time.time() - start_time,
+                            "time_to_first_token": time.time() - start_time,
+                            "estimated_tokens": cached["estimated_tokens"],
+                            "cost_usd": 0.0,
+                            "provider": provider,
+                            "tier": model_tier,
+                            "cache_hit": True,
+                            "cost_saved_usd": cached["cost_usd"],
+                            **self.response_cache.stats()
+                        }
+                    }
+                    return
+            
+            if provider == "replicate":
+                tokens = self._stream_replicate_response(prompt, model_tier, temperature, max_tokens)
+            else:
+                tokens = self._stream_openai_response(
+                    messages or [{"role": "user", "content": prompt}],
+                    model_tier, temperature, max_tokens
+                )
+            
+            time_to_first_token = None
+            async with aclosing(tokens):
+                async for token in tokens:
+                    if time_to_first_token is None:
+                        time_to_first_token = time.time() - start_time
+                        performance_monitor.record_ai_time_to_first_token(
+                            model=model_name,
+                            operation=operation_label,
+                            duration=time_to_first_token
+                        )
+                    chunks.append(token)
+                    yield {"type": "token", "text": token}
+            
+            processing_time = time.time() - start_time
+            performance_monitor.record_ai_processing_time(
+                model=model_name,
+                operation=operation_label,
+                duration=processing_time
+            )
+            
+            response = {"text": "".join(chunks), "model": model_name, "provider": provider}
+            estimated_tokens = len(prompt.split()) + len(response["text"].split())
+            cost = estimated_tokens * self.models[model_tier]["cost_per_token"]
+            
+            if use_cache and response["text"]:
+                await self.response_cache.set(
+                    cache_key,
+                    {"response": response, "estimated_tokens": estimated_tokens, "cost_usd": cost},
+                    operation
+                )
+            
+            yield {
+                "type": "done",
+                "response": response,
+                "metadata": {
+                    "model": model_name,
+                    "processing_time": processing_time,
+                    "time_to_first_token": time_to_first_token,
+                    "estimated_tokens": estimated_tokens,
+                    "cost_usd": cost,
+                    "provider": provider,
+                    "tier": model_tier,
+                    "cache_hit": False,
+                    "cost_saved_usd": 0.0,
+                    **self.response_cache.stats()
+                }
+            }
+            
+        except Exception as e:
+            logger.error("AI model streaming error", error=str(e), operation=operation_label)
+            yield {
+                "type": "error",
+                "error": str(e),
+                "partial_text": "".join(chunks),
+                "metadata": {
+                    "processing_time": time.time() - start_time,
+                    "provider": provider,
+                    "tier": model_tier
+                }
+            }
+    
+    async def _stream_replicate_response(
+        self,
+        prompt: str,
+        model_tier: str,
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Stream tokens from a Replicate prediction"""
+        
+        model_name = self.models[model_tier]["replicate"]
+        if max_tokens is None:
+            max_tokens = self.models[model_tier]["max_tokens"]
+        
+        tokens = self.replicate_client.stream(
+            model_name,
+            input={
+                "prompt": prompt,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "top_p": 0.9
+            },
+            tier=model_tier
+        )
+        try:
+            async with aclosing(tokens):
+                async for token in tokens:
+                    yield token
+        except Exception as e:
+            raise AIModelError(f"Replicate API error: {str(e)}")
+    
+    async def _stream_openai_response(
+        self,
+        messages: List[Dict[str, str]],
+        model_tier: str,
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Stream tokens from an OpenAI chat completion"""
+        
+        model_name = self.models[model_tier]["openai"]
+        if max_tokens is None:
+            max_tokens = self.models[model_tier]["max_tokens"]
+        
+        try:
+            stream = await self.openai_client.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise AIModelError(f"OpenAI API error: {str(e)}")
+    
+    @staticmethod
+    def _messages_to_prompt(messages: List[Dict[str, str]]) -> str:
+        """Render a chat history as a single prompt for completion-style models"""
+        lines = [f"{message['role'].upper()}: {message['content']}" for message in messages]
+        lines.append("ASSISTANT:")
+        return "\n\n".join(lines)
+    
     async def _generate_replicate_response(
         self,
         prompt: str,
@@ -136,28 +377,19 @@ class AIModelManager:
         if max_tokens is None:
             max_tokens = self.models[model_tier]["max_tokens"]
         
-        # Run the model
+        # Run the model on the event loop; the tier limiter caps generations in flight
         try:
-            output = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.replicate_client.run(
-                    model_name,
-                    input={
-                        "prompt": prompt,
-                        "temperature": temperature,
-                        "max_tokens": max_tokens,
-                        "top_p": 0.9
-                    }
-                )
+            output = await self.replicate_client.run(
+                model_name,
+                input={
+                    "prompt": prompt,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                    "top_p": 0.9
+                },
+                tier=model_tier
             )
-            
-            # Handle different output formats
-            if isinstance(output, list):
-                text = "".join(output)
-            elif isinstance(output, str):
-                text = output
-            else:
-                text = str(output)
+            text = output_text(output)
             
             return {
                 "text": text,
@@ -254,9 +486,11 @@ ai_model_manager = AIModelManager()
 async def generate_job_match_analysis(
     job_data: Dict[str, Any],
     user_profile: Dict[str, Any],
-    user_tier: str = "free"
+    user_tier: str = "free",
+    model_tier: Optional[str] = None,
+    complexity: str = "medium"
 ) -> Dict[str, Any]:
-    """Generate job matching analysis"""
+    """Generate job matching analysis (model_tier overrides the tier picked for the user)"""
     from app.ai.prompts import AIPrompts, PromptType
     
     prompt = AIPrompts.format_prompt(
@@ -270,8 +504,10 @@ async def generate_job_match_analysis(
         success_rates=user_profile.get("success_rates", {})
     )
     
-    model_tier, provider = ai_model_manager.select_optimal_model("job_matching", user_tier)
-    result = await ai_model_manager.generate_response(prompt, user_profile, model_tier, provider)
+    selected_tier, provider = ai_model_manager.select_optimal_model("job_matching", user_tier, complexity)
+    result = await ai_model_manager.generate_response(
+        prompt, user_profile, model_tier or selected_tier, provider, operation="job_matching"
+    )
     
     if result["success"]:
         parsed_response = await ai_model_manager.parse_json_response(result["response"]["text"])
@@ -284,16 +520,14 @@ async def generate_job_match_analysis(
         return result
 
 
-async def generate_cover_letter(
+def _cover_letter_prompt(
     job_data: Dict[str, Any],
     user_profile: Dict[str, Any],
-    company_research: Dict[str, Any] = None,
-    user_tier: str = "free"
-) -> Dict[str, Any]:
-    """Generate personalized cover letter"""
+    company_research: Dict[str, Any] = None
+) -> str:
     from app.ai.prompts import AIPrompts, PromptType
     
-    prompt = AIPrompts.format_prompt(
+    return AIPrompts.format_prompt(
         PromptType.COVER_LETTER,
         job_title=job_data.get("title", ""),
         company_name=job_data.get("company", {}).get("name", ""),
@@ -305,9 +539,21 @@ async def generate_cover_letter(
         skills_alignment=job_data.get("skills_match", ""),
         experience_relevance=job_data.get("experience_match", "")
     )
+
+
+async def generate_cover_letter(
+    job_data: Dict[str, Any],
+    user_profile: Dict[str, Any],
+    company_research: Dict[str, Any] = None,
+    user_tier: str = "free"
+) -> Dict[str, Any]:
+    """Generate personalized cover letter"""
+    prompt = _cover_letter_prompt(job_data, user_profile, company_research)
     
     model_tier, provider = ai_model_manager.select_optimal_model("cover_letter", user_tier)
-    result = await ai_model_manager.generate_response(prompt, user_profile, model_tier, provider)
+    result = await ai_model_manager.generate_response(
+        prompt, user_profile, model_tier, provider, operation="cover_letter"
+    )
     
     if result["success"]:
         parsed_response = await ai_model_manager.parse_json_response(result["response"]["text"])
@@ -320,6 +566,53 @@ async def generate_cover_letter(
         return result
 
 
+async def stream_cover_letter(
+    job_data: Dict[str, Any],
+    user_profile: Dict[str, Any],
+    company_research: Dict[str, Any] = None,
+    user_tier: str = "free"
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream a personalized cover letter
+    Token events pass through as generated; the final done event carries the parsed
+    cover letter and the quality report, validated once the last token has arrived
+    """
+    prompt = _cover_letter_prompt(job_data, user_profile, company_research)
+    
+    model_tier, provider = ai_model_manager.select_optimal_model("cover_letter", user_tier)
+    events = ai_model_manager.stream_response(
+        prompt, user_profile, model_tier, provider, operation="cover_letter"
+    )
+    
+    async with aclosing(events):
+        async for event in events:
+            if event["type"] != "done":
+                yield event
+                continue
+            
+            text = event["response"]["text"]
+            try:
+                cover_letter = await ai_model_manager.parse_json_response(text)
+            except AIModelError:
+                cover_letter = None
+            
+            quality = await ai_quality_validator.validate_ai_response(
+                "cover_letter",
+                text,
+                {
+                    "job_title": job_data.get("title", ""),
+                    "required_skills": job_data.get("required_skills", []),
+                    "skills": user_profile.get("skills", [])
+                }
+            )
+            yield {
+                "type": "done",
+                "cover_letter": cover_letter,
+                "quality": quality,
+                "metadata": event["metadata"]
+            }
+
+
 # Export public interfaces
 __all__ = [
     "AIModelManager", 
@@ -327,5 +620,6 @@ __all__ = [
     "AIModelError",
     "ai_model_manager",
     "generate_job_match_analysis",
-    "generate_cover_letter"
+    "generate_cover_letter",
+    "stream_cover_letter"
 ]
\ No newline at end of file
@@ -0,0 +1,291 @@
+"""
+Async-native Replicate client
+Predictions are created and awaited on the event loop over the shared HTTP pool, so
+a worker can keep many generations in flight without holding a thread for each
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import time
+import weakref
+from typing import Any, AsyncIterator, Dict, Optional
+
+import redis.asyncio as aioredis
+import structlog
+
+from app.core.config import settings
+from app.core.http_client import http_client_pool
+
+logger = structlog.get_logger()
+
+
+class ReplicateError(Exception):
+    """Replicate prediction failed, was canceled or timed out"""
+    pass
+
+
+TERMINAL_STATUSES = ("succeeded", "failed", "canceled")
+
+
+class AsyncReplicateClient:
+    """
+    Replicate predictions API on the shared HTTP pool
+    Completion is detected by polling with exponential backoff. When a webhook URL is
+    configured, Replicate posts the finished prediction to it, the webhook handler parks
+    it in Redis, and waiters read it there instead of polling the API.
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        base_url: str = "https://api.replicate.com/v1",
+        tier_concurrency: Optional[Dict[str, int]] = None,
+        poll_initial_interval: float = 0.25,
+        poll_max_interval: float = 5.0,
+        poll_backoff: float = 1.5,
+        timeout: float = 300.0,
+        webhook_url: Optional[str] = None,
+        webhook_secret: Optional[str] = None,
+        webhook_tolerance: float = 300.0,
+        redis_url: Optional[str] = None
+    ):
+        self.api_token = api_token
+        self.base_url = base_url
+        self.tier_concurrency = tier_concurrency or {}
+        self.poll_initial_interval = poll_initial_interval
+        self.poll_max_interval = poll_max_interval
+        self.poll_backoff = poll_backoff
+        self.timeout = timeout
+        self.webhook_url = webhook_url
+        self.webhook_secret = webhook_secret
+        self.webhook_tolerance = webhook_tolerance
+        self.redis_url = redis_url
+
+        self._limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+        self._redis_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json"
+        }
+
+    async def run(self, model: str, input: Dict[str, Any], tier: Optional[str] = None) -> Any:
+        """Create a prediction and wait for its output"""
+        async with self._limiter(tier):
+            prediction = await self.create_prediction(model, input)
+            prediction = await self.wait(prediction)
+        return prediction.get("output")
+
+    async def stream(self, model: str, input: Dict[str, Any], tier: Optional[str] = None) -> AsyncIterator[str]:
+        """Yield output tokens as the model produces them (server-sent events)"""
+        async with self._limiter(tier):
+            prediction = await self.create_prediction(model, input, stream=True)
+            stream_url = prediction.get("urls", {}).get("stream")
+
+            if not stream_url:
+                # Model without streaming support: deliver the whole output at once
+                prediction = await self.wait(prediction)
+                yield output_text(prediction.get("output"))
+                return
+
+            headers = {"Authorization": self.headers["Authorization"], "Accept": "text/event-stream"}
+            async with http_client_pool.stream("GET", stream_url, headers=headers, timeout=self.timeout) as response:
+                response.raise_for_status()
+                event, data = "message", []
+                async for line in response.aiter_lines():
+                    if line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif line.startswith("data:"):
+                        data.append(line[5:].removeprefix(" "))
+                    elif line == "":
+                        payload = "\n".join(data)
+                        if event == "output":
+                            yield payload
+                        elif event == "error":
+                            raise ReplicateError(f"Prediction {prediction['id']} failed: {payload}")
+                        elif event == "done":
+                            return
+                        event, data = "message", []
+
+    async def create_prediction(self, model: str, input: Dict[str, Any], stream: bool = False) -> Dict[str, Any]:
+        """Start a prediction for "owner/name" (latest version) or "owner/name:version" """
+        body: Dict[str, Any] = {"input": input}
+        if stream:
+            body["stream"] = True
+        if self.webhook_url:
+            body["webhook"] = self.webhook_url
+            body["webhook_events_filter"] = ["completed"]
+
+        if ":" in model:
+            body["version"] = model.split(":", 1)[1]
+            url = f"{self.base_url}/predictions"
+        else:
+            url = f"{self.base_url}/models/{model}/predictions"
+
+        response = await http_client_pool.post(url, headers=self.headers, json=body, timeout=30.0)
+        if response.status_code not in (200, 201):
+            raise ReplicateError(f"Replicate API error: {response.status_code} {response.text[:200]}")
+        return response.json()
+
+    async def get_prediction(self, prediction_id: str) -> Dict[str, Any]:
+        response = await http_client_pool.get(
+            f"{self.base_url}/predictions/{prediction_id}",
+            headers=self.headers,
+            timeout=30.0
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def cancel_prediction(self, prediction_id: str) -> bool:
+        """Best-effort cancel; failures are logged and never raised"""
+        try:
+            response = await http_client_pool.post(
+                f"{self.base_url}/predictions/{prediction_id}/cancel",
+                headers=self.headers,
+                timeout=30.0
+            )
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            logger.warning("Failed to cancel Replicate prediction", prediction_id=prediction_id, error=str(e))
+            return False
+
+    async def wait(self, prediction: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Wait for a prediction to finish using webhook results or backoff polling"""
+        prediction_id = prediction["id"]
+        deadline = time.monotonic() + (timeout or self.timeout)
+        delay = self.poll_initial_interval
+
+        while prediction.get("status") not in TERMINAL_STATUSES:
+            if time.monotonic() + delay > deadline:
+                # Stop paying for a prediction nobody is waiting for any more
+                await self.cancel_prediction(prediction_id)
+                raise ReplicateError(f"Prediction {prediction_id} timed out")
+            await asyncio.sleep(delay)
+
+            completed = await self._webhook_result(prediction_id) if self.webhook_url else None
+            if completed is not None:
+                prediction = completed
+            elif not self.webhook_url or delay >= self.poll_max_interval:
+                # With webhooks the API is only polled as a safety net at the slowest interval
+                prediction = await self.get_prediction(prediction_id)
+
+            delay = min(delay * self.poll_backoff, self.poll_max_interval)
+
+        if prediction["status"] != "succeeded":
+            raise ReplicateError(
+                f"Prediction {prediction_id} {prediction['status']}: {prediction.get('error', 'Unknown error')}"
+            )
+        return prediction
+
+    def verify_webhook(self, body: bytes, headers: Dict[str, str]) -> bool:
+        """
+        Check Replicate's webhook-signature header against the signing secret
+        Fails closed: without a secret, with a malformed secret or header, or with a
+        webhook-timestamp outside webhook_tolerance seconds (replays), nothing is accepted
+        """
+        if not self.webhook_secret:
+            logger.warning("Rejecting Replicate webhook, REPLICATE_WEBHOOK_SECRET is not set")
+            return False
+
+        webhook_id = headers.get("webhook-id", "")
+        timestamp = headers.get("webhook-timestamp", "")
+        signatures = headers.get("webhook-signature", "")
+
+        try:
+            if abs(time.time() - int(timestamp)) > self.webhook_tolerance:
+                return False
+            key = base64.b64decode(self.webhook_secret.split("_", 1)[-1], validate=True)
+        except (ValueError, TypeError) as e:
+            logger.warning("Rejecting Replicate webhook with malformed timestamp or secret", error=str(e))
+            return False
+
+        signed = f"{webhook_id}.{timestamp}.".encode() + body
+        expected = base64.b64encode(hmac.new(key, signed, hashlib.sha256).digest()).decode()
+
+        return any(
+            hmac.compare_digest(expected, signature.split(",", 1)[-1])
+            for signature in signatures.split()
+        )
+
+    async def handle_webhook(self, prediction: Dict[str, Any]):
+        """Park a completed prediction where waiting workers look for it"""
+        if prediction.get("status") not in TERMINAL_STATUSES:
+            return
+        client = self._redis()
+        if client is None:
+            return
+        await client.set(self._webhook_key(prediction["id"]), json.dumps(prediction), ex=600)
+
+    async def _webhook_result(self, prediction_id: str) -> Optional[Dict[str, Any]]:
+        client = self._redis()
+        if client is None:
+            return None
+        try:
+            payload = await client.get(self._webhook_key(prediction_id))
+        except Exception as e:
+            logger.warning("Replicate webhook store unavailable", error=str(e))
+            return None
+        return json.loads(payload) if payload else None
+
+    def _webhook_key(self, prediction_id: str) -> str:
+        return f"replicate:prediction:{prediction_id}"
+
+    def _redis(self):
+        if not self.redis_url:
+            return None
+        loop = asyncio.get_running_loop()
+        client = self._redis_clients.get(loop)
+        if client is None:
+            client = self._redis_clients[loop] = aioredis.from_url(
+                self.redis_url, socket_connect_timeout=1, socket_timeout=1
+            )
+        return client
+
+    def _limiter(self, tier: Optional[str]) -> asyncio.Semaphore:
+        """Per-tier cap on predictions in flight in this process"""
+        tier = tier or "default"
+        loop = asyncio.get_running_loop()
+        limiters = self._limiters.get(loop)
+        if limiters is None:
+            limiters = self._limiters[loop] = {}
+        limiter = limiters.get(tier)
+        if limiter is None:
+            limit = self.tier_concurrency.get(tier, self.tier_concurrency.get("default", 100))
+            limiter = limiters[tier] = asyncio.Semaphore(limit)
+        return limiter
+
+
+def output_text(output: Any) -> str:
+    """Flatten Replicate output (token list or string) to text"""
+    if isinstance(output, list):
+        return "".join(str(part) for part in output)
+    if output is None:
+        return ""
+    return output if isinstance(output, str) else str(output)
+
+
+# Global Replicate client shared by the AI model manager and AI client
+replicate_client = AsyncReplicateClient(
+    api_token=settings.REPLICATE_API_TOKEN,
+    tier_concurrency={
+        "cheap": settings.REPLICATE_CONCURRENCY_CHEAP,
+        "balanced": settings.REPLICATE_CONCURRENCY_BALANCED,
+        "premium": settings.REPLICATE_CONCURRENCY_PREMIUM,
+        "default": settings.REPLICATE_CONCURRENCY_BALANCED
+    },
+    poll_max_interval=settings.REPLICATE_POLL_MAX_INTERVAL,
+    timeout=settings.REPLICATE_PREDICTION_TIMEOUT,
+    webhook_url=settings.REPLICATE_WEBHOOK_URL,
+    webhook_secret=settings.REPLICATE_WEBHOOK_SECRET,
+    redis_url=settings.REDIS_URL if settings.REPLICATE_WEBHOOK_URL else None
+)
+
+
+# Export public interfaces
+__all__ = ["AsyncReplicateClient", "ReplicateError", "output_text", "replicate_client"]
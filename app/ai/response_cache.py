@@ -0,0 +1,190 @@
+"""
+Content-addressed cache for AI model responses
+Identical prompts sent to the same model, tier and temperature reuse the stored
+completion instead of paying for another Replicate/OpenAI call
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+import redis.asyncio as aioredis
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+
+# Seconds a cached response stays valid, per operation
+OPERATION_CACHE_TTLS: Dict[str, int] = {
+    "job_matching": 86400,
+    "resume_optimization": 86400,
+    "job_insights": 86400,
+    "cover_letter": 21600,
+    "auto_apply_decision": 3600,
+}
+
+
+class SQLiteResponseBackend:
+    """Single-file local backend; good for one host running API and workers"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT payload, expires_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= time.time():
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                return None
+            return row[0]
+
+    def _set(self, key: str, payload: str, ttl: int):
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO llm_responses (key, payload, expires_at) VALUES (?, ?, ?)",
+                (key, payload, time.time() + ttl)
+            )
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, payload: str, ttl: int):
+        await asyncio.to_thread(self._set, key, payload, ttl)
+
+
+class RedisResponseBackend:
+    """Shared backend for multi-host deployments"""
+
+    def __init__(self, url: str, prefix: str = "llm_response:"):
+        self.url = url
+        self.prefix = prefix
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+    def _client(self):
+        # Redis connections are bound to the event loop that opened them
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = aioredis.from_url(
+                self.url, socket_connect_timeout=1, socket_timeout=1
+            )
+        return client
+
+    async def get(self, key: str) -> Optional[str]:
+        payload = await self._client().get(self.prefix + key)
+        return payload.decode("utf-8") if payload is not None else None
+
+    async def set(self, key: str, payload: str, ttl: int):
+        await self._client().set(self.prefix + key, payload, ex=ttl)
+
+
+class LLMResponseCache:
+    """Deterministic response cache keyed on (model, tier, prompt hash, temperature, max_tokens)"""
+
+    def __init__(self, backend: Optional[Any], default_ttl: int = 3600):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.cost_saved_usd = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    @staticmethod
+    def make_key(
+        model: str,
+        model_tier: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: Optional[int]
+    ) -> str:
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        material = json.dumps([model, model_tier, prompt_hash, round(temperature, 4), max_tokens])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, operation: Optional[str]) -> int:
+        return OPERATION_CACHE_TTLS.get(operation, self.default_ttl)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached entry ({response, estimated_tokens, cost_usd}) or None"""
+        try:
+            payload = await self.backend.get(key)
+        except Exception as e:
+            logger.warning("LLM response cache read failed", error=str(e))
+            payload = None
+
+        if payload is None:
+            self.misses += 1
+            return None
+
+        entry = json.loads(payload)
+        self.hits += 1
+        self.cost_saved_usd += entry.get("cost_usd", 0.0)
+        return entry
+
+    async def set(self, key: str, entry: Dict[str, Any], operation: Optional[str] = None):
+        try:
+            await self.backend.set(key, json.dumps(entry), self.ttl_for(operation))
+        except Exception as e:
+            logger.warning("LLM response cache write failed", error=str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_hit_ratio": self.hits / lookups if lookups else 0.0,
+            "total_cost_saved_usd": round(self.cost_saved_usd, 6)
+        }
+
+
+def create_response_cache() -> LLMResponseCache:
+    """Response cache with the backend selected by LLM_CACHE_BACKEND (sqlite, redis or none)"""
+    backend_name = settings.LLM_CACHE_BACKEND.lower()
+    if backend_name == "sqlite":
+        backend = SQLiteResponseBackend(settings.LLM_CACHE_SQLITE_PATH)
+    elif backend_name == "redis":
+        backend = RedisResponseBackend(settings.REDIS_URL)
+    else:
+        backend = None
+    return LLMResponseCache(backend, default_ttl=settings.LLM_CACHE_DEFAULT_TTL)
+
+
+# Export public interfaces
+__all__ = [
+    "LLMResponseCache",
+    "SQLiteResponseBackend",
+    "RedisResponseBackend",
+    "OPERATION_CACHE_TTLS",
+    "create_response_cache"
+]
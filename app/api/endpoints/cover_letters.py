@@ -8,13 +8,19 @@ from fastapi.responses import JSONResponse
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, EmailStr, validator
+from contextlib import aclosing
+import json
 import logging
 import re
+import time
 
 from app.core.database import database
 from app.api.endpoints.auth import get_current_user
+from app.api.streaming import format_sse, sse_response
 from app.core.security import PermissionChecker
 from app.services.ai_client import get_ai_client
+from app.ai.models import ai_model_manager
+from app.ai.quality_validator import ai_quality_validator
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +99,95 @@ Sincerely,
 {payload.emailAddress}{contact_line}"""
 
 
+def clean_cover_letter_request(request: CoverLetterRequest) -> CoverLetterRequest:
+    """Clean and sanitize input data"""
+    return CoverLetterRequest(
+        fullName=sanitize(request.fullName),
+        city=sanitize(request.city),
+        phoneNumber=sanitize(request.phoneNumber),
+        emailAddress=request.emailAddress,
+        desiredPosition=sanitize(request.desiredPosition),
+        companyName=sanitize(request.companyName),
+        jobDetails=sanitize(request.jobDetails),
+        writingStyle=sanitize(request.writingStyle or "professional")
+    )
+
+
+def build_cover_letter_prompt(payload: CoverLetterRequest) -> str:
+    """Prompt for a plain-text cover letter"""
+    return f"""You are a professional career coach and expert cover letter writer. Write compelling, personalized cover letters that help candidates stand out.
+
+Write a professional cover letter for the following job application:
+
+CANDIDATE INFORMATION:
+- Name: {payload.fullName}
+- Location: {payload.city or 'N/A'}
+- Email: {payload.emailAddress}
+- Phone: {payload.phoneNumber or 'N/A'}
+- Desired Position: {payload.desiredPosition}
+- Target Company: {payload.companyName}
+- Writing Style: {payload.writingStyle}
+
+JOB DETAILS:
+{payload.jobDetails}
+
+REQUIREMENTS:
+1. Keep it professional and concise (3-4 paragraphs, 250-400 words)
+2. Start with "Dear Hiring Manager,"
+3. Highlight relevant experience and skills based on job requirements
+4. Show enthusiasm for the role and company
+5. Include a strong opening and closing
+6. Customize for this specific position and company
+7. Do not include placeholders or [brackets]
+8. Make it personal and engaging
+9. End with "Sincerely," followed by the candidate's name
+10. Return ONLY the cover letter text, no extra formatting or explanations"""
+
+
+async def save_cover_letter(
+    user_id: Any,
+    payload: CoverLetterRequest,
+    content: str,
+    ai_generated: bool,
+    model_used: str,
+    generation_time_ms: int
+) -> Optional[str]:
+    """Persist a generated cover letter, returning its id (None if the save failed)"""
+    try:
+        insert_query = """
+            INSERT INTO cover_letters (
+                user_id, title, content, is_ai_generated, generation_prompt,
+                ai_model_version, generation_time_ms, status, created_at, updated_at
+            ) VALUES (
+                :user_id, :title, :content, :is_ai_generated, :generation_prompt,
+                :ai_model_version, :generation_time_ms, :status, :created_at, :updated_at
+            ) RETURNING id
+        """
+
+        values = {
+            "user_id": user_id,
+            "title": f"Cover Letter - {payload.desiredPosition} at {payload.companyName}",
+            "content": content,
+            "is_ai_generated": ai_generated,
+            "generation_prompt": "Standalone cover letter",
+            "ai_model_version": model_used,
+            "generation_time_ms": generation_time_ms,
+            "status": "active",
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow()
+        }
+
+        result = await database.fetch_one(query=insert_query, values=values)
+        if result:
+            return str(result["id"])
+
+    except Exception as db_error:
+        logger.error(f"Error saving cover letter to database: {str(db_error)}")
+        # Continue even if database save fails
+
+    return None
+
+
 @router.post("/generate", response_model=CoverLetterResponse)
 async def generate_cover_letter(
     request: CoverLetterRequest,
@@ -106,17 +201,7 @@ async def generate_cover_letter(
                 detail="Insufficient permissions to generate cover letters"
             )
 
-        # Clean and sanitize input data
-        cleaned_request = CoverLetterRequest(
-            fullName=sanitize(request.fullName),
-            city=sanitize(request.city),
-            phoneNumber=sanitize(request.phoneNumber),
-            emailAddress=request.emailAddress,
-            desiredPosition=sanitize(request.desiredPosition),
-            companyName=sanitize(request.companyName),
-            jobDetails=sanitize(request.jobDetails),
-            writingStyle=sanitize(request.writingStyle or "professional")
-        )
+        cleaned_request = clean_cover_letter_request(request)
 
         content = ""
         ai_generated = False
@@ -126,33 +211,7 @@ async def generate_cover_letter(
             # Try to use AI client for cover letter generation
             ai_client = get_ai_client()
 
-            prompt = f"""You are a professional career coach and expert cover letter writer. Write compelling, personalized cover letters that help candidates stand out.
-
-Write a professional cover letter for the following job application:
-
-CANDIDATE INFORMATION:
-- Name: {cleaned_request.fullName}
-- Location: {cleaned_request.city or 'N/A'}
-- Email: {cleaned_request.emailAddress}
-- Phone: {cleaned_request.phoneNumber or 'N/A'}
-- Desired Position: {cleaned_request.desiredPosition}
-- Target Company: {cleaned_request.companyName}
-- Writing Style: {cleaned_request.writingStyle}
-
-JOB DETAILS:
-{cleaned_request.jobDetails}
-
-REQUIREMENTS:
-1. Keep it professional and concise (3-4 paragraphs, 250-400 words)
-2. Start with "Dear Hiring Manager,"
-3. Highlight relevant experience and skills based on job requirements
-4. Show enthusiasm for the role and company
-5. Include a strong opening and closing
-6. Customize for this specific position and company
-7. Do not include placeholders or [brackets]
-8. Make it personal and engaging
-9. End with "Sincerely," followed by the candidate's name
-10. Return ONLY the cover letter text, no extra formatting or explanations"""
+            prompt = build_cover_letter_prompt(cleaned_request)
 
             ai_response = await ai_client.generate_text(prompt)
             if ai_response and ai_response.strip():
@@ -168,38 +227,10 @@ REQUIREMENTS:
             content = generate_basic_cover_letter(cleaned_request)
 
         # Save cover letter to database
-        cover_letter_id = None
-        try:
-            insert_query = """
-                INSERT INTO cover_letters (
-                    user_id, title, content, is_ai_generated, generation_prompt,
-                    ai_model_version, generation_time_ms, status, created_at, updated_at
-                ) VALUES (
-                    :user_id, :title, :content, :is_ai_generated, :generation_prompt,
-                    :ai_model_version, :generation_time_ms, :status, :created_at, :updated_at
-                ) RETURNING id
-            """
-
-            values = {
-                "user_id": current_user["id"],
-                "title": f"Cover Letter - {cleaned_request.desiredPosition} at {cleaned_request.companyName}",
-                "content": content,
-                "is_ai_generated": ai_generated,
-                "generation_prompt": "Standalone cover letter",
-                "ai_model_version": model_used,
-                "generation_time_ms": 1000,  # Placeholder
-                "status": "active",
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            }
-
-            result = await database.fetch_one(query=insert_query, values=values)
-            if result:
-                cover_letter_id = str(result["id"])
-
-        except Exception as db_error:
-            logger.error(f"Error saving cover letter to database: {str(db_error)}")
-            # Continue even if database save fails
+        cover_letter_id = await save_cover_letter(
+            current_user["id"], cleaned_request, content, ai_generated, model_used,
+            generation_time_ms=1000  # Placeholder
+        )
 
         return CoverLetterResponse(
             content=content,
@@ -218,6 +249,95 @@ REQUIREMENTS:
         )
 
 
+@router.post("/generate/stream")
+async def stream_cover_letter(
+    request: CoverLetterRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    Generate a personalized cover letter, streaming tokens as server-sent events
+    Events: start, token ({text}) and done ({id, ai_generated, model, quality}); the quality
+    check and database save run after the last token has been sent
+    """
+    if not permission_checker.has_permission(current_user, "cover_letters", "create"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to generate cover letters"
+        )
+
+    cleaned_request = clean_cover_letter_request(request)
+    prompt = build_cover_letter_prompt(cleaned_request)
+
+    async def events():
+        start_time = time.time()
+        yield format_sse("start", {"status": "generating"})
+
+        chunks: List[str] = []
+        model_used = "basic-template"
+        error = None
+
+        model_tier, provider = ai_model_manager.select_optimal_model(
+            "cover_letter", current_user.get("subscription_plan") or "free", complexity="high"
+        )
+        stream = ai_model_manager.stream_response(
+            prompt,
+            {"id": current_user["id"]},
+            model_tier=model_tier,
+            provider=provider,
+            operation="cover_letter"
+        )
+        async with aclosing(stream):
+            async for event in stream:
+                if event["type"] == "token":
+                    chunks.append(event["text"])
+                    yield format_sse("token", {"text": event["text"]})
+                elif event["type"] == "done":
+                    model_used = event["metadata"]["model"]
+                else:
+                    error = event["error"]
+
+        content = "".join(chunks).strip()
+        if error and content:
+            # Tokens already reached the client; a template cannot be spliced in
+            logger.error(f"Cover letter stream interrupted: {error}")
+            yield format_sse("error", {"detail": "Cover letter generation was interrupted"})
+            return
+
+        ai_generated = not error and bool(content)
+        quality = None
+        if ai_generated:
+            report = await ai_quality_validator.validate_ai_response(
+                "cover_letter",
+                json.dumps({"cover_letter": content}),
+                {"job_title": cleaned_request.desiredPosition}
+            )
+            quality = {
+                "validation_passed": report["validation_passed"],
+                "quality_score": report["quality_score"],
+                "quality_level": report["quality_level"],
+                "recommendations": report.get("recommendations", [])
+            }
+        else:
+            logger.warning(f"AI generation failed, using template: {error or 'empty response'}")
+            model_used = "basic-template"
+            content = generate_basic_cover_letter(cleaned_request)
+            yield format_sse("token", {"text": content})
+
+        cover_letter_id = await save_cover_letter(
+            current_user["id"], cleaned_request, content, ai_generated, model_used,
+            generation_time_ms=int((time.time() - start_time) * 1000)
+        )
+
+        yield format_sse("done", {
+            "id": cover_letter_id,
+            "ai_generated": ai_generated,
+            "model": model_used,
+            "quality": quality
+        })
+
+    return sse_response(events())
+
+
 @router.get("/", response_model=List[CoverLetterListResponse])
 async def get_cover_letters(
     current_user: Dict[str, Any] = Depends(get_current_user)
@@ -5,22 +5,29 @@ Handles AI-powered interview sessions, conversation, and evaluation
 
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.responses import JSONResponse
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 from pydantic import BaseModel, validator
+from contextlib import aclosing
 import json
 import logging
 
 from app.core.database import database
 from app.api.endpoints.auth import get_current_user
+from app.api.streaming import format_sse, sse_response
 from app.core.security import PermissionChecker
 from app.services.ai_client import get_ai_client
+from app.ai.models import ai_model_manager
+from app.ai.quality_validator import ai_quality_validator
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 permission_checker = PermissionChecker()
 
+# Fields the final evaluation must carry (see EVALUATION FORMAT in the system prompt)
+EVALUATION_REQUIRED_FIELDS = ["overall_score", "strengths", "areas_for_improvement", "recommendation"]
+
 
 class InterviewCreateRequest(BaseModel):
     workflow: Dict[str, Any]
@@ -101,112 +108,222 @@ def safe_json_parse(text: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-@router.post("/", response_model=InterviewResponse)
-async def conduct_interview(
+async def load_or_create_interview(
     request: InterviewMessageRequest,
-    current_user: Dict[str, Any] = Depends(get_current_user)
+    current_user: Dict[str, Any]
 ):
-    """Conduct an interview session with AI"""
-    try:
-        if not permission_checker.has_permission(current_user, "interviews", "create"):
+    """Fetch the caller's interview, or start one from the request workflow"""
+    if request.interviewId:
+        query = """
+            SELECT id, user_id, workflow, current_stage, current_question, status, created_at, updated_at
+            FROM interviews
+            WHERE id = :interview_id AND user_id = :user_id
+        """
+        interview = await database.fetch_one(
+            query=query,
+            values={"interview_id": request.interviewId, "user_id": current_user["id"]}
+        )
+
+        if not interview:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Insufficient permissions to conduct interviews"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Interview not found"
             )
+        return interview
 
-        interview = None
-        interview_id = request.interviewId
-
-        # Get or create interview
-        if interview_id:
-            # Get existing interview
-            query = """
-                SELECT id, user_id, workflow, current_stage, current_question, status, created_at, updated_at
-                FROM interviews
-                WHERE id = :interview_id AND user_id = :user_id
-            """
-            interview = await database.fetch_one(
-                query=query,
-                values={"interview_id": interview_id, "user_id": current_user["id"]}
-            )
+    if not request.workflow:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Missing workflow for new interview"
+        )
 
-            if not interview:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Interview not found"
-                )
-        else:
-            # Create new interview
-            if not request.workflow:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Missing workflow for new interview"
-                )
-
-            insert_query = """
-                INSERT INTO interviews (
-                    user_id, workflow, current_stage, current_question, status, created_at, updated_at
-                ) VALUES (
-                    :user_id, :workflow, :current_stage, :current_question, :status, :created_at, :updated_at
-                ) RETURNING id, user_id, workflow, current_stage, current_question, status, created_at, updated_at
-            """
-
-            values = {
-                "user_id": current_user["id"],
-                "workflow": json.dumps(request.workflow),
-                "current_stage": 0,
-                "current_question": 0,
-                "status": "active",
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
+    insert_query = """
+        INSERT INTO interviews (
+            user_id, workflow, current_stage, current_question, status, created_at, updated_at
+        ) VALUES (
+            :user_id, :workflow, :current_stage, :current_question, :status, :created_at, :updated_at
+        ) RETURNING id, user_id, workflow, current_stage, current_question, status, created_at, updated_at
+    """
+
+    values = {
+        "user_id": current_user["id"],
+        "workflow": json.dumps(request.workflow),
+        "current_stage": 0,
+        "current_question": 0,
+        "status": "active",
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow()
+    }
+
+    return await database.fetch_one(query=insert_query, values=values)
+
+
+async def prepare_interview_turn(interview, user_message: Optional[str]):
+    """Record the user message and build the chat history for the next AI turn"""
+    if user_message:
+        message_query = """
+            INSERT INTO interview_messages (interview_id, role, content, created_at)
+            VALUES (:interview_id, :role, :content, :created_at)
+        """
+        await database.execute(
+            query=message_query,
+            values={
+                "interview_id": interview["id"],
+                "role": "user",
+                "content": user_message,
+                "created_at": datetime.utcnow()
             }
+        )
 
-            interview = await database.fetch_one(query=insert_query, values=values)
-            interview_id = str(interview["id"])
-
-        # Save user message if provided
-        if request.userMessage:
-            message_query = """
-                INSERT INTO interview_messages (interview_id, role, content, created_at)
-                VALUES (:interview_id, :role, :content, :created_at)
-            """
-            await database.execute(
-                query=message_query,
-                values={
-                    "interview_id": interview["id"],
-                    "role": "user",
-                    "content": request.userMessage,
-                    "created_at": datetime.utcnow()
-                }
-            )
+    # Get conversation history
+    history_query = """
+        SELECT role, content
+        FROM interview_messages
+        WHERE interview_id = :interview_id
+        ORDER BY created_at ASC
+    """
+    history = await database.fetch_all(
+        query=history_query,
+        values={"interview_id": interview["id"]}
+    )
+
+    # Parse workflow from database
+    workflow_data = json.loads(interview["workflow"]) if isinstance(interview["workflow"], str) else interview["workflow"]
+
+    # Prepare messages for AI
+    system_prompt = get_enterprise_system_prompt("ApplyRush")
+    workflow_message = f"WORKFLOW_JSON:{json.dumps(workflow_data)}"
+
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "system", "content": workflow_message},
+    ]
+
+    # Add conversation history
+    for msg in history:
+        messages.append({"role": msg["role"], "content": msg["content"]})
+
+    return messages, workflow_data
+
+
+def extract_evaluation(assistant_response: str) -> Optional[Dict[str, Any]]:
+    """JSON evaluation following "Interview complete", if the response contains one"""
+    trimmed = assistant_response.strip()
+    completion_idx = trimmed.find("Interview complete")
+    if completion_idx == -1:
+        return None
 
-        # Get conversation history
-        history_query = """
-            SELECT role, content
-            FROM interview_messages
-            WHERE interview_id = :interview_id
-            ORDER BY created_at ASC
+    # Look for JSON evaluation after "Interview complete"
+    json_start = trimmed.find("{", completion_idx)
+    json_end = trimmed.rfind("}")
+
+    if json_start != -1 and json_end != -1 and json_end > json_start:
+        return safe_json_parse(trimmed[json_start:json_end + 1])
+    return None
+
+
+async def complete_interview_turn(
+    interview,
+    workflow_data: Dict[str, Any],
+    assistant_response: str
+) -> Tuple[bool, Optional[Dict[str, Any]], int, int]:
+    """Save the assistant turn, any evaluation and the interview progress"""
+    await database.execute(
+        query="""
+            INSERT INTO interview_messages (interview_id, role, content, created_at)
+            VALUES (:interview_id, :role, :content, :created_at)
+        """,
+        values={
+            "interview_id": interview["id"],
+            "role": "assistant",
+            "content": assistant_response,
+            "created_at": datetime.utcnow()
+        }
+    )
+
+    # Check if interview is complete and extract evaluation
+    done = False
+    evaluation = extract_evaluation(assistant_response)
+
+    if evaluation:
+        done = True
+        # Save evaluation
+        eval_query = """
+            INSERT INTO interview_evaluations (interview_id, evaluation, created_at)
+            VALUES (:interview_id, :evaluation, :created_at)
         """
-        history = await database.fetch_all(
-            query=history_query,
-            values={"interview_id": interview["id"]}
+        await database.execute(
+            query=eval_query,
+            values={
+                "interview_id": interview["id"],
+                "evaluation": json.dumps(evaluation),
+                "created_at": datetime.utcnow()
+            }
         )
 
-        # Parse workflow from database
-        workflow_data = json.loads(interview["workflow"]) if isinstance(interview["workflow"], str) else interview["workflow"]
+    # Update interview progress
+    next_stage = interview["current_stage"]
+    next_question = interview["current_question"]
+
+    if not done:
+        # Advance to next question/stage
+        stages = workflow_data.get("stages", [])
+        current_stage = next_stage
+        current_question = next_question
+
+        if current_stage < len(stages):
+            current_stage_obj = stages[current_stage]
+            questions = current_stage_obj.get("questions", [])
+            next_question_index = current_question + 1
+
+            if next_question_index >= len(questions):
+                # Move to next stage
+                next_stage_index = current_stage + 1
+                if next_stage_index >= len(stages):
+                    done = True
+                else:
+                    next_stage = next_stage_index
+                    next_question = 0
+            else:
+                next_question = next_question_index
+
+    # Update interview status
+    status_value = "completed" if done else "active"
+    update_query = """
+        UPDATE interviews
+        SET current_stage = :current_stage, current_question = :current_question,
+            status = :status, updated_at = :updated_at
+        WHERE id = :interview_id
+    """
+    await database.execute(
+        query=update_query,
+        values={
+            "current_stage": next_stage,
+            "current_question": next_question,
+            "status": status_value,
+            "updated_at": datetime.utcnow(),
+            "interview_id": interview["id"]
+        }
+    )
 
-        # Prepare messages for AI
-        system_prompt = get_enterprise_system_prompt("ApplyRush")
-        workflow_message = f"WORKFLOW_JSON:{json.dumps(workflow_data)}"
+    return done, evaluation, next_stage, next_question
 
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "system", "content": workflow_message},
-        ]
 
-        # Add conversation history
-        for msg in history:
-            messages.append({"role": msg["role"], "content": msg["content"]})
+@router.post("/", response_model=InterviewResponse)
+async def conduct_interview(
+    request: InterviewMessageRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """Conduct an interview session with AI"""
+    try:
+        if not permission_checker.has_permission(current_user, "interviews", "create"):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Insufficient permissions to conduct interviews"
+            )
+
+        interview = await load_or_create_interview(request, current_user)
+        messages, workflow_data = await prepare_interview_turn(interview, request.userMessage)
 
         # Generate AI response
         ai_client = get_ai_client()
@@ -222,95 +339,8 @@ async def conduct_interview(
                 detail="Failed to generate AI response"
             )
 
-        # Save assistant message
-        await database.execute(
-            query="""
-                INSERT INTO interview_messages (interview_id, role, content, created_at)
-                VALUES (:interview_id, :role, :content, :created_at)
-            """,
-            values={
-                "interview_id": interview["id"],
-                "role": "assistant",
-                "content": assistant_response,
-                "created_at": datetime.utcnow()
-            }
-        )
-
-        # Check if interview is complete and extract evaluation
-        done = False
-        evaluation = None
-
-        trimmed = assistant_response.strip()
-        completion_idx = trimmed.find("Interview complete")
-
-        if completion_idx != -1:
-            # Look for JSON evaluation after "Interview complete"
-            json_start = trimmed.find("{", completion_idx)
-            json_end = trimmed.rfind("}")
-
-            if json_start != -1 and json_end != -1 and json_end > json_start:
-                json_block = trimmed[json_start:json_end + 1]
-                evaluation = safe_json_parse(json_block)
-
-                if evaluation:
-                    done = True
-                    # Save evaluation
-                    eval_query = """
-                        INSERT INTO interview_evaluations (interview_id, evaluation, created_at)
-                        VALUES (:interview_id, :evaluation, :created_at)
-                    """
-                    await database.execute(
-                        query=eval_query,
-                        values={
-                            "interview_id": interview["id"],
-                            "evaluation": json.dumps(evaluation),
-                            "created_at": datetime.utcnow()
-                        }
-                    )
-
-        # Update interview progress
-        next_stage = interview["current_stage"]
-        next_question = interview["current_question"]
-
-        if not done:
-            # Advance to next question/stage
-            stages = workflow_data.get("stages", [])
-            current_stage = next_stage
-            current_question = next_question
-
-            if current_stage < len(stages):
-                current_stage_obj = stages[current_stage]
-                questions = current_stage_obj.get("questions", [])
-                next_question_index = current_question + 1
-
-                if next_question_index >= len(questions):
-                    # Move to next stage
-                    next_stage_index = current_stage + 1
-                    if next_stage_index >= len(stages):
-                        done = True
-                    else:
-                        next_stage = next_stage_index
-                        next_question = 0
-                else:
-                    next_question = next_question_index
-
-        # Update interview status
-        status_value = "completed" if done else "active"
-        update_query = """
-            UPDATE interviews
-            SET current_stage = :current_stage, current_question = :current_question,
-                status = :status, updated_at = :updated_at
-            WHERE id = :interview_id
-        """
-        await database.execute(
-            query=update_query,
-            values={
-                "current_stage": next_stage,
-                "current_question": next_question,
-                "status": status_value,
-                "updated_at": datetime.utcnow(),
-                "interview_id": interview["id"]
-            }
+        done, evaluation, next_stage, next_question = await complete_interview_turn(
+            interview, workflow_data, assistant_response
         )
 
         return InterviewResponse(
@@ -332,6 +362,104 @@ async def conduct_interview(
         )
 
 
+@router.post("/stream")
+async def stream_interview(
+    request: InterviewMessageRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    Conduct an interview turn, streaming the interviewer's reply as server-sent events
+    Events: start ({interviewId}), token ({text}) and done (the InterviewResponse fields plus
+    a quality report for the final evaluation); progress is saved after the last token
+    """
+    if not permission_checker.has_permission(current_user, "interviews", "create"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to conduct interviews"
+        )
+
+    try:
+        interview = await load_or_create_interview(request, current_user)
+        messages, workflow_data = await prepare_interview_turn(interview, request.userMessage)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error conducting interview: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to conduct interview"
+        )
+
+    async def events():
+        interview_id = str(interview["id"])
+        yield format_sse("start", {"interviewId": interview_id})
+
+        chunks: List[str] = []
+        error = None
+
+        # Interview turns depend on the whole conversation, so they are never cached
+        model_tier, provider = ai_model_manager.select_optimal_model(
+            "interview", current_user.get("subscription_plan") or "free", complexity="high"
+        )
+        stream = ai_model_manager.stream_response(
+            "",
+            {"id": current_user["id"]},
+            model_tier=model_tier,
+            provider=provider,
+            temperature=0,
+            max_tokens=800,
+            bypass_cache=True,
+            messages=messages
+        )
+        async with aclosing(stream):
+            async for event in stream:
+                if event["type"] == "token":
+                    chunks.append(event["text"])
+                    yield format_sse("token", {"text": event["text"]})
+                elif event["type"] == "error":
+                    error = event["error"]
+
+        assistant_response = "".join(chunks)
+        if error or not assistant_response:
+            logger.error(f"Interview stream failed: {error or 'empty response'}")
+            yield format_sse("error", {"detail": "Failed to generate AI response"})
+            return
+
+        try:
+            done, evaluation, next_stage, next_question = await complete_interview_turn(
+                interview, workflow_data, assistant_response
+            )
+        except Exception as e:
+            logger.error(f"Error saving interview turn: {str(e)}")
+            yield format_sse("error", {"detail": "Failed to save interview progress"})
+            return
+
+        quality = None
+        if evaluation:
+            report = await ai_quality_validator.validate_ai_response(
+                "interview_evaluation",
+                json.dumps(evaluation),
+                {},
+                expected_schema={"required_fields": EVALUATION_REQUIRED_FIELDS}
+            )
+            quality = {
+                "validation_passed": report["validation_passed"],
+                "quality_score": report["quality_score"],
+                "quality_level": report["quality_level"]
+            }
+
+        yield format_sse("done", {
+            "interviewId": interview_id,
+            "done": done,
+            "evaluation": evaluation,
+            "current_stage": next_stage,
+            "current_question": next_question,
+            "quality": quality
+        })
+
+    return sse_response(events())
+
+
 @router.get("/list", response_model=List[InterviewListItem])
 async def get_interviews(
     current_user: Dict[str, Any] = Depends(get_current_user)
@@ -6,10 +6,12 @@ Handles intelligent job matching and analysis
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from typing import Dict, List, Any, Optional
 from pydantic import BaseModel, Field
+from contextlib import aclosing
 import json
 
 from app.services.job_matcher import job_matching_engine, MatchingStrategy
-from app.ai.models import generate_job_match_analysis, generate_cover_letter
+from app.ai.models import generate_job_match_analysis, generate_cover_letter, stream_cover_letter
+from app.api.streaming import format_sse, sse_response
 from app.core.database import get_database
 import structlog
 
@@ -244,6 +246,59 @@ async def bulk_analyze_job_matches(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _load_cover_letter_context(request: CoverLetterRequest) -> Dict[str, Any]:
+    """User profile, job details and company research for a cover letter request"""
+    database = await get_database()
+    
+    # Get user profile
+    user_data = await database.fetch_one(
+        "SELECT * FROM users WHERE id = :user_id",
+        {"user_id": request.user_id}
+    )
+    
+    if not user_data:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    user_profile = dict(user_data)
+    user_profile["skills"] = json.loads(user_profile.get("skills") or "[]")
+    user_profile["preferences"] = json.loads(user_profile.get("preferences") or "{}")
+    
+    # Get job data
+    job_data = await database.fetch_one(
+        "SELECT * FROM jobs WHERE external_id = :job_id",
+        {"job_id": request.job_id}
+    )
+    
+    if not job_data:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    job_details = dict(job_data)
+    job_details["required_skills"] = json.loads(job_details.get("required_skills") or "[]")
+    job_details["location"] = json.loads(job_details.get("location") or "{}")
+    job_details["company"] = {"name": job_details.get("company_name", "")}
+    
+    # Get company research if requested
+    company_research = {}
+    if request.include_company_research:
+        # In a real implementation, this would:
+        # 1. Scrape company website/social media
+        # 2. Get recent news about the company
+        # 3. Analyze company culture from job descriptions
+        # 4. Use AI to summarize company values
+        company_research = {
+            "culture": "Innovation-focused technology company",
+            "recent_news": "Recently raised Series B funding",
+            "values": "Customer-centric, collaborative, growth-minded"
+        }
+    
+    return {
+        "job_data": job_details,
+        "user_profile": user_profile,
+        "company_research": company_research,
+        "user_tier": user_profile.get("tier", "free")
+    }
+
+
 @router.post("/cover-letter")
 async def generate_cover_letter_endpoint(request: CoverLetterRequest):
     """
@@ -254,56 +309,11 @@ async def generate_cover_letter_endpoint(request: CoverLetterRequest):
                    user_id=request.user_id, 
                    job_id=request.job_id)
         
-        database = await get_database()
-        
-        # Get user profile
-        user_data = await database.fetch_one(
-            "SELECT * FROM users WHERE id = :user_id",
-            {"user_id": request.user_id}
-        )
-        
-        if not user_data:
-            raise HTTPException(status_code=404, detail="User not found")
-        
-        user_profile = dict(user_data)
-        user_profile["skills"] = json.loads(user_profile.get("skills") or "[]")
-        user_profile["preferences"] = json.loads(user_profile.get("preferences") or "{}")
-        
-        # Get job data
-        job_data = await database.fetch_one(
-            "SELECT * FROM jobs WHERE external_id = :job_id",
-            {"job_id": request.job_id}
-        )
-        
-        if not job_data:
-            raise HTTPException(status_code=404, detail="Job not found")
-        
-        job_details = dict(job_data)
-        job_details["required_skills"] = json.loads(job_details.get("required_skills") or "[]")
-        job_details["location"] = json.loads(job_details.get("location") or "{}")
-        job_details["company"] = {"name": job_details.get("company_name", "")}
-        
-        # Get company research if requested
-        company_research = {}
-        if request.include_company_research:
-            # In a real implementation, this would:
-            # 1. Scrape company website/social media
-            # 2. Get recent news about the company
-            # 3. Analyze company culture from job descriptions
-            # 4. Use AI to summarize company values
-            company_research = {
-                "culture": "Innovation-focused technology company",
-                "recent_news": "Recently raised Series B funding",
-                "values": "Customer-centric, collaborative, growth-minded"
-            }
+        context = await _load_cover_letter_context(request)
+        job_details = context["job_data"]
         
         # Generate cover letter
-        result = await generate_cover_letter(
-            job_data=job_details,
-            user_profile=user_profile,
-            company_research=company_research,
-            user_tier=user_profile.get("tier", "free")
-        )
+        result = await generate_cover_letter(**context)
         
         if not result["success"]:
             raise HTTPException(status_code=500, detail="Cover letter generation failed")
@@ -324,6 +334,39 @@ async def generate_cover_letter_endpoint(request: CoverLetterRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/cover-letter/stream")
+async def stream_cover_letter_endpoint(request: CoverLetterRequest):
+    """
+    Generate a cover letter for a job application, streaming tokens as server-sent events
+    Events: token ({text}), then done ({cover_letter, quality, metadata}) once the letter
+    has been parsed and validated, or error
+    """
+    logger.info("Streamed cover letter generation request",
+               user_id=request.user_id,
+               job_id=request.job_id)
+    
+    # Lookup failures surface as normal HTTP errors before the stream starts
+    context = await _load_cover_letter_context(request)
+    
+    async def events():
+        stream = stream_cover_letter(**context)
+        async with aclosing(stream):
+            async for event in stream:
+                if event["type"] == "token":
+                    yield format_sse("token", {"text": event["text"]})
+                elif event["type"] == "done":
+                    yield format_sse("done", {
+                        "cover_letter": event["cover_letter"],
+                        "quality": event["quality"],
+                        "metadata": event["metadata"]
+                    })
+                else:
+                    logger.error("Streamed cover letter generation error", error=event.get("error"))
+                    yield format_sse("error", {"detail": "Cover letter generation failed"})
+    
+    return sse_response(events())
+
+
 @router.get("/user/{user_id}/preferences")
 async def get_matching_preferences(user_id: int):
     """
@@ -3,8 +3,8 @@ Resume Management API endpoints
 Handles resume upload, parsing, and management
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status, UploadFile, File
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, status, UploadFile, File, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel
@@ -12,6 +12,7 @@ import logging
 import base64
 import uuid
 
+from app.core.blob_store import blob_store, parse_byte_range, BlobRangeError, BlobTooLargeError
 from app.core.database import database
 from app.api.endpoints.auth import get_current_user
 from app.core.security import PermissionChecker
@@ -126,10 +127,11 @@ async def upload_resume(
                 detail="Invalid file type. Please upload PDF or Word document."
             )
 
-        # Validate file size (max 10MB)
+        # Stream the file into blob storage, validating size (max 10MB) as chunks arrive
         max_size = 10 * 1024 * 1024  # 10MB
-        file_content = await file.read()
-        if len(file_content) > max_size:
+        try:
+            blob = await blob_store.put_upload(file, max_size=max_size)
+        except BlobTooLargeError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File size too large. Maximum 10MB allowed."
@@ -145,16 +147,13 @@ async def upload_resume(
 
         stored_filename = f"{file_id}{file_extension}"
 
-        # Encode file content as base64 for storage
-        file_content_b64 = base64.b64encode(file_content).decode()
-
-        # Store resume in database
+        # Store resume metadata; the content lives in blob storage under its digest
         resume_query = """
             INSERT INTO resumes (
-                user_id, original_filename, stored_filename, file_content,
+                user_id, original_filename, stored_filename, content_sha256,
                 file_type, file_size, uploaded_at, status
             ) VALUES (
-                :user_id, :original_filename, :stored_filename, :file_content,
+                :user_id, :original_filename, :stored_filename, :content_sha256,
                 :file_type, :file_size, :uploaded_at, :status
             ) RETURNING id
         """
@@ -163,9 +162,9 @@ async def upload_resume(
             "user_id": current_user["id"],
             "original_filename": file.filename,
             "stored_filename": stored_filename,
-            "file_content": file_content_b64,
+            "content_sha256": blob.digest,
             "file_type": file.content_type,
-            "file_size": len(file_content),
+            "file_size": blob.size,
             "uploaded_at": datetime.utcnow(),
             "status": "active"
         }
@@ -193,7 +192,7 @@ async def upload_resume(
         resume_response = ResumeResponse(
             id=str(resume_id),
             original_filename=file.filename,
-            file_size=len(file_content),
+            file_size=blob.size,
             file_type=file.content_type,
             uploaded_at=datetime.utcnow(),
             status="active",
@@ -427,9 +426,10 @@ async def delete_resume(
 @router.get("/{resume_id}/download")
 async def download_resume(
     resume_id: str,
+    request: Request,
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
-    """Download resume file"""
+    """Download resume file (supports single byte-range requests)"""
     try:
         if not permission_checker.has_permission(current_user, "resumes", "read"):
             raise HTTPException(
@@ -438,7 +438,7 @@ async def download_resume(
             )
 
         query = """
-            SELECT original_filename, file_content, file_type
+            SELECT original_filename, content_sha256, file_content, file_type, file_size
             FROM resumes
             WHERE id = :resume_id AND user_id = :user_id AND status = 'active'
         """
@@ -454,7 +454,36 @@ async def download_resume(
                 detail="Resume not found"
             )
 
-        # Decode base64 content
+        disposition = f"attachment; filename={resume['original_filename']}"
+
+        if resume["content_sha256"]:
+            size = resume["file_size"]
+            try:
+                byte_range = parse_byte_range(request.headers.get("range"), size)
+            except BlobRangeError:
+                raise HTTPException(
+                    status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                    detail="Requested range not satisfiable",
+                    headers={"Content-Range": f"bytes */{size}"}
+                )
+
+            start, end = byte_range or (0, size - 1)
+            headers = {
+                "Content-Disposition": disposition,
+                "Accept-Ranges": "bytes",
+                "Content-Length": str(end - start + 1)
+            }
+            if byte_range:
+                headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+            return StreamingResponse(
+                blob_store.open(resume["content_sha256"], start, end),
+                status_code=status.HTTP_206_PARTIAL_CONTENT if byte_range else status.HTTP_200_OK,
+                media_type=resume["file_type"],
+                headers=headers
+            )
+
+        # Resumes uploaded before blob storage keep base64 content in the row
         file_content = base64.b64decode(resume["file_content"])
 
         from fastapi.responses import Response
@@ -463,7 +492,7 @@ async def download_resume(
             content=file_content,
             media_type=resume["file_type"],
             headers={
-                "Content-Disposition": f"attachment; filename={resume['original_filename']}"
+                "Content-Disposition": disposition
             }
         )
 
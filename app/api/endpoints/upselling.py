@@ -10,6 +10,7 @@ from datetime import datetime
 from pydantic import BaseModel, EmailStr, validator
 import logging
 
+from app.core.blob_store import blob_store
 from app.core.database import database
 from app.api.endpoints.auth import get_current_user
 from app.core.security import PermissionChecker
@@ -337,28 +338,26 @@ async def upload_resume(
 
         stored_filename = f"{file_id}{file_extension}"
 
-        # Store resume in database
+        # Store resume metadata; the content lives in blob storage under its digest
         resume_query = """
             INSERT INTO resumes (
-                user_id, original_filename, stored_filename, file_content,
+                user_id, original_filename, stored_filename, content_sha256,
                 file_type, file_size, uploaded_at, status
             ) VALUES (
-                :user_id, :original_filename, :stored_filename, :file_content,
+                :user_id, :original_filename, :stored_filename, :content_sha256,
                 :file_type, :file_size, :uploaded_at, :status
             ) RETURNING id
         """
 
-        # Decode base64 content to get file size
-        file_content_bytes = base64.b64decode(request.file_content)
-        file_size = len(file_content_bytes)
+        blob = await blob_store.put_bytes(base64.b64decode(request.file_content))
 
         values = {
             "user_id": current_user["id"],
             "original_filename": request.file_name,
             "stored_filename": stored_filename,
-            "file_content": request.file_content,
+            "content_sha256": blob.digest,
             "file_type": request.file_type,
-            "file_size": file_size,
+            "file_size": blob.size,
             "uploaded_at": datetime.utcnow(),
             "status": "active"
         }
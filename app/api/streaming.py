@@ -0,0 +1,28 @@
+"""
+Server-sent events for streamed AI responses
+"""
+
+import json
+from typing import Any, AsyncIterator, Dict
+
+from fastapi.responses import StreamingResponse
+
+# Disable proxy buffering (nginx) so tokens reach the browser as they are generated
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"
+}
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Encode one server-sent event with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+    """Stream pre-formatted events as text/event-stream"""
+    return StreamingResponse(events, media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+# Export public interfaces
+__all__ = ["SSE_HEADERS", "format_sse", "sse_response"]
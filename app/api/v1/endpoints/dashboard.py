@@ -5,12 +5,12 @@ Provides dashboard statistics and summary data
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
 from bson import ObjectId
 import logging
 
-from app.core.database_new import get_async_db
+from app.core.mongodb import get_mongodb
 from app.core.security import get_current_user
+from app.services.dashboard_stats import dashboard_stats_service
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +20,7 @@ router = APIRouter()
 @router.get("/summary")
 async def get_dashboard_summary(
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db=Depends(get_async_db)
+    db=Depends(get_mongodb)
 ):
     """
     Get dashboard summary with counts for preview, queue, and completed applications
@@ -28,32 +28,12 @@ async def get_dashboard_summary(
     try:
         user_id = current_user["id"]
 
-        # Count applications by status
-        # "matched" = new matches ready for preview
-        # "pending" = in queue waiting for approval
-        # "applied"/"completed" = already applied
-        preview_count = await db.applications.count_documents({
-            "user_id": user_id,
-            "status": "matched"
-        })
-
-        queue_count = await db.applications.count_documents({
-            "user_id": user_id,
-            "status": "pending"
-        })
-
-        completed_count = await db.applications.count_documents({
-            "user_id": user_id,
-            "status": {"$in": ["applied", "completed"]}
-        })
+        # "preview" = new matches, "queue" = awaiting approval, "completed" = already applied
+        stats = await dashboard_stats_service.get_stats(db, user_id)
 
         return {
             "success": True,
-            "summary": {
-                "preview": preview_count,
-                "queue": queue_count,
-                "completed": completed_count
-            }
+            "summary": dashboard_stats_service.summary(stats)
         }
     except Exception as e:
         logger.error(f"Error getting dashboard summary: {e}")
@@ -63,7 +43,7 @@ async def get_dashboard_summary(
 @router.get("/increase-items")
 async def get_increase_items(
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db=Depends(get_async_db)
+    db=Depends(get_mongodb)
 ):
     """
     Get boost success items with completion status
@@ -72,7 +52,7 @@ async def get_increase_items(
         user_id = current_user["id"]
 
         # Check user profile completion
-        user = await db.users.find_one({"_id": ObjectId(user_id)})
+        user = await db.users.find_one({"_id": ObjectId(user_id)}, {"profile": 1, "preferences": 1})
 
         # Check if user has uploaded resume
         has_resume = await db.resumes.count_documents({"user_id": user_id}) > 0
@@ -137,7 +117,7 @@ async def get_increase_items(
 @router.get("/getting-started")
 async def get_getting_started_text(
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db=Depends(get_async_db)
+    db=Depends(get_mongodb)
 ):
     """
     Get personalized getting started text based on user's application status
@@ -146,7 +126,8 @@ async def get_getting_started_text(
         user_id = current_user["id"]
 
         # Count user's applications
-        app_count = await db.applications.count_documents({"user_id": user_id})
+        stats = await dashboard_stats_service.get_stats(db, user_id)
+        app_count = dashboard_stats_service.application_stats(stats)["totalApplications"]
 
         if app_count == 0:
             text = "It will take a couple of hours to find roles that match your preferences. We'll notify you when new applications are ready for review."
@@ -168,7 +149,7 @@ async def get_getting_started_text(
 async def get_application_stats(
     userId: str = Query(..., description="User ID"),
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db=Depends(get_async_db)
+    db=Depends(get_mongodb)
 ):
     """
     Get detailed application statistics
@@ -180,77 +161,11 @@ async def get_application_stats(
         if userId != user_id:
             raise HTTPException(status_code=403, detail="Unauthorized access")
 
-        # Get total applications
-        total_applications = await db.applications.count_documents({"user_id": user_id})
-
-        # Get applications from this week
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        this_week = await db.applications.count_documents({
-            "user_id": user_id,
-            "created_at": {"$gte": week_ago}
-        })
-
-        # Get applications from this month
-        month_ago = datetime.utcnow() - timedelta(days=30)
-        this_month = await db.applications.count_documents({
-            "user_id": user_id,
-            "created_at": {"$gte": month_ago}
-        })
-
-        # Calculate response rate
-        applied_count = await db.applications.count_documents({
-            "user_id": user_id,
-            "status": {"$in": ["applied", "completed"]}
-        })
-
-        # Count applications with responses
-        responded_count = await db.applications.count_documents({
-            "user_id": user_id,
-            "status": {"$in": ["interview", "offer", "rejected"]}
-        })
-
-        response_rate = int((responded_count / applied_count * 100)) if applied_count > 0 else 0
-
-        # Calculate average response time
-        pipeline = [
-            {
-                "$match": {
-                    "user_id": user_id,
-                    "status": {"$in": ["interview", "offer", "rejected"]},
-                    "applied_at": {"$exists": True},
-                    "updated_at": {"$exists": True}
-                }
-            },
-            {
-                "$project": {
-                    "response_time": {
-                        "$divide": [
-                            {"$subtract": ["$updated_at", "$applied_at"]},
-                            1000 * 60 * 60 * 24  # Convert to days
-                        ]
-                    }
-                }
-            },
-            {
-                "$group": {
-                    "_id": None,
-                    "avg_response_time": {"$avg": "$response_time"}
-                }
-            }
-        ]
-
-        avg_result = await db.applications.aggregate(pipeline).to_list(1)
-        average_response_time = int(avg_result[0]["avg_response_time"]) if avg_result else 0
+        stats = await dashboard_stats_service.get_stats(db, user_id)
 
         return {
             "success": True,
-            "stats": {
-                "totalApplications": total_applications,
-                "thisWeek": this_week,
-                "thisMonth": this_month,
-                "responseRate": response_rate,
-                "averageResponseTime": average_response_time
-            }
+            "stats": dashboard_stats_service.application_stats(stats)
         }
     except Exception as e:
         logger.error(f"Error getting application stats: {e}")
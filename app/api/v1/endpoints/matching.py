@@ -8,8 +8,9 @@ from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
 from bson import ObjectId
+from pymongo import UpdateOne
 
-from app.core.database_new import get_db, Collections, serialize_doc
+from app.core.mongodb import Collections, get_mongodb
 from app.core.security import get_current_user
 
 router = APIRouter()
@@ -48,6 +49,21 @@ class JobMatchListResponse(BaseModel):
 # JOB MATCHING ALGORITHM
 # ============================================
 
+# Fields calculate_match_score and the response need; keeps descriptions off the wire
+JOB_MATCH_PROJECTION = {
+    "title": 1,
+    "company_name": 1,
+    "skills_required": 1,
+    "location": 1,
+    "remote_type": 1,
+    "salary_min": 1,
+    "salary_max": 1,
+    "experience_years_min": 1,
+}
+
+USER_MATCH_PROJECTION = {"job_preferences": 1, "onboarding": 1}
+
+
 def calculate_match_score(job: dict, user_preferences: dict, user_onboarding: dict) -> dict:
     """
     Calculate match score based on:
@@ -176,7 +192,7 @@ async def get_matched_jobs(
     min_score: int = Query(55, ge=0, le=100, description="Minimum match score"),
     limit: int = Query(50, ge=1, le=200),
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_mongodb)
 ):
     """
     Get matched jobs based on user's onboarding preferences
@@ -191,7 +207,7 @@ async def get_matched_jobs(
     user_id = ObjectId(current_user["id"])
 
     # Get user data
-    user = db[Collections.USERS].find_one({"_id": user_id})
+    user = await db[Collections.USERS].find_one({"_id": user_id}, USER_MATCH_PROJECTION)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -228,7 +244,8 @@ async def get_matched_jobs(
         query["employment_type"] = {"$in": employment_types}
 
     # Get jobs from database
-    jobs = list(db[Collections.JOBS].find(query).limit(limit * 2))  # Get more for filtering
+    candidate_limit = limit * 2  # Get more for filtering
+    jobs = await db[Collections.JOBS].find(query, JOB_MATCH_PROJECTION).limit(candidate_limit).to_list(length=candidate_limit)
 
     # Calculate match scores
     matches = []
@@ -260,7 +277,9 @@ async def get_matched_jobs(
     # Limit results
     matches = matches[:limit]
 
-    # Save matches to database for future reference
+    # Save matches to database for future reference (one round-trip for all upserts)
+    now = datetime.utcnow()
+    upserts = []
     for match in matches:
         match_doc = {
             "user_id": user_id,
@@ -270,18 +289,19 @@ async def get_matched_jobs(
             "skills_matched": match.skills_matched,
             "skills_missing": match.skills_missing,
             "status": "pending",  # pending, approved, rejected, applied
-            "created_at": datetime.utcnow(),
+            "created_at": now,
         }
-
-        # Upsert (update or insert)
-        db[Collections.JOB_MATCHES].update_one(
+        upserts.append(UpdateOne(
             {
                 "user_id": user_id,
                 "job_id": ObjectId(match.job_id)
             },
             {"$set": match_doc},
             upsert=True
-        )
+        ))
+
+    if upserts:
+        await db[Collections.JOB_MATCHES].bulk_write(upserts, ordered=False)
 
     return JobMatchListResponse(
         total_matches=len(matches),
@@ -301,7 +321,7 @@ async def get_matched_jobs(
 async def approve_job_match(
     job_id: str,
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_mongodb)
 ):
     """
     Approve a job match - adds to auto-apply queue
@@ -310,7 +330,7 @@ async def approve_job_match(
     user_id = ObjectId(current_user["id"])
 
     # Update match status
-    result = db[Collections.JOB_MATCHES].update_one(
+    result = await db[Collections.JOB_MATCHES].update_one(
         {
             "user_id": user_id,
             "job_id": ObjectId(job_id)
@@ -330,8 +350,8 @@ async def approve_job_match(
         )
 
     # Add to auto-apply queue (if auto-apply is enabled)
-    user = db[Collections.USERS].find_one({"_id": user_id})
-    if user.get("settings", {}).get("browser_auto_apply", False):
+    user = await db[Collections.USERS].find_one({"_id": user_id}, {"settings.browser_auto_apply": 1})
+    if (user or {}).get("settings", {}).get("browser_auto_apply", False):
         # Add to queue for auto-apply
         # This will be processed by Celery worker
         pass
@@ -346,13 +366,13 @@ async def approve_job_match(
 async def reject_job_match(
     job_id: str,
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_mongodb)
 ):
     """Reject a job match"""
 
     user_id = ObjectId(current_user["id"])
 
-    result = db[Collections.JOB_MATCHES].update_one(
+    result = await db[Collections.JOB_MATCHES].update_one(
         {
             "user_id": user_id,
             "job_id": ObjectId(job_id)
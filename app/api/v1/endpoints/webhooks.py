@@ -14,6 +14,7 @@ from datetime import datetime
 
 from app.core.database_new import get_db
 from app.core.config import settings
+from app.ai.replicate_client import replicate_client
 from app.services.email_forwarding_service import EmailForwardingService
 
 logger = logging.getLogger(__name__)
@@ -271,6 +272,26 @@ async def stripe_webhook(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/replicate")
+async def replicate_webhook(request: Request):
+    """
+    Replicate Prediction Webhook
+    Hands completed predictions to the workers waiting on them
+    """
+    payload = await request.body()
+
+    if not replicate_client.verify_webhook(payload, request.headers):
+        raise HTTPException(status_code=400, detail="Invalid signature")
+
+    try:
+        await replicate_client.handle_webhook(json.loads(payload))
+        return {"message": "Webhook processed"}
+
+    except Exception as e:
+        logger.error(f"Error processing Replicate webhook: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/email/test")
 async def test_email_webhook(db = Depends(get_db)):
     """
@@ -4,12 +4,16 @@ Integrates with Replicate, OpenAI, and other AI services
 """
 
 import os
-import asyncio
+import hashlib
+import json
 import logging
 from typing import Dict, List, Optional, Any
-import httpx
 from datetime import datetime
 
+from app.ai.replicate_client import replicate_client, output_text
+from app.core.cache import create_search_cache
+from app.core.http_client import http_client_pool
+
 logger = logging.getLogger(__name__)
 
 class AIClient:
@@ -20,7 +24,10 @@ class AIClient:
         self.openai_key = os.getenv("OPENAI_API_KEY") 
         self.jsearch_key = os.getenv("JSEARCH_API_KEY")
         
-        self.client = httpx.AsyncClient(timeout=120.0)
+        # Shared keep-alive pool; its lifetime is owned by the app lifespan / Celery worker
+        self.client = http_client_pool
+        self.timeout = 120.0
+        self.search_cache = create_search_cache("ai_job_search")
         
         # AI Model configurations
         self.models = {
@@ -193,72 +200,21 @@ class AIClient:
     async def _call_replicate_api(self, model: str, prompt: str, max_tokens: int = 500) -> str:
         """Call Replicate API for AI processing"""
         try:
-            headers = {
-                "Authorization": f"Token {self.replicate_token}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "version": "latest",
-                "input": {
+            output = await replicate_client.run(
+                model,
+                input={
                     "prompt": prompt,
                     "max_new_tokens": max_tokens,
                     "temperature": 0.7,
                     "system_message": "You are an expert AI career advisor and job matching specialist."
                 }
-            }
-            
-            response = await self.client.post(
-                f"https://api.replicate.com/v1/models/{model}/predictions",
-                headers=headers,
-                json=payload
             )
-            
-            if response.status_code == 201:
-                prediction_data = response.json()
-                prediction_id = prediction_data["id"]
-                
-                # Poll for completion
-                result = await self._poll_replicate_prediction(prediction_id)
-                return "".join(result) if isinstance(result, list) else str(result)
-            else:
-                raise Exception(f"Replicate API error: {response.status_code}")
+            return output_text(output)
                 
         except Exception as e:
             logger.error(f"Replicate API call failed: {e}")
             raise
     
-    async def _poll_replicate_prediction(self, prediction_id: str, max_attempts: int = 30) -> Any:
-        """Poll Replicate prediction until completion"""
-        headers = {"Authorization": f"Token {self.replicate_token}"}
-        
-        for attempt in range(max_attempts):
-            try:
-                response = await self.client.get(
-                    f"https://api.replicate.com/v1/predictions/{prediction_id}",
-                    headers=headers
-                )
-                
-                data = response.json()
-                status = data.get("status")
-                
-                if status == "succeeded":
-                    return data.get("output", "")
-                elif status == "failed":
-                    raise Exception(f"Prediction failed: {data.get('error', 'Unknown error')}")
-                elif status in ["starting", "processing"]:
-                    await asyncio.sleep(2)  # Wait 2 seconds before next poll
-                    continue
-                else:
-                    raise Exception(f"Unknown prediction status: {status}")
-                    
-            except Exception as e:
-                if attempt == max_attempts - 1:
-                    raise
-                await asyncio.sleep(2)
-        
-        raise Exception("Prediction timed out")
-    
     async def _search_jobs_jsearch(self, criteria: Dict) -> List[Dict]:
         """Search jobs using JSearch API"""
         try:
@@ -281,46 +237,56 @@ class AIClient:
             if criteria.get("location"):
                 params["location"] = criteria["location"]
             
-            response = await self.client.get(
-                "https://jsearch.p.rapidapi.com/search",
-                headers=headers,
-                params=params
+            # Shared with other workers; identical searches make one upstream call
+            cache_key = hashlib.md5(json.dumps(params, sort_keys=True).encode()).hexdigest()
+            return await self.search_cache.get_or_fetch(
+                cache_key,
+                lambda: self._fetch_jsearch_jobs(headers, params)
             )
-            
-            if response.status_code == 200:
-                data = response.json()
-                jobs = data.get("data", [])
-                
-                # Convert to standardized format
-                standardized_jobs = []
-                for job in jobs:
-                    # Safe location concatenation
-                    city = job.get("job_city", "") or ""
-                    state = job.get("job_state", "") or ""
-                    location = f"{city}, {state}".strip(", ") if city or state else "Location not specified"
-                    
-                    standardized_jobs.append({
-                        "id": job.get("job_id", ""),
-                        "title": job.get("job_title", ""),
-                        "company": job.get("employer_name", ""),
-                        "location": location,
-                        "description": job.get("job_description", ""),
-                        "salary_min": job.get("job_min_salary"),
-                        "salary_max": job.get("job_max_salary"),
-                        "remote": job.get("job_is_remote", False),
-                        "apply_url": job.get("job_apply_link", ""),
-                        "posted_date": job.get("job_posted_at_datetime_utc", ""),
-                        "source": "jsearch_api"
-                    })
-                
-                return standardized_jobs
-            else:
-                raise Exception(f"JSearch API error: {response.status_code}")
                 
         except Exception as e:
             logger.error(f"JSearch API call failed: {e}")
             return self._get_fallback_jobs(criteria)
     
+    async def _fetch_jsearch_jobs(self, headers: Dict, params: Dict) -> List[Dict]:
+        """Fetch one JSearch result set in standardized format (raises on API errors)"""
+        response = await self.client.get(
+            "https://jsearch.p.rapidapi.com/search",
+            headers=headers,
+            params=params,
+            timeout=self.timeout
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            jobs = data.get("data", [])
+
+            # Convert to standardized format
+            standardized_jobs = []
+            for job in jobs:
+                # Safe location concatenation
+                city = job.get("job_city", "") or ""
+                state = job.get("job_state", "") or ""
+                location = f"{city}, {state}".strip(", ") if city or state else "Location not specified"
+
+                standardized_jobs.append({
+                    "id": job.get("job_id", ""),
+                    "title": job.get("job_title", ""),
+                    "company": job.get("employer_name", ""),
+                    "location": location,
+                    "description": job.get("job_description", ""),
+                    "salary_min": job.get("job_min_salary"),
+                    "salary_max": job.get("job_max_salary"),
+                    "remote": job.get("job_is_remote", False),
+                    "apply_url": job.get("job_apply_link", ""),
+                    "posted_date": job.get("job_posted_at_datetime_utc", ""),
+                    "source": "jsearch_api"
+                })
+
+            return standardized_jobs
+        else:
+            raise Exception(f"JSearch API error: {response.status_code}")
+
     def _build_job_match_prompt(self, user_profile: Dict, job_data: Dict) -> str:
         """Build comprehensive prompt for job matching analysis"""
         return f"""
@@ -660,7 +626,8 @@ Best regards,
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        # The pooled connections are shared with other clients and outlive this instance
+        pass
 
 # Global AI client instance
 ai_client = None
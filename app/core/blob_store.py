@@ -0,0 +1,382 @@
+"""
+Content-addressed blob storage
+Files are stored once per SHA-256 digest on a pluggable backend (local filesystem or
+any S3-compatible service); database rows keep only the digest and file metadata
+"""
+
+import asyncio
+import hashlib
+import hmac
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+import structlog
+
+from app.core.config import settings
+from app.core.http_client import http_client_pool
+
+logger = structlog.get_logger()
+
+
+class BlobStoreError(Exception):
+    """Blob backend request failed"""
+    pass
+
+
+class BlobTooLargeError(BlobStoreError):
+    """Upload exceeded the allowed size"""
+    pass
+
+
+class BlobRangeError(BlobStoreError):
+    """Requested byte range cannot be satisfied"""
+    pass
+
+
+@dataclass
+class StoredBlob:
+    """Result of storing a blob"""
+    digest: str    # Hex SHA-256 of the content, also the storage key
+    size: int
+    created: bool  # False when identical content was already stored
+
+
+class BlobBackend:
+    """Storage backend interface; blobs are addressed by digest and never modified"""
+
+    # Directory for upload spool files; None = system temp directory
+    staging_dir: Optional[str] = None
+
+    async def exists(self, digest: str) -> bool:
+        raise NotImplementedError
+
+    async def put_file(self, digest: str, path: str, size: int):
+        """Store the spooled file at path under digest (the file may be moved)"""
+        raise NotImplementedError
+
+    def read(self, digest: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Stream bytes start..end (inclusive, end None = to the end of the blob)"""
+        raise NotImplementedError
+
+    async def delete(self, digest: str):
+        raise NotImplementedError
+
+
+class LocalBlobBackend(BlobBackend):
+    """Blobs under root/ab/cd/<digest>; uploads are moved into place atomically"""
+
+    def __init__(self, root: str, chunk_size: int = 64 * 1024):
+        self.root = root
+        self.chunk_size = chunk_size
+        self.staging_dir = os.path.join(root, "tmp")
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    async def exists(self, digest: str) -> bool:
+        return await asyncio.to_thread(os.path.exists, self._path(digest))
+
+    async def put_file(self, digest: str, path: str, size: int):
+        target = self._path(digest)
+
+        def move():
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(path, target)
+
+        await asyncio.to_thread(move)
+
+    async def read(self, digest: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        try:
+            handle = await asyncio.to_thread(open, self._path(digest), "rb")
+        except FileNotFoundError:
+            raise BlobStoreError(f"Blob {digest} not found")
+
+        try:
+            await asyncio.to_thread(handle.seek, start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                size = self.chunk_size if remaining is None else min(self.chunk_size, remaining)
+                chunk = await asyncio.to_thread(handle.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            handle.close()
+
+    async def delete(self, digest: str):
+        try:
+            await asyncio.to_thread(os.remove, self._path(digest))
+        except FileNotFoundError:
+            pass
+
+
+class S3BlobBackend(BlobBackend):
+    """
+    S3-compatible object storage (AWS S3, MinIO, R2) over the shared HTTP pool
+    Requests use path-style URLs and AWS Signature Version 4; the payload hash of an
+    upload is the blob digest, so content is verified by the server.
+    """
+
+    def __init__(
+        self,
+        endpoint_url: str,
+        bucket: str,
+        access_key_id: str,
+        secret_access_key: str,
+        region: str = "us-east-1",
+        prefix: str = "blobs",
+        chunk_size: int = 64 * 1024,
+        timeout: float = 60.0
+    ):
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.bucket = bucket
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.region = region
+        self.prefix = prefix.strip("/")
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+
+    def _key(self, digest: str) -> str:
+        return f"{self.prefix}/{digest[:2]}/{digest}" if self.prefix else f"{digest[:2]}/{digest}"
+
+    def _url_and_path(self, digest: str) -> Tuple[str, str]:
+        path = quote(f"/{self.bucket}/{self._key(digest)}")
+        return f"{self.endpoint_url}{path}", path
+
+    def _signed_headers(
+        self,
+        method: str,
+        path: str,
+        payload_hash: str = "UNSIGNED-PAYLOAD",
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        now = datetime.utcnow()
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date = now.strftime("%Y%m%d")
+
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+        headers.update({
+            "host": urlsplit(self.endpoint_url).netloc,
+            "x-amz-date": amz_date,
+            "x-amz-content-sha256": payload_hash
+        })
+
+        signed_names = sorted(headers)
+        canonical_request = "\n".join([
+            method,
+            path,
+            "",
+            "".join(f"{name}:{str(headers[name]).strip()}\n" for name in signed_names),
+            ";".join(signed_names),
+            payload_hash
+        ])
+
+        scope = f"{date}/{self.region}/s3/aws4_request"
+        string_to_sign = "\n".join([
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode()).hexdigest()
+        ])
+
+        key = ("AWS4" + self.secret_access_key).encode()
+        for part in (date, self.region, "s3", "aws4_request"):
+            key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+        signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+        headers["authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key_id}/{scope}, "
+            f"SignedHeaders={';'.join(signed_names)}, Signature={signature}"
+        )
+        return headers
+
+    async def exists(self, digest: str) -> bool:
+        url, path = self._url_and_path(digest)
+        response = await http_client_pool.request(
+            "HEAD", url, headers=self._signed_headers("HEAD", path), timeout=self.timeout
+        )
+        if response.status_code == 404:
+            return False
+        if response.status_code != 200:
+            raise BlobStoreError(f"S3 HEAD failed: {response.status_code}")
+        return True
+
+    async def put_file(self, digest: str, path: str, size: int):
+        url, object_path = self._url_and_path(digest)
+        headers = self._signed_headers(
+            "PUT", object_path, payload_hash=digest, headers={"content-length": str(size)}
+        )
+
+        async def body():
+            handle = await asyncio.to_thread(open, path, "rb")
+            try:
+                while chunk := await asyncio.to_thread(handle.read, self.chunk_size):
+                    yield chunk
+            finally:
+                handle.close()
+
+        try:
+            response = await http_client_pool.request(
+                "PUT", url, headers=headers, content=body(), timeout=self.timeout
+            )
+        finally:
+            await asyncio.to_thread(os.remove, path)
+
+        if response.status_code not in (200, 201):
+            raise BlobStoreError(f"S3 PUT failed: {response.status_code} {response.text[:200]}")
+
+    async def read(self, digest: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        url, path = self._url_and_path(digest)
+        extra = {}
+        if start or end is not None:
+            extra["range"] = f"bytes={start}-{'' if end is None else end}"
+
+        headers = self._signed_headers("GET", path, headers=extra)
+        async with http_client_pool.stream("GET", url, headers=headers, timeout=self.timeout) as response:
+            if response.status_code not in (200, 206):
+                raise BlobStoreError(f"S3 GET failed: {response.status_code}")
+            async for chunk in response.aiter_bytes(self.chunk_size):
+                yield chunk
+
+    async def delete(self, digest: str):
+        url, path = self._url_and_path(digest)
+        response = await http_client_pool.request(
+            "DELETE", url, headers=self._signed_headers("DELETE", path), timeout=self.timeout
+        )
+        if response.status_code not in (200, 204, 404):
+            raise BlobStoreError(f"S3 DELETE failed: {response.status_code}")
+
+
+class BlobStore:
+    """Streams uploads to a backend, deduplicating by SHA-256"""
+
+    def __init__(self, backend: BlobBackend, chunk_size: int = 64 * 1024):
+        self.backend = backend
+        self.chunk_size = chunk_size
+
+    async def put_stream(self, chunks: AsyncIterator[bytes], max_size: Optional[int] = None) -> StoredBlob:
+        """Spool chunks to disk while hashing, then store them unless the digest already exists"""
+        digest = hashlib.sha256()
+        size = 0
+
+        if self.backend.staging_dir:
+            await asyncio.to_thread(os.makedirs, self.backend.staging_dir, exist_ok=True)
+        handle = await asyncio.to_thread(
+            tempfile.NamedTemporaryFile, dir=self.backend.staging_dir, prefix="upload-", delete=False
+        )
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise BlobTooLargeError(f"Upload exceeds {max_size} bytes")
+                digest.update(chunk)
+                await asyncio.to_thread(handle.write, chunk)
+            await asyncio.to_thread(handle.close)
+
+            hex_digest = digest.hexdigest()
+            if await self.backend.exists(hex_digest):
+                await asyncio.to_thread(os.remove, handle.name)
+                logger.debug("Blob already stored", digest=hex_digest, size=size)
+                return StoredBlob(digest=hex_digest, size=size, created=False)
+
+            await self.backend.put_file(hex_digest, handle.name, size)
+            logger.info("Blob stored", digest=hex_digest, size=size)
+            return StoredBlob(digest=hex_digest, size=size, created=True)
+
+        except BaseException:
+            handle.close()
+            if os.path.exists(handle.name):
+                os.remove(handle.name)
+            raise
+
+    async def put_upload(self, upload: Any, max_size: Optional[int] = None) -> StoredBlob:
+        """Store a FastAPI UploadFile without reading it into memory"""
+
+        async def chunks():
+            while chunk := await upload.read(self.chunk_size):
+                yield chunk
+
+        return await self.put_stream(chunks(), max_size=max_size)
+
+    async def put_bytes(self, data: bytes) -> StoredBlob:
+        async def chunks():
+            yield data
+
+        return await self.put_stream(chunks())
+
+    def open(self, digest: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Stream a stored blob, optionally a byte range (end inclusive)"""
+        return self.backend.read(digest, start, end)
+
+    async def delete(self, digest: str):
+        """Remove a blob; callers must make sure no row references the digest any more"""
+        await self.backend.delete(digest)
+
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    (start, end) inclusive for a single-range Range header, None to send the whole body
+    Multi-range and malformed headers are ignored, as RFC 9110 allows.
+    """
+    if not header:
+        return None
+    match = _RANGE.match(header.strip())
+    if not match or not any(match.groups()):
+        return None
+
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise BlobRangeError(f"Unsatisfiable range {header}")
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise BlobRangeError(f"Unsatisfiable range {header}")
+    return start, end
+
+
+def _create_backend() -> BlobBackend:
+    if settings.BLOB_STORAGE_BACKEND == "s3":
+        return S3BlobBackend(
+            endpoint_url=settings.BLOB_S3_ENDPOINT_URL,
+            bucket=settings.BLOB_S3_BUCKET,
+            access_key_id=settings.BLOB_S3_ACCESS_KEY_ID,
+            secret_access_key=settings.BLOB_S3_SECRET_ACCESS_KEY,
+            region=settings.BLOB_S3_REGION,
+            chunk_size=settings.BLOB_CHUNK_SIZE
+        )
+    return LocalBlobBackend(settings.BLOB_STORAGE_PATH, chunk_size=settings.BLOB_CHUNK_SIZE)
+
+
+# Global blob store used for resumes and other uploaded documents
+blob_store = BlobStore(_create_backend(), chunk_size=settings.BLOB_CHUNK_SIZE)
+
+
+# Export public interfaces
+__all__ = [
+    "BlobBackend",
+    "BlobRangeError",
+    "BlobStore",
+    "BlobStoreError",
+    "BlobTooLargeError",
+    "LocalBlobBackend",
+    "S3BlobBackend",
+    "StoredBlob",
+    "blob_store",
+    "parse_byte_range"
+]
@@ -0,0 +1,310 @@
+"""
+Two-tier result cache
+In-process LRU/TTL tier in front of a shared Redis tier, with stale-while-revalidate,
+request coalescing and compressed serialization
+"""
+
+import asyncio
+import json
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import redis.asyncio as aioredis
+import structlog
+
+from app.core.config import settings
+from app.core.monitoring import performance_monitor
+
+logger = structlog.get_logger()
+
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+
+def _encode_value(value: Any) -> Any:
+    # Normalized jobs carry datetimes; tag them so Redis hits return the same types
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _decode_value(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+class CacheEntry:
+    """Cached value with its freshness deadlines (epoch seconds, shared across processes)"""
+
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value: Any, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class TwoTierCache:
+    """
+    Result cache shared by API and Celery workers
+    Lookups hit the local LRU first, then Redis; entries past their TTL are served stale
+    for stale_ttl seconds while one background refresh runs. Concurrent misses for the
+    same key share a single upstream call. Redis errors degrade to the local tier only.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: int,
+        stale_ttl: int = 0,
+        max_local_entries: int = 512,
+        redis_url: Optional[str] = None,
+        compress_min_bytes: int = 1024,
+        redis_retry_interval: float = 30.0
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_local_entries = max_local_entries
+        self.redis_url = redis_url
+        self.compress_min_bytes = compress_min_bytes
+        self.redis_retry_interval = redis_retry_interval
+
+        self._local: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._redis_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = weakref.WeakKeyDictionary()
+        self._refreshing = set()
+        self._redis_down_until = 0.0
+        self._stats = {"local_hits": 0, "redis_hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0}
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None
+    ) -> Any:
+        """Cached value for key, calling fetch (once per process) on a miss"""
+        entry, tier = await self._lookup(key)
+        now = time.time()
+
+        if entry is not None and now < entry.fresh_until:
+            self._record(tier, "hit")
+            return entry.value
+
+        if entry is not None and now < entry.stale_until:
+            self._record(tier, "stale")
+            self._refresh_in_background(key, fetch, ttl)
+            return entry.value
+
+        inflight = self._inflight_tasks()
+        task = inflight.get(key)
+        if task is not None:
+            self._record(tier, "coalesced")
+        else:
+            self._record(tier, "miss")
+            task = self._start_fetch(key, fetch, ttl)
+        return await asyncio.shield(task)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Fresh or stale cached value, without fetching"""
+        entry, _ = await self._lookup(key)
+        if entry is None or time.time() >= entry.stale_until:
+            return None
+        return entry.value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        """Store a value in both tiers"""
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        entry = CacheEntry(value, now + ttl, now + ttl + self.stale_ttl)
+        self._store_local(key, entry)
+
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            await client.set(
+                self._redis_key(key),
+                self._serialize(entry),
+                ex=max(1, int(ttl + self.stale_ttl))
+            )
+        except Exception as e:
+            self._mark_redis_down(e)
+
+    async def invalidate(self, key: str):
+        """Drop a key from both tiers"""
+        self._local.pop(key, None)
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            await client.delete(self._redis_key(key))
+        except Exception as e:
+            self._mark_redis_down(e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit counters and ratios since process start"""
+        stats = dict(self._stats)
+        lookups = sum(stats.values())
+        hits = stats["local_hits"] + stats["redis_hits"] + stats["stale_hits"] + stats["coalesced"]
+        stats["lookups"] = lookups
+        stats["hit_ratio"] = hits / lookups if lookups else 0.0
+        stats["local_hit_ratio"] = stats["local_hits"] / lookups if lookups else 0.0
+        stats["local_entries"] = len(self._local)
+        return stats
+
+    async def _lookup(self, key: str) -> Tuple[Optional[CacheEntry], str]:
+        entry = self._local.get(key)
+        if entry is not None:
+            if time.time() < entry.stale_until:
+                self._local.move_to_end(key)
+                return entry, "local"
+            del self._local[key]
+
+        client = self._redis()
+        if client is None:
+            return None, "local"
+        try:
+            payload = await client.get(self._redis_key(key))
+        except Exception as e:
+            self._mark_redis_down(e)
+            return None, "local"
+        if payload is None:
+            return None, "redis"
+
+        try:
+            entry = self._deserialize(payload)
+        except (ValueError, zlib.error) as e:
+            logger.warning("Dropping undecodable cache entry", cache=self.name, error=str(e))
+            return None, "redis"
+        self._store_local(key, entry)
+        return entry, "redis"
+
+    def _start_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: Optional[int]) -> asyncio.Task:
+        inflight = self._inflight_tasks()
+
+        async def run():
+            try:
+                value = await fetch()
+                await self.set(key, value, ttl)
+                return value
+            finally:
+                inflight.pop(key, None)
+
+        task = asyncio.create_task(run())
+        inflight[key] = task
+        return task
+
+    def _refresh_in_background(self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: Optional[int]):
+        if key in self._refreshing or key in self._inflight_tasks():
+            return
+        self._refreshing.add(key)
+
+        async def revalidate():
+            try:
+                # One revalidation across all workers; others keep serving the stale value
+                if await self._acquire_refresh_lock(key):
+                    await self._start_fetch(key, fetch, ttl)
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(revalidate())
+        task.add_done_callback(self._log_refresh_failure)
+
+    def _log_refresh_failure(self, task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background cache refresh failed", cache=self.name, error=str(task.exception()))
+
+    async def _acquire_refresh_lock(self, key: str) -> bool:
+        client = self._redis()
+        if client is None:
+            return True
+        try:
+            return bool(await client.set(f"{self._redis_key(key)}:refresh", b"1", nx=True, ex=30))
+        except Exception as e:
+            self._mark_redis_down(e)
+            return True
+
+    def _store_local(self, key: str, entry: CacheEntry):
+        self._local[key] = entry
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+
+    def _inflight_tasks(self) -> Dict[str, asyncio.Task]:
+        loop = asyncio.get_running_loop()
+        tasks = self._inflight.get(loop)
+        if tasks is None:
+            tasks = self._inflight[loop] = {}
+        return tasks
+
+    def _redis(self):
+        # Redis connections are bound to the event loop that opened them
+        if not self.redis_url or time.monotonic() < self._redis_down_until:
+            return None
+        loop = asyncio.get_running_loop()
+        client = self._redis_clients.get(loop)
+        if client is None:
+            client = self._redis_clients[loop] = aioredis.from_url(
+                self.redis_url, socket_connect_timeout=1, socket_timeout=1
+            )
+        return client
+
+    def _mark_redis_down(self, error: Exception):
+        self._redis_down_until = time.monotonic() + self.redis_retry_interval
+        logger.warning("Redis cache tier unavailable, using local tier only",
+                      cache=self.name, retry_in=self.redis_retry_interval, error=str(error))
+
+    def _redis_key(self, key: str) -> str:
+        return f"cache:{self.name}:{key}"
+
+    def _serialize(self, entry: CacheEntry) -> bytes:
+        body = json.dumps(
+            {"fresh_until": entry.fresh_until, "stale_until": entry.stale_until, "value": entry.value},
+            separators=(",", ":"),
+            default=_encode_value
+        ).encode("utf-8")
+        if len(body) >= self.compress_min_bytes:
+            return _ZLIB + zlib.compress(body, 6)
+        return _RAW + body
+
+    def _deserialize(self, payload: bytes) -> CacheEntry:
+        header, body = payload[:1], payload[1:]
+        if header == _ZLIB:
+            body = zlib.decompress(body)
+        elif header != _RAW:
+            raise ValueError("unknown cache encoding")
+        data = json.loads(body, object_hook=_decode_value)
+        return CacheEntry(data["value"], data["fresh_until"], data["stale_until"])
+
+    def _record(self, tier: str, result: str):
+        if result == "hit":
+            self._stats["local_hits" if tier == "local" else "redis_hits"] += 1
+        elif result == "stale":
+            self._stats["stale_hits"] += 1
+        else:
+            self._stats["coalesced" if result == "coalesced" else "misses"] += 1
+        performance_monitor.record_cache_lookup(self.name, tier, result)
+
+
+def create_search_cache(name: str, ttl: Optional[int] = None) -> TwoTierCache:
+    """Search result cache configured from settings"""
+    return TwoTierCache(
+        name=name,
+        ttl=settings.JOB_CACHE_TTL if ttl is None else ttl,
+        stale_ttl=settings.JOB_CACHE_STALE_TTL,
+        max_local_entries=settings.JOB_CACHE_LOCAL_MAX_ENTRIES,
+        redis_url=settings.REDIS_URL if settings.JOB_CACHE_USE_REDIS else None,
+        compress_min_bytes=settings.CACHE_COMPRESS_MIN_BYTES
+    )
+
+
+# Export public interfaces
+__all__ = ["TwoTierCache", "CacheEntry", "create_search_cache"]
@@ -67,10 +67,63 @@ class Settings(BaseSettings):
     DEFAULT_MODEL: str = "meta/llama-2-70b-chat:02e509c789964a7ea8736978a43525956ef40397be9033abf9fd2badfe68c9e3"
     CHEAP_MODEL: str = "mistralai/mixtral-8x7b-instruct-v0.1"
     PREMIUM_MODEL: str = "anthropic/claude-3-5-sonnet-20241022"
+    REPLICATE_CONCURRENCY_CHEAP: int = 200  # Predictions in flight per process, by model tier
+    REPLICATE_CONCURRENCY_BALANCED: int = 100
+    REPLICATE_CONCURRENCY_PREMIUM: int = 20
+    REPLICATE_POLL_MAX_INTERVAL: float = 5.0  # Backoff ceiling when polling predictions
+    REPLICATE_PREDICTION_TIMEOUT: float = 300.0
+    REPLICATE_WEBHOOK_URL: Optional[str] = None  # Public URL of /api/v1/webhooks/replicate
+    REPLICATE_WEBHOOK_SECRET: Optional[str] = None  # whsec_... signing secret
+    LLM_CACHE_BACKEND: str = "sqlite"  # sqlite, redis or none
+    LLM_CACHE_SQLITE_PATH: str = ".cache/llm_responses.sqlite3"
+    LLM_CACHE_DEFAULT_TTL: int = 3600  # Seconds, for operations without their own TTL
     
     # Job Search Configuration
     MAX_JOBS_PER_SEARCH: int = 100
     JOB_CACHE_TTL: int = 3600  # 1 hour
+    JOB_CACHE_STALE_TTL: int = 600  # Serve stale results this long while revalidating
+    JOB_CACHE_LOCAL_MAX_ENTRIES: int = 512  # In-process LRU tier size
+    JOB_CACHE_USE_REDIS: bool = True  # Share cached searches across workers via REDIS_URL
+    CACHE_COMPRESS_MIN_BYTES: int = 1024  # Compress cached payloads at least this large
+    JOB_SEARCH_PREFETCH_PAGES: int = 3  # Result pages downloaded concurrently (1 = sequential)
+    JSEARCH_RATE_LIMIT_PER_SECOND: float = 2.0  # Sustained JSearch quota
+    JSEARCH_RATE_LIMIT_BURST: int = 3
+    JSEARCH_MAX_RETRIES: int = 3  # Retries per page after HTTP 429
+    JOB_INGEST_BATCH_SIZE: int = 200  # Jobs per multi-row upsert statement
+    JOB_MATCH_BATCH_SIZE: int = 500  # Job matches per multi-row insert statement
+    
+    # Job Matching Configuration
+    SKILL_SYNONYMS_FILE: Optional[str] = None  # JSON {canonical: [aliases]}, overrides built-in table
+    SKILL_SYNONYMS_RELOAD_INTERVAL: int = 60  # Seconds between data file change checks
+    MATCH_CANDIDATE_LIMIT: int = 50  # Top-K pre-filtered jobs per user sent to full matching
+    MATCH_CASCADE_ENABLED: bool = True  # Hybrid matching scores algorithmically before any LLM call
+    MATCH_CASCADE_REJECT_SCORE: float = 50.0  # Algorithmic score below which the LLM is skipped
+    MATCH_CASCADE_ESCALATE_SCORE: float = 65.0  # From here on the full model tier is used instead of the cheap one
+    
+    # Dashboard Statistics
+    DASHBOARD_STATS_MAX_AGE: int = 300  # Seconds before materialized per-user counters are fully recounted (backstop for writers that skip updated_at)
+    
+    # Application Queue Processing
+    QUEUE_LEASE_SECONDS: int = 600  # A claimed queue item returns to the queue if its worker stops renewing for this long
+    QUEUE_MAX_ATTEMPTS: int = 3  # Claims of an item whose lease expired before it is marked failed
+    
+    # Blob Storage (resumes and uploaded documents)
+    BLOB_STORAGE_BACKEND: str = "local"  # local or s3
+    BLOB_STORAGE_PATH: str = "./data/blobs"  # Root directory of the local backend
+    BLOB_S3_ENDPOINT_URL: Optional[str] = None  # Any S3-compatible endpoint (AWS, MinIO, R2)
+    BLOB_S3_BUCKET: Optional[str] = None
+    BLOB_S3_REGION: str = "us-east-1"
+    BLOB_S3_ACCESS_KEY_ID: Optional[str] = None
+    BLOB_S3_SECRET_ACCESS_KEY: Optional[str] = None
+    BLOB_CHUNK_SIZE: int = 65536  # Bytes per read/write when streaming uploads and downloads
+    
+    # Outbound HTTP Connection Pool
+    HTTP_POOL_MAX_CONNECTIONS: int = 100
+    HTTP_POOL_MAX_KEEPALIVE: int = 20
+    HTTP_POOL_KEEPALIVE_EXPIRY: float = 30.0  # Seconds an idle connection is kept open
+    HTTP_POOL_MAX_PER_HOST: int = 20  # Concurrent requests per upstream host
+    HTTP_POOL_HTTP2: bool = True  # Requires the h2 package (httpx[http2])
+    HTTP_CLIENT_TIMEOUT: float = 30.0
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,224 @@
+"""
+Shared outbound HTTP connection pool
+One keep-alive (HTTP/2 when available) httpx client per event loop, reused by the job
+fetcher, AI clients and blob store instead of a new client per call
+"""
+
+import asyncio
+import importlib.util
+import time
+import weakref
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+import structlog
+
+from app.core.config import settings
+from app.core.tracing import add_trace_context, set_span_attributes, start_span
+
+logger = structlog.get_logger()
+
+
+class HostStats:
+    """Saturation counters for one upstream host"""
+
+    __slots__ = ("in_flight", "waiting", "requests", "wait_seconds")
+
+    def __init__(self):
+        self.in_flight = 0
+        self.waiting = 0
+        self.requests = 0
+        self.wait_seconds = 0.0
+
+
+class HTTPClientPool:
+    """
+    Process-wide pooled HTTP client
+    httpx connections belong to the event loop that opened them, so a client is kept per
+    loop. Requests through the pool are capped per upstream host, and the in-flight and
+    waiting counts are reported as pool saturation metrics. Each request is a client
+    span (URL without query string) including the time spent waiting for a host slot.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        max_per_host: int = 20,
+        http2: bool = True,
+        timeout: float = 30.0
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        if http2 and not self.http2:
+            logger.warning("h2 package not installed, outbound HTTP pool falling back to HTTP/1.1")
+
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+        self._host_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+        self._host_stats: Dict[str, HostStats] = {}
+        self._metrics = None
+
+    def bind_metrics(self, collector: Any):
+        """Report pool saturation through a MetricsCollector (record_http_pool_stats)"""
+        self._metrics = collector
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled client for the running event loop, created on first use"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout
+            )
+            self._clients[loop] = client
+        return client
+
+    async def startup(self):
+        """Open the pool on the running loop (FastAPI lifespan / Celery worker init)"""
+        client = self.client
+        logger.info("Outbound HTTP pool started",
+                   http2=self.http2,
+                   max_connections=self.limits.max_connections,
+                   max_keepalive=self.limits.max_keepalive_connections,
+                   max_per_host=self.max_per_host)
+        return client
+
+    async def shutdown(self):
+        """Close the pooled client of the running loop"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.pop(loop, None)
+        self._host_slots.pop(loop, None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+            logger.info("Outbound HTTP pool closed")
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the pooled client, waiting for a free per-host slot"""
+        with start_span(f"HTTP {method}", kind="client", attributes=_span_attributes(method, url)) as span:
+            async with self._host_slot_held(url):
+                response = await self.client.request(method, url, **kwargs)
+            set_span_attributes(span, **{"http.status_code": response.status_code})
+            return response
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """
+        Streamed response (SSE, chunked bodies)
+        The host slot only covers connecting and receiving the headers, so long-lived
+        streams don't starve ordinary calls to the same host; the body is still bounded
+        by the client's connection limits
+        """
+        with start_span(f"HTTP {method}", kind="client", attributes=_span_attributes(method, url)) as span:
+            async with AsyncExitStack() as slot_scope:
+                await slot_scope.enter_async_context(self._host_slot_held(url))
+                async with self.client.stream(method, url, **kwargs) as response:
+                    await slot_scope.aclose()
+                    set_span_attributes(span, **{"http.status_code": response.status_code})
+                    yield response
+
+    @asynccontextmanager
+    async def _host_slot_held(self, url: str):
+        host = urlsplit(url).netloc or "default"
+        slot = self._host_slot(host)
+        stats = self._host_stats.setdefault(host, HostStats())
+
+        stats.waiting += 1
+        wait_start = time.perf_counter()
+        try:
+            await slot.acquire()
+        finally:
+            stats.waiting -= 1
+        wait_time = time.perf_counter() - wait_start
+
+        stats.in_flight += 1
+        stats.requests += 1
+        stats.wait_seconds += wait_time
+        self._report(host, stats, wait_time)
+        add_trace_context(**{"http.pool_wait_seconds": wait_time})
+        try:
+            yield
+        finally:
+            stats.in_flight -= 1
+            slot.release()
+            self._report(host, stats)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host saturation snapshot"""
+        return {
+            host: {
+                "in_flight": stats.in_flight,
+                "waiting": stats.waiting,
+                "limit": self.max_per_host,
+                "utilization": stats.in_flight / self.max_per_host,
+                "requests": stats.requests,
+                "avg_wait_ms": (stats.wait_seconds / stats.requests * 1000) if stats.requests else 0.0
+            }
+            for host, stats in self._host_stats.items()
+        }
+
+    def _host_slot(self, host: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = self._host_slots.get(loop)
+        if slots is None:
+            slots = self._host_slots[loop] = {}
+        slot = slots.get(host)
+        if slot is None:
+            slot = slots[host] = asyncio.Semaphore(self.max_per_host)
+        return slot
+
+    def _report(self, host: str, stats: HostStats, wait_time: Optional[float] = None):
+        if self._metrics is None:
+            return
+        try:
+            self._metrics.record_http_pool_stats(
+                host=host,
+                in_flight=stats.in_flight,
+                waiting=stats.waiting,
+                limit=self.max_per_host,
+                wait_time=wait_time
+            )
+        except Exception as e:
+            logger.debug("Failed to record HTTP pool metrics", error=str(e))
+
+
+def _span_attributes(method: str, url: str) -> Dict[str, Any]:
+    # Query strings can carry search terms and keys, so they stay out of traces
+    parts = urlsplit(url)
+    return {
+        "http.method": method,
+        "http.url": parts._replace(query="", fragment="").geturl(),
+        "net.peer.name": parts.hostname
+    }
+
+
+# Global connection pool shared by all outbound API clients
+http_client_pool = HTTPClientPool(
+    max_connections=settings.HTTP_POOL_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.HTTP_POOL_MAX_KEEPALIVE,
+    keepalive_expiry=settings.HTTP_POOL_KEEPALIVE_EXPIRY,
+    max_per_host=settings.HTTP_POOL_MAX_PER_HOST,
+    http2=settings.HTTP_POOL_HTTP2,
+    timeout=settings.HTTP_CLIENT_TIMEOUT
+)
+
+
+# Export public interfaces
+__all__ = ["HTTPClientPool", "http_client_pool"]
@@ -4,8 +4,7 @@ MongoDB connection and configuration management
 
 import logging
 from motor.motor_asyncio import AsyncIOMotorClient
-from beanie import init_beanie
-from typing import Optional
+from typing import Any, Dict, Optional
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -21,6 +20,52 @@ class MongoDB:
 mongodb = MongoDB()
 
 
+class Collections:
+    """Collection names of the Beanie document models, for raw Motor queries"""
+
+    USERS = "users"
+    COMPANIES = "companies"
+    JOBS = "jobs"
+    JOB_MATCHES = "job_matches"
+    JOB_APPLICATIONS = "job_applications"
+
+
+_user_field_encryption = None
+
+
+def _get_user_field_encryption():
+    """Encryption service built from the same settings as the enterprise container"""
+    global _user_field_encryption
+    if _user_field_encryption is None:
+        from jobhire.config.settings import get_settings
+        from jobhire.shared.infrastructure.security.encryption import EncryptionService
+        _user_field_encryption = EncryptionService.from_settings(get_settings())
+    return _user_field_encryption
+
+
+def decrypt_user_document(document: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Decrypt the fields the enterprise UserRepository stores encrypted in the shared
+    users collection, so legacy readers see plaintext. Plaintext values pass through
+    """
+    from jobhire.domains.user.infrastructure.repositories.user_repository import UserRepository
+    from jobhire.shared.infrastructure.security.encryption import EncryptionService
+
+    fields = [field for field in UserRepository.ENCRYPTED_FIELDS
+              if EncryptionService.is_encrypted(document.get(field))]
+    if not fields:
+        return document
+
+    document_id = document.get("_id", document.get("id"))
+    encryption = _get_user_field_encryption()
+    decrypted = dict(document)
+    for field in fields:
+        decrypted[field] = encryption.decrypt_value(
+            document[field], associated_data=f"{Collections.USERS}.{field}:{document_id}"
+        )
+    return decrypted
+
+
 async def connect_to_mongodb():
     """Create database connection"""
     try:
@@ -32,6 +77,7 @@ async def connect_to_mongodb():
         logger.info(f"Connected to MongoDB: {settings.MONGODB_URL}")
 
         # Initialize Beanie with document models
+        from beanie import init_beanie
         from app.models.mongodb_models import (
             User, Company, Job, JobMatch, JobApplication,
             ApplicationStatusHistory, AIProcessingLog, UserAnalytics
@@ -2,34 +2,29 @@
 Monitoring and metrics setup
 """
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
 from starlette.responses import Response
-import time
 import structlog
 
 # Setup structured logging
 logger = structlog.get_logger()
 
 # Prometheus metrics
-REQUEST_COUNT = Counter(
-    'http_requests_total',
-    'Total HTTP requests',
-    ['method', 'endpoint', 'status']
-)
-
-REQUEST_DURATION = Histogram(
-    'http_request_duration_seconds',
-    'HTTP request duration in seconds',
-    ['method', 'endpoint']
-)
-
+# HTTP request metrics are recorded by the enterprise MetricsMiddleware
 AI_PROCESSING_TIME = Histogram(
     'ai_processing_duration_seconds',
     'AI processing duration in seconds',
     ['model', 'operation']
 )
 
+AI_TIME_TO_FIRST_TOKEN = Histogram(
+    'ai_time_to_first_token_seconds',
+    'Time from request to first streamed token in seconds',
+    ['model', 'operation'],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0)
+)
+
 JOB_MATCHING_ACCURACY = Histogram(
     'job_matching_accuracy',
     'Job matching accuracy scores',
@@ -42,35 +37,37 @@ APPLICATION_SUCCESS_RATE = Counter(
     ['user_tier', 'job_source']
 )
 
+CACHE_LOOKUPS = Counter(
+    'cache_lookups_total',
+    'Result cache lookups by tier and outcome',
+    ['cache', 'tier', 'result']
+)
+
+MATCH_CASCADE_STAGES = Counter(
+    'match_cascade_stage_total',
+    'Hybrid matches by the cascade stage that decided them',
+    ['stage']
+)
+
+INGESTION_BATCH_DURATION = Histogram(
+    'ingestion_batch_duration_seconds',
+    'Bulk write duration per batch in seconds',
+    ['table']
+)
+
+INGESTION_ROWS = Counter(
+    'ingestion_rows_total',
+    'Rows written by bulk ingestion batches',
+    ['table', 'result']
+)
+
 
 def setup_monitoring(app: FastAPI):
     """Setup monitoring middleware and endpoints"""
-    
-    @app.middleware("http")
-    async def monitoring_middleware(request: Request, call_next):
-        """Monitor HTTP requests"""
-        start_time = time.time()
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Record metrics
-        process_time = time.time() - start_time
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=request.url.path,
-            status=response.status_code
-        ).inc()
-        
-        REQUEST_DURATION.labels(
-            method=request.method,
-            endpoint=request.url.path
-        ).observe(process_time)
-        
-        # Add processing time to response headers
-        response.headers["X-Process-Time"] = str(process_time)
-        
-        return response
+    # Same middleware as the enterprise app, so a request is only measured once
+    from jobhire.shared.infrastructure.monitoring.metrics import MetricsMiddleware
+
+    app.add_middleware(MetricsMiddleware)
     
     @app.get("/metrics")
     async def get_metrics():
@@ -86,6 +83,11 @@ class PerformanceMonitor:
         """Record AI processing time"""
         AI_PROCESSING_TIME.labels(model=model, operation=operation).observe(duration)
     
+    @staticmethod
+    def record_ai_time_to_first_token(model: str, operation: str, duration: float):
+        """Record latency until the first streamed token"""
+        AI_TIME_TO_FIRST_TOKEN.labels(model=model, operation=operation).observe(duration)
+    
     @staticmethod
     def record_job_matching_accuracy(user_tier: str, accuracy: float):
         """Record job matching accuracy"""
@@ -95,6 +97,22 @@ class PerformanceMonitor:
     def record_application_success(user_tier: str, job_source: str):
         """Record successful application"""
         APPLICATION_SUCCESS_RATE.labels(user_tier=user_tier, job_source=job_source).inc()
+    
+    @staticmethod
+    def record_cache_lookup(cache: str, tier: str, result: str):
+        """Record a cache lookup (result: hit, stale, coalesced, miss)"""
+        CACHE_LOOKUPS.labels(cache=cache, tier=tier, result=result).inc()
+    
+    @staticmethod
+    def record_match_cascade_stage(stage: str):
+        """Record the cascade stage that decided a hybrid match"""
+        MATCH_CASCADE_STAGES.labels(stage=stage).inc()
+    
+    @staticmethod
+    def record_ingestion_batch(table: str, rows: int, duration: float, failed: bool = False):
+        """Record one bulk write batch (rows attempted, wall-clock duration)"""
+        INGESTION_BATCH_DURATION.labels(table=table).observe(duration)
+        INGESTION_ROWS.labels(table=table, result="failed" if failed else "written").inc(rows)
 
 
 # Global performance monitor instance
@@ -0,0 +1,30 @@
+"""
+Distributed rate limiting for the legacy services
+Thin wrapper over the enterprise Redis limiter so API endpoints and Celery workers
+share one budget per key across every process
+"""
+
+import sys
+from pathlib import Path
+
+from app.core.config import settings
+
+# Same src path the legacy entry point uses to reach the enterprise package
+_src_path = str(Path(__file__).resolve().parent.parent.parent / "src")
+if _src_path not in sys.path:
+    sys.path.insert(0, _src_path)
+
+from jobhire.shared.infrastructure.security.rate_limiting import (  # noqa: E402
+    DistributedRateLimiter,
+    RateLimit,
+    RateLimitAlgorithm,
+    RateLimitResult
+)
+
+
+# Global limiter shared by API rate limits and Celery task annotations
+rate_limiter = DistributedRateLimiter(settings.REDIS_URL)
+
+
+# Export public interfaces
+__all__ = ["RateLimit", "RateLimitAlgorithm", "RateLimitResult", "rate_limiter"]
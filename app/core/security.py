@@ -118,28 +118,20 @@ class PermissionChecker:
 class RateLimiter:
     """Rate limiting for API endpoints"""
 
-    def __init__(self, requests_per_minute: int = 60):
+    def __init__(self, requests_per_minute: int = 60, scope: str = "api"):
         self.requests_per_minute = requests_per_minute
-        self.request_counts = {}
-
-    def is_allowed(self, user_id: str) -> bool:
-        """Check if user is allowed to make a request"""
-        current_minute = datetime.utcnow().replace(second=0, microsecond=0)
-        key = f"{user_id}:{current_minute}"
-
-        if key not in self.request_counts:
-            self.request_counts[key] = 0
-
-        self.request_counts[key] += 1
-
-        # Clean old entries
-        cutoff_time = current_minute - timedelta(minutes=2)
-        old_keys = [k for k in self.request_counts.keys()
-                   if datetime.fromisoformat(k.split(":")[1]) < cutoff_time]
-        for k in old_keys:
-            del self.request_counts[k]
-
-        return self.request_counts[key] <= self.requests_per_minute
+        self.scope = scope
+
+    async def is_allowed(self, user_id: str) -> bool:
+        """Check if user is allowed to make a request (counted across all workers)"""
+        # Imported lazily so token helpers don't pull in the enterprise package
+        from app.core.rate_limit import RateLimit, rate_limiter
+
+        result = await rate_limiter.hit(
+            f"{self.scope}:{user_id}",
+            RateLimit(requests=self.requests_per_minute, window=60)
+        )
+        return result.allowed
 
 
 def validate_api_key(api_key: str) -> bool:
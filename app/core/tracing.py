@@ -0,0 +1,110 @@
+"""
+Distributed tracing for the legacy services
+Thin wrapper over the enterprise OpenTelemetry setup so API requests, Celery tasks,
+LangGraph workflow nodes, outbound HTTP and LLM calls report into the same traces
+"""
+
+import functools
+import inspect
+import sys
+from contextlib import aclosing
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Same src path the legacy entry point uses to reach the enterprise package
+_src_path = str(Path(__file__).resolve().parent.parent.parent / "src")
+if _src_path not in sys.path:
+    sys.path.insert(0, _src_path)
+
+from jobhire.config.settings import get_settings  # noqa: E402
+from jobhire.shared.infrastructure.monitoring.tracing import (  # noqa: E402
+    OpenSpan,
+    add_trace_context,
+    begin_span,
+    get_span_id,
+    get_trace_id,
+    inject_trace_context,
+    set_span_attributes,
+    set_span_error,
+    setup_tracing,
+    shutdown_tracing,
+    start_span
+)
+
+
+def setup_worker_tracing():
+    """Set up tracing in a Celery worker process when ENABLE_TRACING is on"""
+    if get_settings().monitoring.enable_tracing:
+        setup_tracing(service_name="jobhire-worker")
+
+
+def record_llm_usage(span: Optional[Any], metadata: Dict[str, Any], error: Optional[str] = None):
+    """Tag an LLM span with the model, estimated tokens and cost from AIModelManager metadata"""
+    set_span_attributes(
+        span,
+        **{
+            "llm.provider": metadata.get("provider"),
+            "llm.tier": metadata.get("tier"),
+            "llm.model": metadata.get("model"),
+            "llm.cache_hit": metadata.get("cache_hit"),
+            "llm.tokens.estimated": metadata.get("estimated_tokens"),
+            "llm.cost_usd": metadata.get("cost_usd"),
+            "llm.cost_saved_usd": metadata.get("cost_saved_usd"),
+            "llm.time_to_first_token": metadata.get("time_to_first_token")
+        }
+    )
+    if error is not None:
+        set_span_attributes(span, **{"llm.error": error})
+        set_span_error(span, error)
+
+
+def traced_llm_call(span_name: str):
+    """
+    Trace an AIModelManager call
+    Coroutines returning a result dict and async generators ending with a "done" or
+    "error" event are both supported; the span gets the result's token and cost metadata
+    """
+    def decorator(func):
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def stream_wrapper(*args, **kwargs):
+                # Not made current: the consumer may resume the generator from another context
+                span = begin_span(span_name, attributes={"llm.operation": kwargs.get("operation")}, activate=False)
+                try:
+                    async with aclosing(func(*args, **kwargs)) as events:
+                        async for event in events:
+                            if event.get("type") in ("done", "error"):
+                                record_llm_usage(span.span, event.get("metadata", {}), event.get("error"))
+                            yield event
+                finally:
+                    span.end()
+            return stream_wrapper
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with start_span(span_name, attributes={"llm.operation": kwargs.get("operation")}) as span:
+                result = await func(*args, **kwargs)
+                error = None if result.get("success") else result.get("error", "LLM call failed")
+                record_llm_usage(span, result.get("metadata", {}), error)
+                return result
+        return wrapper
+    return decorator
+
+
+# Export public interfaces
+__all__ = [
+    "OpenSpan",
+    "add_trace_context",
+    "begin_span",
+    "get_span_id",
+    "get_trace_id",
+    "inject_trace_context",
+    "record_llm_usage",
+    "set_span_attributes",
+    "set_span_error",
+    "setup_tracing",
+    "setup_worker_tracing",
+    "shutdown_tracing",
+    "start_span",
+    "traced_llm_call"
+]
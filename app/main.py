@@ -5,6 +5,7 @@ This file now redirects to the new enterprise architecture.
 
 import sys
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # Add the new src path to Python path
@@ -19,6 +20,42 @@ except ImportError:
     import jobhire.main
     app = jobhire.main.app
 
+# Always through the jobhire package, like the enterprise modules, so this is the
+# same process-wide collector the middleware records into
+from jobhire.config.settings import get_settings
+from jobhire.shared.infrastructure.monitoring.metrics import get_metrics_collector
+from jobhire.shared.infrastructure.monitoring.tracing import setup_tracing
+
+from app.core.http_client import http_client_pool
+from app.core.mongodb import close_mongodb_connection, connect_to_mongodb
+
+
+# Wrap the enterprise lifespan so the legacy services' shared HTTP pool and
+# Motor client (get_mongodb) are opened once at startup and closed at shutdown
+_enterprise_lifespan = app.router.lifespan_context
+
+
+@asynccontextmanager
+async def lifespan(application):
+    # Tracing first, so the pymongo instrumentation hooks the legacy Motor client too;
+    # the enterprise lifespan keeps this setup and shuts it down
+    if get_settings().monitoring.enable_tracing:
+        setup_tracing()
+    http_client_pool.bind_metrics(get_metrics_collector())
+    await http_client_pool.startup()
+    try:
+        await connect_to_mongodb()
+        try:
+            async with _enterprise_lifespan(application) as state:
+                yield state
+        finally:
+            await close_mongodb_connection()
+    finally:
+        await http_client_pool.shutdown()
+
+
+app.router.lifespan_context = lifespan
+
 # For backward compatibility, expose the app
 __all__ = ["app"]
 
@@ -3,12 +3,14 @@ MongoDB models for JobHire.AI using Beanie ODM
 """
 
 from beanie import Document, Indexed
-from pydantic import Field, BaseModel, EmailStr
+from pydantic import Field, BaseModel, EmailStr, model_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
 from bson import ObjectId
 
+from app.core.mongodb import decrypt_user_document
+
 
 class JobStatus(str, Enum):
     """Job application status enumeration"""
@@ -58,6 +60,14 @@ class User(Document):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    @model_validator(mode="before")
+    @classmethod
+    def decrypt_shared_fields(cls, data: Any) -> Any:
+        """Decrypt fields the enterprise UserRepository encrypts in the same collection"""
+        if isinstance(data, dict):
+            return decrypt_user_document(data)
+        return data
+
     class Settings:
         name = "users"
         indexes = [
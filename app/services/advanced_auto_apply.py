@@ -379,7 +379,8 @@ class AdvancedAutoApplyEngine:
                 user_data={"user_id": analysis_data["user_id"]},
                 model_tier="balanced",
                 provider="replicate",
-                temperature=0.3  # Lower temperature for more consistent decisions
+                temperature=0.3,  # Lower temperature for more consistent decisions
+                operation="auto_apply_decision"
             )
             
             if ai_result["success"]:
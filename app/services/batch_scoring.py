@@ -0,0 +1,591 @@
+"""
+Vectorized batch scoring for the job matching engine
+Scores N jobs x M user profiles in one NumPy pass instead of one coroutine per pair
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
+import numpy as np
+
+from app.services.job_matcher import JobMatchingEngine, EXPERIENCE_LEVEL_YEARS, EDUCATION_LEVELS
+from app.services.keyword_extractor import CULTURE_INDICATORS
+import structlog
+
+logger = structlog.get_logger()
+
+
+CULTURE_TYPES: List[str] = list(CULTURE_INDICATORS.keys())
+
+
+@dataclass
+class JobFeatures:
+    """Column-packed job attributes shared by every user chunk"""
+    jobs: List[Dict[str, Any]]
+    skill_index: Dict[str, int]
+    required: np.ndarray           # (N, V) required skill incidence
+    preferred_only: np.ndarray     # (N, V) preferred-but-not-required incidence
+    required_count: np.ndarray     # (N,) raw required skill count
+    preferred_count: np.ndarray    # (N,) raw preferred skill count
+    required_normalized: List[List[str]]
+    preferred_normalized: List[set]
+    min_years: np.ndarray
+    max_years: np.ndarray
+    education_level: np.ndarray
+    remote_full: np.ndarray
+    remote_none: np.ndarray
+    location_codes: Dict[Any, int]
+    state_code: np.ndarray
+    city_code: np.ndarray
+    salary_mid: np.ndarray         # NaN when the job has no salary info
+    has_salary: np.ndarray
+    culture_presence: np.ndarray   # (N, K) normalized culture keyword presence
+    culture_counts: List[Dict[str, int]]
+    description_red_flags: List[List[str]]
+
+
+@dataclass
+class UserFeatures:
+    """Column-packed user profile attributes"""
+    profiles: List[Dict[str, Any]]
+    skill_counts: np.ndarray       # (M, V) occurrences of each known skill
+    skills_normalized: List[List[str]]
+    experience_years: np.ndarray
+    has_education: np.ndarray
+    education_level: np.ndarray
+    remote_only: np.ndarray
+    state_code: np.ndarray
+    city_code: np.ndarray
+    salary_target: np.ndarray      # NaN when missing
+    salary_minimum: np.ndarray     # NaN when missing
+    has_salary: np.ndarray
+    has_culture_prefs: np.ndarray
+    culture_weights: np.ndarray    # (M, K) positive importances
+    culture_total: np.ndarray
+
+
+@dataclass
+class BatchScores:
+    """Rounded category scores and overall score, each shaped (N jobs, M users)"""
+    skills: np.ndarray
+    experience: np.ndarray
+    education: np.ndarray
+    location: np.ndarray
+    salary: np.ndarray
+    culture: np.ndarray
+    overall: np.ndarray
+
+
+class BatchScoringEngine:
+    """Vectorized algorithmic scoring that mirrors JobMatchingEngine._algorithmic_matching"""
+
+    def __init__(self, matching_engine: JobMatchingEngine, user_chunk_size: int = 512):
+        self.matching_engine = matching_engine
+        self.user_chunk_size = user_chunk_size
+
+    def match(
+        self,
+        jobs: List[Dict[str, Any]],
+        user_profiles: List[Dict[str, Any]],
+        min_score: Optional[float] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Score every job against every user profile
+        Returns one list of algorithmic match results per user, best match first.
+        Pairs scoring below min_score are never materialized.
+        """
+
+        if not jobs or not user_profiles:
+            return [[] for _ in user_profiles]
+
+        job_features = self.pack_jobs(jobs)
+        results: List[List[Dict[str, Any]]] = []
+
+        for start in range(0, len(user_profiles), self.user_chunk_size):
+            chunk = user_profiles[start:start + self.user_chunk_size]
+            user_features = self.pack_users(chunk, job_features)
+            scores = self.score(job_features, user_features)
+
+            for user_idx in range(len(chunk)):
+                overall = scores.overall[:, user_idx]
+                job_order = np.argsort(-overall, kind="stable")
+                if min_score is not None:
+                    job_order = job_order[overall[job_order] >= min_score]
+
+                results.append([
+                    self._materialize(job_features, user_features, scores, int(job_idx), user_idx)
+                    for job_idx in job_order
+                ])
+
+        logger.info("Vectorized batch scoring completed",
+                   jobs=len(jobs),
+                   users=len(user_profiles),
+                   pairs=len(jobs) * len(user_profiles))
+
+        return results
+
+    def pack_jobs(self, jobs: List[Dict[str, Any]]) -> JobFeatures:
+        """Pack job attributes into arrays"""
+
+        normalize = self.matching_engine._normalize_skill
+        skill_index: Dict[str, int] = {}
+
+        required_normalized = []
+        preferred_normalized = []
+        for job in jobs:
+            required = [normalize(skill) for skill in job.get("required_skills") or []]
+            preferred = [normalize(skill) for skill in job.get("preferred_skills") or []]
+            for skill in required + preferred:
+                skill_index.setdefault(skill, len(skill_index))
+            required_normalized.append(required)
+            preferred_normalized.append(set(preferred))
+
+        n_jobs = len(jobs)
+        required = np.zeros((n_jobs, len(skill_index)), dtype=np.float64)
+        preferred = np.zeros((n_jobs, len(skill_index)), dtype=np.float64)
+        for job_idx in range(n_jobs):
+            required[job_idx, [skill_index[s] for s in required_normalized[job_idx]]] = 1.0
+            preferred[job_idx, [skill_index[s] for s in preferred_normalized[job_idx]]] = 1.0
+        preferred_only = preferred * (1.0 - required)
+
+        location_codes: Dict[Any, int] = {}
+        year_ranges = [
+            EXPERIENCE_LEVEL_YEARS.get(job.get("experience_level", "mid-level"), (2, 5))
+            for job in jobs
+        ]
+        remote_options = [job.get("remote_option", "no") for job in jobs]
+        state_code, city_code = self._location_codes(
+            [job.get("location") or {} for job in jobs], location_codes
+        )
+
+        salary_mid = np.full(n_jobs, np.nan)
+        has_salary = np.zeros(n_jobs, dtype=bool)
+        for job_idx, job in enumerate(jobs):
+            salary_min, salary_max = job.get("salary_min"), job.get("salary_max")
+            has_salary[job_idx] = bool(salary_min or salary_max)
+            if salary_min and salary_max:
+                salary_mid[job_idx] = (salary_min + salary_max) / 2
+            elif salary_min:
+                salary_mid[job_idx] = salary_min * 1.2
+            elif salary_max:
+                salary_mid[job_idx] = salary_max * 0.8
+
+        culture_counts = [self.matching_engine._extract_culture_signals(job) for job in jobs]
+        culture_presence = np.array(
+            [[min(counts[t], 3) / 3 for t in CULTURE_TYPES] for counts in culture_counts],
+            dtype=np.float64
+        ).reshape(n_jobs, len(CULTURE_TYPES))
+
+        return JobFeatures(
+            jobs=jobs,
+            skill_index=skill_index,
+            required=required,
+            preferred_only=preferred_only,
+            required_count=np.array([len(job.get("required_skills") or []) for job in jobs], dtype=np.float64),
+            preferred_count=np.array([len(job.get("preferred_skills") or []) for job in jobs], dtype=np.float64),
+            required_normalized=required_normalized,
+            preferred_normalized=preferred_normalized,
+            min_years=np.array([r[0] for r in year_ranges], dtype=np.float64),
+            max_years=np.array([r[1] for r in year_ranges], dtype=np.float64),
+            education_level=np.array(
+                [EDUCATION_LEVELS.get(job.get("education_requirements", "bachelor"), 3) for job in jobs],
+                dtype=np.float64
+            ),
+            remote_full=np.array([opt == "full" for opt in remote_options], dtype=bool),
+            remote_none=np.array([opt == "no" for opt in remote_options], dtype=bool),
+            location_codes=location_codes,
+            state_code=state_code,
+            city_code=city_code,
+            salary_mid=salary_mid,
+            has_salary=has_salary,
+            culture_presence=culture_presence,
+            culture_counts=culture_counts,
+            description_red_flags=[
+                self.matching_engine._identify_description_red_flags(job) for job in jobs
+            ]
+        )
+
+    def pack_users(self, profiles: List[Dict[str, Any]], job_features: JobFeatures) -> UserFeatures:
+        """Pack user profile attributes into arrays aligned with the packed jobs"""
+
+        skill_index = job_features.skill_index
+
+        normalize = self.matching_engine._normalize_skill
+        n_users = len(profiles)
+
+        skill_counts = np.zeros((n_users, len(skill_index)), dtype=np.float64)
+        skills_normalized = []
+        for user_idx, profile in enumerate(profiles):
+            normalized = [normalize(skill) for skill in profile.get("skills") or []]
+            skills_normalized.append(normalized)
+            for skill in normalized:
+                column = skill_index.get(skill)
+                if column is not None:
+                    skill_counts[user_idx, column] += 1.0
+
+        preferences = [profile.get("preferences") or {} for profile in profiles]
+
+        has_education = np.zeros(n_users, dtype=bool)
+        education_level = np.ones(n_users, dtype=np.float64)
+        for user_idx, profile in enumerate(profiles):
+            education = profile.get("education") or {}
+            has_education[user_idx] = bool(education)
+            degrees = education.get("degrees", []) if education else []
+            if degrees:
+                education_level[user_idx] = max(
+                    EDUCATION_LEVELS.get(degree.get("level", "bachelor"), 3) for degree in degrees
+                )
+
+        state_code, city_code = self._location_codes(
+            [prefs.get("location") or {} for prefs in preferences], job_features.location_codes
+        )
+
+        culture_weights = np.zeros((n_users, len(CULTURE_TYPES)), dtype=np.float64)
+        culture_total = np.zeros(n_users, dtype=np.float64)
+        for user_idx, prefs in enumerate(preferences):
+            culture_prefs = prefs.get("culture_preferences") or {}
+            culture_total[user_idx] = sum(culture_prefs.values()) if culture_prefs else 0
+            for type_idx, culture_type in enumerate(CULTURE_TYPES):
+                importance = culture_prefs.get(culture_type, 0)
+                if importance > 0:
+                    culture_weights[user_idx, type_idx] = importance
+
+        salary_target = np.array(
+            [prefs.get("salary_target") or np.nan for prefs in preferences], dtype=np.float64
+        )
+        salary_minimum = np.array(
+            [prefs.get("salary_minimum") or np.nan for prefs in preferences], dtype=np.float64
+        )
+
+        return UserFeatures(
+            profiles=profiles,
+            skill_counts=skill_counts,
+            skills_normalized=skills_normalized,
+            experience_years=np.array(
+                [profile.get("experience_years", 0) or 0 for profile in profiles], dtype=np.float64
+            ),
+            has_education=has_education,
+            education_level=education_level,
+            remote_only=np.array(
+                [prefs.get("remote_preference", "hybrid") == "remote_only" for prefs in preferences],
+                dtype=bool
+            ),
+            state_code=state_code,
+            city_code=city_code,
+            salary_target=salary_target,
+            salary_minimum=salary_minimum,
+            has_salary=~(np.isnan(salary_target) & np.isnan(salary_minimum)),
+            has_culture_prefs=np.array(
+                [bool(prefs.get("culture_preferences")) for prefs in preferences], dtype=bool
+            ),
+            culture_weights=culture_weights,
+            culture_total=culture_total
+        )
+
+    def score(self, jobs: JobFeatures, users: UserFeatures) -> BatchScores:
+        """Compute all six category scores and the weighted overall score"""
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            skills = np.round(self._skills_scores(jobs, users), 1)
+            experience = np.round(self._experience_scores(jobs, users), 1)
+            education = np.round(self._education_scores(jobs, users), 1)
+            location = self._location_scores(jobs, users)
+            salary = self._salary_scores(jobs, users)
+            culture = np.round(self._culture_scores(jobs, users), 1)
+
+        weights = self.matching_engine.default_weights
+        overall = (
+            skills * weights.skills +
+            experience * weights.experience +
+            education * weights.education +
+            location * weights.location +
+            salary * weights.salary +
+            culture * weights.culture
+        )
+
+        return BatchScores(
+            skills=skills,
+            experience=experience,
+            education=education,
+            location=location,
+            salary=salary,
+            culture=culture,
+            overall=np.round(overall, 1)
+        )
+
+    def _skills_scores(self, jobs: JobFeatures, users: UserFeatures) -> np.ndarray:
+        matched_required = jobs.required @ users.skill_counts.T
+        matched_preferred = jobs.preferred_only @ users.skill_counts.T
+
+        required_count = jobs.required_count[:, None]
+        preferred_count = jobs.preferred_count[:, None]
+
+        base = np.where(required_count > 0, matched_required / required_count * 70, 50)
+        bonus = np.where(preferred_count > 0, matched_preferred / preferred_count * 30, 0)
+        scores = np.minimum(base + bonus, 100)
+
+        no_requirements = (jobs.required_count == 0) & (jobs.preferred_count == 0)
+        return np.where(no_requirements[:, None], 50.0, scores)
+
+    def _experience_scores(self, jobs: JobFeatures, users: UserFeatures) -> np.ndarray:
+        years = users.experience_years[None, :]
+        min_years = jobs.min_years[:, None]
+        max_years = jobs.max_years[:, None]
+
+        under = np.maximum(50 - (min_years - years) * 10, 0)
+        over = np.maximum(90 - (years - max_years) * 5, 60)
+        return np.where(
+            (years >= min_years) & (years <= max_years), 100.0,
+            np.where(years < min_years, under, over)
+        )
+
+    def _education_scores(self, jobs: JobFeatures, users: UserFeatures) -> np.ndarray:
+        required = jobs.education_level[:, None]
+        achieved = users.education_level[None, :]
+
+        scores = np.where(achieved >= required, 100.0, np.maximum(70 - (required - achieved) * 15, 0))
+        return np.where(users.has_education[None, :], scores, 50.0)
+
+    def _location_scores(self, jobs: JobFeatures, users: UserFeatures) -> np.ndarray:
+        both_known = (jobs.city_code >= 0)[:, None] & (users.city_code >= 0)[None, :]
+        same_city = jobs.city_code[:, None] == users.city_code[None, :]
+        same_state = jobs.state_code[:, None] == users.state_code[None, :]
+
+        geographic = np.where(same_city, 100.0, np.where(same_state, 80.0, 30.0))
+        scores = np.where(both_known, geographic, 70.0)
+        scores = np.where(users.remote_only[None, :] & jobs.remote_none[:, None], 10.0, scores)
+        return np.where(jobs.remote_full[:, None], 100.0, scores)
+
+    def _salary_scores(self, jobs: JobFeatures, users: UserFeatures) -> np.ndarray:
+        salary_mid = jobs.salary_mid[:, None]
+        target = users.salary_target[None, :]
+        minimum = users.salary_minimum[None, :]
+
+        diff = np.abs(salary_mid - target) / target
+        target_scores = np.select([diff <= 0.1, diff <= 0.2, diff <= 0.3], [100.0, 80.0, 60.0], 30.0)
+        minimum_scores = np.where(salary_mid >= minimum, 90.0, 20.0)
+
+        scores = np.where(
+            ~np.isnan(target), target_scores,
+            np.where(~np.isnan(minimum), minimum_scores, 70.0)
+        )
+        return np.where(np.isnan(salary_mid), 70.0, scores)
+
+    def _culture_scores(self, jobs: JobFeatures, users: UserFeatures) -> np.ndarray:
+        alignment = jobs.culture_presence @ users.culture_weights.T
+        total = users.culture_total[None, :]
+
+        scores = np.where(total > 0, alignment / total * 100, 70.0)
+        return np.where(users.has_culture_prefs[None, :], scores, 70.0)
+
+    def _location_codes(
+        self,
+        locations: List[Dict[str, Any]],
+        codes: Dict[Any, int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Intern state and (city, state) keys; -1 marks incomplete locations"""
+
+        state_code = np.full(len(locations), -1, dtype=np.int64)
+        city_code = np.full(len(locations), -1, dtype=np.int64)
+        for idx, location in enumerate(locations):
+            city, state = location.get("city"), location.get("state")
+            if city and state:
+                state_code[idx] = codes.setdefault(("state", state.lower()), len(codes))
+                city_code[idx] = codes.setdefault(("city", city.lower(), state.lower()), len(codes))
+
+        return state_code, city_code
+
+    def _materialize(
+        self,
+        jobs: JobFeatures,
+        users: UserFeatures,
+        scores: BatchScores,
+        job_idx: int,
+        user_idx: int
+    ) -> Dict[str, Any]:
+        """Build the _algorithmic_matching-shaped result for one (job, user) pair"""
+
+        job = jobs.jobs[job_idx]
+        profile = users.profiles[user_idx]
+
+        category_scores = {
+            "skills": self._skills_details(jobs, users, scores, job_idx, user_idx),
+            "experience": self._experience_details(jobs, users, scores, job_idx, user_idx),
+            "education": self._education_details(jobs, users, scores, job_idx, user_idx),
+            "location": self._location_details(jobs, users, scores, job_idx, user_idx),
+            "salary": self._salary_details(jobs, users, scores, job_idx, user_idx),
+            "culture": self._culture_details(jobs, users, scores, job_idx, user_idx)
+        }
+
+        return self.matching_engine._assemble_algorithmic_result(
+            job, profile, category_scores,
+            description_red_flags=jobs.description_red_flags[job_idx]
+        )
+
+    def _skills_details(self, jobs, users, scores, job_idx, user_idx) -> Dict[str, Any]:
+        job = jobs.jobs[job_idx]
+        required_skills = job.get("required_skills") or []
+        preferred_skills = job.get("preferred_skills") or []
+
+        if not required_skills and not preferred_skills:
+            return {
+                "score": 50.0,
+                "matched": [],
+                "missing": [],
+                "details": "No specific skills requirements found"
+            }
+
+        required_normalized = set(jobs.required_normalized[job_idx])
+        preferred_normalized = jobs.preferred_normalized[job_idx]
+        user_normalized = users.skills_normalized[user_idx]
+
+        matched_required = [s for s in user_normalized if s in required_normalized]
+        matched_preferred = [
+            s for s in user_normalized
+            if s not in required_normalized and s in preferred_normalized
+        ]
+        user_set = set(user_normalized)
+
+        return {
+            "score": float(scores.skills[job_idx, user_idx]),
+            "matched": matched_required + matched_preferred,
+            "missing": [
+                skill for skill, normalized in zip(required_skills, jobs.required_normalized[job_idx])
+                if normalized not in user_set
+            ],
+            "required_match_rate": len(matched_required) / len(required_skills) if required_skills else 1.0,
+            "preferred_match_rate": len(matched_preferred) / len(preferred_skills) if preferred_skills else 0.0
+        }
+
+    def _experience_details(self, jobs, users, scores, job_idx, user_idx) -> Dict[str, Any]:
+        min_years, max_years = EXPERIENCE_LEVEL_YEARS.get(
+            jobs.jobs[job_idx].get("experience_level", "mid-level"), (2, 5)
+        )
+        user_years = users.profiles[user_idx].get("experience_years", 0)
+        years = users.experience_years[user_idx]
+
+        if min_years <= years <= max_years:
+            match_type = "perfect"
+        elif years < min_years:
+            match_type = "under_qualified"
+        else:
+            match_type = "over_qualified"
+
+        return {
+            "score": float(scores.experience[job_idx, user_idx]),
+            "years_match": match_type == "perfect",
+            "user_years": user_years,
+            "required_range": f"{min_years}-{max_years if max_years != float('inf') else '10+'} years",
+            "match_type": match_type
+        }
+
+    def _education_details(self, jobs, users, scores, job_idx, user_idx) -> Dict[str, Any]:
+        if not users.has_education[user_idx]:
+            return {
+                "score": 50.0,
+                "meets_requirements": False,
+                "details": "No education information provided"
+            }
+
+        user_level = int(users.education_level[user_idx])
+        required_level = int(jobs.education_level[job_idx])
+
+        return {
+            "score": float(scores.education[job_idx, user_idx]),
+            "meets_requirements": user_level >= required_level,
+            "required": jobs.jobs[job_idx].get("education_requirements", "bachelor"),
+            "user_level": user_level,
+            "required_level": required_level
+        }
+
+    def _location_details(self, jobs, users, scores, job_idx, user_idx) -> Dict[str, Any]:
+        job_remote = jobs.jobs[job_idx].get("remote_option", "no")
+        score = float(scores.location[job_idx, user_idx])
+
+        if jobs.remote_full[job_idx]:
+            return {
+                "score": score,
+                "remote_compatible": True,
+                "distance_km": 0,
+                "details": "Fully remote position"
+            }
+
+        if users.remote_only[user_idx] and jobs.remote_none[job_idx]:
+            return {
+                "score": score,
+                "remote_compatible": False,
+                "details": "User requires remote work but job is on-site"
+            }
+
+        if jobs.city_code[job_idx] >= 0 and users.city_code[user_idx] >= 0:
+            if jobs.city_code[job_idx] == users.city_code[user_idx]:
+                distance = 0
+            elif jobs.state_code[job_idx] == users.state_code[user_idx]:
+                distance = 100
+            else:
+                distance = 500
+            return {
+                "score": score,
+                "remote_compatible": job_remote in ["hybrid", "full"],
+                "distance_km": distance,
+                "same_city": distance == 0
+            }
+
+        return {
+            "score": score,
+            "remote_compatible": job_remote != "no",
+            "details": "Insufficient location data for precise matching"
+        }
+
+    def _salary_details(self, jobs, users, scores, job_idx, user_idx) -> Dict[str, Any]:
+        if not jobs.has_salary[job_idx] and not users.has_salary[user_idx]:
+            return {
+                "score": 70.0,
+                "within_range": None,
+                "details": "No salary information available"
+            }
+
+        if np.isnan(jobs.salary_mid[job_idx]):
+            return {
+                "score": 70.0,
+                "within_range": None,
+                "details": "No job salary information"
+            }
+
+        job = jobs.jobs[job_idx]
+        preferences = users.profiles[user_idx].get("preferences") or {}
+        job_salary_min, job_salary_max = job.get("salary_min"), job.get("salary_max")
+        user_salary_min = preferences.get("salary_minimum")
+        user_salary_target = preferences.get("salary_target")
+
+        return {
+            "score": float(scores.salary[job_idx, user_idx]),
+            "within_range": not (user_salary_min and job_salary_max and job_salary_max < user_salary_min),
+            "negotiation_room": max(0, job_salary_max - user_salary_target)
+            if job_salary_max and user_salary_target else 0,
+            "job_range": f"${job_salary_min:,}-${job_salary_max:,}" if job_salary_min and job_salary_max else None
+        }
+
+    def _culture_details(self, jobs, users, scores, job_idx, user_idx) -> Dict[str, Any]:
+        if not users.has_culture_prefs[user_idx]:
+            return {
+                "score": 70.0,
+                "alignment_factors": [],
+                "details": "No culture preferences specified"
+            }
+
+        job_culture_scores = jobs.culture_counts[job_idx]
+        culture_prefs = users.profiles[user_idx]["preferences"]["culture_preferences"]
+
+        return {
+            "score": float(scores.culture[job_idx, user_idx]),
+            "alignment_factors": [
+                culture_type for culture_type, importance in culture_prefs.items()
+                if culture_type in job_culture_scores and importance > 0
+                and min(job_culture_scores[culture_type], 3) / 3 * importance > 0.5
+            ],
+            "culture_match_details": job_culture_scores
+        }
+
+
+# Export public interfaces
+__all__ = ["BatchScoringEngine", "BatchScores", "JobFeatures", "UserFeatures"]
@@ -0,0 +1,276 @@
+"""
+Dashboard Statistics Service
+Materialized per-user application counters for the dashboard endpoints
+"""
+
+from typing import Dict, Any, Optional
+from datetime import datetime, timedelta
+from pymongo import ReturnDocument
+
+from app.core.config import settings
+import structlog
+
+logger = structlog.get_logger()
+
+
+# Statuses the dashboard groups together
+PREVIEW_STATUSES = ("matched",)
+QUEUE_STATUSES = ("pending",)
+APPLIED_STATUSES = ("applied", "completed")
+RESPONDED_STATUSES = ("interview", "offer", "rejected")
+
+# Days of per-day creation counts kept for the week/month figures
+DAILY_HISTORY_DAYS = 31
+
+DAY_FORMAT = "%Y-%m-%d"
+
+
+class DashboardStatsService:
+    """
+    One stats document per user in the user_stats collection
+    Writers that go through create_application / update_application_status adjust it
+    with $inc; readers get it in a single find_one. Applications are also written
+    outside this service, so a read first checks (one indexed find_one) whether any of
+    the user's applications changed after the counters did. A changed, missing or
+    stale document is rebuilt with one $facet aggregation over the user's applications.
+    """
+
+    COLLECTION = "user_stats"
+
+    def __init__(self, max_age_seconds: int = 300):
+        self.max_age = timedelta(seconds=max_age_seconds)
+        self._indexed = False
+
+    async def get_stats(self, db, user_id: str) -> Dict[str, Any]:
+        """Current stats document for a user, recounted if missing, stale or behind its applications"""
+        stats = await db[self.COLLECTION].find_one({"_id": user_id})
+
+        if (
+            stats is None
+            or stats.get("refreshed_at", datetime.min) < datetime.utcnow() - self.max_age
+            or await self._changed_since(db, user_id, stats.get("updated_at", datetime.min))
+        ):
+            stats = await self.recompute(db, user_id)
+
+        return stats
+
+    async def _changed_since(self, db, user_id: str, since: datetime) -> bool:
+        """Whether any of the user's applications was written after the counters"""
+        if not self._indexed:
+            try:
+                await db.applications.create_index([("user_id", 1), ("updated_at", -1)], name="user_updated_at")
+                self._indexed = True
+            except Exception as e:
+                logger.warning("Failed to create applications change index", error=str(e))
+
+        changed = await db.applications.find_one(
+            {"user_id": user_id, "updated_at": {"$gt": since}},
+            projection={"_id": 1}
+        )
+        return changed is not None
+
+    async def recompute(self, db, user_id: str) -> Dict[str, Any]:
+        """Rebuild a user's stats document from their applications in one round-trip"""
+        now = datetime.utcnow()
+        history_start = (now - timedelta(days=DAILY_HISTORY_DAYS)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+        pipeline = [
+            {"$match": {"user_id": user_id}},
+            {
+                "$facet": {
+                    "by_status": [
+                        {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+                    ],
+                    "by_day": [
+                        {"$match": {"created_at": {"$gte": history_start}}},
+                        {
+                            "$group": {
+                                "_id": {"$dateToString": {"format": DAY_FORMAT, "date": "$created_at"}},
+                                "count": {"$sum": 1}
+                            }
+                        }
+                    ],
+                    "response_time": [
+                        {
+                            "$match": {
+                                "status": {"$in": list(RESPONDED_STATUSES)},
+                                "applied_at": {"$exists": True},
+                                "updated_at": {"$exists": True}
+                            }
+                        },
+                        {
+                            "$group": {
+                                "_id": None,
+                                "total_days": {
+                                    "$sum": {
+                                        "$divide": [
+                                            {"$subtract": ["$updated_at", "$applied_at"]},
+                                            1000 * 60 * 60 * 24  # Convert to days
+                                        ]
+                                    }
+                                },
+                                "count": {"$sum": 1}
+                            }
+                        }
+                    ]
+                }
+            }
+        ]
+
+        results = await db.applications.aggregate(pipeline).to_list(1)
+        facets = results[0] if results else {}
+        response_time = (facets.get("response_time") or [{}])[0]
+
+        stats = {
+            "_id": user_id,
+            "status_counts": {
+                row["_id"]: row["count"] for row in facets.get("by_status", []) if row["_id"] is not None
+            },
+            "created_by_day": {
+                row["_id"]: row["count"] for row in facets.get("by_day", []) if row["_id"] is not None
+            },
+            "response_days_total": response_time.get("total_days", 0),
+            "response_count": response_time.get("count", 0),
+            "refreshed_at": now,
+            "updated_at": now
+        }
+
+        await db[self.COLLECTION].replace_one({"_id": user_id}, stats, upsert=True)
+        logger.debug("Dashboard stats recomputed", user_id=user_id)
+        return stats
+
+    async def create_application(self, db, application: Dict[str, Any]) -> Any:
+        """
+        Insert an application and count it
+        Application writers go through here (or call the record_* hooks themselves) so the
+        user's counters move with the document
+        """
+        now = datetime.utcnow()
+        document = {"created_at": now, "updated_at": now, **application}
+        result = await db.applications.insert_one(document)
+        await self.record_application_created(db, document["user_id"], document["status"], document["created_at"])
+        return result.inserted_id
+
+    async def update_application_status(
+        self,
+        db,
+        user_id: str,
+        application_id: Any,
+        status: str,
+        changes: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Change an application's status and move it between counters; False if not found"""
+        now = datetime.utcnow()
+        fields = {**(changes or {}), "status": status, "updated_at": now}
+        if status in APPLIED_STATUSES:
+            fields.setdefault("applied_at", now)
+
+        # The pre-update document gives the status being left, atomically with the write
+        previous = await db.applications.find_one_and_update(
+            {"_id": application_id, "user_id": user_id},
+            {"$set": fields},
+            projection={"status": 1, "applied_at": 1},
+            return_document=ReturnDocument.BEFORE
+        )
+        if previous is None:
+            return False
+
+        await self.record_status_change(
+            db,
+            user_id,
+            previous.get("status"),
+            status,
+            applied_at=previous.get("applied_at") or fields.get("applied_at"),
+            changed_at=now
+        )
+        return True
+
+    async def record_application_created(
+        self,
+        db,
+        user_id: str,
+        status: str,
+        created_at: Optional[datetime] = None
+    ):
+        """Count a new application"""
+        day = (created_at or datetime.utcnow()).strftime(DAY_FORMAT)
+        await self._increment(db, user_id, {
+            f"status_counts.{status}": 1,
+            f"created_by_day.{day}": 1
+        })
+
+    async def record_status_change(
+        self,
+        db,
+        user_id: str,
+        from_status: Optional[str],
+        to_status: str,
+        applied_at: Optional[datetime] = None,
+        changed_at: Optional[datetime] = None
+    ):
+        """Move an application between status counters"""
+        if from_status == to_status:
+            return
+
+        increments: Dict[str, Any] = {f"status_counts.{to_status}": 1}
+        if from_status:
+            increments[f"status_counts.{from_status}"] = -1
+
+        # First response from the employer: add to the average response time
+        if to_status in RESPONDED_STATUSES and from_status not in RESPONDED_STATUSES and applied_at:
+            elapsed = (changed_at or datetime.utcnow()) - applied_at
+            increments["response_days_total"] = elapsed.total_seconds() / 86400
+            increments["response_count"] = 1
+
+        await self._increment(db, user_id, increments)
+
+    async def _increment(self, db, user_id: str, increments: Dict[str, Any]):
+        # No upsert: a user without a stats document gets a full recount on first read
+        try:
+            await db[self.COLLECTION].update_one(
+                {"_id": user_id},
+                {"$inc": increments, "$set": {"updated_at": datetime.utcnow()}}
+            )
+        except Exception as e:
+            # Counters self-heal at the next recount, so never fail the write that triggered this
+            logger.warning("Failed to update dashboard stats", user_id=user_id, error=str(e))
+
+    @staticmethod
+    def summary(stats: Dict[str, Any]) -> Dict[str, int]:
+        """Preview / queue / completed counts for the dashboard header"""
+        counts = stats.get("status_counts", {})
+        return {
+            "preview": sum(counts.get(status, 0) for status in PREVIEW_STATUSES),
+            "queue": sum(counts.get(status, 0) for status in QUEUE_STATUSES),
+            "completed": sum(counts.get(status, 0) for status in APPLIED_STATUSES)
+        }
+
+    @staticmethod
+    def application_stats(stats: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, int]:
+        """Totals, weekly/monthly volume and response figures"""
+        counts = stats.get("status_counts", {})
+        by_day = stats.get("created_by_day", {})
+        today = (now or datetime.utcnow()).date()
+
+        def created_since(days: int) -> int:
+            start = (today - timedelta(days=days - 1)).strftime(DAY_FORMAT)
+            return sum(count for day, count in by_day.items() if day >= start)
+
+        applied_count = sum(counts.get(status, 0) for status in APPLIED_STATUSES)
+        responded_count = sum(counts.get(status, 0) for status in RESPONDED_STATUSES)
+        response_count = stats.get("response_count", 0)
+
+        return {
+            "totalApplications": sum(counts.values()),
+            "thisWeek": created_since(7),
+            "thisMonth": created_since(30),
+            "responseRate": int(responded_count / applied_count * 100) if applied_count > 0 else 0,
+            "averageResponseTime": int(stats.get("response_days_total", 0) / response_count) if response_count else 0
+        }
+
+
+# Global service instance
+dashboard_stats_service = DashboardStatsService(max_age_seconds=settings.DASHBOARD_STATS_MAX_AGE)
+
+# Export service
+__all__ = ["DashboardStatsService", "dashboard_stats_service"]
@@ -0,0 +1,188 @@
+"""
+Candidate generation for job matching
+Inverted index from normalized skills and title tokens to job IDs, used to pick the
+few jobs worth full (AI-assisted) matching for a user
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from app.core.config import settings
+from app.services.job_matcher import job_matching_engine
+from app.services.skill_index import SkillSynonymIndex
+
+logger = structlog.get_logger()
+
+
+class TermKind:
+    """Posting kinds in the job_terms index"""
+    REQUIRED = "required"    # Required skill
+    PREFERRED = "preferred"  # Preferred skill
+    TITLE = "title"          # Job title token
+
+
+_TITLE_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+# Title words that say nothing about the kind of work
+TITLE_STOPWORDS = frozenset({
+    "a", "an", "and", "at", "for", "in", "of", "on", "or", "the", "to", "with",
+    "i", "ii", "iii", "iv", "sr", "senior", "jr", "junior", "mid", "level",
+    "lead", "staff", "principal", "remote", "hybrid", "onsite", "contract",
+    "full", "part", "time", "position", "role"
+})
+
+
+class JobCandidateIndex:
+    """
+    Cheap overlap pre-filter in front of JobMatchingEngine
+    Jobs are indexed at ingestion as (kind, term) postings; a user's candidates are the
+    unmatched active jobs with the highest weighted overlap with their skills and
+    desired positions, capped at top-K.
+    """
+
+    WEIGHTS = {
+        TermKind.REQUIRED: 2.0,
+        TermKind.PREFERRED: 1.0,
+        TermKind.TITLE: 1.5
+    }
+
+    def __init__(self, skill_index: SkillSynonymIndex, max_age_days: int = 14):
+        self.skill_index = skill_index
+        self.max_age_days = max_age_days
+        # Set once job_terms has postings; until then (fresh upgrade, backfill not run
+        # yet) candidates come from the recent-jobs query
+        self._index_populated = False
+
+    def title_terms(self, title: Optional[str]) -> List[str]:
+        """Distinct informative lowercase tokens of a job title"""
+        terms = []
+        for token in _TITLE_TOKEN.findall((title or "").lower()):
+            token = token.rstrip(".")
+            if len(token) > 1 and token not in TITLE_STOPWORDS and token not in terms:
+                terms.append(token)
+        return terms
+
+    def skill_terms(self, skills: Iterable[str]) -> List[str]:
+        """Distinct canonical skill names"""
+        terms = []
+        for skill in skills or []:
+            if isinstance(skill, str) and skill.strip():
+                term = self.skill_index.normalize(skill)
+                if term not in terms:
+                    terms.append(term)
+        return terms
+
+    def job_terms(self, job: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """(kind, term) postings for a job"""
+        required = self.skill_terms(job.get("required_skills") or [])
+        preferred = [term for term in self.skill_terms(job.get("preferred_skills") or []) if term not in required]
+
+        return (
+            [(TermKind.REQUIRED, term) for term in required]
+            + [(TermKind.PREFERRED, term) for term in preferred]
+            + [(TermKind.TITLE, term) for term in self.title_terms(job.get("title"))]
+        )
+
+    def user_terms(self, user_profile: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+        """(skill terms, title terms) a user's candidates are scored against"""
+        skills = self.skill_terms(user_profile.get("skills") or [])
+
+        titles: List[str] = []
+        positions = (user_profile.get("preferences") or {}).get("desired_positions") or []
+        for position in positions:
+            for term in self.title_terms(position):
+                if term not in titles:
+                    titles.append(term)
+
+        return skills, titles
+
+    async def top_candidates(
+        self,
+        database: Any,
+        user_id: int,
+        user_profile: Dict[str, Any],
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Best-overlapping active jobs the user has not been matched to yet (job rows)"""
+        limit = limit or settings.MATCH_CANDIDATE_LIMIT
+        skills, titles = self.user_terms(user_profile)
+
+        if not skills and not titles:
+            # Nothing to score on: fall back to the most recent unmatched jobs
+            logger.info("No skills or desired positions for candidate scoring, using recent jobs",
+                       user_id=user_id)
+            return await self.recent_candidates(database, user_id, limit)
+
+        if not await self.index_populated(database):
+            logger.warning("Job term index is empty, using recent jobs until rebuild_job_term_index runs",
+                          user_id=user_id)
+            return await self.recent_candidates(database, user_id, limit)
+
+        query = f"""
+        SELECT j.*, c.candidate_score FROM (
+            SELECT jt.job_id, SUM(
+                CASE jt.kind
+                    WHEN '{TermKind.REQUIRED}' THEN CAST(:required_weight AS REAL)
+                    WHEN '{TermKind.PREFERRED}' THEN CAST(:preferred_weight AS REAL)
+                    ELSE CAST(:title_weight AS REAL)
+                END
+            ) AS candidate_score
+            FROM job_terms jt
+            WHERE (jt.kind IN ('{TermKind.REQUIRED}', '{TermKind.PREFERRED}') AND jt.term = ANY(:skills))
+               OR (jt.kind = '{TermKind.TITLE}' AND jt.term = ANY(:titles))
+            GROUP BY jt.job_id
+        ) c
+        JOIN jobs j ON j.id = c.job_id
+        WHERE j.is_active = true
+        AND j.posted_date > NOW() - INTERVAL '{self.max_age_days} days'
+        AND NOT EXISTS (
+            SELECT 1 FROM job_matches jm
+            WHERE jm.job_id = j.id AND jm.user_id = :user_id
+        )
+        ORDER BY c.candidate_score DESC, j.posted_date DESC
+        LIMIT :limit
+        """
+        values = {
+            "user_id": user_id,
+            "skills": skills,
+            "titles": titles,
+            "required_weight": self.WEIGHTS[TermKind.REQUIRED],
+            "preferred_weight": self.WEIGHTS[TermKind.PREFERRED],
+            "title_weight": self.WEIGHTS[TermKind.TITLE],
+            "limit": limit
+        }
+        results = await database.fetch_all(query, values)
+        return [dict(result) for result in results]
+
+    async def recent_candidates(self, database: Any, user_id: int, limit: int) -> List[Dict[str, Any]]:
+        """Most recent active jobs the user has not been matched to yet (job rows)"""
+        query = f"""
+        SELECT j.* FROM jobs j
+        WHERE j.is_active = true
+        AND j.posted_date > NOW() - INTERVAL '{self.max_age_days} days'
+        AND NOT EXISTS (
+            SELECT 1 FROM job_matches jm
+            WHERE jm.job_id = j.id AND jm.user_id = :user_id
+        )
+        ORDER BY j.posted_date DESC
+        LIMIT :limit
+        """
+        results = await database.fetch_all(query, {"user_id": user_id, "limit": limit})
+        return [dict(result) for result in results]
+
+    async def index_populated(self, database: Any) -> bool:
+        """Whether job_terms has any postings (checked until it does, then remembered)"""
+        if not self._index_populated:
+            self._index_populated = bool(await database.fetch_val("SELECT EXISTS (SELECT 1 FROM job_terms)"))
+        return self._index_populated
+
+
+# Global candidate index; shares the matcher's synonym index so postings and match
+# scoring agree on skill names
+job_candidate_index = JobCandidateIndex(job_matching_engine.skill_index)
+
+
+# Export public interfaces
+__all__ = ["JobCandidateIndex", "TermKind", "TITLE_STOPWORDS", "job_candidate_index"]
@@ -5,12 +5,22 @@ Efficiently fetch and process job listings from LinkedIn, Indeed, Glassdoor
 
 import httpx
 import asyncio
+import time
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
 import hashlib
+from app.core.cache import create_search_cache
 from app.core.config import settings
+from app.core.http_client import http_client_pool
 from app.core.monitoring import performance_monitor
+from app.services.keyword_extractor import (
+    job_keyword_extractor,
+    KeywordCategory,
+    SKILL_KEYWORDS,
+    BENEFIT_KEYWORDS,
+    EDUCATION_KEYWORDS
+)
 import structlog
 
 logger = structlog.get_logger()
@@ -30,6 +40,60 @@ class JobSource:
     ALL = "all"
 
 
+class AdaptiveTokenBucket:
+    """
+    Token bucket for an upstream quota
+    On a 429 the refill rate is halved and the bucket paused for Retry-After;
+    each success restores the rate additively up to the configured quota.
+    """
+
+    def __init__(self, rate: float, capacity: int, min_rate: float = 0.1, recovery_step: float = 0.1):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.min_rate = min(min_rate, rate)
+        self.recovery_step = recovery_step
+        self.tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait for one token"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def backoff(self, retry_after: Optional[float] = None):
+        """Multiplicative decrease after a 429"""
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = 0.0
+        pause = retry_after if retry_after is not None else 1 / self.rate
+        self._paused_until = max(self._paused_until, time.monotonic() + pause)
+
+    def recover(self):
+        """Additive increase after a successful request"""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.recovery_step * self.max_rate)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
 class JobFetcher:
     """Handles job fetching from JSearch API with intelligent processing"""
     
@@ -39,8 +103,13 @@ class JobFetcher:
             "X-RapidAPI-Key": settings.JSEARCH_API_KEY,
             "X-RapidAPI-Host": "jsearch.p.rapidapi.com"
         }
-        self.cache = {}  # Simple in-memory cache
-        self.cache_ttl = settings.JOB_CACHE_TTL
+        self.cache = create_search_cache("job_search")
+        self.prefetch_pages = max(1, settings.JOB_SEARCH_PREFETCH_PAGES)
+        self.max_retries = settings.JSEARCH_MAX_RETRIES
+        self.rate_limiter = AdaptiveTokenBucket(
+            rate=settings.JSEARCH_RATE_LIMIT_PER_SECOND,
+            capacity=settings.JSEARCH_RATE_LIMIT_BURST
+        )
     
     async def search_jobs(
         self,
@@ -59,80 +128,116 @@ class JobFetcher:
     ) -> Dict[str, Any]:
         """
         Search for jobs with comprehensive filtering options
+        Results come from the shared search cache; concurrent identical searches share
+        one upstream call and stale results are served while they are refreshed
         """
         
-        # Create cache key
-        cache_key = self._generate_cache_key(locals())
-        cached_result = self._get_from_cache(cache_key)
-        if cached_result:
-            logger.info("Returning cached job search results", query=query)
-            return cached_result
+        search_args = {k: v for k, v in locals().items() if k != "self"}
+        cache_key = self._generate_cache_key(search_args)
+        return await self.cache.get_or_fetch(
+            cache_key,
+            lambda: self._search_jobs_uncached(**search_args)
+        )
+    
+    async def _search_jobs_uncached(
+        self,
+        query: str,
+        location: str,
+        remote_only: bool,
+        page: int,
+        num_pages: int,
+        date_posted: str,
+        employment_types: List[str],
+        job_requirements: List[str],
+        company_types: List[str],
+        radius: int,
+        salary_min: Optional[int],
+        salary_max: Optional[int]
+    ) -> Dict[str, Any]:
+        """Fetch and normalize search result pages from JSearch"""
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                all_jobs = []
-                total_processed = 0
-                
-                for current_page in range(1, num_pages + 1):
-                    logger.info(f"Fetching jobs page {current_page}", query=query, page=current_page)
-                    
-                    # Build search parameters
+            all_jobs = []
+            total_processed = 0
+            current_page = 0
+            page_size = None
+            downloads: Dict[int, asyncio.Task] = {}
+            next_page = 1
+
+            def schedule_downloads(in_hand: int = 0):
+                # Keep up to prefetch_pages requests in flight, but never more pages
+                # than are still needed to reach MAX_JOBS_PER_SEARCH; in_hand counts
+                # jobs of the current page that are not yet processed
+                nonlocal next_page
+                remaining = settings.MAX_JOBS_PER_SEARCH - total_processed - in_hand
+                if remaining <= 0:
+                    return
+                pages_needed = -(-remaining // page_size) if page_size else num_pages
+                last_page = min(num_pages, current_page + pages_needed)
+                while next_page <= last_page and len(downloads) < self.prefetch_pages:
                     params = self._build_search_params(
-                        query, location, remote_only, current_page,
+                        query, location, remote_only, next_page,
                         date_posted, employment_types, job_requirements,
                         company_types, radius, salary_min, salary_max
                     )
-                    
-                    # Make API request
-                    response = await client.get(
-                        f"{self.base_url}/search",
-                        headers=self.headers,
-                        params=params
-                    )
-                    response.raise_for_status()
-                    
-                    data = response.json()
-                    
+                    downloads[next_page] = asyncio.create_task(self._fetch_search_page(params))
+                    next_page += 1
+
+            try:
+                schedule_downloads()
+
+                while current_page + 1 in downloads:
+                    current_page += 1
+                    logger.info(f"Fetching jobs page {current_page}", query=query, page=current_page)
+                    data = await downloads.pop(current_page)
+
                     if not data.get("status") == "OK":
                         logger.error("JSearch API error", error=data.get("error"))
                         break
-                    
-                    # Process jobs from this page
+
                     page_jobs = data.get("data", [])
+                    if len(page_jobs) == 0:
+                        break
+                    page_size = page_size or len(page_jobs)
+
+                    # Start the next download before normalizing this page so the two overlap
+                    schedule_downloads(in_hand=len(page_jobs))
+
                     processed_jobs = await self._process_job_listings(page_jobs)
                     all_jobs.extend(processed_jobs)
                     total_processed += len(processed_jobs)
-                    
-                    # Check if we have more pages
-                    if len(page_jobs) == 0 or total_processed >= settings.MAX_JOBS_PER_SEARCH:
+
+                    if total_processed >= settings.MAX_JOBS_PER_SEARCH:
                         break
-                    
-                    # Rate limiting - small delay between requests
-                    await asyncio.sleep(0.5)
-                
-                result = {
-                    "success": True,
-                    "jobs": all_jobs,
-                    "total_count": total_processed,
-                    "search_params": {
-                        "query": query,
-                        "location": location,
-                        "remote_only": remote_only,
-                        "pages_fetched": current_page
-                    },
-                    "fetched_at": datetime.utcnow().isoformat()
-                }
-                
-                # Cache the result
-                self._store_in_cache(cache_key, result)
-                
-                logger.info("Job search completed", 
-                          query=query, 
-                          total_jobs=total_processed, 
-                          pages=current_page)
-                
-                return result
-                
+
+                    schedule_downloads()
+            finally:
+                # Early stop: drop prefetched pages that are no longer needed
+                for task in downloads.values():
+                    task.cancel()
+                if downloads:
+                    await asyncio.gather(*downloads.values(), return_exceptions=True)
+
+            result = {
+                "success": True,
+                "jobs": all_jobs,
+                "total_count": total_processed,
+                "search_params": {
+                    "query": query,
+                    "location": location,
+                    "remote_only": remote_only,
+                    "pages_fetched": current_page
+                },
+                "fetched_at": datetime.utcnow().isoformat()
+            }
+
+            logger.info("Job search completed",
+                      query=query,
+                      total_jobs=total_processed,
+                      pages=current_page)
+
+            return result
+
         except httpx.HTTPStatusError as e:
             logger.error("JSearch API HTTP error", 
                         status_code=e.response.status_code,
@@ -142,6 +247,31 @@ class JobFetcher:
             logger.error("Job search error", error=str(e))
             raise JobFetcherError(f"Job search failed: {str(e)}")
     
+    async def _fetch_search_page(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one search page under the JSearch rate limit, backing off on 429"""
+
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire()
+
+            response = await http_client_pool.get(
+                f"{self.base_url}/search",
+                headers=self.headers,
+                params=params
+            )
+
+            if response.status_code == 429 and attempt < self.max_retries:
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                self.rate_limiter.backoff(retry_after)
+                logger.warning("JSearch rate limited, backing off",
+                              page=params.get("page"),
+                              attempt=attempt + 1,
+                              rate=self.rate_limiter.rate)
+                continue
+
+            response.raise_for_status()
+            self.rate_limiter.recover()
+            return response.json()
+
     def _build_search_params(
         self,
         query: str,
@@ -200,6 +330,8 @@ class JobFetcher:
         processed_jobs = []
         
         for job_data in raw_jobs:
+            # Yield so prefetched page downloads progress while this page is normalized
+            await asyncio.sleep(0)
             try:
                 processed_job = await self._normalize_job_data(job_data)
                 if processed_job and self._is_valid_job(processed_job):
@@ -298,24 +430,8 @@ class JobFetcher:
         if not description:
             return []
         
-        # Common technical skills to look for
-        common_skills = [
-            "Python", "Java", "JavaScript", "React", "Node.js", "SQL", "AWS", "Docker",
-            "Kubernetes", "Git", "HTML", "CSS", "TypeScript", "C++", "C#", "Ruby",
-            "Go", "Rust", "PHP", "Swift", "Kotlin", "Flutter", "Django", "Flask",
-            "Express", "Spring", "Angular", "Vue.js", "MongoDB", "PostgreSQL",
-            "Redis", "GraphQL", "REST", "API", "Microservices", "DevOps", "CI/CD",
-            "Machine Learning", "Data Science", "AI", "TensorFlow", "PyTorch"
-        ]
-        
-        found_skills = []
-        description_lower = description.lower()
-        
-        for skill in common_skills:
-            if skill.lower() in description_lower:
-                found_skills.append(skill)
-        
-        return found_skills
+        found = job_keyword_extractor.scan(description).found(KeywordCategory.SKILLS)
+        return [skill for skill in SKILL_KEYWORDS if skill in found]
     
     def _normalize_employment_type(self, raw_type: str) -> str:
         """Normalize employment type"""
@@ -365,31 +481,19 @@ class JobFetcher:
         if not description:
             return []
         
-        benefits_keywords = [
-            "health insurance", "dental", "vision", "401k", "retirement",
-            "vacation", "pto", "remote work", "flexible hours", "stock options",
-            "bonus", "gym", "wellness", "education", "tuition", "parental leave"
-        ]
-        
-        found_benefits = []
-        description_lower = description.lower()
-        
-        for benefit in benefits_keywords:
-            if benefit in description_lower:
-                found_benefits.append(benefit.title())
-        
-        return found_benefits
+        found = job_keyword_extractor.scan(description).found(KeywordCategory.BENEFITS)
+        return [benefit.title() for benefit in BENEFIT_KEYWORDS if benefit in found]
     
     async def _extract_experience_level(self, description: str) -> str:
         """Extract experience level requirements"""
         if not description:
             return "mid-level"
         
-        description_lower = description.lower()
+        matches = job_keyword_extractor.scan(description)
         
-        if any(word in description_lower for word in ["entry", "junior", "0-2 years", "new grad"]):
+        if matches.has_any(KeywordCategory.ENTRY_LEVEL):
             return "entry-level"
-        elif any(word in description_lower for word in ["senior", "lead", "5+ years", "7+ years"]):
+        elif matches.has_any(KeywordCategory.SENIOR_LEVEL):
             return "senior-level"
         else:
             return "mid-level"
@@ -399,18 +503,13 @@ class JobFetcher:
         if not description:
             return "bachelor"
         
-        description_lower = description.lower()
+        matches = job_keyword_extractor.scan(description)
         
-        if "phd" in description_lower or "doctorate" in description_lower:
-            return "doctorate"
-        elif "master" in description_lower or "mba" in description_lower:
-            return "masters"
-        elif "bachelor" in description_lower or "bs" in description_lower or "ba" in description_lower:
-            return "bachelor"
-        elif "associate" in description_lower:
-            return "associate"
-        else:
-            return "bachelor"  # Default assumption
+        for level in EDUCATION_KEYWORDS:
+            if matches.has_any(KeywordCategory.education(level)):
+                return level
+        
+        return "bachelor"  # Default assumption
     
     def _is_valid_job(self, job: Dict[str, Any]) -> bool:
         """Validate job data quality"""
@@ -423,16 +522,8 @@ class JobFetcher:
                 return False
         
         # Filter out spam/scam indicators
-        spam_indicators = [
-            "work from home", "make money fast", "no experience required",
-            "earn $", "guaranteed income", "pyramid", "mlm"
-        ]
-        
-        title_lower = job["title"].lower()
-        desc_lower = job["description"].lower()
-        
-        for indicator in spam_indicators:
-            if indicator in title_lower or indicator in desc_lower:
+        for text in (job["title"], job["description"]):
+            if job_keyword_extractor.scan(text).has_any(KeywordCategory.SPAM):
                 return False
         
         return True
@@ -444,55 +535,30 @@ class JobFetcher:
         param_string = json.dumps(clean_params, sort_keys=True)
         return hashlib.md5(param_string.encode()).hexdigest()
     
-    def _get_from_cache(self, key: str) -> Optional[Dict[str, Any]]:
-        """Get result from cache if not expired"""
-        if key in self.cache:
-            cached_data = self.cache[key]
-            if datetime.utcnow() - cached_data["cached_at"] < timedelta(seconds=self.cache_ttl):
-                return cached_data["data"]
-            else:
-                # Remove expired entry
-                del self.cache[key]
-        return None
-    
-    def _store_in_cache(self, key: str, data: Dict[str, Any]):
-        """Store result in cache with timestamp"""
-        self.cache[key] = {
-            "data": data,
-            "cached_at": datetime.utcnow()
-        }
-        
-        # Simple cache cleanup - keep only last 100 entries
-        if len(self.cache) > 100:
-            oldest_key = min(self.cache.keys(), 
-                           key=lambda k: self.cache[k]["cached_at"])
-            del self.cache[oldest_key]
-    
     async def get_job_details(self, job_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific job"""
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/job-details",
-                    headers=self.headers,
-                    params={"job_id": job_id}
-                )
-                response.raise_for_status()
+            response = await http_client_pool.get(
+                f"{self.base_url}/job-details",
+                headers=self.headers,
+                params={"job_id": job_id}
+            )
+            response.raise_for_status()
                 
-                data = response.json()
+            data = response.json()
                 
-                if data.get("status") == "OK" and data.get("data"):
-                    job_details = await self._normalize_job_data(data["data"][0])
-                    return {
-                        "success": True,
-                        "job": job_details
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": "Job not found or API error"
-                    }
+            if data.get("status") == "OK" and data.get("data"):
+                job_details = await self._normalize_job_data(data["data"][0])
+                return {
+                    "success": True,
+                    "job": job_details
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": "Job not found or API error"
+                }
                     
         except Exception as e:
             logger.error("Job details fetch error", job_id=job_id, error=str(e))
@@ -11,10 +11,18 @@ import math
 from dataclasses import dataclass
 from enum import Enum
 
-from app.ai.models import ai_model_manager, generate_job_match_analysis
+from app.ai.models import ai_model_manager, generate_job_match_analysis, ModelTier
 from app.ai.prompts import AIPrompts, PromptType
+from app.core.config import settings
 from app.core.monitoring import performance_monitor
 from app.models.database import MatchRecommendation
+from app.services.keyword_extractor import (
+    job_keyword_extractor,
+    KeywordCategory,
+    CULTURE_INDICATORS,
+    RED_FLAG_PATTERNS
+)
+from app.services.skill_index import SkillSynonymIndex
 import structlog
 
 logger = structlog.get_logger()
@@ -27,6 +35,14 @@ class MatchingStrategy(Enum):
     HYBRID = "hybrid"              # AI + algorithmic combined
 
 
+class CascadeStage:
+    """Stage of the hybrid matching cascade that decided a match"""
+    REJECTED = "rejected"  # Algorithmic score below the reject threshold, no LLM call
+    CHEAP = "cheap"        # Borderline score, checked with the cheap model tier
+    FULL = "full"          # Near the apply threshold, full model tier
+    FALLBACK = "fallback"  # LLM call failed, algorithmic result kept
+
+
 @dataclass
 class MatchingWeights:
     """Configurable weights for matching criteria"""
@@ -38,13 +54,44 @@ class MatchingWeights:
     culture: float = 0.05
 
 
+# Years of experience expected for each normalized experience level
+EXPERIENCE_LEVEL_YEARS: Dict[str, Tuple[float, float]] = {
+    "entry-level": (0, 2),
+    "mid-level": (2, 5),
+    "senior-level": (5, float('inf'))
+}
+
+# Education level hierarchy
+EDUCATION_LEVELS: Dict[str, int] = {
+    "high_school": 1,
+    "associate": 2,
+    "bachelor": 3,
+    "masters": 4,
+    "doctorate": 5
+}
+
 class JobMatchingEngine:
     """Advanced job matching engine with AI and algorithmic approaches"""
     
     def __init__(self):
         self.default_weights = MatchingWeights()
-        self.skill_synonyms = self._load_skill_synonyms()
+        self.skill_index = SkillSynonymIndex(
+            self._load_skill_synonyms(),
+            data_file=settings.SKILL_SYNONYMS_FILE,
+            reload_interval=settings.SKILL_SYNONYMS_RELOAD_INTERVAL
+        )
         self.title_hierarchies = self._load_title_hierarchies()
+        self.cascade_counts: Dict[str, int] = {
+            CascadeStage.REJECTED: 0,
+            CascadeStage.CHEAP: 0,
+            CascadeStage.FULL: 0,
+            CascadeStage.FALLBACK: 0
+        }
+    
+    @property
+    def skill_synonyms(self) -> Dict[str, List[str]]:
+        """Synonym table currently compiled into the skill index"""
+        return self.skill_index.synonyms
     
     async def match_job_to_user(
         self,
@@ -59,6 +106,7 @@ class JobMatchingEngine:
         """
         
         start_time = datetime.utcnow()
+        self.skill_index.maybe_reload()
         
         try:
             if strategy == MatchingStrategy.AI_POWERED:
@@ -146,6 +194,17 @@ class JobMatchingEngine:
         # Calculate individual scores
         scores = await self._calculate_algorithmic_scores(job_data, user_profile)
         
+        return self._assemble_algorithmic_result(job_data, user_profile, scores)
+    
+    def _assemble_algorithmic_result(
+        self,
+        job_data: Dict[str, Any],
+        user_profile: Dict[str, Any],
+        scores: Dict[str, Dict[str, Any]],
+        description_red_flags: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Build the algorithmic match result from per-category scores"""
+        
         # Calculate overall score
         weights = self.default_weights
         overall_score = (
@@ -175,7 +234,7 @@ class JobMatchingEngine:
             "apply_priority": self._calculate_priority(overall_score),
             "success_probability": success_probability,
             "improvement_suggestions": suggestions,
-            "red_flags": self._identify_red_flags(job_data, scores),
+            "red_flags": self._identify_red_flags(job_data, scores, description_red_flags),
             "competitive_advantage": self._identify_competitive_advantage(scores, user_profile)
         }
     
@@ -187,6 +246,9 @@ class JobMatchingEngine:
     ) -> Dict[str, Any]:
         """Combine AI and algorithmic approaches for best accuracy"""
         
+        if settings.MATCH_CASCADE_ENABLED:
+            return await self._cascade_matching(job_data, user_profile, user_tier)
+        
         logger.info("Running hybrid job matching", 
                    job_id=job_data.get("external_id"))
         
@@ -224,6 +286,75 @@ class JobMatchingEngine:
                 "recommendation": MatchRecommendation.WEAK_MATCH.value
             }
     
+    async def _cascade_matching(
+        self,
+        job_data: Dict[str, Any],
+        user_profile: Dict[str, Any],
+        user_tier: str
+    ) -> Dict[str, Any]:
+        """
+        Hybrid matching as a cascade: algorithmic score first, LLM only where it can matter
+        Clear mismatches never reach the LLM, borderline ones get the cheap tier, and only
+        matches near the apply threshold pay for the full tier.
+        """
+        
+        algo_result = await self._algorithmic_matching(job_data, user_profile)
+        algo_score = algo_result.get("overall_score", 0)
+        
+        if algo_score < settings.MATCH_CASCADE_REJECT_SCORE:
+            return self._finish_cascade(algo_result, CascadeStage.REJECTED)
+        
+        if algo_score < settings.MATCH_CASCADE_ESCALATE_SCORE:
+            stage, model_tier, complexity = CascadeStage.CHEAP, ModelTier.CHEAP, "medium"
+        else:
+            stage, model_tier, complexity = CascadeStage.FULL, None, "high"
+        
+        logger.info("Escalating job match to AI analysis",
+                   job_id=job_data.get("external_id"),
+                   algorithmic_score=algo_score,
+                   stage=stage)
+        
+        try:
+            ai_result = await generate_job_match_analysis(
+                job_data, user_profile, user_tier, model_tier=model_tier, complexity=complexity
+            )
+        except Exception as e:
+            ai_result = {"success": False, "error": str(e)}
+        
+        if not ai_result.get("success"):
+            logger.warning("AI matching failed in cascade, keeping algorithmic result",
+                          stage=stage, error=ai_result.get("error"))
+            return self._finish_cascade(algo_result, CascadeStage.FALLBACK)
+        
+        enhanced_result = self._merge_ai_and_algorithmic_results(
+            ai_result["analysis"], algo_result["category_scores"]
+        )
+        ai_match = {
+            "success": True,
+            "source": "ai_powered",
+            **enhanced_result,
+            "ai_metadata": ai_result.get("metadata", {})
+        }
+        return self._finish_cascade(self._combine_hybrid_results(ai_match, algo_result), stage)
+    
+    def _finish_cascade(self, result: Dict[str, Any], stage: str) -> Dict[str, Any]:
+        self.cascade_counts[stage] += 1
+        performance_monitor.record_match_cascade_stage(stage)
+        result["cascade_stage"] = stage
+        return result
+    
+    def cascade_stats(self) -> Dict[str, Any]:
+        """Share of cascade matches decided at each stage since startup"""
+        total = sum(self.cascade_counts.values())
+        return {
+            "total": total,
+            "stages": {
+                stage: {"count": count, "rate": count / total if total else 0.0}
+                for stage, count in self.cascade_counts.items()
+            },
+            "llm_call_rate": (total - self.cascade_counts[CascadeStage.REJECTED]) / total if total else 0.0
+        }
+    
     async def _calculate_algorithmic_scores(
         self,
         job_data: Dict[str, Any],
@@ -277,20 +408,24 @@ class JobMatchingEngine:
                 "details": "No specific skills requirements found"
             }
         
-        # Normalize skills for comparison
-        required_normalized = [self._normalize_skill(skill) for skill in required_skills]
-        preferred_normalized = [self._normalize_skill(skill) for skill in preferred_skills]
-        user_normalized = [self._normalize_skill(skill) for skill in user_skills]
+        # Map skills to canonical IDs for comparison
+        required_ids = self.skill_index.skill_ids(required_skills)
+        required_set = set(required_ids)
+        preferred_set = set(self.skill_index.skill_ids(preferred_skills)) - required_set
+        user_ids = self.skill_index.skill_ids(user_skills)
+        user_set = set(user_ids)
         
         # Find matches
-        matched_required = []
-        matched_preferred = []
-        
-        for user_skill in user_normalized:
-            if user_skill in required_normalized:
-                matched_required.append(user_skill)
-            elif user_skill in preferred_normalized:
-                matched_preferred.append(user_skill)
+        # Names come from the user's own skills: a free-text ID may be evicted by a
+        # concurrent request before it could be looked up again
+        matched_required = [
+            self.skill_index.normalize(skill) for skill, skill_id in zip(user_skills, user_ids)
+            if skill_id in required_set
+        ]
+        matched_preferred = [
+            self.skill_index.normalize(skill) for skill, skill_id in zip(user_skills, user_ids)
+            if skill_id in preferred_set
+        ]
         
         # Calculate score
         if required_skills:
@@ -309,8 +444,8 @@ class JobMatchingEngine:
         total_score = min(base_score + bonus_score, 100)
         
         # Missing skills
-        missing_required = [skill for skill in required_skills 
-                          if self._normalize_skill(skill) not in user_normalized]
+        missing_required = [skill for skill, skill_id in zip(required_skills, required_ids)
+                          if skill_id not in user_set]
         
         return {
             "score": round(total_score, 1),
@@ -330,14 +465,7 @@ class JobMatchingEngine:
         job_experience_level = job_data.get("experience_level", "mid-level")
         user_experience_years = user_profile.get("experience_years", 0)
         
-        # Experience level mappings
-        level_years = {
-            "entry-level": (0, 2),
-            "mid-level": (2, 5),
-            "senior-level": (5, float('inf'))
-        }
-        
-        min_years, max_years = level_years.get(job_experience_level, (2, 5))
+        min_years, max_years = EXPERIENCE_LEVEL_YEARS.get(job_experience_level, (2, 5))
         
         # Calculate score based on experience alignment
         if min_years <= user_experience_years <= max_years:
@@ -379,15 +507,7 @@ class JobMatchingEngine:
                 "details": "No education information provided"
             }
         
-        # Education level hierarchy
-        education_levels = {
-            "high_school": 1,
-            "associate": 2,
-            "bachelor": 3,
-            "masters": 4,
-            "doctorate": 5
-        }
-        
+        education_levels = EDUCATION_LEVELS
         required_level = education_levels.get(required_education, 3)
         
         # Get highest user education level
@@ -554,27 +674,10 @@ class JobMatchingEngine:
     ) -> Dict[str, Any]:
         """Calculate culture fit score"""
         
-        # Extract culture indicators from job description
-        job_description = job_data.get("description", "").lower()
-        company_data = job_data.get("company", {})
         user_preferences = user_profile.get("preferences", {})
         
-        # Culture keywords and their weights
-        culture_indicators = {
-            "innovation": ["innovative", "cutting-edge", "disruptive", "technology"],
-            "collaboration": ["team", "collaborative", "together", "partnership"],
-            "flexibility": ["flexible", "work-life balance", "remote", "hybrid"],
-            "growth": ["growth", "learning", "development", "career"],
-            "diversity": ["diverse", "inclusive", "equality", "belonging"],
-            "entrepreneurial": ["startup", "entrepreneurial", "fast-paced", "agile"],
-            "stability": ["stable", "established", "enterprise", "mature"]
-        }
-        
         # Find culture matches
-        job_culture_scores = {}
-        for culture_type, keywords in culture_indicators.items():
-            score = sum(1 for keyword in keywords if keyword in job_description)
-            job_culture_scores[culture_type] = score
+        job_culture_scores = self._extract_culture_signals(job_data)
         
         # User culture preferences (would be collected during onboarding)
         user_culture_prefs = user_preferences.get("culture_preferences", {})
@@ -613,16 +716,22 @@ class JobMatchingEngine:
             "culture_match_details": job_culture_scores
         }
     
+    def _extract_culture_signals(self, job_data: Dict[str, Any]) -> Dict[str, int]:
+        """Count culture keywords present per culture type in the job description"""
+        matches = job_keyword_extractor.scan(job_data.get("description", ""))
+        
+        return {
+            culture_type: len(matches.found(KeywordCategory.culture(culture_type)))
+            for culture_type in CULTURE_INDICATORS
+        }
+    
     def _normalize_skill(self, skill: str) -> str:
         """Normalize skill name for comparison"""
-        skill_lower = skill.lower().strip()
-        
-        # Check for synonyms
-        for canonical, synonyms in self.skill_synonyms.items():
-            if skill_lower in synonyms:
-                return canonical
-        
-        return skill_lower
+        return self.skill_index.normalize(skill)
+    
+    def _skill_id(self, skill: str) -> int:
+        """Interned integer ID of the canonical skill"""
+        return self.skill_index.skill_id(skill)
     
     def _load_skill_synonyms(self) -> Dict[str, List[str]]:
         """Load skill synonyms mapping"""
@@ -731,28 +840,15 @@ class JobMatchingEngine:
     def _identify_red_flags(
         self,
         job_data: Dict[str, Any],
-        scores: Dict[str, Dict[str, Any]]
+        scores: Dict[str, Dict[str, Any]],
+        description_red_flags: Optional[List[str]] = None
     ) -> List[str]:
         """Identify potential red flags in the job posting"""
         
-        red_flags = []
-        
-        job_description = job_data.get("description", "").lower()
-        
-        # Common red flag indicators
-        red_flag_patterns = [
-            "no experience necessary",
-            "make money fast",
-            "work from home opportunity",
-            "earn up to",
-            "unlimited earning potential",
-            "pyramid",
-            "mlm"
-        ]
+        if description_red_flags is None:
+            description_red_flags = self._identify_description_red_flags(job_data)
         
-        for pattern in red_flag_patterns:
-            if pattern in job_description:
-                red_flags.append(f"Potential scam indicator: '{pattern}'")
+        red_flags = list(description_red_flags)
         
         # Salary red flags
         salary_data = scores["salary"]
@@ -761,6 +857,17 @@ class JobMatchingEngine:
         
         return red_flags
     
+    def _identify_description_red_flags(self, job_data: Dict[str, Any]) -> List[str]:
+        """Red flags that depend only on the job description"""
+        
+        found = job_keyword_extractor.scan(job_data.get("description", "")).found(KeywordCategory.RED_FLAGS)
+        
+        return [
+            f"Potential scam indicator: '{pattern}'"
+            for pattern in RED_FLAG_PATTERNS
+            if pattern in found
+        ]
+    
     def _identify_competitive_advantage(
         self,
         scores: Dict[str, Dict[str, Any]],
@@ -862,6 +969,17 @@ class JobMatchingEngine:
         
         logger.info(f"Starting batch job matching for {len(jobs)} jobs")
         
+        # Pure algorithmic scoring needs no per-job coroutines
+        if strategy == MatchingStrategy.ALGORITHMIC:
+            try:
+                results = await self.batch_match_users(jobs, [user_profile], user_tier=user_tier)
+                return results[0]
+            except Exception as e:
+                # One malformed job fails the whole vectorized batch; match jobs one by
+                # one instead so only the bad job is dropped
+                logger.warning("Vectorized batch matching failed, matching jobs individually",
+                              jobs=len(jobs), error=str(e))
+        
         # Create matching tasks
         tasks = []
         for job in jobs:
@@ -887,6 +1005,48 @@ class JobMatchingEngine:
         logger.info(f"Completed batch matching: {len(successful_results)} successful matches")
         
         return successful_results
+    
+    async def batch_match_users(
+        self,
+        jobs: List[Dict[str, Any]],
+        user_profiles: List[Dict[str, Any]],
+        min_score: Optional[float] = None,
+        user_tier: str = "free"
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Vectorized algorithmic matching of every job against every user profile
+        Returns one score-sorted result list per user profile, in input order
+        """
+        from app.services.batch_scoring import BatchScoringEngine
+        
+        start_time = datetime.utcnow()
+        self.skill_index.maybe_reload()
+        
+        results = BatchScoringEngine(self).match(jobs, user_profiles, min_score=min_score)
+        
+        processing_time = (datetime.utcnow() - start_time).total_seconds()
+        pair_count = max(len(jobs) * len(user_profiles), 1)
+        
+        for user_results in results:
+            for result in user_results:
+                result["metadata"] = {
+                    "processing_time_seconds": processing_time / pair_count,
+                    "strategy_used": MatchingStrategy.ALGORITHMIC.value,
+                    "matched_at": start_time.isoformat(),
+                    "user_tier": user_tier,
+                    "vectorized": True
+                }
+                performance_monitor.record_job_matching_accuracy(
+                    user_tier=user_tier,
+                    accuracy=result.get("overall_score", 0) / 100.0
+                )
+        
+        logger.info("Completed vectorized batch matching",
+                   jobs=len(jobs),
+                   users=len(user_profiles),
+                   processing_time_seconds=processing_time)
+        
+        return results
 
 
 # Global job matching engine instance
@@ -895,6 +1055,7 @@ job_matching_engine = JobMatchingEngine()
 
 # Export public interfaces
 __all__ = [
+    "CascadeStage",
     "JobMatchingEngine",
     "MatchingStrategy", 
     "MatchingWeights",
@@ -0,0 +1,224 @@
+"""
+Multi-pattern keyword extraction for job postings
+Tags every keyword category (skills, benefits, seniority, education, culture, spam)
+in a single scan of the text instead of one substring loop per category
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple, FrozenSet
+import structlog
+
+logger = structlog.get_logger()
+
+
+# Technical skills extracted from job descriptions (labels keep display casing)
+SKILL_KEYWORDS: List[str] = [
+    "Python", "Java", "JavaScript", "React", "Node.js", "SQL", "AWS", "Docker",
+    "Kubernetes", "Git", "HTML", "CSS", "TypeScript", "C++", "C#", "Ruby",
+    "Go", "Rust", "PHP", "Swift", "Kotlin", "Flutter", "Django", "Flask",
+    "Express", "Spring", "Angular", "Vue.js", "MongoDB", "PostgreSQL",
+    "Redis", "GraphQL", "REST", "API", "Microservices", "DevOps", "CI/CD",
+    "Machine Learning", "Data Science", "AI", "TensorFlow", "PyTorch"
+]
+
+BENEFIT_KEYWORDS: List[str] = [
+    "health insurance", "dental", "vision", "401k", "retirement",
+    "vacation", "pto", "remote work", "flexible hours", "stock options",
+    "bonus", "gym", "wellness", "education", "tuition", "parental leave"
+]
+
+ENTRY_LEVEL_KEYWORDS: List[str] = ["entry", "junior", "0-2 years", "new grad"]
+SENIOR_LEVEL_KEYWORDS: List[str] = ["senior", "lead", "5+ years", "7+ years"]
+
+# Checked in order, highest degree first
+EDUCATION_KEYWORDS: Dict[str, List[str]] = {
+    "doctorate": ["phd", "ph.d", "doctorate"],
+    "masters": ["master", "masters", "mba"],
+    "bachelor": ["bachelor", "bachelors", "bs", "ba"],
+    "associate": ["associate"]
+}
+
+SPAM_INDICATORS: List[str] = [
+    "work from home", "make money fast", "no experience required",
+    "earn $", "guaranteed income", "pyramid", "mlm"
+]
+
+# Culture keywords looked up in job descriptions
+CULTURE_INDICATORS: Dict[str, List[str]] = {
+    "innovation": ["innovative", "cutting-edge", "disruptive", "technology"],
+    "collaboration": ["team", "collaborative", "together", "partnership"],
+    "flexibility": ["flexible", "work-life balance", "remote", "hybrid"],
+    "growth": ["growth", "learning", "development", "career"],
+    "diversity": ["diverse", "inclusive", "equality", "belonging"],
+    "entrepreneurial": ["startup", "entrepreneurial", "fast-paced", "agile"],
+    "stability": ["stable", "established", "enterprise", "mature"]
+}
+
+# Common red flag indicators in job descriptions
+RED_FLAG_PATTERNS: List[str] = [
+    "no experience necessary",
+    "make money fast",
+    "work from home opportunity",
+    "earn up to",
+    "unlimited earning potential",
+    "pyramid",
+    "mlm"
+]
+
+
+class KeywordCategory:
+    """Category names produced by the job keyword extractor"""
+    SKILLS = "skills"
+    BENEFITS = "benefits"
+    ENTRY_LEVEL = "experience.entry"
+    SENIOR_LEVEL = "experience.senior"
+    SPAM = "spam"
+    RED_FLAGS = "red_flags"
+
+    @staticmethod
+    def education(level: str) -> str:
+        return f"education.{level}"
+
+    @staticmethod
+    def culture(culture_type: str) -> str:
+        return f"culture.{culture_type}"
+
+
+class KeywordMatches:
+    """Keywords found in a text, grouped by category"""
+
+    __slots__ = ("_found",)
+
+    def __init__(self, found: Dict[str, FrozenSet[str]]):
+        self._found = found
+
+    def found(self, category: str) -> FrozenSet[str]:
+        """Keyword labels of a category present in the text"""
+        return self._found.get(category, frozenset())
+
+    def has_any(self, category: str) -> bool:
+        return bool(self._found.get(category))
+
+
+_END = ""  # Trie terminal marker
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordAutomaton:
+    """
+    Compiled multi-pattern matcher
+    Keywords are folded into a prefix trie and compiled into one regex, so each text is
+    scanned once by the C regex engine. Every occurrence is reported, including keywords
+    that overlap or are prefixes of longer keywords. Matches must start on a word boundary;
+    whole-word categories must also end on one.
+    """
+
+    def __init__(self, categories: Dict[str, Tuple[List[str], bool]], cache_size: int = 2048):
+        """categories maps category name -> (keywords, whole_word)"""
+        self._trie: Dict[str, dict] = {}
+
+        for category, (keywords, whole_word) in categories.items():
+            for label in keywords:
+                node = self._trie
+                for char in label.lower():
+                    node = node.setdefault(char, {})
+                node.setdefault(_END, []).append((category, label, whole_word))
+
+        self._pattern = re.compile("(?=(" + self._compile_root() + "))")
+        self._terminal_offsets = lru_cache(maxsize=cache_size)(self._walk_terminals)
+        self.scan = lru_cache(maxsize=cache_size)(self._scan)
+
+    def _compile_root(self) -> str:
+        # Keywords starting with a word character must start on a word boundary
+        word_start = {char: child for char, child in self._trie.items() if _is_word_char(char)}
+        other_start = {char: child for char, child in self._trie.items() if not _is_word_char(char)}
+
+        alternatives = []
+        if word_start:
+            alternatives.append("(?<!\\w)" + self._compile_node(word_start))
+        if other_start:
+            alternatives.append(self._compile_node(other_start))
+        return "|".join(alternatives)
+
+    def _compile_node(self, node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + self._compile_node(child)
+            for char, child in sorted(node.items()) if char != _END
+        ]
+        if not branches:
+            return ""
+
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional suffix: the regex reports the longest keyword at each position
+        return "(?:" + body + ")?" if _END in node else body
+
+    def _scan(self, text: str) -> KeywordMatches:
+        if not text:
+            return KeywordMatches({})
+
+        text = text.lower()
+        text_length = len(text)
+        found: Dict[str, set] = {}
+
+        for match in self._pattern.finditer(text):
+            start = match.start()
+
+            for length, ends_in_word, terminals in self._terminal_offsets(match.group(1)):
+                end = start + length
+                word_continues = ends_in_word and end < text_length and _is_word_char(text[end])
+                for category, label, whole_word in terminals:
+                    if whole_word and word_continues:
+                        continue
+                    found.setdefault(category, set()).add(label)
+
+        return KeywordMatches({category: frozenset(labels) for category, labels in found.items()})
+
+    def _walk_terminals(self, longest: str) -> List[Tuple[int, bool, list]]:
+        """Every keyword that is a prefix of the longest match at a position also occurs there"""
+        node = self._trie
+        terminals = []
+        for offset, char in enumerate(longest):
+            node = node[char]
+            if _END in node:
+                terminals.append((offset + 1, _is_word_char(char), node[_END]))
+        return terminals
+
+
+def _build_job_keyword_extractor() -> KeywordAutomaton:
+    categories: Dict[str, Tuple[List[str], bool]] = {
+        KeywordCategory.SKILLS: (SKILL_KEYWORDS, True),
+        KeywordCategory.BENEFITS: (BENEFIT_KEYWORDS, False),
+        KeywordCategory.ENTRY_LEVEL: (ENTRY_LEVEL_KEYWORDS, True),
+        KeywordCategory.SENIOR_LEVEL: (SENIOR_LEVEL_KEYWORDS, True),
+        KeywordCategory.SPAM: (SPAM_INDICATORS, True),
+        KeywordCategory.RED_FLAGS: (RED_FLAG_PATTERNS, True),
+    }
+    for level, keywords in EDUCATION_KEYWORDS.items():
+        categories[KeywordCategory.education(level)] = (keywords, True)
+    for culture_type, keywords in CULTURE_INDICATORS.items():
+        # Culture keywords are stems ("team" should count "teams" and "teamwork")
+        categories[KeywordCategory.culture(culture_type)] = (keywords, False)
+
+    return KeywordAutomaton(categories)
+
+
+# Global keyword extractor shared by job ingestion and matching
+job_keyword_extractor = _build_job_keyword_extractor()
+
+
+# Export public interfaces
+__all__ = [
+    "KeywordAutomaton",
+    "KeywordCategory",
+    "KeywordMatches",
+    "job_keyword_extractor",
+    "SKILL_KEYWORDS",
+    "BENEFIT_KEYWORDS",
+    "EDUCATION_KEYWORDS",
+    "CULTURE_INDICATORS",
+    "RED_FLAG_PATTERNS"
+]
@@ -0,0 +1,184 @@
+"""
+Skill synonym index for job matching
+Compiles the synonym table into a hashed alias -> canonical lookup with interned integer IDs
+"""
+
+import json
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Iterable, Optional
+import structlog
+
+logger = structlog.get_logger()
+
+
+class SkillSynonymIndex:
+    """
+    O(1) skill normalization with stable integer skill IDs and hot reload from a data file
+    Canonical skills from the synonym table get permanent non-negative IDs; free-text skills
+    seen only in user and job input get negative IDs from a bounded LRU table
+    """
+
+    def __init__(
+        self,
+        default_synonyms: Dict[str, List[str]],
+        data_file: Optional[str] = None,
+        reload_interval: float = 60.0,
+        max_free_skills: int = 10000
+    ):
+        self.default_synonyms = default_synonyms
+        self.data_file = data_file
+        self.reload_interval = reload_interval
+        self.max_free_skills = max_free_skills
+
+        self._lock = threading.Lock()
+        self._skill_ids: Dict[str, int] = {}   # canonical name -> id, grows only with the synonym table
+        self._skill_names: List[str] = []      # id -> canonical name
+        self._alias_ids: Dict[str, int] = {}   # lowercased alias -> canonical id
+        self._free_ids: "OrderedDict[str, int]" = OrderedDict()  # free-text name -> negative id, LRU
+        self._free_names: Dict[int, str] = {}
+        self._next_free_id = -1
+        self._synonyms: Dict[str, List[str]] = {}
+        self._file_mtime: Optional[float] = None
+        self._last_check = 0.0
+
+        self.reload()
+
+    @property
+    def synonyms(self) -> Dict[str, List[str]]:
+        """Synonym table currently compiled into the index"""
+        return self._synonyms
+
+    def skill_id(self, skill: str) -> int:
+        """
+        Integer ID of the canonical form of a skill
+        Unknown skills get a transient negative ID that stays valid until it is among the
+        least recently used of max_free_skills free-text skills; IDs are never reused
+        """
+        skill_lower = skill.lower().strip()
+
+        skill_id = self._alias_ids.get(skill_lower)
+        if skill_id is None:
+            skill_id = self._skill_ids.get(skill_lower)
+            if skill_id is None:
+                skill_id = self._free_skill_id(skill_lower)
+        return skill_id
+
+    def skill_ids(self, skills: Iterable[str]) -> List[int]:
+        """Map a list of skills to IDs, preserving order and duplicates"""
+        return [self.skill_id(skill) for skill in skills]
+
+    def skill_name(self, skill_id: int) -> Optional[str]:
+        """Normalized skill name for an ID, None for a free-text ID that has been evicted"""
+        if skill_id < 0:
+            return self._free_names.get(skill_id)
+        return self._skill_names[skill_id]
+
+    def normalize(self, skill: str) -> str:
+        """Canonical lowercase skill name"""
+        skill_lower = skill.lower().strip()
+
+        skill_id = self._alias_ids.get(skill_lower)
+        if skill_id is None:
+            skill_id = self._skill_ids.get(skill_lower)
+            if skill_id is None:
+                return skill_lower
+        return self._skill_names[skill_id]
+
+    def maybe_reload(self) -> bool:
+        """Reload the data file if it changed, checking at most once per reload_interval"""
+        if not self.data_file:
+            return False
+
+        now = time.monotonic()
+        if now - self._last_check < self.reload_interval:
+            return False
+        self._last_check = now
+
+        try:
+            mtime = os.path.getmtime(self.data_file)
+        except OSError:
+            return False
+
+        if mtime == self._file_mtime:
+            return False
+
+        return self.reload()
+
+    def reload(self) -> bool:
+        """Recompile the index from the data file, falling back to the built-in table"""
+        synonyms = self.default_synonyms
+        mtime = None
+
+        if self.data_file:
+            try:
+                mtime = os.path.getmtime(self.data_file)
+                with open(self.data_file, "r", encoding="utf-8") as f:
+                    synonyms = json.load(f)
+                self._validate_synonyms(synonyms)
+            except (OSError, ValueError) as e:
+                mtime = None
+                logger.warning("Failed to load skill synonyms file, keeping current table",
+                              path=self.data_file, error=str(e))
+                if self._alias_ids:
+                    return False
+                synonyms = self.default_synonyms
+
+        with self._lock:
+            alias_ids: Dict[str, int] = {}
+            for canonical, aliases in synonyms.items():
+                canonical_id = self._intern_locked(canonical.lower().strip())
+                for alias in aliases:
+                    alias_ids.setdefault(alias.lower().strip(), canonical_id)
+
+            # Swap in atomically so concurrent readers never see a partial index
+            self._alias_ids = alias_ids
+            self._synonyms = synonyms
+            self._file_mtime = mtime
+
+        logger.info("Skill synonym index compiled",
+                   canonical_skills=len(synonyms),
+                   aliases=len(alias_ids),
+                   source=self.data_file if mtime is not None else "built-in")
+        return True
+
+    @staticmethod
+    def _validate_synonyms(synonyms: object) -> None:
+        """Reject data files that are not a {canonical: [alias, ...]} mapping of strings"""
+        if not isinstance(synonyms, dict):
+            raise ValueError("skill synonyms must be a JSON object")
+        for canonical, aliases in synonyms.items():
+            if not isinstance(aliases, list) or not all(isinstance(alias, str) for alias in aliases):
+                raise ValueError(f"aliases of '{canonical}' must be a list of strings")
+
+    def _free_skill_id(self, skill_lower: str) -> int:
+        # Lookup, insertion and eviction happen under one lock so concurrent requests
+        # never see a name without its ID or evict an entry that is being inserted
+        with self._lock:
+            skill_id = self._free_ids.get(skill_lower)
+            if skill_id is not None:
+                self._free_ids.move_to_end(skill_lower)
+                return skill_id
+
+            skill_id = self._next_free_id
+            self._next_free_id -= 1
+            self._free_ids[skill_lower] = skill_id
+            self._free_names[skill_id] = skill_lower
+            while len(self._free_ids) > self.max_free_skills:
+                _, evicted_id = self._free_ids.popitem(last=False)
+                del self._free_names[evicted_id]
+            return skill_id
+
+    def _intern_locked(self, skill_lower: str) -> int:
+        skill_id = self._skill_ids.get(skill_lower)
+        if skill_id is None:
+            skill_id = len(self._skill_names)
+            self._skill_names.append(skill_lower)
+            self._skill_ids[skill_lower] = skill_id
+        return skill_id
+
+
+# Export public interfaces
+__all__ = ["SkillSynonymIndex"]
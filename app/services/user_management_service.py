@@ -27,6 +27,9 @@ import structlog
 
 logger = structlog.get_logger()
 
+# user_queues statuses with a counter column in user_queue_stats
+QUEUE_STAT_STATUSES = ("queued", "processing", "completed", "failed", "skipped")
+
 
 class UserManagementService:
     """
@@ -49,6 +52,14 @@ class UserManagementService:
             self.logger.error("Failed to get user profile", user_id=user_id, error=str(e))
             return None
     
+    async def get_user_profiles(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Profiles for several users in one query, keyed by user_id"""
+        if not user_ids:
+            return {}
+        query = "SELECT * FROM user_profiles WHERE user_id = ANY(:user_ids)"
+        results = await database.fetch_all(query, {"user_ids": list(user_ids)})
+        return {result["user_id"]: dict(result) for result in results}
+    
     async def create_user_profile(self, user_id: str, profile_data: Dict[str, Any]) -> bool:
         """Create new user profile"""
         try:
@@ -136,6 +147,14 @@ class UserManagementService:
             self.logger.error("Failed to get search settings", user_id=user_id, error=str(e))
             return None
     
+    async def get_search_settings_for_users(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Search settings for several users in one query, keyed by user_id"""
+        if not user_ids:
+            return {}
+        query = "SELECT * FROM user_search_settings WHERE user_id = ANY(:user_ids)"
+        results = await database.fetch_all(query, {"user_ids": list(user_ids)})
+        return {result["user_id"]: dict(result) for result in results}
+    
     async def create_default_search_settings(self, user_id: str) -> bool:
         """Create default search settings for new user"""
         try:
@@ -343,6 +362,7 @@ class UserManagementService:
                 "job_id": queue_item.job_id,
                 "priority": queue_item.priority.value,
                 "job_data": json.dumps(queue_item.job_data),
+                "match_score": queue_item.job_data.get("match_score"),
                 "scheduled_for": queue_item.scheduled_for,
                 "user_notes": queue_item.user_notes,
                 "status": "queued"
@@ -350,15 +370,19 @@ class UserManagementService:
             
             query = """
                 INSERT INTO user_queues (
-                    user_id, job_id, priority, job_data, scheduled_for, user_notes, status
+                    user_id, job_id, priority, job_data, match_score, scheduled_for, user_notes, status
                 ) VALUES (
-                    :user_id, :job_id, :priority, :job_data, :scheduled_for, :user_notes, :status
+                    :user_id, :job_id, :priority, :job_data, :match_score, :scheduled_for, :user_notes, :status
                 )
                 RETURNING id
             """
             
-            result = await database.fetch_one(query, queue_data)
-            queue_id = result["id"]
+            async with database.transaction():
+                result = await database.fetch_one(query, queue_data)
+                queue_id = result["id"]
+                await self._adjust_queue_statistics(
+                    user_id, None, "queued", match_score=queue_data["match_score"]
+                )
             
             self.logger.info("Job added to queue", user_id=user_id, job_id=queue_item.job_id, queue_id=str(queue_id))
             
@@ -439,13 +463,7 @@ class UserManagementService:
             if not update_fields:
                 return True
             
-            query = f"""
-                UPDATE user_queues 
-                SET {', '.join(update_fields)}, updated_at = NOW()
-                WHERE id = :queue_id AND user_id = :user_id
-            """
-            
-            await database.execute(query, update_values)
+            await self._transition_queue_item(user_id, queue_id, update_fields, update_values)
             
             self.logger.info("Queue item updated", user_id=user_id, queue_id=queue_id)
             return True
@@ -454,6 +472,210 @@ class UserManagementService:
             self.logger.error("Failed to update queue item", user_id=user_id, queue_id=queue_id, error=str(e))
             return False
     
+    async def _transition_queue_item(
+        self,
+        user_id: str,
+        queue_id: str,
+        assignments: List[str],
+        values: Dict[str, Any],
+        row_condition: str = ""
+    ) -> bool:
+        """Update one queue row and its user's counters atomically; False if no row matched"""
+        # Join the locked pre-update row so the status transition is known atomically
+        query = f"""
+            UPDATE user_queues q
+            SET {', '.join(assignments)}, updated_at = NOW()
+            FROM (
+                SELECT id, status, application_submitted FROM user_queues
+                WHERE id = :queue_id AND user_id = :user_id {row_condition}
+                FOR UPDATE
+            ) previous
+            WHERE q.id = previous.id
+            RETURNING previous.status AS previous_status, q.status,
+                      previous.application_submitted AS was_submitted, q.application_submitted
+        """
+        
+        async with database.transaction():
+            result = await database.fetch_one(query, {**values, "user_id": user_id, "queue_id": queue_id})
+            if result:
+                await self._adjust_queue_statistics(
+                    user_id,
+                    result["previous_status"],
+                    result["status"],
+                    submitted_delta=int(bool(result["application_submitted"])) - int(bool(result["was_submitted"]))
+                )
+        
+        return result is not None
+    
+    # === QUEUE CLAIMING (processors) ===
+    
+    async def claim_queue_items(
+        self,
+        worker_id: str,
+        limit: int = 10,
+        lease_seconds: int = 600,
+        queue_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Atomically claim the next queued items for one processor
+        Rows locked by another claimer are skipped rather than waited on, so concurrent
+        processors never get the same item. Claimed rows move to 'processing' under a
+        lease that must be renewed until the item is finished.
+        """
+        try:
+            if queue_id:
+                # Explicit request for one item: ignore its schedule
+                filters = "AND uq.id = :queue_id"
+            else:
+                filters = """AND uss.search_status = 'active'
+                    AND (uq.scheduled_for IS NULL OR uq.scheduled_for <= NOW())"""
+            
+            query = f"""
+                WITH claimable AS (
+                    SELECT uq.id FROM user_queues uq
+                    JOIN user_search_settings uss ON uq.user_id = uss.user_id
+                    WHERE uq.status = 'queued'
+                    {filters}
+                    ORDER BY 
+                        CASE uq.priority 
+                            WHEN 'urgent' THEN 1 
+                            WHEN 'high' THEN 2 
+                            WHEN 'normal' THEN 3 
+                            WHEN 'low' THEN 4 
+                        END,
+                        uq.queued_at ASC
+                    LIMIT :limit
+                    FOR UPDATE OF uq SKIP LOCKED
+                ),
+                claimed AS (
+                    UPDATE user_queues q
+                    SET status = 'processing',
+                        processed_at = NOW(),
+                        lease_owner = :worker_id,
+                        lease_expires_at = NOW() + make_interval(secs => CAST(:lease_seconds AS INTEGER)),
+                        attempts = q.attempts + 1,
+                        updated_at = NOW()
+                    FROM claimable
+                    WHERE q.id = claimable.id
+                    RETURNING q.*
+                ),
+                counted AS (
+                    UPDATE user_queue_stats s
+                    SET queued = s.queued - c.items, processing = s.processing + c.items
+                    FROM (SELECT user_id, COUNT(*) AS items FROM claimed GROUP BY user_id) c
+                    WHERE s.user_id = c.user_id
+                )
+                SELECT * FROM claimed
+            """
+            values = {"worker_id": worker_id, "limit": limit, "lease_seconds": lease_seconds}
+            if queue_id:
+                values["queue_id"] = queue_id
+            
+            results = await database.fetch_all(query, values)
+            return [dict(result) for result in results]
+            
+        except Exception as e:
+            self.logger.error("Failed to claim queue items", worker_id=worker_id, error=str(e))
+            return []
+    
+    async def renew_queue_leases(self, worker_id: str, queue_ids: List[str], lease_seconds: int = 600) -> int:
+        """Extend this processor's leases on items it is still working on"""
+        if not queue_ids:
+            return 0
+        
+        query = """
+            UPDATE user_queues 
+            SET lease_expires_at = NOW() + make_interval(secs => CAST(:lease_seconds AS INTEGER))
+            WHERE id = ANY(CAST(:queue_ids AS UUID[]))
+            AND lease_owner = :worker_id 
+            AND status = 'processing'
+            RETURNING id
+        """
+        results = await database.fetch_all(query, {
+            "worker_id": worker_id,
+            "queue_ids": queue_ids,
+            "lease_seconds": lease_seconds
+        })
+        return len(results)
+    
+    async def finish_queue_item(
+        self,
+        user_id: str,
+        queue_id: str,
+        worker_id: str,
+        updates: Dict[str, Any]
+    ) -> bool:
+        """
+        Record a processor's outcome for a claimed item and release its lease
+        Returns False when the lease was lost (reaped after expiry), in which case
+        the row is left to whichever processor holds it now.
+        """
+        result_fields = [
+            "status", "scheduled_for", "processing_error",
+            "application_submitted", "workflow_execution_id", "application_id"
+        ]
+        
+        assignments = ["lease_owner = NULL", "lease_expires_at = NULL"]
+        values = {"worker_id": worker_id}
+        for field in result_fields:
+            if updates.get(field) is not None:
+                assignments.append(f"{field} = :{field}")
+                values[field] = updates[field]
+        
+        try:
+            finished = await self._transition_queue_item(
+                user_id, queue_id, assignments, values,
+                row_condition="AND status = 'processing' AND lease_owner = :worker_id"
+            )
+            if not finished:
+                self.logger.warning("Queue item lease lost before completion", queue_id=queue_id, worker_id=worker_id)
+            return finished
+            
+        except Exception as e:
+            self.logger.error("Failed to finish queue item", user_id=user_id, queue_id=queue_id, error=str(e))
+            return False
+    
+    async def reap_expired_queue_leases(self, max_attempts: int = 3) -> int:
+        """Return items of crashed processors to the queue, failing those out of attempts"""
+        try:
+            query = """
+                WITH expired AS (
+                    UPDATE user_queues 
+                    SET status = CASE WHEN attempts >= :max_attempts THEN 'failed' ELSE 'queued' END,
+                        processing_error = CASE 
+                            WHEN attempts >= :max_attempts THEN 'Processing lease expired ' || attempts || ' times'
+                            ELSE processing_error 
+                        END,
+                        lease_owner = NULL,
+                        lease_expires_at = NULL,
+                        updated_at = NOW()
+                    WHERE status = 'processing' AND lease_expires_at < NOW()
+                    RETURNING user_id, status
+                ),
+                counted AS (
+                    UPDATE user_queue_stats s
+                    SET processing = s.processing - c.items, queued = s.queued + c.requeued, failed = s.failed + c.failed
+                    FROM (
+                        SELECT user_id,
+                               COUNT(*) AS items,
+                               COUNT(CASE WHEN status = 'queued' THEN 1 END) AS requeued,
+                               COUNT(CASE WHEN status = 'failed' THEN 1 END) AS failed
+                        FROM expired GROUP BY user_id
+                    ) c
+                    WHERE s.user_id = c.user_id
+                )
+                SELECT COUNT(*) AS reaped FROM expired
+            """
+            result = await database.fetch_one(query, {"max_attempts": max_attempts})
+            reaped = result["reaped"] if result else 0
+            if reaped:
+                self.logger.warning("Reclaimed expired queue leases", count=reaped)
+            return reaped
+            
+        except Exception as e:
+            self.logger.error("Failed to reap expired queue leases", error=str(e))
+            return 0
+    
     async def get_next_queue_items(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get next items to process from all user queues"""
         try:
@@ -655,44 +877,98 @@ class UserManagementService:
             return {}
     
     async def _get_queue_statistics(self, user_id: str) -> Dict[str, Any]:
-        """Get queue statistics for user"""
+        """Get queue statistics for user (materialized counters, recounted when stale)"""
         try:
-            query = """
-                SELECT 
-                    COUNT(*) as total_items,
-                    COUNT(CASE WHEN status = 'queued' THEN 1 END) as pending,
-                    COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed,
-                    COUNT(CASE WHEN status = 'processing' THEN 1 END) as processing,
-                    COUNT(CASE WHEN application_submitted = TRUE THEN 1 END) as applications_submitted,
-                    AVG(match_score) as avg_match_score
-                FROM user_queues 
-                WHERE user_id = :user_id
-            """
-            
+            query = "SELECT * FROM user_queue_stats WHERE user_id = :user_id"
             result = await database.fetch_one(query, {"user_id": user_id})
             
-            if result:
-                return {
-                    "total_items": result["total_items"] or 0,
-                    "pending": result["pending"] or 0,
-                    "completed": result["completed"] or 0,
-                    "processing": result["processing"] or 0,
-                    "applications_submitted": result["applications_submitted"] or 0,
-                    "avg_match_score": round(result["avg_match_score"] or 0, 1)
-                }
+            max_age = timedelta(seconds=settings.DASHBOARD_STATS_MAX_AGE)
+            if not result or result["refreshed_at"] < datetime.utcnow() - max_age:
+                result = await self._refresh_queue_statistics(user_id)
             
+            score_count = result["match_score_count"] or 0
             return {
-                "total_items": 0,
-                "pending": 0,
-                "completed": 0,
-                "processing": 0,
-                "applications_submitted": 0,
-                "avg_match_score": 0
+                "total_items": result["total_items"] or 0,
+                "pending": result["queued"] or 0,
+                "completed": result["completed"] or 0,
+                "processing": result["processing"] or 0,
+                "applications_submitted": result["applications_submitted"] or 0,
+                "avg_match_score": round(result["match_score_sum"] / score_count, 1) if score_count else 0
             }
             
         except Exception as e:
             self.logger.error("Failed to get queue statistics", user_id=user_id, error=str(e))
             return {}
+    
+    async def _refresh_queue_statistics(self, user_id: str):
+        """Recount a user's queue statistics from user_queues and store them"""
+        query = f"""
+            INSERT INTO user_queue_stats (
+                user_id, total_items, {', '.join(QUEUE_STAT_STATUSES)},
+                applications_submitted, match_score_sum, match_score_count, refreshed_at
+            )
+            SELECT 
+                :user_id,
+                COUNT(*),
+                {', '.join(f"COUNT(CASE WHEN status = '{status}' THEN 1 END)" for status in QUEUE_STAT_STATUSES)},
+                COUNT(CASE WHEN application_submitted = TRUE THEN 1 END),
+                COALESCE(SUM(match_score), 0),
+                COUNT(match_score),
+                NOW()
+            FROM user_queues 
+            WHERE user_id = :user_id
+            ON CONFLICT (user_id) DO UPDATE SET
+                total_items = EXCLUDED.total_items,
+                {', '.join(f"{status} = EXCLUDED.{status}" for status in QUEUE_STAT_STATUSES)},
+                applications_submitted = EXCLUDED.applications_submitted,
+                match_score_sum = EXCLUDED.match_score_sum,
+                match_score_count = EXCLUDED.match_score_count,
+                refreshed_at = EXCLUDED.refreshed_at
+            RETURNING *
+        """
+        return await database.fetch_one(query, {"user_id": user_id})
+    
+    async def _adjust_queue_statistics(
+        self,
+        user_id: str,
+        from_status: Optional[str],
+        to_status: Optional[str],
+        submitted_delta: int = 0,
+        match_score: Optional[float] = None
+    ):
+        """
+        Apply one queue item transition to the user's counters (from_status None = new item,
+        match_score the new item's score for the running average)
+        """
+        changes = []
+        if from_status is None:
+            changes.append("total_items = total_items + 1")
+            if match_score is not None:
+                changes.append("match_score_sum = match_score_sum + :match_score")
+                changes.append("match_score_count = match_score_count + 1")
+        if from_status != to_status:
+            if from_status in QUEUE_STAT_STATUSES:
+                changes.append(f"{from_status} = {from_status} - 1")
+            if to_status in QUEUE_STAT_STATUSES:
+                changes.append(f"{to_status} = {to_status} + 1")
+        if submitted_delta:
+            changes.append("applications_submitted = applications_submitted + :submitted_delta")
+        
+        if not changes:
+            return
+        
+        # Users without a stats row are recounted on first read instead
+        query = f"""
+            UPDATE user_queue_stats 
+            SET {', '.join(changes)}
+            WHERE user_id = :user_id
+        """
+        values = {"user_id": user_id}
+        if submitted_delta:
+            values["submitted_delta"] = submitted_delta
+        if from_status is None and match_score is not None:
+            values["match_score"] = match_score
+        await database.execute(query, values)
 
 
 # Global service instance
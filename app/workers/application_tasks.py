@@ -6,10 +6,9 @@ Handles intelligent job application submission and tracking
 from celery import shared_task
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
-import asyncio
 import json
 
-from app.workers.celery_app import celery_app
+from app.workers.celery_app import celery_app, run_async
 from app.ai.models import generate_cover_letter, ai_model_manager
 from app.ai.prompts import AIPrompts, PromptType
 from app.services.job_matcher import job_matching_engine
@@ -28,14 +27,8 @@ def process_auto_apply_queue(self) -> Dict[str, Any]:
     try:
         logger.info("Starting auto-apply queue processing")
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            result = loop.run_until_complete(_process_auto_apply_queue_async())
-            return result
-        finally:
-            loop.close()
+        result = run_async(_process_auto_apply_queue_async())
+        return result
             
     except Exception as e:
         logger.error("Auto-apply queue processing failed", error=str(e))
@@ -206,7 +199,8 @@ async def _make_auto_apply_decision(
             prompt=prompt,
             user_data={"user_id": candidate["user_id"]},
             model_tier="cheap",  # Fast decision for auto-apply
-            provider="replicate"
+            provider="replicate",
+            operation="auto_apply_decision"
         )
         
         if ai_result["success"]:
@@ -344,14 +338,8 @@ def update_application_statuses(self) -> Dict[str, Any]:
     try:
         logger.info("Starting application status updates")
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            result = loop.run_until_complete(_update_application_statuses_async())
-            return result
-        finally:
-            loop.close()
+        result = run_async(_update_application_statuses_async())
+        return result
             
     except Exception as e:
         logger.error("Application status update failed", error=str(e))
@@ -510,16 +498,8 @@ def generate_application_documents(self, user_id: int, job_id: int) -> Dict[str,
     try:
         logger.info("Generating application documents", user_id=user_id, job_id=job_id)
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            result = loop.run_until_complete(
-                _generate_application_documents_async(user_id, job_id)
-            )
-            return result
-        finally:
-            loop.close()
+        result = run_async(_generate_application_documents_async(user_id, job_id))
+        return result
             
     except Exception as e:
         logger.error("Application document generation failed",
@@ -590,7 +570,8 @@ async def _generate_application_documents_async(user_id: int, job_id: int) -> Di
             prompt=resume_prompt,
             user_data=user_profile,
             model_tier="balanced",
-            provider="replicate"
+            provider="replicate",
+            operation="resume_optimization"
         )
         
         if resume_result["success"]:
@@ -3,9 +3,65 @@ Celery configuration for JobHire.AI
 Handles background task processing for auto-apply system
 """
 
-from celery import Celery
+import asyncio
+
+from celery import Celery, Task
+from celery.exceptions import Ignore
 from celery.schedules import crontab
+from celery.signals import (
+    before_task_publish,
+    task_failure,
+    task_postrun,
+    task_prerun,
+    worker_process_init,
+    worker_process_shutdown
+)
 from app.core.config import settings
+from app.core.http_client import http_client_pool
+from app.core.rate_limit import RateLimit, rate_limiter
+from app.core.tracing import (
+    begin_span,
+    get_span_id,
+    get_trace_id,
+    inject_trace_context,
+    setup_worker_tracing,
+    shutdown_tracing
+)
+import structlog
+
+logger = structlog.get_logger()
+
+
+class RateLimitedTask(Task):
+    """
+    Task base enforcing the distributed_rate_limit annotation across all workers
+    Celery's own rate_limit is per worker process, so N workers allow N times the limit.
+    Here each task name shares one Redis budget; a task over budget is re-queued with
+    a countdown instead of blocking the worker.
+    """
+
+    distributed_rate_limit = None  # e.g. "10/m", set through task_annotations
+
+    def __call__(self, *args, **kwargs):
+        if self.distributed_rate_limit and not self.request.called_directly:
+            result = run_async(rate_limiter.hit(
+                f"celery:{self.name}",
+                RateLimit.parse(self.distributed_rate_limit)
+            ))
+            if not result.allowed:
+                logger.info("Task rate limited, re-queued", task=self.name,
+                           task_id=self.request.id, countdown=result.retry_after)
+                self.apply_async(
+                    args=args,
+                    kwargs=kwargs,
+                    task_id=self.request.id,
+                    countdown=result.retry_after,
+                    retries=self.request.retries
+                )
+                raise Ignore()
+
+        return super().__call__(*args, **kwargs)
+
 
 # Create Celery app
 celery_app = Celery(
@@ -17,7 +73,8 @@ celery_app = Celery(
         "app.workers.application_tasks",
         "app.workers.notification_tasks",
         "app.workers.analytics_tasks"
-    ]
+    ],
+    task_cls=RateLimitedTask
 )
 
 # Celery configuration
@@ -50,11 +107,11 @@ celery_app.conf.update(
     worker_send_task_events=True,
     task_send_sent_event=True,
     
-    # Rate limiting
+    # Rate limiting (cluster-wide, enforced by RateLimitedTask)
     task_annotations={
-        "*": {"rate_limit": "100/m"},  # Global rate limit
-        "app.workers.job_tasks.fetch_jobs": {"rate_limit": "10/m"},
-        "app.workers.application_tasks.submit_application": {"rate_limit": "5/m"},
+        "*": {"distributed_rate_limit": "100/m"},  # Per task name
+        "app.workers.job_tasks.fetch_jobs": {"distributed_rate_limit": "10/m"},
+        "app.workers.application_tasks.submit_application": {"distributed_rate_limit": "5/m"},
     },
     
     # Beat scheduler for periodic tasks
@@ -68,6 +125,10 @@ celery_app.conf.update(
             "task": "app.workers.job_tasks.refresh_job_cache",
             "schedule": crontab(minute=30, hour="*/4"),  # Every 4 hours at :30
         },
+        "rebuild-job-term-index": {
+            "task": "app.workers.job_tasks.rebuild_job_term_index",
+            "schedule": crontab(minute=0, hour=4),  # Daily at 4 AM (backfill, synonym changes)
+        },
         
         # Application processing
         "process-auto-apply-queue": {
@@ -103,5 +164,92 @@ celery_app.conf.task_default_retry_delay = 60  # 1 minute
 celery_app.conf.task_max_retries = 3
 
 
+# Persistent event loop per worker process, so pooled HTTP connections are
+# reused across tasks instead of being torn down with a per-task loop
+_worker_loop = None
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """Open the shared HTTP pool when a worker process starts"""
+    global _worker_loop
+    setup_worker_tracing()
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    _worker_loop.run_until_complete(http_client_pool.startup())
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    """Drain the shared HTTP pool before a worker process exits"""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        return
+    try:
+        _worker_loop.run_until_complete(http_client_pool.shutdown())
+    finally:
+        _worker_loop.close()
+        _worker_loop = None
+        shutdown_tracing()
+
+
+# Trace context travels with each task in W3C traceparent message headers, so a task's
+# span continues the trace of the request or task that queued it
+_task_spans = {}
+
+
+@before_task_publish.connect
+def propagate_trace_context(headers=None, **kwargs):
+    """Add the publisher's trace context to the task message headers"""
+    if headers is not None:
+        inject_trace_context(headers)
+
+
+@task_prerun.connect
+def start_task_span(task_id=None, task=None, **kwargs):
+    """Open the task's span (custom message headers are attributes of task.request)"""
+    _task_spans[task_id] = begin_span(
+        f"celery.task {task.name}",
+        kind="consumer",
+        attributes={
+            "celery.task_name": task.name,
+            "celery.task_id": task_id,
+            "celery.retries": task.request.retries,
+            "messaging.destination": (task.request.delivery_info or {}).get("routing_key")
+        },
+        carrier=task.request
+    )
+    trace_id = get_trace_id()
+    if trace_id:
+        structlog.contextvars.bind_contextvars(trace_id=trace_id, span_id=get_span_id())
+
+
+@task_failure.connect
+def record_task_failure(task_id=None, exception=None, **kwargs):
+    span = _task_spans.get(task_id)
+    if span is not None and exception is not None:
+        span.record_exception(exception)
+
+
+@task_postrun.connect
+def end_task_span(task_id=None, state=None, **kwargs):
+    span = _task_spans.pop(task_id, None)
+    if span is not None:
+        span.set_attributes(**{"celery.state": state})
+        span.end()
+    structlog.contextvars.unbind_contextvars("trace_id", "span_id")
+
+
+def run_async(coro):
+    """Run a task coroutine on the worker process loop, opened on first use outside a worker"""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        # Kept for the process lifetime: per-loop clients (HTTP pool, rate limiter Redis)
+        # would otherwise be rebuilt on every call
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop.run_until_complete(coro)
+
+
 if __name__ == "__main__":
     celery_app.start()
\ No newline at end of file
@@ -0,0 +1,279 @@
+"""
+Bulk job ingestion
+Fetched pages are deduplicated in memory and written with multi-row upserts, so
+storing a page costs one round-trip per batch instead of two or three per job
+"""
+
+import json
+import time
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from app.core.config import settings
+from app.core.monitoring import performance_monitor
+
+logger = structlog.get_logger()
+
+
+JOB_COLUMNS = [
+    "external_id", "title", "description", "location",
+    "remote_option", "employment_type", "required_skills",
+    "preferred_skills", "salary_min", "salary_max", "currency",
+    "source", "posted_date", "application_url", "benefits",
+    "experience_level", "education_requirements"
+]
+
+# Columns refreshed when a job is fetched again; missing values keep the stored ones
+JOB_UPDATE_COLUMNS = [
+    "title", "description", "location", "remote_option", "employment_type",
+    "required_skills", "preferred_skills", "salary_min", "salary_max",
+    "posted_date", "application_url", "experience_level"
+]
+
+# Fallbacks for fields trending searches often leave empty (new jobs only, see upsert_jobs)
+TRENDING_JOB_DEFAULTS = {
+    "remote_option": "no",
+    "employment_type": "full-time",
+    "source": "unknown",
+    "experience_level": "mid-level"
+}
+
+MATCH_COLUMNS = [
+    "user_id", "job_id", "overall_score", "skill_match_score",
+    "experience_score", "education_score", "location_score",
+    "salary_score", "culture_score", "recommendation",
+    "apply_priority", "success_probability", "matched_skills",
+    "missing_skills", "improvement_suggestions", "red_flags",
+    "competitive_advantage"
+]
+
+
+def dedupe_jobs(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop jobs without an external_id and repeats of the same external_id (first wins)"""
+    unique_jobs: Dict[str, Dict[str, Any]] = {}
+    for job in jobs:
+        external_id = job.get("external_id")
+        if external_id and external_id not in unique_jobs:
+            unique_jobs[external_id] = job
+    return list(unique_jobs.values())
+
+
+def job_row(job_data: Dict[str, Any], defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Column values for the jobs table"""
+    defaults = defaults or {}
+
+    def value(key: str, fallback: Any = None) -> Any:
+        found = job_data.get(key)
+        return found if found is not None else defaults.get(key, fallback)
+
+    return {
+        "external_id": job_data.get("external_id"),
+        "title": job_data.get("title"),
+        "description": job_data.get("description"),
+        "location": json.dumps(job_data.get("location", {})),
+        "remote_option": value("remote_option"),
+        "employment_type": value("employment_type"),
+        "required_skills": json.dumps(job_data.get("required_skills", [])),
+        "preferred_skills": json.dumps(job_data.get("preferred_skills", [])),
+        "salary_min": job_data.get("salary_min"),
+        "salary_max": job_data.get("salary_max"),
+        "currency": value("currency", "USD"),
+        "source": value("source"),
+        "posted_date": job_data.get("posted_date"),
+        "application_url": job_data.get("application_url"),
+        "benefits": json.dumps(job_data.get("benefits", [])),
+        "experience_level": value("experience_level"),
+        "education_requirements": job_data.get("education_requirements"),
+    }
+
+
+def match_row(match_data: Dict[str, Any], user_id: int, job_db_id: int) -> Dict[str, Any]:
+    """Column values for the job_matches table"""
+    category_scores = match_data.get("category_scores", {})
+
+    return {
+        "user_id": user_id,
+        "job_id": job_db_id,
+        "overall_score": match_data.get("overall_score", 0),
+        "skill_match_score": category_scores.get("skills", {}).get("score", 0),
+        "experience_score": category_scores.get("experience", {}).get("score", 0),
+        "education_score": category_scores.get("education", {}).get("score", 0),
+        "location_score": category_scores.get("location", {}).get("score", 0),
+        "salary_score": category_scores.get("salary", {}).get("score", 0),
+        "culture_score": category_scores.get("culture", {}).get("score", 0),
+        "recommendation": match_data.get("recommendation", "weak_match"),
+        "apply_priority": match_data.get("apply_priority", 5),
+        "success_probability": match_data.get("success_probability", 0.5),
+        "matched_skills": json.dumps(category_scores.get("skills", {}).get("matched", [])),
+        "missing_skills": json.dumps(category_scores.get("skills", {}).get("missing", [])),
+        "improvement_suggestions": json.dumps(match_data.get("improvement_suggestions", [])),
+        "red_flags": json.dumps(match_data.get("red_flags", [])),
+        "competitive_advantage": match_data.get("competitive_advantage", "")
+    }
+
+
+def _values_clause(
+    columns: List[str],
+    rows: List[Dict[str, Any]],
+    literals: Tuple[str, ...] = ()
+) -> Tuple[str, Dict[str, Any]]:
+    """Multi-row VALUES list with one named parameter per cell (plus fixed literals)"""
+    groups = []
+    values: Dict[str, Any] = {}
+    for index, row in enumerate(rows):
+        placeholders = []
+        for column in columns:
+            name = f"{column}_{index}"
+            placeholders.append(f":{name}")
+            values[name] = row[column]
+        groups.append(f"({', '.join(placeholders + list(literals))})")
+    return ",\n".join(groups), values
+
+
+def _batches(rows: List[Any], size: int) -> List[List[Any]]:
+    size = max(1, size)
+    return [rows[i:i + size] for i in range(0, len(rows), size)]
+
+
+async def upsert_jobs(
+    database: Any,
+    rows: List[Dict[str, Any]],
+    batch_size: Optional[int] = None,
+    keep_stored: Iterable[str] = ()
+) -> Dict[str, Tuple[int, bool]]:
+    """
+    Insert or refresh jobs by external_id
+    Returns {external_id: (job id, newly inserted)} for every row that was written.
+    Rows must already be deduplicated: one statement cannot update the same row twice.
+    keep_stored columns only fill gaps in existing jobs; pass the columns that job_row
+    filled from defaults so a placeholder never overwrites a real value.
+    """
+    write = partial(_upsert_jobs_batch, keep_stored=frozenset(keep_stored))
+    stored: Dict[str, Tuple[int, bool]] = {}
+    for batch in _batches(rows, batch_size or settings.JOB_INGEST_BATCH_SIZE):
+        for record in await _write_batch(database, "jobs", batch, write):
+            stored[record["external_id"]] = (record["id"], record["inserted"])
+    return stored
+
+
+async def insert_job_matches(
+    database: Any,
+    rows: List[Dict[str, Any]],
+    batch_size: Optional[int] = None
+) -> int:
+    """Insert job matches, skipping (user_id, job_id) pairs that already exist; returns rows written"""
+    written = 0
+    for batch in _batches(rows, batch_size or settings.JOB_MATCH_BATCH_SIZE):
+        written += len(await _write_batch(database, "job_matches", batch, _insert_matches_batch))
+    return written
+
+
+async def replace_job_terms(
+    database: Any,
+    terms: Dict[int, List[Tuple[str, str]]],
+    batch_size: Optional[int] = None
+) -> int:
+    """Replace the candidate index postings of each job ({job id: [(kind, term)]}); returns jobs indexed"""
+    indexed = 0
+    items = list(terms.items())
+    for batch in _batches(items, batch_size or settings.JOB_INGEST_BATCH_SIZE):
+        indexed += len(await _write_batch(database, "job_terms", batch, _replace_terms_batch))
+    return indexed
+
+
+async def _upsert_jobs_batch(
+    database: Any,
+    batch: List[Dict[str, Any]],
+    keep_stored: frozenset = frozenset()
+) -> List[Dict[str, Any]]:
+    values_sql, values = _values_clause(JOB_COLUMNS, batch, literals=("true",))
+    updates = ",\n        ".join(
+        f"{column} = COALESCE(jobs.{column}, EXCLUDED.{column})" if column in keep_stored
+        else f"{column} = COALESCE(EXCLUDED.{column}, jobs.{column})"
+        for column in JOB_UPDATE_COLUMNS
+    )
+    query = f"""
+    INSERT INTO jobs ({', '.join(JOB_COLUMNS)}, is_active)
+    VALUES
+    {values_sql}
+    ON CONFLICT (external_id) DO UPDATE SET
+        {updates},
+        is_active = true,
+        updated_at = NOW()
+    RETURNING id, external_id, (xmax = 0) AS inserted
+    """
+    results = await database.fetch_all(query, values)
+    return [dict(result) for result in results]
+
+
+async def _insert_matches_batch(database: Any, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    values_sql, values = _values_clause(MATCH_COLUMNS, batch)
+    query = f"""
+    INSERT INTO job_matches ({', '.join(MATCH_COLUMNS)})
+    VALUES
+    {values_sql}
+    ON CONFLICT (user_id, job_id) DO NOTHING
+    RETURNING id
+    """
+    results = await database.fetch_all(query, values)
+    return [dict(result) for result in results]
+
+
+async def _replace_terms_batch(database: Any, batch: List[Tuple[int, List[Tuple[str, str]]]]) -> List[Dict[str, Any]]:
+    rows = [
+        {"job_id": job_id, "kind": kind, "term": term}
+        for job_id, postings in batch
+        for kind, term in postings
+    ]
+    async with database.transaction():
+        await database.execute(
+            "DELETE FROM job_terms WHERE job_id = ANY(:job_ids)",
+            {"job_ids": [job_id for job_id, _ in batch]}
+        )
+        if rows:
+            values_sql, values = _values_clause(["job_id", "kind", "term"], rows)
+            query = f"""
+            INSERT INTO job_terms (job_id, kind, term)
+            VALUES
+            {values_sql}
+            ON CONFLICT DO NOTHING
+            """
+            await database.execute(query, values)
+    return [{"job_id": job_id} for job_id, _ in batch]
+
+
+async def _write_batch(database: Any, table: str, batch: List[Any], write) -> List[Dict[str, Any]]:
+    """Run one bulk statement; if it fails, retry row by row so one bad row only loses itself"""
+    start_time = time.perf_counter()
+    try:
+        results = await write(database, batch)
+    except Exception as e:
+        performance_monitor.record_ingestion_batch(table, len(batch), time.perf_counter() - start_time, failed=True)
+        if len(batch) == 1:
+            logger.warning("Failed to store row", table=table, error=str(e))
+            return []
+        logger.warning("Bulk write failed, retrying rows individually",
+                      table=table, rows=len(batch), error=str(e))
+        results = []
+        for row in batch:
+            results.extend(await _write_batch(database, table, [row], write))
+        return results
+
+    duration = time.perf_counter() - start_time
+    performance_monitor.record_ingestion_batch(table, len(batch), duration)
+    logger.debug("Bulk write batch stored", table=table, rows=len(batch), duration_ms=round(duration * 1000, 2))
+    return results
+
+
+# Export public interfaces
+__all__ = [
+    "TRENDING_JOB_DEFAULTS",
+    "dedupe_jobs",
+    "job_row",
+    "match_row",
+    "upsert_jobs",
+    "insert_job_matches",
+    "replace_job_terms"
+]
@@ -6,14 +6,17 @@ Handles job fetching, matching, and processing
 from celery import shared_task
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
-import asyncio
 import json
 
-from app.workers.celery_app import celery_app
+from app.workers.celery_app import celery_app, run_async
 from app.services.job_fetcher import job_fetcher
 from app.services.job_matcher import job_matching_engine, MatchingStrategy
 from app.core.database import get_database
 from app.core.monitoring import performance_monitor
+from app.services.job_candidates import job_candidate_index
+from app.workers.job_ingestion import (
+    TRENDING_JOB_DEFAULTS, dedupe_jobs, job_row, match_row, upsert_jobs, insert_job_matches, replace_job_terms
+)
 import structlog
 
 logger = structlog.get_logger()
@@ -28,14 +31,8 @@ def fetch_jobs_for_user(self, user_id: int, search_params: Dict[str, Any]) -> Di
         logger.info("Starting job fetch for user", user_id=user_id, params=search_params)
         
         # Run async job fetching in sync context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            result = loop.run_until_complete(_fetch_jobs_async(user_id, search_params))
-            return result
-        finally:
-            loop.close()
+        result = run_async(_fetch_jobs_async(user_id, search_params))
+        return result
             
     except Exception as e:
         logger.error("Job fetch failed", user_id=user_id, error=str(e))
@@ -127,14 +124,8 @@ def fetch_trending_jobs(self) -> Dict[str, Any]:
         logger.info("Starting trending jobs fetch")
         
         # Run async trending job fetching
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            result = loop.run_until_complete(_fetch_trending_jobs_async())
-            return result
-        finally:
-            loop.close()
+        result = run_async(_fetch_trending_jobs_async())
+        return result
             
     except Exception as e:
         logger.error("Trending jobs fetch failed", error=str(e))
@@ -177,14 +168,10 @@ async def _fetch_trending_jobs_async() -> Dict[str, Any]:
             continue
     
     # Remove duplicates
-    unique_jobs = {}
-    for job in all_jobs:
-        job_id = job.get("external_id")
-        if job_id and job_id not in unique_jobs:
-            unique_jobs[job_id] = job
+    unique_jobs = dedupe_jobs(all_jobs)
     
     # Store trending jobs in cache/database
-    stored_count = await _store_trending_jobs(list(unique_jobs.values()))
+    stored_count = await _store_trending_jobs(unique_jobs)
     
     logger.info("Trending jobs fetch completed", 
                fetched=len(all_jobs),
@@ -207,14 +194,8 @@ def refresh_job_cache(self) -> Dict[str, Any]:
     try:
         logger.info("Starting job cache refresh")
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            result = loop.run_until_complete(_refresh_job_cache_async())
-            return result
-        finally:
-            loop.close()
+        result = run_async(_refresh_job_cache_async())
+        return result
             
     except Exception as e:
         logger.error("Job cache refresh failed", error=str(e))
@@ -269,14 +250,8 @@ def match_user_to_existing_jobs(self, user_id: int) -> Dict[str, Any]:
     try:
         logger.info("Starting job matching for user", user_id=user_id)
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            result = loop.run_until_complete(_match_user_to_jobs_async(user_id))
-            return result
-        finally:
-            loop.close()
+        result = run_async(_match_user_to_jobs_async(user_id))
+        return result
             
     except Exception as e:
         logger.error("User job matching failed", user_id=user_id, error=str(e))
@@ -299,20 +274,8 @@ async def _match_user_to_jobs_async(user_id: int) -> Dict[str, Any]:
     user_profile["skills"] = json.loads(user_profile.get("skills") or "[]")
     user_profile["preferences"] = json.loads(user_profile.get("preferences") or "{}")
     
-    # Get active jobs that haven't been matched to this user
-    jobs_query = """
-    SELECT j.* FROM jobs j
-    WHERE j.is_active = true 
-    AND j.posted_date > NOW() - INTERVAL '14 days'
-    AND NOT EXISTS (
-        SELECT 1 FROM job_matches jm 
-        WHERE jm.job_id = j.id AND jm.user_id = :user_id
-    )
-    LIMIT 100
-    """
-    
-    jobs_result = await database.fetch_all(jobs_query, {"user_id": user_id})
-    jobs = [dict(job) for job in jobs_result]
+    # Only the best-overlapping unmatched jobs go through full matching
+    jobs = await job_candidate_index.top_candidates(database, user_id, user_profile)
     
     # Convert database format to matching format
     formatted_jobs = []
@@ -343,7 +306,7 @@ async def _match_user_to_jobs_async(user_id: int) -> Dict[str, Any]:
         formatted_jobs.append((formatted_job, job["id"]))  # Keep database ID
     
     # Perform matching
-    matches_created = 0
+    match_rows = []
     
     for formatted_job, job_db_id in formatted_jobs:
         try:
@@ -355,9 +318,7 @@ async def _match_user_to_jobs_async(user_id: int) -> Dict[str, Any]:
             )
             
             if match_result.get("success"):
-                # Store match in database
-                await _store_job_match(match_result, user_id, job_db_id)
-                matches_created += 1
+                match_rows.append(match_row(match_result, user_id, job_db_id))
                 
         except Exception as e:
             logger.warning("Failed to match job to user",
@@ -366,10 +327,14 @@ async def _match_user_to_jobs_async(user_id: int) -> Dict[str, Any]:
                           error=str(e))
             continue
     
+    # Store matches in database
+    matches_created = await insert_job_matches(database, match_rows)
+    
     logger.info("User job matching completed",
                user_id=user_id,
                jobs_processed=len(formatted_jobs),
-               matches_created=matches_created)
+               matches_created=matches_created,
+               llm_call_rate=job_matching_engine.cascade_stats()["llm_call_rate"])
     
     return {
         "success": True,
@@ -384,193 +349,99 @@ async def _store_jobs_and_matches(
     user_id: int, 
     user_profile: Dict[str, Any]
 ) -> int:
-    """Store jobs and their matches in database"""
+    """Store jobs and their matches in database (bulk upsert, then bulk match insert)"""
     
     database = await get_database()
-    stored_count = 0
+    unique_jobs = dedupe_jobs(matched_jobs)
     
-    for job_data in matched_jobs:
-        try:
-            # Check if job already exists
-            job_check_query = "SELECT id FROM jobs WHERE external_id = :external_id"
-            existing_job = await database.fetch_one(
-                job_check_query, 
-                {"external_id": job_data.get("external_id")}
-            )
-            
-            if existing_job:
-                job_db_id = existing_job["id"]
-            else:
-                # Insert new job
-                job_insert_query = """
-                INSERT INTO jobs (
-                    external_id, title, description, company_id, location,
-                    remote_option, employment_type, required_skills,
-                    preferred_skills, salary_min, salary_max, currency,
-                    source, posted_date, application_url, benefits,
-                    experience_level, education_requirements, is_active
-                ) VALUES (
-                    :external_id, :title, :description, NULL, :location,
-                    :remote_option, :employment_type, :required_skills,
-                    :preferred_skills, :salary_min, :salary_max, :currency,
-                    :source, :posted_date, :application_url, :benefits,
-                    :experience_level, :education_requirements, true
-                )
-                RETURNING id
-                """
-                
-                job_values = {
-                    "external_id": job_data.get("external_id"),
-                    "title": job_data.get("title"),
-                    "description": job_data.get("description"),
-                    "location": json.dumps(job_data.get("location", {})),
-                    "remote_option": job_data.get("remote_option"),
-                    "employment_type": job_data.get("employment_type"),
-                    "required_skills": json.dumps(job_data.get("required_skills", [])),
-                    "preferred_skills": json.dumps(job_data.get("preferred_skills", [])),
-                    "salary_min": job_data.get("salary_min"),
-                    "salary_max": job_data.get("salary_max"),
-                    "currency": job_data.get("currency", "USD"),
-                    "source": job_data.get("source"),
-                    "posted_date": job_data.get("posted_date"),
-                    "application_url": job_data.get("application_url"),
-                    "benefits": json.dumps(job_data.get("benefits", [])),
-                    "experience_level": job_data.get("experience_level"),
-                    "education_requirements": job_data.get("education_requirements"),
-                }
-                
-                result = await database.fetch_one(job_insert_query, job_values)
-                job_db_id = result["id"]
-            
-            # Store job match
-            await _store_job_match(job_data, user_id, job_db_id)
-            stored_count += 1
-            
-        except Exception as e:
-            logger.warning("Failed to store job and match",
-                          job_id=job_data.get("external_id"),
-                          error=str(e))
-            continue
+    stored_jobs = await upsert_jobs(database, [job_row(job_data) for job_data in unique_jobs])
+    await _index_job_terms(database, unique_jobs, stored_jobs)
+    
+    match_rows = [
+        match_row(job_data, user_id, stored_jobs[job_data["external_id"]][0])
+        for job_data in unique_jobs
+        if job_data["external_id"] in stored_jobs
+    ]
+    await insert_job_matches(database, match_rows)
     
-    return stored_count
+    return len(stored_jobs)
 
 
-async def _store_job_match(match_data: Dict[str, Any], user_id: int, job_db_id: int):
-    """Store individual job match in database"""
+async def _store_trending_jobs(jobs: List[Dict[str, Any]]) -> int:
+    """Store trending jobs in database; returns the number of new jobs"""
     
     database = await get_database()
+    unique_jobs = dedupe_jobs(jobs)
+    rows = [job_row(job_data, defaults=TRENDING_JOB_DEFAULTS) for job_data in unique_jobs]
     
-    # Check if match already exists
-    match_check_query = """
-    SELECT id FROM job_matches 
-    WHERE user_id = :user_id AND job_id = :job_id
-    """
-    existing_match = await database.fetch_one(
-        match_check_query, 
-        {"user_id": user_id, "job_id": job_db_id}
-    )
-    
-    if existing_match:
-        return  # Match already exists
-    
-    # Insert job match
-    match_insert_query = """
-    INSERT INTO job_matches (
-        user_id, job_id, overall_score, skill_match_score,
-        experience_score, education_score, location_score,
-        salary_score, culture_score, recommendation,
-        apply_priority, success_probability, matched_skills,
-        missing_skills, improvement_suggestions, red_flags,
-        competitive_advantage
-    ) VALUES (
-        :user_id, :job_id, :overall_score, :skill_match_score,
-        :experience_score, :education_score, :location_score,
-        :salary_score, :culture_score, :recommendation,
-        :apply_priority, :success_probability, :matched_skills,
-        :missing_skills, :improvement_suggestions, :red_flags,
-        :competitive_advantage
-    )
-    """
-    
-    category_scores = match_data.get("category_scores", {})
+    # Defaults only fill in new jobs; they never replace what a real fetch stored
+    stored_jobs = await upsert_jobs(database, rows, keep_stored=TRENDING_JOB_DEFAULTS)
+    await _index_job_terms(database, unique_jobs, stored_jobs)
+    return sum(1 for _, inserted in stored_jobs.values() if inserted)
+
+
+async def _index_job_terms(
+    database,
+    jobs: List[Dict[str, Any]],
+    stored_jobs: Dict[str, Any]
+) -> int:
+    """Refresh candidate index postings for freshly stored jobs"""
     
-    match_values = {
-        "user_id": user_id,
-        "job_id": job_db_id,
-        "overall_score": match_data.get("overall_score", 0),
-        "skill_match_score": category_scores.get("skills", {}).get("score", 0),
-        "experience_score": category_scores.get("experience", {}).get("score", 0),
-        "education_score": category_scores.get("education", {}).get("score", 0),
-        "location_score": category_scores.get("location", {}).get("score", 0),
-        "salary_score": category_scores.get("salary", {}).get("score", 0),
-        "culture_score": category_scores.get("culture", {}).get("score", 0),
-        "recommendation": match_data.get("recommendation", "weak_match"),
-        "apply_priority": match_data.get("apply_priority", 5),
-        "success_probability": match_data.get("success_probability", 0.5),
-        "matched_skills": json.dumps(category_scores.get("skills", {}).get("matched", [])),
-        "missing_skills": json.dumps(category_scores.get("skills", {}).get("missing", [])),
-        "improvement_suggestions": json.dumps(match_data.get("improvement_suggestions", [])),
-        "red_flags": json.dumps(match_data.get("red_flags", [])),
-        "competitive_advantage": match_data.get("competitive_advantage", "")
+    terms = {
+        stored_jobs[job_data["external_id"]][0]: job_candidate_index.job_terms(job_data)
+        for job_data in jobs
+        if job_data["external_id"] in stored_jobs
     }
-    
-    await database.execute(match_insert_query, match_values)
+    return await replace_job_terms(database, terms)
 
 
-async def _store_trending_jobs(jobs: List[Dict[str, Any]]) -> int:
-    """Store trending jobs in database"""
+@shared_task(bind=True)
+def rebuild_job_term_index(self, batch_size: int = 500) -> Dict[str, Any]:
+    """
+    Rebuild candidate index postings for all active jobs
+    Needed once for jobs stored before the index existed, or after skill synonyms change
+    """
+    try:
+        logger.info("Starting job term index rebuild")
+        
+        result = run_async(_rebuild_job_term_index_async(batch_size))
+        return result
+            
+    except Exception as e:
+        logger.error("Job term index rebuild failed", error=str(e))
+        return {"success": False, "error": str(e)}
+
+
+async def _rebuild_job_term_index_async(batch_size: int) -> Dict[str, Any]:
+    """Async helper for the job term index rebuild (keyset pagination over active jobs)"""
     
     database = await get_database()
-    stored_count = 0
     
-    for job_data in jobs:
-        try:
-            # Check if job already exists
-            job_check_query = "SELECT id FROM jobs WHERE external_id = :external_id"
-            existing_job = await database.fetch_one(
-                job_check_query, 
-                {"external_id": job_data.get("external_id")}
-            )
-            
-            if not existing_job:
-                # Insert new trending job (similar to _store_jobs_and_matches)
-                job_insert_query = """
-                INSERT INTO jobs (
-                    external_id, title, description, location,
-                    remote_option, employment_type, required_skills,
-                    salary_min, salary_max, source, posted_date,
-                    application_url, experience_level, is_active
-                ) VALUES (
-                    :external_id, :title, :description, :location,
-                    :remote_option, :employment_type, :required_skills,
-                    :salary_min, :salary_max, :source, :posted_date,
-                    :application_url, :experience_level, true
-                ) ON CONFLICT (external_id) DO NOTHING
-                """
-                
-                job_values = {
-                    "external_id": job_data.get("external_id"),
-                    "title": job_data.get("title"),
-                    "description": job_data.get("description"),
-                    "location": json.dumps(job_data.get("location", {})),
-                    "remote_option": job_data.get("remote_option", "no"),
-                    "employment_type": job_data.get("employment_type", "full-time"),
-                    "required_skills": json.dumps(job_data.get("required_skills", [])),
-                    "salary_min": job_data.get("salary_min"),
-                    "salary_max": job_data.get("salary_max"),
-                    "source": job_data.get("source", "unknown"),
-                    "posted_date": job_data.get("posted_date"),
-                    "application_url": job_data.get("application_url"),
-                    "experience_level": job_data.get("experience_level", "mid-level"),
-                }
-                
-                await database.execute(job_insert_query, job_values)
-                stored_count += 1
-                
-        except Exception as e:
-            logger.warning("Failed to store trending job",
-                          job_id=job_data.get("external_id"),
-                          error=str(e))
-            continue
+    query = """
+    SELECT id, title, required_skills, preferred_skills FROM jobs
+    WHERE is_active = true AND id > :last_id
+    ORDER BY id
+    LIMIT :limit
+    """
+    
+    last_id = 0
+    jobs_indexed = 0
+    while True:
+        results = await database.fetch_all(query, {"last_id": last_id, "limit": batch_size})
+        if not results:
+            break
+        
+        terms = {}
+        for result in results:
+            job = dict(result)
+            for field in ("required_skills", "preferred_skills"):
+                if isinstance(job.get(field), str):
+                    job[field] = json.loads(job[field] or "[]")
+            terms[job["id"]] = job_candidate_index.job_terms(job)
+        
+        jobs_indexed += await replace_job_terms(database, terms)
+        last_id = results[-1]["id"]
+    
+    logger.info("Job term index rebuild completed", jobs_indexed=jobs_indexed)
     
-    return stored_count
\ No newline at end of file
+    return {"success": True, "jobs_indexed": jobs_indexed}
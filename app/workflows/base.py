@@ -3,9 +3,10 @@ Base LangGraph workflow components for JobHire.AI
 Provides common workflow utilities and state management
 """
 
-from typing import Dict, Any, List, Optional, TypedDict, Literal
+from typing import Dict, Any, List, Optional, TypedDict, Literal, Callable, Awaitable
 from enum import Enum
 import asyncio
+import functools
 from datetime import datetime
 import structlog
 from pydantic import BaseModel, Field
@@ -15,6 +16,8 @@ from langgraph.graph import StateGraph, START, END
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.checkpoint.memory import MemorySaver
 
+from ..core.tracing import set_span_error, start_span
+
 logger = structlog.get_logger()
 
 
@@ -148,8 +151,9 @@ class BaseWorkflow:
             
             config = {"configurable": {"thread_id": initial_state["workflow_id"]}}
             
-            # Run the graph
-            final_state = await self.graph.ainvoke(initial_state, config=config)
+            # Run the graph (node spans are children of the workflow span)
+            with start_span(f"workflow {self.__class__.__name__}", attributes=self._span_attributes(initial_state)):
+                final_state = await self.graph.ainvoke(initial_state, config=config)
             
             # Update completion status
             final_state["status"] = WorkflowStatus.COMPLETED
@@ -176,6 +180,33 @@ class BaseWorkflow:
             
             return error_state
     
+    def traced_node(self, name: str, node: Callable[[BaseWorkflowState], Awaitable[BaseWorkflowState]]):
+        """Wrap a graph node so each run is a span; errors the node adds to the state fail the span"""
+        
+        @functools.wraps(node)
+        async def run(state: BaseWorkflowState) -> BaseWorkflowState:
+            with start_span(
+                f"workflow.node {name}",
+                attributes={**self._span_attributes(state), "workflow.node": name}
+            ) as span:
+                errors_before = len(state.get("errors", []))
+                result = await node(state)
+                errors = (result or {}).get("errors", [])
+                if len(errors) > errors_before:
+                    set_span_error(span, str(errors[-1].get("error")))
+                return result
+        
+        return run
+    
+    def _span_attributes(self, state: BaseWorkflowState) -> Dict[str, Any]:
+        return {
+            "workflow.name": self.__class__.__name__,
+            "workflow.id": state.get("workflow_id"),
+            "user.id": state.get("user_id"),
+            "job.id": state.get("job_id"),
+            "user.tier": state.get("user_tier")
+        }
+    
     async def add_error(self, state: BaseWorkflowState, error: str, node: str = None) -> BaseWorkflowState:
         """Add error to workflow state"""
         error_entry = {
@@ -68,15 +68,15 @@ class JobApplicationWorkflow(BaseWorkflow):
         # Create the state graph
         graph = StateGraph(JobApplicationState)
         
-        # Add nodes
-        graph.add_node("analyze_job", self.analyze_job_node)
-        graph.add_node("research_company", self.research_company_node)
-        graph.add_node("evaluate_match", self.evaluate_match_node)
-        graph.add_node("optimize_resume", self.optimize_resume_node)
-        graph.add_node("generate_cover_letter", self.generate_cover_letter_node)
-        graph.add_node("submit_application", self.submit_application_node)
-        graph.add_node("schedule_follow_up", self.schedule_follow_up_node)
-        graph.add_node("log_skip_decision", self.log_skip_decision_node)
+        # Add nodes (each traced as a span of the workflow run)
+        graph.add_node("analyze_job", self.traced_node("analyze_job", self.analyze_job_node))
+        graph.add_node("research_company", self.traced_node("research_company", self.research_company_node))
+        graph.add_node("evaluate_match", self.traced_node("evaluate_match", self.evaluate_match_node))
+        graph.add_node("optimize_resume", self.traced_node("optimize_resume", self.optimize_resume_node))
+        graph.add_node("generate_cover_letter", self.traced_node("generate_cover_letter", self.generate_cover_letter_node))
+        graph.add_node("submit_application", self.traced_node("submit_application", self.submit_application_node))
+        graph.add_node("schedule_follow_up", self.traced_node("schedule_follow_up", self.schedule_follow_up_node))
+        graph.add_node("log_skip_decision", self.traced_node("log_skip_decision", self.log_skip_decision_node))
         
         # Add edges
         graph.add_edge(START, "analyze_job")
@@ -249,7 +249,8 @@ class JobApplicationWorkflow(BaseWorkflow):
                 user_data=user_profile,
                 model_tier=model_tier,
                 provider="openai",
-                temperature=0.3
+                temperature=0.3,
+                operation="resume_optimization"
             )
             
             if ai_result["success"]:
@@ -433,7 +434,8 @@ class JobApplicationWorkflow(BaseWorkflow):
                 user_data=user_profile,
                 model_tier="balanced",
                 provider="openai",
-                temperature=0.2
+                temperature=0.2,
+                operation="job_insights"
             )
             
             if result["success"]:
@@ -0,0 +1,27 @@
+-- Migration for materialized per-user queue statistics
+-- Counters are adjusted on every queue status transition so dashboards read one row
+-- instead of scanning user_queues; refreshed_at marks the last full recount
+
+CREATE TABLE IF NOT EXISTS user_queue_stats (
+    user_id VARCHAR(255) PRIMARY KEY,
+    
+    -- Items per status
+    total_items INTEGER NOT NULL DEFAULT 0,
+    queued INTEGER NOT NULL DEFAULT 0,
+    processing INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    skipped INTEGER NOT NULL DEFAULT 0,
+    applications_submitted INTEGER NOT NULL DEFAULT 0,
+    
+    -- Running sum and count behind avg_match_score
+    match_score_sum FLOAT NOT NULL DEFAULT 0,
+    match_score_count INTEGER NOT NULL DEFAULT 0,
+    
+    refreshed_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE TRIGGER update_user_queue_stats_updated_at 
+    BEFORE UPDATE ON user_queue_stats 
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
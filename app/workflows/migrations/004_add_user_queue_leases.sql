@@ -0,0 +1,10 @@
+-- Migration for lease-based claiming of user_queues items
+-- Processors claim rows with FOR UPDATE SKIP LOCKED and hold a renewable lease; rows whose
+-- lease expires (crashed worker) are returned to the queue, or failed after too many attempts
+
+ALTER TABLE user_queues ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(255);
+ALTER TABLE user_queues ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP;
+ALTER TABLE user_queues ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+
+-- Reaper scan
+CREATE INDEX IF NOT EXISTS idx_user_queues_lease_expiry ON user_queues(lease_expires_at) WHERE status = 'processing';
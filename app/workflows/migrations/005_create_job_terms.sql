@@ -0,0 +1,16 @@
+-- Migration for the job candidate index
+-- Skill and title postings per job, used to pre-filter jobs before full match scoring.
+-- Jobs stored before this migration have no postings until the rebuild_job_term_index
+-- Celery task runs (daily via beat); to backfill right away, run it once by hand:
+--   celery -A app.workers.celery_app call app.workers.job_tasks.rebuild_job_term_index
+-- Until the index has rows, matching falls back to the most recent jobs
+
+CREATE TABLE IF NOT EXISTS job_terms (
+    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    kind VARCHAR(20) NOT NULL,
+    term VARCHAR(255) NOT NULL,
+    PRIMARY KEY (kind, term, job_id)
+);
+
+-- Posting replacement on re-ingestion deletes by job
+CREATE INDEX IF NOT EXISTS idx_job_terms_job_id ON job_terms(job_id);
@@ -4,15 +4,20 @@ Processes jobs from user queues using LangGraph workflows
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+import os
+import socket
+import uuid
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime, timedelta
 import json
 
 try:
     from ..core.database import database
+    from ..core.config import settings
     from ..core.monitoring import performance_monitor
 except ImportError:
     database = None
+    settings = None
     performance_monitor = None
 
 from ..services.user_management_service import user_management_service
@@ -27,13 +32,20 @@ class QueueProcessor:
     """
     Processes jobs from user queues using LangGraph workflows
     Integrates user settings with workflow execution
+    
+    Items are claimed with SELECT ... FOR UPDATE SKIP LOCKED under a renewable lease,
+    so any number of processors can run in parallel; leases of crashed processors
+    expire and are reaped back into the queue.
     """
     
-    def __init__(self):
+    def __init__(self, lease_seconds: Optional[int] = None, max_attempts: Optional[int] = None):
         self.logger = logger.bind(service="QueueProcessor")
         self.processing = False
         self.max_concurrent_jobs = 10
         self.processing_semaphore = asyncio.Semaphore(self.max_concurrent_jobs)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds or (settings.QUEUE_LEASE_SECONDS if settings else 600)
+        self.max_attempts = max_attempts or (settings.QUEUE_MAX_ATTEMPTS if settings else 3)
     
     async def start_processing(self, interval_seconds: int = 30):
         """Start continuous queue processing"""
@@ -42,10 +54,11 @@ class QueueProcessor:
             return
         
         self.processing = True
-        self.logger.info("Starting queue processor", interval=interval_seconds)
+        self.logger.info("Starting queue processor", interval=interval_seconds, worker_id=self.worker_id)
         
         try:
             while self.processing:
+                await user_management_service.reap_expired_queue_leases(self.max_attempts)
                 await self.process_queue_batch()
                 await asyncio.sleep(interval_seconds)
         except Exception as e:
@@ -62,22 +75,16 @@ class QueueProcessor:
     async def process_queue_batch(self, batch_size: int = 20):
         """Process a batch of items from the queue"""
         try:
-            # Get next items to process
-            queue_items = await user_management_service.get_next_queue_items(batch_size)
+            # Claim next items; rows claimed by other processors are skipped
+            queue_items = await user_management_service.claim_queue_items(
+                self.worker_id, batch_size, self.lease_seconds
+            )
             
             if not queue_items:
                 return
             
             self.logger.info("Processing queue batch", item_count=len(queue_items))
-            
-            # Process items concurrently with semaphore limit
-            tasks = []
-            for item in queue_items:
-                task = asyncio.create_task(self._process_queue_item(item))
-                tasks.append(task)
-            
-            # Wait for all tasks to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await self._process_claimed_items(queue_items)
             
             # Log results
             successful = sum(1 for r in results if r is True)
@@ -91,11 +98,63 @@ class QueueProcessor:
         except Exception as e:
             self.logger.error("Failed to process queue batch", error=str(e))
     
-    async def _process_queue_item(self, queue_item: Dict[str, Any]) -> bool:
-        """Process a single queue item"""
+    async def _process_claimed_items(self, queue_items: List[Dict[str, Any]]) -> List[Any]:
+        """Process claimed items concurrently while keeping their leases alive"""
+        context = await self._prefetch_batch_context(queue_items)
+        in_flight = {str(item["id"]) for item in queue_items}
+        renewer = asyncio.create_task(self._renew_leases(in_flight))
+        
+        async def process(item):
+            try:
+                return await self._process_queue_item(item, context)
+            finally:
+                in_flight.discard(str(item["id"]))
+        
+        try:
+            # Process items concurrently with semaphore limit
+            return await asyncio.gather(*(process(item) for item in queue_items), return_exceptions=True)
+        finally:
+            renewer.cancel()
+    
+    async def _renew_leases(self, in_flight: Set[str]):
+        """Extend leases of unfinished items every third of the lease period"""
+        while in_flight:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await user_management_service.renew_queue_leases(
+                    self.worker_id, list(in_flight), self.lease_seconds
+                )
+            except Exception as e:
+                self.logger.warning("Failed to renew queue leases", error=str(e))
+    
+    async def _prefetch_batch_context(self, queue_items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Profiles, search settings and today's application counts for every user in the batch"""
+        user_ids = list({item["user_id"] for item in queue_items})
+        
+        profiles, search_settings, applications_today = await asyncio.gather(
+            user_management_service.get_user_profiles(user_ids),
+            user_management_service.get_search_settings_for_users(user_ids),
+            self._count_applications_today(user_ids)
+        )
+        
+        return {
+            "profiles": profiles,
+            "search_settings": search_settings,
+            "applications_today": applications_today
+        }
+    
+    async def _finish(self, queue_item: Dict[str, Any], updates: Dict[str, Any]) -> bool:
+        return await user_management_service.finish_queue_item(
+            queue_item["user_id"], str(queue_item["id"]), self.worker_id, updates
+        )
+    
+    async def _process_queue_item(self, queue_item: Dict[str, Any], context: Dict[str, Dict[str, Any]]) -> bool:
+        """Process a single claimed queue item"""
         queue_id = queue_item["id"]
         user_id = queue_item["user_id"]
         job_id = queue_item["job_id"]
+        applications_today = context["applications_today"]
+        reserved_slot = False
         
         async with self.processing_semaphore:
             try:
@@ -104,17 +163,9 @@ class QueueProcessor:
                                user_id=user_id, 
                                job_id=job_id)
                 
-                # Mark as processing
-                await user_management_service.update_queue_item(
-                    user_id, str(queue_id), {
-                        "status": "processing",
-                        "processed_at": datetime.utcnow()
-                    }
-                )
-                
                 # Get user profile and settings
-                user_profile = await user_management_service.get_user_profile(user_id)
-                search_settings = await user_management_service.get_search_settings(user_id)
+                user_profile = context["profiles"].get(user_id)
+                search_settings = context["search_settings"].get(user_id)
                 
                 if not user_profile or not search_settings:
                     raise Exception("User profile or search settings not found")
@@ -125,35 +176,34 @@ class QueueProcessor:
                                    user_id=user_id, 
                                    status=search_settings.get("search_status"))
                     
-                    await user_management_service.update_queue_item(
-                        user_id, str(queue_id), {
-                            "status": "skipped",
-                            "processing_error": "User search not active"
-                        }
-                    )
+                    await self._finish(queue_item, {
+                        "status": "skipped",
+                        "processing_error": "User search not active"
+                    })
                     return True
                 
-                # Check daily application limits
+                # Check daily application limits; the slot is reserved before any await so
+                # concurrent items of the same user can't overshoot the limit
                 daily_limit = search_settings.get("max_applications_per_day", 10)
-                applications_today = await self._count_applications_today(user_id)
                 
-                if applications_today >= daily_limit:
+                if applications_today.get(user_id, 0) >= daily_limit:
                     self.logger.info("Daily application limit reached", 
                                    user_id=user_id, 
                                    limit=daily_limit, 
-                                   count=applications_today)
+                                   count=applications_today.get(user_id, 0))
                     
                     # Reschedule for tomorrow
                     tomorrow = datetime.utcnow().replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=1)
-                    await user_management_service.update_queue_item(
-                        user_id, str(queue_id), {
-                            "status": "queued",
-                            "scheduled_for": tomorrow,
-                            "processing_error": "Daily application limit reached"
-                        }
-                    )
+                    await self._finish(queue_item, {
+                        "status": "queued",
+                        "scheduled_for": tomorrow,
+                        "processing_error": "Daily application limit reached"
+                    })
                     return True
                 
+                applications_today[user_id] = applications_today.get(user_id, 0) + 1
+                reserved_slot = True
+                
                 # Prepare job data
                 job_data = queue_item["job_data"]
                 if isinstance(job_data, str):
@@ -177,14 +227,16 @@ class QueueProcessor:
                 
                 if workflow_result.get("should_apply"):
                     update_data["application_id"] = workflow_result.get("application_id")
+                else:
+                    # No application went out, release the reserved slot
+                    applications_today[user_id] -= 1
+                    reserved_slot = False
                 
                 if not workflow_result.get("success"):
                     update_data["processing_error"] = workflow_result.get("error", "Workflow failed")
                     update_data["status"] = "failed"
                 
-                await user_management_service.update_queue_item(
-                    user_id, str(queue_id), update_data
-                )
+                await self._finish(queue_item, update_data)
                 
                 self.logger.info("Queue item processed successfully", 
                                queue_id=str(queue_id), 
@@ -197,42 +249,44 @@ class QueueProcessor:
                                 queue_id=str(queue_id), 
                                 error=str(e))
                 
+                if reserved_slot:
+                    applications_today[user_id] -= 1
+                
                 # Mark as failed
-                await user_management_service.update_queue_item(
-                    user_id, str(queue_id), {
-                        "status": "failed",
-                        "processing_error": str(e)
-                    }
-                )
+                await self._finish(queue_item, {
+                    "status": "failed",
+                    "processing_error": str(e)
+                })
                 
                 return False
     
-    async def _count_applications_today(self, user_id: str) -> int:
-        """Count applications submitted today for user"""
+    async def _count_applications_today(self, user_ids: List[str]) -> Dict[str, int]:
+        """Count applications submitted today, per user"""
         try:
-            if not database:
-                return 0
+            if not database or not user_ids:
+                return {}
                 
             today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
             
             query = """
-                SELECT COUNT(*) as count 
+                SELECT user_id, COUNT(*) as count 
                 FROM user_queues 
-                WHERE user_id = :user_id 
+                WHERE user_id = ANY(:user_ids) 
                 AND application_submitted = TRUE 
                 AND processed_at >= :today_start
+                GROUP BY user_id
             """
             
-            result = await database.fetch_one(query, {
-                "user_id": user_id,
+            results = await database.fetch_all(query, {
+                "user_ids": user_ids,
                 "today_start": today_start
             })
             
-            return result["count"] if result else 0
+            return {result["user_id"]: result["count"] for result in results}
             
         except Exception as e:
-            self.logger.error("Failed to count applications today", user_id=user_id, error=str(e))
-            return 0
+            self.logger.error("Failed to count applications today", user_count=len(user_ids), error=str(e))
+            return {}
     
     async def process_single_job(self, user_id: str, job_data: Dict[str, Any], priority: QueuePriority = QueuePriority.NORMAL) -> Dict[str, Any]:
         """Process a single job immediately (bypass queue)"""
@@ -268,20 +322,17 @@ class QueueProcessor:
     async def priority_process_queue_item(self, queue_id: str) -> Dict[str, Any]:
         """Process a specific queue item with priority"""
         try:
-            # Get queue item
-            if not database:
-                return {"success": False, "error": "Database not available"}
-                
-            query = "SELECT * FROM user_queues WHERE id = :queue_id AND status = 'queued'"
-            result = await database.fetch_one(query, {"queue_id": queue_id})
+            # Claim the item; fails if it is not queued or another processor has it
+            queue_items = await user_management_service.claim_queue_items(
+                self.worker_id, 1, self.lease_seconds, queue_id=queue_id
+            )
             
-            if not result:
+            if not queue_items:
                 return {"success": False, "error": "Queue item not found or not in queued status"}
             
-            queue_item = dict(result)
-            
             # Process the item
-            success = await self._process_queue_item(queue_item)
+            results = await self._process_claimed_items(queue_items)
+            success = results[0] is True
             
             return {
                 "success": success,
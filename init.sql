@@ -107,6 +107,14 @@ CREATE TABLE IF NOT EXISTS job_matches (
     UNIQUE(user_id, job_id)
 );
 
+-- Job candidate index (skill and title postings per job)
+CREATE TABLE IF NOT EXISTS job_terms (
+    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    kind VARCHAR(20) NOT NULL,
+    term VARCHAR(255) NOT NULL,
+    PRIMARY KEY (kind, term, job_id)
+);
+
 -- Job applications table
 CREATE TABLE IF NOT EXISTS job_applications (
     id SERIAL PRIMARY KEY,
@@ -183,6 +191,7 @@ CREATE INDEX idx_jobs_active ON jobs(is_active) WHERE is_active = true;
 CREATE INDEX idx_jobs_posted_date ON jobs(posted_date);
 CREATE INDEX idx_job_matches_user_id ON job_matches(user_id);
 CREATE INDEX idx_job_matches_score ON job_matches(overall_score);
+CREATE INDEX idx_job_terms_job_id ON job_terms(job_id);
 CREATE INDEX idx_job_applications_user_id ON job_applications(user_id);
 CREATE INDEX idx_job_applications_status ON job_applications(status);
 CREATE INDEX idx_job_applications_submitted ON job_applications(submitted_at);
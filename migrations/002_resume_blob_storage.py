@@ -0,0 +1,27 @@
+"""
+Resume Blob Storage Migration
+Resume files move out of resumes.file_content into content-addressed blob storage;
+rows keep the SHA-256 digest of their file
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Add the blob digest column to resumes"""
+
+    op.add_column('resumes', sa.Column('content_sha256', sa.String(64)))
+    op.create_index('idx_resumes_content_sha256', 'resumes', ['content_sha256'])
+
+
+def downgrade():
+    """Drop the blob digest column"""
+
+    op.drop_index('idx_resumes_content_sha256', table_name='resumes')
+    op.drop_column('resumes', 'content_sha256')
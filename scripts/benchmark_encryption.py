@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark field encryption against the previous XOR implementation.
+"""
+
+import argparse
+import base64
+import hashlib
+import secrets
+import sys
+import time
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from jobhire.shared.infrastructure.security.encryption import EncryptionService
+
+
+class LegacyXorEncryption:
+    """The per-byte XOR loop EncryptionService used before AES-GCM (baseline only)."""
+
+    def __init__(self, secret_key: str):
+        self.key = hashlib.pbkdf2_hmac('sha256', secret_key.encode(), b'salt_', 100000)
+
+    def encrypt(self, data: str) -> str:
+        encrypted = bytearray()
+        for i, byte in enumerate(data.encode('utf-8')):
+            encrypted.append(byte ^ self.key[i % len(self.key)])
+        return base64.b64encode(secrets.token_bytes(16) + bytes(encrypted)).decode('utf-8')
+
+    def decrypt(self, encrypted_data: str) -> str:
+        actual_data = base64.b64decode(encrypted_data.encode('utf-8'))[16:]
+        decrypted = bytearray()
+        for i, byte in enumerate(actual_data):
+            decrypted.append(byte ^ self.key[i % len(self.key)])
+        return decrypted.decode('utf-8')
+
+
+def measure(label: str, operation, count: int, size: int) -> float:
+    """Run operation once and print its throughput."""
+    start = time.perf_counter()
+    operation()
+    elapsed = time.perf_counter() - start
+    megabytes = count * size / (1024 * 1024)
+    print(f"{label:<32} {elapsed * 1000:>10.1f} ms {count / elapsed:>12.0f} values/s {megabytes / elapsed:>9.1f} MB/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark field encryption")
+    parser.add_argument("--count", type=int, default=2000, help="Values per run")
+    parser.add_argument("--size", type=int, default=8192, help="Value size in bytes (a typical resume)")
+    args = parser.parse_args()
+
+    secret = "benchmark-secret-key"
+    values = [secrets.token_hex(args.size // 2) for _ in range(args.count)]
+    associated = [f"users.full_name:{index}" for index in range(args.count)]
+
+    legacy = LegacyXorEncryption(secret)
+    service = EncryptionService(secret_key=secret)
+
+    print(f"{args.count} values of {args.size} bytes\n")
+
+    legacy_tokens = []
+    legacy_encrypt = measure(
+        "legacy XOR encrypt", lambda: legacy_tokens.extend(legacy.encrypt(v) for v in values), args.count, args.size
+    )
+    legacy_decrypt = measure(
+        "legacy XOR decrypt", lambda: [legacy.decrypt(t) for t in legacy_tokens], args.count, args.size
+    )
+
+    tokens = []
+    measure(
+        "AES-GCM encrypt (per value)",
+        lambda: tokens.extend(service.encrypt(v, a) for v, a in zip(values, associated)),
+        args.count,
+        args.size
+    )
+    measure(
+        "AES-GCM decrypt (per value)",
+        lambda: [service.decrypt(t, a) for t, a in zip(tokens, associated)],
+        args.count,
+        args.size
+    )
+
+    batch_tokens = []
+    batch_encrypt = measure(
+        "AES-GCM encrypt_many",
+        lambda: batch_tokens.extend(service.encrypt_many(values, associated)),
+        args.count,
+        args.size
+    )
+    batch_decrypt = measure(
+        "AES-GCM decrypt_many",
+        lambda: service.decrypt_many(batch_tokens, associated),
+        args.count,
+        args.size
+    )
+
+    print(f"\nencrypt speedup: {legacy_encrypt / batch_encrypt:.0f}x, decrypt speedup: {legacy_decrypt / batch_decrypt:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,13 @@ Enterprise application settings with comprehensive configuration management.
 
 import os
 from functools import lru_cache
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings
 
+# Placeholder SECRET_KEY for local development; never valid for deployed environments
+DEFAULT_SECRET_KEY = "dev-secret-key-change-in-production"
+
 
 class DatabaseSettings(BaseSettings):
     """Database configuration settings."""
@@ -18,6 +21,7 @@ class DatabaseSettings(BaseSettings):
     mongodb_test_database: str = Field(default="jobhire_ai_test", env="MONGODB_TEST_DATABASE")
     mongodb_min_pool_size: int = Field(default=10, env="MONGODB_MIN_POOL_SIZE")
     mongodb_max_pool_size: int = Field(default=100, env="MONGODB_MAX_POOL_SIZE")
+    mongodb_transactions: bool = Field(default=False, env="MONGODB_TRANSACTIONS")  # Needs a replica set; commits aggregates and outbox events atomically
 
     # Redis (Cache & Queue)
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
@@ -30,7 +34,7 @@ class SecuritySettings(BaseSettings):
     """Security configuration settings."""
 
     # JWT Configuration
-    secret_key: str = Field(default="dev-secret-key-change-in-production", env="SECRET_KEY")
+    secret_key: str = Field(default=DEFAULT_SECRET_KEY, env="SECRET_KEY")
     algorithm: str = Field(default="HS256", env="JWT_ALGORITHM")
     access_token_expire_minutes: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
     refresh_token_expire_days: int = Field(default=7, env="REFRESH_TOKEN_EXPIRE_DAYS")
@@ -47,6 +51,10 @@ class SecuritySettings(BaseSettings):
     rate_limit_requests_per_minute: int = Field(default=100, env="RATE_LIMIT_REQUESTS_PER_MINUTE")
     rate_limit_burst: int = Field(default=20, env="RATE_LIMIT_BURST")
 
+    # Field Encryption
+    encryption_keys: Optional[str] = Field(default=None, env="ENCRYPTION_KEYS")  # "key_id:base64 32-byte key,..."; required outside development/testing
+    encryption_active_key_id: Optional[str] = Field(default=None, env="ENCRYPTION_ACTIVE_KEY_ID")  # Key for new ciphertexts; defaults to the last listed
+
     # CORS
     allowed_origins: List[str] = Field(default=["http://localhost:3000"], env="ALLOWED_ORIGINS")
     allowed_methods: List[str] = Field(default=["GET", "POST", "PUT", "DELETE", "PATCH"], env="ALLOWED_METHODS")
@@ -65,6 +73,17 @@ class SecuritySettings(BaseSettings):
             return []
         return [key.strip() for key in self.api_keys.split(",")]
 
+    @property
+    def encryption_keys_map(self) -> Dict[str, str]:
+        """Get field encryption keys by key ID, in listed order."""
+        if not self.encryption_keys:
+            return {}
+        keys = {}
+        for entry in self.encryption_keys.split(","):
+            key_id, _, key = entry.strip().partition(":")
+            keys[key_id.strip()] = key.strip()
+        return keys
+
 
 class MonitoringSettings(BaseSettings):
     """Monitoring and observability settings."""
@@ -78,11 +97,15 @@ class MonitoringSettings(BaseSettings):
     enable_metrics: bool = Field(default=True, env="ENABLE_METRICS")
     metrics_port: int = Field(default=8001, env="METRICS_PORT")
     prometheus_endpoint: str = Field(default="/metrics", env="PROMETHEUS_ENDPOINT")
+    slow_request_threshold: float = Field(default=1.0, env="SLOW_REQUEST_THRESHOLD")  # seconds; slower requests get trace exemplars
 
     # Tracing
     enable_tracing: bool = Field(default=False, env="ENABLE_TRACING")
     jaeger_endpoint: Optional[str] = Field(default=None, env="JAEGER_ENDPOINT")
     trace_sampling_rate: float = Field(default=0.1, env="TRACE_SAMPLING_RATE")
+    trace_exporter: str = Field(default="otlp", env="TRACE_EXPORTER")  # otlp, file, console or none
+    otlp_endpoint: Optional[str] = Field(default=None, env="OTLP_ENDPOINT")  # e.g. http://collector:4318/v1/traces
+    trace_file_path: str = Field(default="traces.jsonl", env="TRACE_FILE_PATH")  # used by the file exporter
 
     # Error Tracking
     sentry_dsn: Optional[str] = Field(default=None, env="SENTRY_DSN")
@@ -150,6 +173,20 @@ class PerformanceSettings(BaseSettings):
     max_applications_per_day: int = Field(default=50, env="MAX_APPLICATIONS_PER_DAY")
     max_file_size_mb: int = Field(default=10, env="MAX_FILE_SIZE_MB")
 
+    # Interview sessions
+    interview_session_cache_size: int = Field(default=1000, env="INTERVIEW_SESSION_CACHE_SIZE")  # Sessions cached per worker
+    interview_session_idle_ttl: int = Field(default=7200, env="INTERVIEW_SESSION_IDLE_TTL")  # 2 hours; idle active sessions expire
+
+    # Job queue
+    job_queue_max_claims: int = Field(default=5, env="JOB_QUEUE_MAX_CLAIMS")  # Then an unfinished item is dead-lettered as failed
+
+    # Domain event outbox
+    event_outbox_batch_size: int = Field(default=100, env="EVENT_OUTBOX_BATCH_SIZE")  # Events claimed per dispatcher round
+    event_outbox_poll_interval: float = Field(default=1.0, env="EVENT_OUTBOX_POLL_INTERVAL")  # Seconds between polls when idle
+    event_outbox_max_attempts: int = Field(default=10, env="EVENT_OUTBOX_MAX_ATTEMPTS")  # Then the event is parked as dead
+    event_outbox_retention_days: int = Field(default=7, env="EVENT_OUTBOX_RETENTION_DAYS")  # Dispatched events kept for replay/debugging
+    event_handler_concurrency: int = Field(default=10, env="EVENT_HANDLER_CONCURRENCY")  # Concurrent deliveries per handler
+
     # Background Tasks
     celery_broker_url: str = Field(default="redis://localhost:6379/0", env="CELERY_BROKER_URL")
     celery_result_backend: str = Field(default="redis://localhost:6379/0", env="CELERY_RESULT_BACKEND")
@@ -0,0 +1,6 @@
+"""Interview persistence infrastructure."""
+
+from .interview_session_repository import InterviewSessionRepository
+from .interview_session_store import InterviewSessionStore
+
+__all__ = ["InterviewSessionRepository", "InterviewSessionStore"]
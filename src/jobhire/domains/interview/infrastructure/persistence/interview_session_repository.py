@@ -0,0 +1,205 @@
+"""
+Interview session repository implementation.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING
+
+from jobhire.shared.domain.types import EntityId
+from jobhire.shared.domain.exceptions import ConcurrencyException
+from jobhire.shared.infrastructure.repositories import BaseMongoRepository
+from jobhire.domains.interview.domain.entities.interview_session import (
+    InterviewSession, InterviewMessage, InterviewFeedback,
+    InterviewStatus, InterviewType, DifficultyLevel
+)
+
+
+# Sessions in these states expire after the idle TTL; finished ones are kept for history
+ACTIVE_STATUSES = (InterviewStatus.CREATED, InterviewStatus.IN_PROGRESS)
+
+
+class InterviewSessionRepository(BaseMongoRepository[InterviewSession]):
+    """
+    Repository for interview sessions.
+
+    The transcript lives in the session document, but updates only $push the messages
+    added since the last save, so an answer never rewrites the whole conversation.
+    Saves are conditional on the stored version to catch concurrent writers.
+    """
+
+    # Everything except the transcript and per-question working data
+    SUMMARY_PROJECTION = {"messages": 0, "planned_questions": 0, "answer_evaluations": 0, "job_description": 0}
+
+    def __init__(self, database: AsyncIOMotorDatabase, idle_ttl_seconds: int = 7200):
+        super().__init__(database, "interview_sessions", InterviewSession)
+        self.idle_ttl = timedelta(seconds=idle_ttl_seconds)
+
+    async def ensure_indexes(self) -> None:
+        """Create the history and idle-expiry indexes."""
+        await self.collection.create_index(
+            [("user_id", ASCENDING), ("created_at", DESCENDING)],
+            name="user_sessions"
+        )
+        # expires_at is only set on active sessions and pushed forward on every save
+        await self.collection.create_index("expires_at", expireAfterSeconds=0, name="idle_expiry")
+
+    async def create(self, session: InterviewSession) -> None:
+        """Create a new interview session."""
+        document = {
+            "_id": str(session.id),
+            **self._session_fields(session),
+            "messages": [self._message_to_document(message) for message in session.messages]
+        }
+        await self.collection.insert_one(document)
+        self._mark_stored(session)
+
+    async def update(self, session: InterviewSession) -> None:
+        """Persist changes since the session was loaded or last saved."""
+        stored_version = getattr(session, "_stored_version", None)
+        if stored_version is None:
+            raise ValueError(f"Interview session {session.id} was not loaded for update")
+
+        if session.version == stored_version:
+            # Working data (evaluations, planned questions) can change without a version bump
+            session.increment_version()
+
+        update: Dict[str, Any] = {"$set": self._session_fields(session)}
+        new_messages = session.messages[session._stored_message_count:]
+        if new_messages:
+            update["$push"] = {
+                "messages": {"$each": [self._message_to_document(message) for message in new_messages]}
+            }
+
+        result = await self.collection.update_one(
+            {"_id": str(session.id), "version": stored_version},
+            update
+        )
+        if result.matched_count == 0:
+            raise ConcurrencyException(f"Interview session {session.id} was modified or has expired")
+
+        self._mark_stored(session)
+
+    async def find_by_id(self, session_id: EntityId) -> Optional[InterviewSession]:
+        """Find interview session by ID, with its full transcript."""
+        document = await self.collection.find_one({"_id": str(session_id)})
+        if not document:
+            return None
+        return self._document_to_entity(document)
+
+    async def get_version(self, session_id: EntityId) -> Optional[int]:
+        """Stored version of a session, without loading it."""
+        document = await self.collection.find_one({"_id": str(session_id)}, {"version": 1})
+        return document["version"] if document else None
+
+    async def find_by_user_id(self, user_id: EntityId, limit: Optional[int] = None) -> List[InterviewSession]:
+        """
+        Newest-first sessions for a user, without transcripts.
+        Returned sessions are read-only summaries and cannot be passed to update().
+        """
+        cursor = self.collection.find(
+            {"user_id": str(user_id)},
+            self.SUMMARY_PROJECTION
+        ).sort("created_at", DESCENDING)
+        if limit:
+            cursor = cursor.limit(limit)
+
+        sessions = []
+        async for document in cursor:
+            session = self._document_to_entity(document)
+            # Don't let a transcript-less summary be written back
+            session._stored_version = None
+            sessions.append(session)
+        return sessions
+
+    def _session_fields(self, session: InterviewSession) -> Dict[str, Any]:
+        now = datetime.utcnow()
+        feedback = session.feedback
+        return {
+            "user_id": str(session.user_id),
+            "job_description": session.job_description,
+            "interview_type": session.interview_type.value,
+            "difficulty_level": session.difficulty_level.value,
+            "status": session.status.value,
+            "created_at": session.created_at,
+            "started_at": session.started_at,
+            "completed_at": session.completed_at,
+            "current_question_index": session.current_question_index,
+            "total_questions_planned": session.total_questions_planned,
+            "feedback": {
+                "overall_score": feedback.overall_score,
+                "strengths": feedback.strengths,
+                "areas_for_improvement": feedback.areas_for_improvement,
+                "detailed_feedback": feedback.detailed_feedback,
+                "question_scores": feedback.question_scores,
+                "recommendations": feedback.recommendations,
+                "estimated_performance": feedback.estimated_performance
+            } if feedback else None,
+            "ai_personality": session.ai_personality,
+            "estimated_duration_minutes": session.estimated_duration_minutes,
+            "actual_duration_minutes": session.actual_duration_minutes,
+            "job_title": session.job_title,
+            "company_name": session.company_name,
+            "planned_questions": getattr(session, "planned_questions", []),
+            "answer_evaluations": getattr(session, "answer_evaluations", []),
+            "message_count": len(session.messages),
+            "last_active_at": now,
+            "expires_at": now + self.idle_ttl if session.status in ACTIVE_STATUSES else None,
+            "version": session.version
+        }
+
+    @staticmethod
+    def _message_to_document(message: InterviewMessage) -> Dict[str, Any]:
+        return {
+            "id": message.id,
+            "sender": message.sender,
+            "content": message.content,
+            "timestamp": message.timestamp,
+            "message_type": message.message_type,
+            "metadata": message.metadata
+        }
+
+    @staticmethod
+    def _mark_stored(session: InterviewSession) -> None:
+        session._stored_version = session.version
+        session._stored_message_count = len(session.messages)
+
+    def _document_to_entity(self, document: Dict[str, Any]) -> InterviewSession:
+        """Convert MongoDB document to InterviewSession entity."""
+        session = InterviewSession(
+            session_id=EntityId.from_string(document["_id"]),
+            user_id=EntityId.from_string(document["user_id"]),
+            job_description=document.get("job_description", ""),
+            interview_type=InterviewType(document["interview_type"]),
+            difficulty_level=DifficultyLevel(document["difficulty_level"])
+        )
+        # Loading is not creation
+        session.clear_domain_events()
+
+        session.status = InterviewStatus(document["status"])
+        session.created_at = document["created_at"]
+        session.started_at = document.get("started_at")
+        session.completed_at = document.get("completed_at")
+        session.current_question_index = document.get("current_question_index", 0)
+        session.total_questions_planned = document.get("total_questions_planned", 0)
+        session.ai_personality = document.get("ai_personality", "professional")
+        session.estimated_duration_minutes = document.get("estimated_duration_minutes", 30)
+        session.actual_duration_minutes = document.get("actual_duration_minutes")
+        session.job_title = document.get("job_title")
+        session.company_name = document.get("company_name")
+        session.version = document.get("version", 1)
+
+        if document.get("feedback"):
+            session.feedback = InterviewFeedback(**document["feedback"])
+
+        if "planned_questions" in document:
+            session.planned_questions = document["planned_questions"]
+        if document.get("answer_evaluations"):
+            session.answer_evaluations = document["answer_evaluations"]
+
+        session.messages = [
+            InterviewMessage(**message) for message in document.get("messages", [])
+        ]
+        self._mark_stored(session)
+        return session
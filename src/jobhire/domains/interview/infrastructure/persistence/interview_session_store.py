@@ -0,0 +1,94 @@
+"""
+Cached interview session store.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+import structlog
+
+from jobhire.shared.domain.types import EntityId
+from jobhire.shared.domain.exceptions import ConcurrencyException
+from jobhire.domains.interview.domain.entities.interview_session import InterviewSession
+from .interview_session_repository import InterviewSessionRepository
+
+logger = structlog.get_logger(__name__)
+
+
+class InterviewSessionStore:
+    """
+    Per-process LRU of interview sessions in front of the repository.
+
+    Each request gets its own copy of the cached aggregate and its changes are
+    written back once, as a single delta, when the request saves it. Concurrent
+    requests on one session never share an object: the first save wins and the
+    others fail the version check with ConcurrencyException. Cached entries are
+    validated against the stored version before use, so any worker can serve any
+    session without sticky routing; a hit costs one small version lookup and an
+    in-memory copy instead of a full transcript load. Entries idle longer than the
+    TTL are dropped.
+    """
+
+    def __init__(
+        self,
+        repository: InterviewSessionRepository,
+        max_sessions: int = 1000,
+        idle_ttl_seconds: int = 7200
+    ):
+        self.repository = repository
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl_seconds
+        self._sessions: "OrderedDict[str, Tuple[InterviewSession, float]]" = OrderedDict()
+
+    async def get(self, session_id: str) -> Optional[InterviewSession]:
+        """Current session for one request, from the cache when it is up to date."""
+        cached = self._cached(session_id)
+        if cached is not None:
+            if await self.repository.get_version(cached.id) == cached.version:
+                return copy.deepcopy(cached)
+            # Changed by another worker
+            self._sessions.pop(session_id, None)
+
+        session = await self.repository.find_by_id(EntityId.from_string(session_id))
+        if session is not None:
+            self._remember(copy.deepcopy(session))
+        return session
+
+    async def add(self, session: InterviewSession) -> None:
+        """Persist a new session and cache it."""
+        await self.repository.create(session)
+        self._remember(copy.deepcopy(session))
+
+    async def save(self, session: InterviewSession) -> None:
+        """Write back the changes made to a session."""
+        try:
+            await self.repository.update(session)
+        except ConcurrencyException:
+            self._sessions.pop(str(session.id), None)
+            raise
+        self._remember(copy.deepcopy(session))
+
+    async def list_for_user(self, user_id: str, limit: Optional[int] = None) -> List[InterviewSession]:
+        """Newest-first session summaries for a user (not cached)."""
+        return await self.repository.find_by_user_id(EntityId.from_string(user_id), limit)
+
+    def _cached(self, session_id: str) -> Optional[InterviewSession]:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+
+        session, last_access = entry
+        if time.monotonic() - last_access > self.idle_ttl:
+            del self._sessions[session_id]
+            return None
+        return session
+
+    def _remember(self, session: InterviewSession) -> None:
+        session_id = str(session.id)
+        self._sessions[session_id] = (session, time.monotonic())
+        self._sessions.move_to_end(session_id)
+
+        while len(self._sessions) > self.max_sessions:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            logger.debug("Interview session evicted from cache", session_id=evicted_id)
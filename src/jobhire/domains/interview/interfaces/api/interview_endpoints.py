@@ -7,11 +7,14 @@ from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
 import structlog
 
 from jobhire.shared.domain.types import EntityId
+from jobhire.shared.domain.exceptions import ConcurrencyException
 from jobhire.shared.infrastructure.security import get_current_user, require_permission, Permission
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
+from jobhire.shared.infrastructure.container import get_interview_session_store
 
 from jobhire.domains.interview.application.services.interview_service import InterviewService
 from jobhire.domains.interview.infrastructure.ai.interview_ai_service import InterviewAIService
+from jobhire.domains.interview.infrastructure.persistence import InterviewSessionStore
+from jobhire.domains.interview.domain.entities.interview_session import InterviewSession
 from jobhire.domains.interview.application.dto.interview_dto import (
     CreateInterviewSessionDTO, StartInterviewDTO, SubmitAnswerDTO,
     InterviewSessionResponseDTO, InterviewProgressDTO, InterviewChatHistoryDTO,
@@ -22,9 +25,6 @@ from jobhire.domains.interview.application.dto.interview_dto import (
 logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/interview", tags=["🎯 AI Mock Interview"])
 
-# In-memory storage for demo (replace with actual repository)
-interview_sessions = {}
-
 
 async def get_interview_service() -> InterviewService:
     """Dependency to get interview service."""
@@ -32,12 +32,29 @@ async def get_interview_service() -> InterviewService:
     return InterviewService(ai_service=ai_service)
 
 
+async def _get_owned_session(
+    session_store: InterviewSessionStore,
+    session_id: str,
+    current_user
+) -> InterviewSession:
+    """Load a session, enforcing that it belongs to the current user."""
+    session = await session_store.get(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Interview session not found")
+
+    # Verify user ownership
+    if str(session.user_id) != current_user["user_id"]:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    return session
+
+
 @router.post("/sessions", response_model=InterviewSessionResponseDTO)
-@measure_http_request("/interview/sessions")
 async def create_interview_session(
     session_data: CreateInterviewSessionDTO,
     current_user=Depends(get_current_user),
-    interview_service: InterviewService = Depends(get_interview_service)
+    interview_service: InterviewService = Depends(get_interview_service),
+    session_store: InterviewSessionStore = Depends(get_interview_session_store)
 ):
     """
     Create a new AI mock interview session.
@@ -77,8 +94,7 @@ async def create_interview_session(
             ai_personality=session_data.ai_personality
         )
 
-        # Store session in memory (replace with repository)
-        interview_sessions[str(session.id)] = session
+        await session_store.add(session)
 
         logger.info("Interview session created", session_id=str(session.id))
 
@@ -90,12 +106,12 @@ async def create_interview_session(
 
 
 @router.post("/sessions/{session_id}/start", response_model=NextQuestionResponseDTO)
-@measure_http_request("/interview/sessions/start")
 async def start_interview_session(
     session_id: str,
     start_data: StartInterviewDTO,
     current_user=Depends(get_current_user),
-    interview_service: InterviewService = Depends(get_interview_service)
+    interview_service: InterviewService = Depends(get_interview_service),
+    session_store: InterviewSessionStore = Depends(get_interview_session_store)
 ):
     """
     Start an interview session with AI welcome message and first question.
@@ -112,13 +128,7 @@ async def start_interview_session(
     - Readiness for first question
     """
     try:
-        session = interview_sessions.get(session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-
-        # Verify user ownership
-        if str(session.user_id) != current_user["user_id"]:
-            raise HTTPException(status_code=403, detail="Access denied")
+        session = await _get_owned_session(session_store, session_id, current_user)
 
         session = await interview_service.start_interview_session(
             session=session,
@@ -127,6 +137,7 @@ async def start_interview_session(
 
         # Get first question
         first_question = await interview_service.ask_next_question(session)
+        await session_store.save(session)
 
         logger.info("Interview session started", session_id=session_id)
 
@@ -141,18 +152,20 @@ async def start_interview_session(
 
     except HTTPException:
         raise
+    except ConcurrencyException:
+        raise HTTPException(status_code=409, detail="Interview session was changed by another request")
     except Exception as e:
         logger.error("Failed to start interview session", error=str(e))
         raise HTTPException(status_code=500, detail="Failed to start interview session")
 
 
 @router.post("/sessions/{session_id}/answer", response_model=AnswerFeedbackResponseDTO)
-@measure_http_request("/interview/sessions/answer")
 async def submit_answer(
     session_id: str,
     answer_data: SubmitAnswerDTO,
     current_user=Depends(get_current_user),
-    interview_service: InterviewService = Depends(get_interview_service)
+    interview_service: InterviewService = Depends(get_interview_service),
+    session_store: InterviewSessionStore = Depends(get_interview_session_store)
 ):
     """
     Submit an answer to the current interview question.
@@ -176,13 +189,7 @@ async def submit_answer(
     - Session completion when appropriate
     """
     try:
-        session = interview_sessions.get(session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-
-        # Verify user ownership
-        if str(session.user_id) != current_user["user_id"]:
-            raise HTTPException(status_code=403, detail="Access denied")
+        session = await _get_owned_session(session_store, session_id, current_user)
 
         # Process the answer
         feedback = await interview_service.process_answer(
@@ -190,6 +197,7 @@ async def submit_answer(
             answer=answer_data.answer,
             provide_feedback=answer_data.request_feedback
         )
+        await session_store.save(session)
 
         # Determine next action
         next_action = "continue"
@@ -213,17 +221,19 @@ async def submit_answer(
 
     except HTTPException:
         raise
+    except ConcurrencyException:
+        raise HTTPException(status_code=409, detail="Interview session was changed by another request")
     except Exception as e:
         logger.error("Failed to submit answer", error=str(e))
         raise HTTPException(status_code=500, detail="Failed to submit answer")
 
 
 @router.get("/sessions/{session_id}/next-question", response_model=NextQuestionResponseDTO)
-@measure_http_request("/interview/sessions/next-question")
 async def get_next_question(
     session_id: str,
     current_user=Depends(get_current_user),
-    interview_service: InterviewService = Depends(get_interview_service)
+    interview_service: InterviewService = Depends(get_interview_service),
+    session_store: InterviewSessionStore = Depends(get_interview_session_store)
 ):
     """
     Get the next interview question.
@@ -243,15 +253,10 @@ async def get_next_question(
     - Company fit and motivation
     """
     try:
-        session = interview_sessions.get(session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-
-        # Verify user ownership
-        if str(session.user_id) != current_user["user_id"]:
-            raise HTTPException(status_code=403, detail="Access denied")
+        session = await _get_owned_session(session_store, session_id, current_user)
 
         next_question = await interview_service.ask_next_question(session)
+        await session_store.save(session)
 
         is_complete = next_question is None or session.is_interview_complete()
 
@@ -266,18 +271,20 @@ async def get_next_question(
 
     except HTTPException:
         raise
+    except ConcurrencyException:
+        raise HTTPException(status_code=409, detail="Interview session was changed by another request")
     except Exception as e:
         logger.error("Failed to get next question", error=str(e))
         raise HTTPException(status_code=500, detail="Failed to get next question")
 
 
 @router.post("/sessions/{session_id}/complete", response_model=InterviewSessionResponseDTO)
-@measure_http_request("/interview/sessions/complete")
 async def complete_interview(
     session_id: str,
     complete_data: CompleteInterviewDTO,
     current_user=Depends(get_current_user),
-    interview_service: InterviewService = Depends(get_interview_service)
+    interview_service: InterviewService = Depends(get_interview_service),
+    session_store: InterviewSessionStore = Depends(get_interview_session_store)
 ):
     """
     Complete the interview session and generate comprehensive feedback.
@@ -305,15 +312,10 @@ async def complete_interview(
     - Confidence and clarity
     """
     try:
-        session = interview_sessions.get(session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-
-        # Verify user ownership
-        if str(session.user_id) != current_user["user_id"]:
-            raise HTTPException(status_code=403, detail="Access denied")
+        session = await _get_owned_session(session_store, session_id, current_user)
 
         completed_session = await interview_service.complete_interview(session)
+        await session_store.save(completed_session)
 
         logger.info("Interview session completed", session_id=session_id,
                    overall_score=completed_session.feedback.overall_score if completed_session.feedback else None)
@@ -322,17 +324,19 @@ async def complete_interview(
 
     except HTTPException:
         raise
+    except ConcurrencyException:
+        raise HTTPException(status_code=409, detail="Interview session was changed by another request")
     except Exception as e:
         logger.error("Failed to complete interview session", error=str(e))
         raise HTTPException(status_code=500, detail="Failed to complete interview session")
 
 
 @router.get("/sessions/{session_id}/progress", response_model=InterviewProgressDTO)
-@measure_http_request("/interview/sessions/progress")
 async def get_interview_progress(
     session_id: str,
     current_user=Depends(get_current_user),
-    interview_service: InterviewService = Depends(get_interview_service)
+    interview_service: InterviewService = Depends(get_interview_service),
+    session_store: InterviewSessionStore = Depends(get_interview_session_store)
 ):
     """
     Get real-time interview session progress.
@@ -345,13 +349,7 @@ async def get_interview_progress(
     - Performance indicators
     """
     try:
-        session = interview_sessions.get(session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-
-        # Verify user ownership
-        if str(session.user_id) != current_user["user_id"]:
-            raise HTTPException(status_code=403, detail="Access denied")
+        session = await _get_owned_session(session_store, session_id, current_user)
 
         progress = await interview_service.get_session_progress(session)
 
@@ -365,12 +363,12 @@ async def get_interview_progress(
 
 
 @router.get("/sessions/{session_id}/chat", response_model=InterviewChatHistoryDTO)
-@measure_http_request("/interview/sessions/chat")
 async def get_chat_history(
     session_id: str,
     limit: Optional[int] = Query(None, description="Limit number of messages"),
     current_user=Depends(get_current_user),
-    interview_service: InterviewService = Depends(get_interview_service)
+    interview_service: InterviewService = Depends(get_interview_service),
+    session_store: InterviewSessionStore = Depends(get_interview_session_store)
 ):
     """
     Get the complete conversation history for an interview session.
@@ -390,13 +388,7 @@ async def get_chat_history(
     - `follow_up`: Additional probing questions
     """
     try:
-        session = interview_sessions.get(session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-
-        # Verify user ownership
-        if str(session.user_id) != current_user["user_id"]:
-            raise HTTPException(status_code=403, detail="Access denied")
+        session = await _get_owned_session(session_store, session_id, current_user)
 
         messages = await interview_service.get_chat_history(session, limit)
 
@@ -414,10 +406,10 @@ async def get_chat_history(
 
 
 @router.get("/sessions/{session_id}", response_model=InterviewSessionResponseDTO)
-@measure_http_request("/interview/sessions/get")
 async def get_interview_session(
     session_id: str,
-    current_user=Depends(get_current_user)
+    current_user=Depends(get_current_user),
+    session_store: InterviewSessionStore = Depends(get_interview_session_store)
 ):
     """
     Get detailed information about a specific interview session.
@@ -431,13 +423,7 @@ async def get_interview_session(
     - Completion status
     """
     try:
-        session = interview_sessions.get(session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-
-        # Verify user ownership
-        if str(session.user_id) != current_user["user_id"]:
-            raise HTTPException(status_code=403, detail="Access denied")
+        session = await _get_owned_session(session_store, session_id, current_user)
 
         return InterviewSessionResponseDTO(**session.to_dict())
 
@@ -449,11 +435,11 @@ async def get_interview_session(
 
 
 @router.delete("/sessions/{session_id}")
-@measure_http_request("/interview/sessions/cancel")
 async def cancel_interview_session(
     session_id: str,
     current_user=Depends(get_current_user),
-    interview_service: InterviewService = Depends(get_interview_service)
+    interview_service: InterviewService = Depends(get_interview_service),
+    session_store: InterviewSessionStore = Depends(get_interview_session_store)
 ):
     """
     Cancel an active interview session.
@@ -465,15 +451,10 @@ async def cancel_interview_session(
     - Updates session status to cancelled
     """
     try:
-        session = interview_sessions.get(session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-
-        # Verify user ownership
-        if str(session.user_id) != current_user["user_id"]:
-            raise HTTPException(status_code=403, detail="Access denied")
+        session = await _get_owned_session(session_store, session_id, current_user)
 
         await interview_service.cancel_interview(session, "User requested cancellation")
+        await session_store.save(session)
 
         logger.info("Interview session cancelled", session_id=session_id)
 
@@ -481,16 +462,18 @@ async def cancel_interview_session(
 
     except HTTPException:
         raise
+    except ConcurrencyException:
+        raise HTTPException(status_code=409, detail="Interview session was changed by another request")
     except Exception as e:
         logger.error("Failed to cancel interview session", error=str(e))
         raise HTTPException(status_code=500, detail="Failed to cancel interview session")
 
 
 @router.get("/history", response_model=InterviewHistoryDTO)
-@measure_http_request("/interview/history")
 async def get_interview_history(
     limit: int = Query(10, description="Number of sessions to return"),
-    current_user=Depends(get_current_user)
+    current_user=Depends(get_current_user),
+    session_store: InterviewSessionStore = Depends(get_interview_session_store)
 ):
     """
     Get user's interview session history and statistics.
@@ -512,14 +495,8 @@ async def get_interview_history(
     try:
         user_id = current_user["user_id"]
 
-        # Filter sessions for current user
-        user_sessions = [
-            session for session in interview_sessions.values()
-            if str(session.user_id) == user_id
-        ]
-
-        # Sort by creation date (newest first)
-        user_sessions.sort(key=lambda x: x.created_at, reverse=True)
+        # Newest first
+        user_sessions = await session_store.list_for_user(user_id)
 
         # Limit results
         limited_sessions = user_sessions[:limit]
@@ -559,9 +536,9 @@ async def get_interview_history(
 
 
 @router.get("/analytics", response_model=InterviewAnalyticsDTO)
-@measure_http_request("/interview/analytics")
 async def get_interview_analytics(
-    current_user=Depends(get_current_user)
+    current_user=Depends(get_current_user),
+    session_store: InterviewSessionStore = Depends(get_interview_session_store)
 ):
     """
     Get comprehensive interview practice analytics and insights.
@@ -584,10 +561,7 @@ async def get_interview_analytics(
         user_id = current_user["user_id"]
 
         # Get user sessions
-        user_sessions = [
-            session for session in interview_sessions.values()
-            if str(session.user_id) == user_id
-        ]
+        user_sessions = await session_store.list_for_user(user_id)
 
         completed = [s for s in user_sessions if s.status.value == "completed"]
         scores = [s.feedback.overall_score for s in completed if s.feedback]
@@ -9,6 +9,7 @@ from typing import List, Optional, Dict, Any
 from jobhire.shared.domain.types import EntityId
 from jobhire.shared.application.exceptions import BusinessRuleException, NotFoundException
 from jobhire.shared.infrastructure.events import DomainEventPublisher
+from jobhire.shared.infrastructure.repositories import retry_on_conflict
 
 from jobhire.domains.job.domain.entities.job_queue import (
     JobQueue, QueuePriority, QueueStatus, UserAction
@@ -17,6 +18,7 @@ from jobhire.domains.job.infrastructure.repositories.job_queue_repository import
 from jobhire.domains.job.application.dto.job_queue_dto import (
     JobQueueCreateDTO, JobQueueUpdateDTO, JobQueueResponseDTO, QueueStatsDTO
 )
+from jobhire.domains.user.domain.entities.user import User
 from jobhire.domains.user.infrastructure.repositories.user_repository import UserRepository
 
 
@@ -64,7 +66,7 @@ class JobQueueService:
             )
 
         # Check user's daily queue limits
-        await self._check_queue_limits(user_id)
+        await self._check_queue_limits(user)
 
         # Create queue item
         queue_id = EntityId.generate()
@@ -170,14 +172,20 @@ class JobQueueService:
 
         return JobQueueResponseDTO.from_job_queue(queue_item)
 
-    async def process_queue_item(self, queue_id: EntityId, workflow_execution_id: EntityId) -> None:
-        """Start processing a queue item."""
-        queue_item = await self.job_queue_repository.find_by_id(queue_id)
-        if not queue_item:
-            raise NotFoundException(f"Queue item {queue_id} not found")
+    async def process_queue_item(
+        self,
+        queue_id: EntityId,
+        workflow_execution_id: EntityId,
+        worker_id: Optional[str] = None
+    ) -> None:
+        """Start processing a queue item (pass worker_id for items from claim_for_processing)."""
+        async def start() -> JobQueue:
+            queue_item = await self._get_queue_item(queue_id)
+            queue_item.start_processing(workflow_execution_id, worker_id)
+            await self.job_queue_repository.update(queue_item)
+            return queue_item
 
-        queue_item.start_processing(workflow_execution_id)
-        await self.job_queue_repository.update(queue_item)
+        queue_item = await retry_on_conflict(start)
 
         # Publish domain events
         await self.event_publisher.publish_events(queue_item.get_domain_events())
@@ -186,7 +194,8 @@ class JobQueueService:
             "Queue item processing started",
             queue_id=str(queue_id),
             user_id=str(queue_item.user_id),
-            workflow_execution_id=str(workflow_execution_id)
+            workflow_execution_id=str(workflow_execution_id),
+            worker_id=worker_id
         )
 
     async def complete_queue_processing(
@@ -196,12 +205,13 @@ class JobQueueService:
         application_id: Optional[EntityId] = None
     ) -> None:
         """Complete processing of a queue item."""
-        queue_item = await self.job_queue_repository.find_by_id(queue_id)
-        if not queue_item:
-            raise NotFoundException(f"Queue item {queue_id} not found")
+        async def complete() -> JobQueue:
+            queue_item = await self._get_queue_item(queue_id)
+            queue_item.complete_processing(application_submitted, application_id)
+            await self.job_queue_repository.update(queue_item)
+            return queue_item
 
-        queue_item.complete_processing(application_submitted, application_id)
-        await self.job_queue_repository.update(queue_item)
+        queue_item = await retry_on_conflict(complete)
 
         # Publish domain events
         await self.event_publisher.publish_events(queue_item.get_domain_events())
@@ -215,12 +225,13 @@ class JobQueueService:
 
     async def fail_queue_processing(self, queue_id: EntityId, error: str) -> None:
         """Mark queue processing as failed."""
-        queue_item = await self.job_queue_repository.find_by_id(queue_id)
-        if not queue_item:
-            raise NotFoundException(f"Queue item {queue_id} not found")
+        async def fail() -> JobQueue:
+            queue_item = await self._get_queue_item(queue_id)
+            queue_item.fail_processing(error)
+            await self.job_queue_repository.update(queue_item)
+            return queue_item
 
-        queue_item.fail_processing(error)
-        await self.job_queue_repository.update(queue_item)
+        queue_item = await retry_on_conflict(fail)
 
         # Publish domain events
         await self.event_publisher.publish_events(queue_item.get_domain_events())
@@ -292,6 +303,27 @@ class JobQueueService:
 
         return [JobQueueResponseDTO.from_job_queue(item) for item in queue_items]
 
+    async def claim_for_processing(
+        self,
+        worker_id: str,
+        limit: int = 50,
+        visibility_timeout: int = 300
+    ) -> List[JobQueue]:
+        """Lease ready queue items to a worker; unfinished leases expire back to the queue."""
+        queue_items = await self.job_queue_repository.claim_ready_for_processing(
+            worker_id, limit=limit, visibility_timeout=visibility_timeout
+        )
+
+        if queue_items:
+            logger.info(
+                "Claimed queue items",
+                worker_id=worker_id,
+                claimed=len(queue_items),
+                visibility_timeout=visibility_timeout
+            )
+
+        return queue_items
+
     async def get_flagged_items(self, user_id: EntityId, limit: int = 50) -> List[JobQueueResponseDTO]:
         """Get flagged items for manual review."""
         queue_items = await self.job_queue_repository.find_flagged_items(user_id, limit)
@@ -345,20 +377,22 @@ class JobQueueService:
 
         return success
 
-    async def _check_queue_limits(self, user_id: EntityId) -> None:
+    async def _check_queue_limits(self, user: User) -> None:
         """Check if user has exceeded their queue limits."""
         # Get today's queue count
-        stats = await self.job_queue_repository.get_user_queue_stats(user_id)
+        stats = await self.job_queue_repository.get_user_queue_stats(user.id)
         today_queued = stats.get("today_queued", 0)
 
-        # Get user settings to check limits
-        user = await self.user_repository.find_by_id(user_id)
-        if not user:
-            return
-
         # Check daily limits (this would be based on user's search settings)
         daily_limit = 50  # Default limit, should come from user settings
         if today_queued >= daily_limit:
             raise BusinessRuleException(
                 f"Daily queue limit of {daily_limit} items exceeded"
-            )
\ No newline at end of file
+            )
+
+    async def _get_queue_item(self, queue_id: EntityId) -> JobQueue:
+        """Load a queue item or raise NotFoundException."""
+        queue_item = await self.job_queue_repository.find_by_id(queue_id)
+        if not queue_item:
+            raise NotFoundException(f"Queue item {queue_id} not found")
+        return queue_item
@@ -318,10 +318,10 @@ class JobSearchService:
         return processed_jobs
 
     async def _publish_search_events(self, job_search: JobSearch) -> None:
-        """Publish domain events for the job search."""
-        for event in job_search.events:
-            await self.event_bus.publish(event)
+        """Publish domain events for the job search (recorded in the outbox, delivered in the background)."""
+        events = job_search.events
         job_search.clear_events()
+        await self.event_bus.publish_events(events)
 
     async def _update_user_search_history(self, user, job_search: JobSearch) -> None:
         """Update user's search history and statistics."""
@@ -18,6 +18,19 @@ class QueuePriority(str, Enum):
     HIGH = "high"
     URGENT = "urgent"
 
+    @property
+    def rank(self) -> int:
+        """Numeric ordering persisted as priority_rank (higher is claimed first)."""
+        return _PRIORITY_RANKS[self]
+
+
+_PRIORITY_RANKS = {
+    QueuePriority.LOW: 1,
+    QueuePriority.NORMAL: 2,
+    QueuePriority.HIGH: 3,
+    QueuePriority.URGENT: 4
+}
+
 
 class QueueStatus(str, Enum):
     """Queue status options."""
@@ -111,6 +124,8 @@ class JobQueue(AggregateRoot[EntityId]):
         self.queued_at = datetime.utcnow()
         self.processed_at: Optional[datetime] = None
         self.workflow_execution_id: Optional[EntityId] = None
+        # Worker holding the processing lease (set by the repository when claimed)
+        self.lease_owner: Optional[str] = None
 
         # Processing results
         self.application_submitted = False
@@ -129,9 +144,20 @@ class JobQueue(AggregateRoot[EntityId]):
         # Fire domain event
         self.add_domain_event(JobQueuedEvent(self.id, self.user_id, self.job_id, self.priority))
 
-    def start_processing(self, workflow_execution_id: EntityId) -> None:
-        """Start processing this queue item."""
-        if self.status != QueueStatus.QUEUED:
+    def start_processing(self, workflow_execution_id: EntityId, worker_id: Optional[str] = None) -> None:
+        """
+        Start processing this queue item.
+
+        Claimed items are already in processing; they can be started by the worker
+        holding the lease, once.
+        """
+        leased = (
+            self.status == QueueStatus.PROCESSING
+            and worker_id is not None
+            and self.lease_owner == worker_id
+            and self.workflow_execution_id is None
+        )
+        if self.status != QueueStatus.QUEUED and not leased:
             raise ValueError(f"Cannot start processing item in status: {self.status}")
 
         self.status = QueueStatus.PROCESSING
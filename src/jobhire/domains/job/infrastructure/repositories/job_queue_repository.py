@@ -2,9 +2,10 @@
 Job Queue repository implementation.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
 
 from jobhire.shared.domain.types import EntityId
 from jobhire.shared.infrastructure.repositories import BaseMongoRepository
@@ -14,65 +15,58 @@ from jobhire.domains.job.domain.entities.job_queue import JobQueue, QueuePriorit
 class JobQueueRepository(BaseMongoRepository[JobQueue]):
     """Repository for job queue management."""
 
-    def __init__(self, database: AsyncIOMotorDatabase):
+    # Claim order: highest priority first, then oldest
+    CLAIM_SORT = [("priority_rank", DESCENDING), ("queued_at", ASCENDING)]
+
+    def __init__(self, database: AsyncIOMotorDatabase, max_claims: int = 5):
         super().__init__(database, "job_queues", JobQueue)
+        # Claims an item gets before it is dead-lettered instead of handed out again
+        self.max_claims = max_claims
+
+    async def ensure_indexes(self) -> None:
+        """Create the claim indexes and backfill priority_rank on older documents."""
+        await self.collection.create_index(
+            [("status", ASCENDING), ("priority_rank", DESCENDING),
+             ("scheduled_for", ASCENDING), ("queued_at", ASCENDING)],
+            name="claim_order"
+        )
+        await self.collection.create_index(
+            [("status", ASCENDING), ("lease_expires_at", ASCENDING)],
+            name="expired_leases"
+        )
+        for priority in QueuePriority:
+            await self.collection.update_many(
+                {"priority": priority.value, "priority_rank": {"$exists": False}},
+                {"$set": {"priority_rank": priority.rank}}
+            )
 
     async def create(self, job_queue: JobQueue) -> None:
         """Create a new job queue item."""
         document = {
             "_id": str(job_queue.id),
-            "user_id": str(job_queue.user_id),
-            "job_id": job_queue.job_id,
-            "job_data": job_queue.job_data,
-            "priority": job_queue.priority.value,
-            "scheduled_for": job_queue.scheduled_for,
-            "match_score": job_queue.match_score,
-            "status": job_queue.status.value,
-            "queued_at": job_queue.queued_at,
-            "processed_at": job_queue.processed_at,
-            "workflow_execution_id": str(job_queue.workflow_execution_id) if job_queue.workflow_execution_id else None,
-            "application_submitted": job_queue.application_submitted,
-            "application_id": str(job_queue.application_id) if job_queue.application_id else None,
-            "processing_error": job_queue.processing_error,
-            "user_flagged": job_queue.user_flagged,
-            "user_notes": job_queue.user_notes,
-            "user_action": job_queue.user_action.value if job_queue.user_action else None,
-            "created_at": job_queue.created_at,
-            "updated_at": job_queue.updated_at,
-            "version": job_queue.version
+            **self._entity_document(job_queue),
+            "lease_owner": None,
+            "lease_expires_at": None,
+            "created_at": job_queue.created_at
         }
         await self.collection.insert_one(document)
+        self._attach(job_queue)
 
     async def update(self, job_queue: JobQueue) -> None:
-        """Update an existing job queue item."""
-        document = {
-            "user_id": str(job_queue.user_id),
-            "job_id": job_queue.job_id,
-            "job_data": job_queue.job_data,
-            "priority": job_queue.priority.value,
-            "scheduled_for": job_queue.scheduled_for,
-            "match_score": job_queue.match_score,
-            "status": job_queue.status.value,
-            "queued_at": job_queue.queued_at,
-            "processed_at": job_queue.processed_at,
-            "workflow_execution_id": str(job_queue.workflow_execution_id) if job_queue.workflow_execution_id else None,
-            "application_submitted": job_queue.application_submitted,
-            "application_id": str(job_queue.application_id) if job_queue.application_id else None,
-            "processing_error": job_queue.processing_error,
-            "user_flagged": job_queue.user_flagged,
-            "user_notes": job_queue.user_notes,
-            "user_action": job_queue.user_action.value if job_queue.user_action else None,
-            "updated_at": job_queue.updated_at,
-            "version": job_queue.version
-        }
+        """Save the fields changed since the queue item was loaded or claimed."""
+        touch = {}
+        if job_queue.status != QueueStatus.PROCESSING:
+            # Leaving the processing state ends any lease held on the item
+            touch = {"lease_owner": None, "lease_expires_at": None}
 
-        await self.collection.update_one(
-            {"_id": str(job_queue.id)},
-            {"$set": document}
-        )
+        await self._save_changes(job_queue, touch=touch)
 
     async def find_by_id(self, queue_id: EntityId) -> Optional[JobQueue]:
         """Find job queue item by ID."""
+        cached = self._from_unit_of_work(queue_id)
+        if cached is not None:
+            return cached
+
         document = await self.collection.find_one({"_id": str(queue_id)})
         if not document:
             return None
@@ -104,45 +98,123 @@ class JobQueueRepository(BaseMongoRepository[JobQueue]):
         limit: int = 50,
         priority_order: bool = True
     ) -> List[JobQueue]:
-        """Find queue items ready for processing."""
-        filters = {
-            "status": QueueStatus.QUEUED.value,
-            "$or": [
-                {"scheduled_for": {"$lte": datetime.utcnow()}},
-                {"scheduled_for": None}
-            ]
-        }
+        """Find queue items ready for processing (read-only; use claim_ready_for_processing to work them)."""
+        sort_criteria = self.CLAIM_SORT if priority_order else [("queued_at", ASCENDING)]
+
+        cursor = self.collection.find(self._ready_filter(datetime.utcnow())).sort(sort_criteria).limit(limit)
+        documents = await cursor.to_list(length=limit)
 
-        sort_criteria = []
-        if priority_order:
-            # Sort by priority: urgent, high, normal, low
-            priority_map = {
-                QueuePriority.URGENT.value: 4,
-                QueuePriority.HIGH.value: 3,
-                QueuePriority.NORMAL.value: 2,
-                QueuePriority.LOW.value: 1
+        return [self._document_to_entity(doc) for doc in documents]
+
+    async def claim_ready_for_processing(
+        self,
+        worker_id: str,
+        limit: int = 50,
+        visibility_timeout: int = 300
+    ) -> List[JobQueue]:
+        """
+        Lease up to limit ready items to a worker, highest priority first.
+
+        Each item is claimed with an atomic find_one_and_update, so concurrent workers
+        never receive the same item. Claimed items move to processing with a lease that
+        expires after visibility_timeout seconds; items whose lease expired (crashed
+        worker) or that were released become claimable again. Items already claimed
+        max_claims times are dead-lettered as failed instead, so a poison item cannot
+        crash workers forever.
+        """
+        await self.dead_letter_exhausted()
+
+        claimed = []
+        for _ in range(limit):
+            now = datetime.utcnow()
+            document = await self.collection.find_one_and_update(
+                {
+                    "$or": [
+                        self._ready_filter(now),
+                        {"status": QueueStatus.PROCESSING.value, "lease_expires_at": {"$lte": now}}
+                    ],
+                    # Matches items without a claim_count too
+                    "claim_count": {"$not": {"$gte": self.max_claims}}
+                },
+                {
+                    "$set": {
+                        "status": QueueStatus.PROCESSING.value,
+                        "lease_owner": worker_id,
+                        "lease_expires_at": now + timedelta(seconds=visibility_timeout),
+                        # Each claim starts a new workflow (see JobQueue.start_processing)
+                        "workflow_execution_id": None,
+                        "updated_at": now
+                    },
+                    "$inc": {"claim_count": 1, "version": 1}
+                },
+                sort=self.CLAIM_SORT,
+                return_document=ReturnDocument.AFTER
+            )
+            if document is None:
+                break
+            claimed.append(self._document_to_entity(document))
+
+        return claimed
+
+    async def dead_letter_exhausted(self) -> int:
+        """Fail claimable items that have used up max_claims without finishing."""
+        now = datetime.utcnow()
+        result = await self.collection.update_many(
+            {
+                "$or": [
+                    self._ready_filter(now),
+                    {"status": QueueStatus.PROCESSING.value, "lease_expires_at": {"$lte": now}}
+                ],
+                "claim_count": {"$gte": self.max_claims}
+            },
+            {
+                "$set": {
+                    "status": QueueStatus.FAILED.value,
+                    "processing_error": f"Dead-lettered after {self.max_claims} unfinished claims",
+                    "processed_at": now,
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                    "updated_at": now
+                },
+                "$inc": {"version": 1}
             }
-            # MongoDB doesn't support direct enum sorting, so we'll sort by queued_at for now
-            # In a production system, you'd add a priority_order field
-            sort_criteria.append(("queued_at", 1))
-        else:
-            sort_criteria.append(("queued_at", 1))
+        )
+        return result.modified_count
 
-        cursor = self.collection.find(filters).sort(sort_criteria).limit(limit)
-        documents = await cursor.to_list(length=limit)
+    async def extend_lease(self, queue_id: EntityId, worker_id: str, visibility_timeout: int = 300) -> bool:
+        """Push back the lease expiry of an item the worker still holds."""
+        now = datetime.utcnow()
+        result = await self.collection.update_one(
+            {"_id": str(queue_id), "status": QueueStatus.PROCESSING.value, "lease_owner": worker_id},
+            {"$set": {"lease_expires_at": now + timedelta(seconds=visibility_timeout), "updated_at": now}}
+        )
+        return result.modified_count > 0
 
-        # Sort by priority in Python if needed
-        queue_items = [self._document_to_entity(doc) for doc in documents]
-        if priority_order:
-            priority_order_map = {
-                QueuePriority.URGENT: 4,
-                QueuePriority.HIGH: 3,
-                QueuePriority.NORMAL: 2,
-                QueuePriority.LOW: 1
+    async def release_lease(self, queue_id: EntityId, worker_id: str) -> bool:
+        """Return an unfinished item held by the worker to the queue."""
+        result = await self.collection.update_one(
+            {"_id": str(queue_id), "status": QueueStatus.PROCESSING.value, "lease_owner": worker_id},
+            {
+                "$set": {
+                    "status": QueueStatus.QUEUED.value,
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                    "updated_at": datetime.utcnow()
+                },
+                "$inc": {"version": 1}
             }
-            queue_items.sort(key=lambda x: priority_order_map[x.priority], reverse=True)
+        )
+        return result.modified_count > 0
 
-        return queue_items
+    @staticmethod
+    def _ready_filter(now: datetime) -> Dict[str, Any]:
+        return {
+            "status": QueueStatus.QUEUED.value,
+            "$or": [
+                {"scheduled_for": {"$lte": now}},
+                {"scheduled_for": None}
+            ]
+        }
 
     async def find_by_job_id(self, user_id: EntityId, job_id: str) -> Optional[JobQueue]:
         """Find queue item by user and job ID."""
@@ -215,6 +287,7 @@ class JobQueueRepository(BaseMongoRepository[JobQueue]):
 
     async def delete_by_id(self, queue_id: EntityId) -> bool:
         """Delete a queue item by ID."""
+        self._forget(queue_id)
         result = await self.collection.delete_one({"_id": str(queue_id)})
         return result.deleted_count > 0
 
@@ -256,6 +329,7 @@ class JobQueueRepository(BaseMongoRepository[JobQueue]):
         job_queue.queued_at = document["queued_at"]
         job_queue.processed_at = document.get("processed_at")
         job_queue.workflow_execution_id = EntityId.from_string(document["workflow_execution_id"]) if document.get("workflow_execution_id") else None
+        job_queue.lease_owner = document.get("lease_owner")
         job_queue.application_submitted = document.get("application_submitted", False)
         job_queue.application_id = EntityId.from_string(document["application_id"]) if document.get("application_id") else None
         job_queue.processing_error = document.get("processing_error")
@@ -267,4 +341,28 @@ class JobQueueRepository(BaseMongoRepository[JobQueue]):
         job_queue.version = document.get("version", 1)
         job_queue._domain_events = []
 
-        return job_queue
\ No newline at end of file
+        return self._attach(job_queue, versioned="version" in document)
+
+    def _entity_document(self, job_queue: JobQueue) -> Dict[str, Any]:
+        """Convert JobQueue entity to its updatable fields."""
+        return {
+            "user_id": str(job_queue.user_id),
+            "job_id": job_queue.job_id,
+            "job_data": job_queue.job_data,
+            "priority": job_queue.priority.value,
+            "priority_rank": job_queue.priority.rank,
+            "scheduled_for": job_queue.scheduled_for,
+            "match_score": job_queue.match_score,
+            "status": job_queue.status.value,
+            "queued_at": job_queue.queued_at,
+            "processed_at": job_queue.processed_at,
+            "workflow_execution_id": str(job_queue.workflow_execution_id) if job_queue.workflow_execution_id else None,
+            "application_submitted": job_queue.application_submitted,
+            "application_id": str(job_queue.application_id) if job_queue.application_id else None,
+            "processing_error": job_queue.processing_error,
+            "user_flagged": job_queue.user_flagged,
+            "user_notes": job_queue.user_notes,
+            "user_action": job_queue.user_action.value if job_queue.user_action else None,
+            "updated_at": job_queue.updated_at,
+            "version": job_queue.version
+        }
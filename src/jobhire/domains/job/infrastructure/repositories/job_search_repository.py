@@ -21,48 +21,22 @@ class JobSearchRepository(BaseMongoRepository[JobSearch]):
         """Create a new job search."""
         document = {
             "_id": str(job_search.id),
-            "user_id": str(job_search.user_id),
-            "query": job_search.query,
-            "status": job_search.status.value,
-            "initiated_at": job_search.initiated_at,
-            "started_at": job_search.started_at,
-            "completed_at": job_search.completed_at,
-            "search_results": job_search.search_results,
-            "total_jobs_found": job_search.total_jobs_found,
-            "qualified_jobs_count": job_search.qualified_jobs_count,
-            "jobs_above_threshold": job_search.jobs_above_threshold,
-            "error_message": job_search.error_message,
-            "created_at": job_search.created_at,
-            "updated_at": job_search.updated_at,
-            "version": job_search.version
+            **self._entity_document(job_search),
+            "created_at": job_search.created_at
         }
         await self.collection.insert_one(document)
+        self._attach(job_search)
 
     async def update(self, job_search: JobSearch) -> None:
-        """Update an existing job search."""
-        document = {
-            "user_id": str(job_search.user_id),
-            "query": job_search.query,
-            "status": job_search.status.value,
-            "initiated_at": job_search.initiated_at,
-            "started_at": job_search.started_at,
-            "completed_at": job_search.completed_at,
-            "search_results": job_search.search_results,
-            "total_jobs_found": job_search.total_jobs_found,
-            "qualified_jobs_count": job_search.qualified_jobs_count,
-            "jobs_above_threshold": job_search.jobs_above_threshold,
-            "error_message": job_search.error_message,
-            "updated_at": job_search.updated_at,
-            "version": job_search.version
-        }
-
-        await self.collection.update_one(
-            {"_id": str(job_search.id)},
-            {"$set": document}
-        )
+        """Save the fields changed since the job search was loaded; new results are appended."""
+        await self._save_changes(job_search)
 
     async def find_by_id(self, search_id: EntityId) -> Optional[JobSearch]:
         """Find job search by ID."""
+        cached = self._from_unit_of_work(search_id)
+        if cached is not None:
+            return cached
+
         document = await self.collection.find_one({"_id": str(search_id)})
         if not document:
             return None
@@ -178,4 +152,22 @@ class JobSearchRepository(BaseMongoRepository[JobSearch]):
         job_search.version = document.get("version", 1)
         job_search._domain_events = []
 
-        return job_search
\ No newline at end of file
+        return self._attach(job_search, versioned="version" in document)
+
+    def _entity_document(self, job_search: JobSearch) -> Dict[str, Any]:
+        """Convert JobSearch entity to its updatable fields."""
+        return {
+            "user_id": str(job_search.user_id),
+            "query": job_search.query,
+            "status": job_search.status.value,
+            "initiated_at": job_search.initiated_at,
+            "started_at": job_search.started_at,
+            "completed_at": job_search.completed_at,
+            "search_results": job_search.search_results,
+            "total_jobs_found": job_search.total_jobs_found,
+            "qualified_jobs_count": job_search.qualified_jobs_count,
+            "jobs_above_threshold": job_search.jobs_above_threshold,
+            "error_message": job_search.error_message,
+            "updated_at": job_search.updated_at,
+            "version": job_search.version
+        }
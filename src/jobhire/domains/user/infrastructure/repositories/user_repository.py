@@ -12,53 +12,39 @@ from jobhire.domains.user.domain.entities.user import User
 
 
 class UserRepository(BaseMongoRepository[User]):
-    """Repository for user management."""
+    """
+    Repository for user management.
 
-    def __init__(self, database: AsyncIOMotorDatabase):
-        super().__init__(database, "users", User)
+    With an encryption service, the user's name and application configuration are
+    stored encrypted. Email and username stay plaintext because logins look them up.
+    """
+
+    ENCRYPTED_FIELDS = ("full_name", "application_configuration")
+
+    def __init__(self, database: AsyncIOMotorDatabase, encryption=None):
+        super().__init__(database, "users", User, encryption=encryption)
 
     async def create(self, user: User) -> None:
         """Create a new user."""
         document = {
             "_id": str(user.id),
-            "email": user.email,
-            "username": getattr(user, 'username', None),
-            "full_name": getattr(user, 'full_name', None),
-            "password_hash": getattr(user, 'password_hash', None),
-            "user_tier": getattr(user, 'user_tier', 'free'),
-            "is_active": getattr(user, 'is_active', True),
-            "job_search_preferences": getattr(user, 'job_search_preferences', None),
-            "application_configuration": getattr(user, 'application_configuration', None),
+            **self._encrypt_fields(str(user.id), self._entity_document(user)),
             "created_at": getattr(user, 'created_at', datetime.utcnow()),
-            "updated_at": getattr(user, 'updated_at', datetime.utcnow()),
-            "last_login": getattr(user, 'last_login', None),
-            "version": user.version
+            "updated_at": getattr(user, 'updated_at', datetime.utcnow())
         }
         await self.collection.insert_one(document)
+        self._attach(user)
 
     async def update(self, user: User) -> None:
-        """Update an existing user."""
-        document = {
-            "email": user.email,
-            "username": getattr(user, 'username', None),
-            "full_name": getattr(user, 'full_name', None),
-            "password_hash": getattr(user, 'password_hash', None),
-            "user_tier": getattr(user, 'user_tier', 'free'),
-            "is_active": getattr(user, 'is_active', True),
-            "job_search_preferences": getattr(user, 'job_search_preferences', None),
-            "application_configuration": getattr(user, 'application_configuration', None),
-            "updated_at": datetime.utcnow(),
-            "last_login": getattr(user, 'last_login', None),
-            "version": user.version
-        }
-
-        await self.collection.update_one(
-            {"_id": str(user.id)},
-            {"$set": document}
-        )
+        """Save the fields changed since the user was loaded."""
+        await self._save_changes(user, touch={"updated_at": datetime.utcnow()})
 
     async def find_by_id(self, user_id: EntityId) -> Optional[User]:
         """Find user by ID."""
+        cached = self._from_unit_of_work(user_id)
+        if cached is not None:
+            return cached
+
         document = await self.collection.find_one({"_id": str(user_id)})
         if not document:
             return None
@@ -82,13 +68,13 @@ class UserRepository(BaseMongoRepository[User]):
         """Find active users with pagination."""
         cursor = self.collection.find({"is_active": True}).skip(offset).limit(limit)
         documents = await cursor.to_list(length=limit)
-        return [self._document_to_entity(doc) for doc in documents]
+        return [self._document_to_entity(doc) for doc in self._decrypt_documents(documents)]
 
     async def find_by_tier(self, user_tier: str, limit: int = 100) -> List[User]:
         """Find users by tier."""
         cursor = self.collection.find({"user_tier": user_tier}).limit(limit)
         documents = await cursor.to_list(length=limit)
-        return [self._document_to_entity(doc) for doc in documents]
+        return [self._document_to_entity(doc) for doc in self._decrypt_documents(documents)]
 
     async def count_active_users(self) -> int:
         """Count active users."""
@@ -96,11 +82,13 @@ class UserRepository(BaseMongoRepository[User]):
 
     async def delete_by_id(self, user_id: EntityId) -> bool:
         """Delete a user by ID."""
+        self._forget(user_id)
         result = await self.collection.delete_one({"_id": str(user_id)})
         return result.deleted_count > 0
 
     def _document_to_entity(self, document: Dict[str, Any]) -> User:
         """Convert MongoDB document to User entity."""
+        self._decrypt_documents([document])
         user_id = EntityId.from_string(document["_id"])
 
         # Create a minimal user entity - in practice this would be more complete
@@ -120,4 +108,19 @@ class UserRepository(BaseMongoRepository[User]):
         user.version = document.get("version", 1)
         user._domain_events = []
 
-        return user
\ No newline at end of file
+        return self._attach(user, versioned="version" in document)
+
+    def _entity_document(self, user: User) -> Dict[str, Any]:
+        """Convert User entity to its updatable fields."""
+        return {
+            "email": user.email,
+            "username": getattr(user, 'username', None),
+            "full_name": getattr(user, 'full_name', None),
+            "password_hash": getattr(user, 'password_hash', None),
+            "user_tier": getattr(user, 'user_tier', 'free'),
+            "is_active": getattr(user, 'is_active', True),
+            "job_search_preferences": getattr(user, 'job_search_preferences', None),
+            "application_configuration": getattr(user, 'application_configuration', None),
+            "last_login": getattr(user, 'last_login', None),
+            "version": user.version
+        }
@@ -9,7 +9,6 @@ import structlog
 
 from jobhire.shared.domain.types import EntityId
 from jobhire.shared.infrastructure.security import get_current_user, require_permission, Permission
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
 from jobhire.shared.application.exceptions import BusinessRuleException, NotFoundException
 
 from jobhire.domains.user.application.services import UserProfileService
@@ -25,7 +24,6 @@ router = APIRouter(prefix="/application-settings", tags=["📱 Application Setti
 
 
 @router.get("/")
-@measure_http_request("/application-settings/get")
 async def get_application_settings(
     current_user=Depends(get_current_user),
     user_service: UserProfileService = Depends(get_user_profile_service)
@@ -75,7 +73,6 @@ async def get_application_settings(
 
 
 @router.put("/")
-@measure_http_request("/application-settings/update")
 async def update_application_settings(
     settings_data: Dict[str, Any],
     current_user=Depends(get_current_user),
@@ -152,7 +149,6 @@ async def update_application_settings(
 
 
 @router.post("/service/pause")
-@measure_http_request("/application-settings/pause")
 async def pause_application_service(
     reason: str = "User requested pause",
     current_user=Depends(get_current_user),
@@ -222,7 +218,6 @@ async def pause_application_service(
 
 
 @router.post("/service/resume")
-@measure_http_request("/application-settings/resume")
 async def resume_application_service(
     current_user=Depends(get_current_user),
     user_service: UserProfileService = Depends(get_user_profile_service)
@@ -288,7 +283,6 @@ async def resume_application_service(
 
 
 @router.get("/options/match-levels")
-@measure_http_request("/application-settings/match-levels")
 async def get_match_level_options(
     current_user=Depends(get_current_user)
 ) -> Dict[str, Any]:
@@ -331,7 +325,6 @@ async def get_match_level_options(
 
 
 @router.get("/options/approval-modes")
-@measure_http_request("/application-settings/approval-modes")
 async def get_approval_mode_options(
     current_user=Depends(get_current_user)
 ) -> Dict[str, Any]:
@@ -371,7 +364,6 @@ async def get_approval_mode_options(
 
 
 @router.get("/premium-features")
-@measure_http_request("/application-settings/premium-features")
 async def get_premium_features_info(
     current_user=Depends(get_current_user),
     user_service: UserProfileService = Depends(get_user_profile_service)
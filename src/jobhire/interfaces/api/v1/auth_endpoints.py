@@ -9,8 +9,6 @@ from fastapi.security import HTTPBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel, Field, EmailStr
 import structlog
 
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
-
 
 logger = structlog.get_logger(__name__)
 security = HTTPBearer()
@@ -44,7 +42,6 @@ class PasswordChange(BaseModel):
 
 
 @router.post("/register", response_model=LoginResponse)
-@measure_http_request("/auth/register")
 async def register_user(user_data: UserRegistration) -> LoginResponse:
     """Register a new user."""
     try:
@@ -75,7 +72,6 @@ async def register_user(user_data: UserRegistration) -> LoginResponse:
 
 
 @router.post("/login", response_model=LoginResponse)
-@measure_http_request("/auth/login")
 async def login_user(form_data: OAuth2PasswordRequestForm = Depends()) -> LoginResponse:
     """Login user with email/username and password."""
     try:
@@ -105,7 +101,6 @@ async def login_user(form_data: OAuth2PasswordRequestForm = Depends()) -> LoginR
 
 
 @router.post("/logout")
-@measure_http_request("/auth/logout")
 async def logout_user(current_user=Depends(security)) -> Dict[str, Any]:
     """Logout user and invalidate token."""
     try:
@@ -131,7 +126,6 @@ async def logout_user(current_user=Depends(security)) -> Dict[str, Any]:
 
 
 @router.post("/forgot-password")
-@measure_http_request("/auth/forgot-password")
 async def forgot_password(reset_data: PasswordReset) -> Dict[str, Any]:
     """Send password reset email."""
     try:
@@ -158,7 +152,6 @@ async def forgot_password(reset_data: PasswordReset) -> Dict[str, Any]:
 
 
 @router.post("/change-password")
-@measure_http_request("/auth/change-password")
 async def change_password(
     password_data: PasswordChange,
     current_user=Depends(security)
@@ -189,7 +182,6 @@ async def change_password(
 
 
 @router.get("/me")
-@measure_http_request("/auth/me")
 async def get_current_user(current_user=Depends(security)) -> Dict[str, Any]:
     """Get current authenticated user information."""
     try:
@@ -220,7 +212,6 @@ async def get_current_user(current_user=Depends(security)) -> Dict[str, Any]:
 
 
 @router.post("/refresh-token")
-@measure_http_request("/auth/refresh-token")
 async def refresh_token(current_user=Depends(security)) -> LoginResponse:
     """Refresh access token."""
     try:
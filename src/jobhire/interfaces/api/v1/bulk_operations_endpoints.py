@@ -11,7 +11,6 @@ from pydantic import BaseModel, Field
 
 from jobhire.shared.domain.types import EntityId
 from jobhire.shared.infrastructure.security import get_current_user, require_permission, Permission
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
 from jobhire.shared.application.exceptions import BusinessRuleException, NotFoundException
 
 from jobhire.domains.user.application.services import UserProfileService
@@ -44,7 +43,6 @@ class SettingsValidationRequest(BaseModel):
 
 # Bulk Save Operations
 @router.post("/{user_id}/settings/save-all")
-@measure_http_request("/users/settings/save-all")
 async def save_all_settings(
     settings_data: SaveAllSettingsRequest,
     user_id: str = Path(..., description="User ID"),
@@ -128,7 +126,6 @@ async def save_all_settings(
 
 # Reset Operations
 @router.post("/{user_id}/settings/reset")
-@measure_http_request("/users/settings/reset-all")
 async def reset_all_settings(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
@@ -172,7 +169,6 @@ async def reset_all_settings(
 
 
 @router.post("/{user_id}/settings/reset/search")
-@measure_http_request("/users/settings/reset-search")
 async def reset_search_settings(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
@@ -225,7 +221,6 @@ async def reset_search_settings(
 
 
 @router.post("/{user_id}/settings/reset/application")
-@measure_http_request("/users/settings/reset-application")
 async def reset_application_settings(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
@@ -278,7 +273,6 @@ async def reset_application_settings(
 
 
 @router.post("/{user_id}/settings/reset/notifications")
-@measure_http_request("/users/settings/reset-notifications")
 async def reset_notification_settings(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
@@ -332,7 +326,6 @@ async def reset_notification_settings(
 
 # Validation Operations
 @router.post("/{user_id}/settings/validate")
-@measure_http_request("/users/settings/validate")
 async def validate_settings(
     validation_data: SettingsValidationRequest,
     user_id: str = Path(..., description="User ID"),
@@ -9,7 +9,6 @@ import structlog
 import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
 
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
 from jobhire.config.settings import get_settings
 
 
@@ -18,7 +17,6 @@ router = APIRouter(tags=["💚 Health & Status"])
 
 
 @router.get("/health")
-@measure_http_request("/health")
 async def health_check() -> Dict[str, Any]:
     """Basic health check endpoint."""
     try:
@@ -41,7 +39,6 @@ async def health_check() -> Dict[str, Any]:
 
 
 @router.get("/status")
-@measure_http_request("/status")
 async def detailed_status() -> Dict[str, Any]:
     """Detailed system status check."""
     try:
@@ -94,7 +91,6 @@ async def detailed_status() -> Dict[str, Any]:
 
 
 @router.get("/status/database")
-@measure_http_request("/status/database")
 async def database_status() -> Dict[str, Any]:
     """Database-specific health check."""
     try:
@@ -114,7 +110,6 @@ async def database_status() -> Dict[str, Any]:
 
 
 @router.get("/status/services")
-@measure_http_request("/status/services")
 async def services_status() -> Dict[str, Any]:
     """External services health check."""
     try:
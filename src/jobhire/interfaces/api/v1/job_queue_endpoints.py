@@ -9,7 +9,6 @@ import structlog
 
 from jobhire.shared.domain.types import EntityId
 from jobhire.shared.infrastructure.security import get_current_user, require_permission, Permission
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
 from jobhire.shared.application.exceptions import ValidationException, BusinessRuleException, NotFoundException
 
 from jobhire.domains.job.application.services import JobQueueService
@@ -27,7 +26,6 @@ router = APIRouter(prefix="/queue", tags=["📋 Job Queue"])
 
 
 @router.post("/", response_model=JobQueueResponseDTO)
-@measure_http_request("/queue/create")
 async def add_job_to_queue(
     create_request: JobQueueCreateDTO,
     current_user=Depends(get_current_user),
@@ -74,7 +72,6 @@ async def add_job_to_queue(
 
 
 @router.get("/", response_model=List[JobQueueResponseDTO])
-@measure_http_request("/queue/list")
 async def get_user_queue(
     status: Optional[QueueStatus] = Query(None),
     priority: Optional[QueuePriority] = Query(None),
@@ -107,7 +104,6 @@ async def get_user_queue(
 
 
 @router.get("/{queue_id}", response_model=JobQueueResponseDTO)
-@measure_http_request("/queue/get")
 async def get_queue_item(
     queue_id: str,
     current_user=Depends(get_current_user),
@@ -141,7 +137,6 @@ async def get_queue_item(
 
 
 @router.put("/{queue_id}", response_model=JobQueueResponseDTO)
-@measure_http_request("/queue/update")
 async def update_queue_item(
     queue_id: str,
     update_request: JobQueueUpdateDTO,
@@ -177,7 +172,6 @@ async def update_queue_item(
 
 
 @router.post("/{queue_id}/skip", response_model=JobQueueResponseDTO)
-@measure_http_request("/queue/skip")
 async def skip_queue_item(
     queue_id: str,
     reason: Optional[str] = None,
@@ -207,7 +201,6 @@ async def skip_queue_item(
 
 
 @router.post("/{queue_id}/cancel", response_model=JobQueueResponseDTO)
-@measure_http_request("/queue/cancel")
 async def cancel_queue_item(
     queue_id: str,
     reason: Optional[str] = None,
@@ -237,7 +230,6 @@ async def cancel_queue_item(
 
 
 @router.delete("/{queue_id}")
-@measure_http_request("/queue/delete")
 async def remove_queue_item(
     queue_id: str,
     current_user=Depends(get_current_user),
@@ -272,7 +264,6 @@ async def remove_queue_item(
 
 
 @router.get("/flagged/items", response_model=List[JobQueueResponseDTO])
-@measure_http_request("/queue/flagged")
 async def get_flagged_items(
     limit: int = Query(50, ge=1, le=200),
     current_user=Depends(get_current_user),
@@ -299,7 +290,6 @@ async def get_flagged_items(
 
 
 @router.get("/stats/summary", response_model=QueueStatsDTO)
-@measure_http_request("/queue/stats")
 async def get_queue_stats(
     current_user=Depends(get_current_user),
     job_queue_service: JobQueueService = Depends(get_job_queue_service)
@@ -324,7 +314,6 @@ async def get_queue_stats(
 
 
 @router.post("/bulk/cancel")
-@measure_http_request("/queue/bulk-cancel")
 async def bulk_cancel_queued_items(
     current_user=Depends(get_current_user),
     job_queue_service: JobQueueService = Depends(get_job_queue_service)
@@ -359,13 +348,12 @@ async def bulk_cancel_queued_items(
 
 
 @router.get("/ready/processing", response_model=List[JobQueueResponseDTO])
-@measure_http_request("/queue/ready")
 async def get_ready_for_processing(
     limit: int = Query(50, ge=1, le=200),
     current_user=Depends(get_current_user),
     job_queue_service: JobQueueService = Depends(get_job_queue_service)
 ) -> List[JobQueueResponseDTO]:
-    """Get queue items ready for processing (admin/system endpoint)."""
+    """Preview queue items ready for processing (read-only; workers use /ready/claim)."""
     try:
         require_permission(current_user.role, Permission.ADMIN_READ)
 
@@ -381,8 +369,69 @@ async def get_ready_for_processing(
         raise HTTPException(status_code=500, detail="Failed to retrieve ready items")
 
 
+@router.post("/ready/claim", response_model=List[JobQueueResponseDTO])
+async def claim_ready_for_processing(
+    worker_id: str = Query(..., min_length=1),
+    limit: int = Query(50, ge=1, le=200),
+    visibility_timeout: int = Query(300, ge=30, le=3600),
+    current_user=Depends(get_current_user),
+    job_queue_service: JobQueueService = Depends(get_job_queue_service)
+) -> List[JobQueueResponseDTO]:
+    """Lease ready queue items to a processing worker (admin/system endpoint)."""
+    try:
+        require_permission(current_user.role, Permission.ADMIN)
+
+        claimed_items = await job_queue_service.claim_for_processing(
+            worker_id, limit=limit, visibility_timeout=visibility_timeout
+        )
+        return [JobQueueResponseDTO.from_job_queue(item) for item in claimed_items]
+
+    except Exception as e:
+        logger.error(
+            "Failed to claim ready items",
+            worker_id=worker_id,
+            error=str(e)
+        )
+        raise HTTPException(status_code=500, detail="Failed to claim ready items")
+
+
+@router.post("/{queue_id}/start")
+async def start_queue_item_processing(
+    queue_id: str,
+    worker_id: str = Query(..., min_length=1),
+    workflow_execution_id: str = Query(...),
+    current_user=Depends(get_current_user),
+    job_queue_service: JobQueueService = Depends(get_job_queue_service)
+):
+    """Start processing an item claimed through /ready/claim (admin/system endpoint)."""
+    try:
+        require_permission(current_user.role, Permission.ADMIN)
+
+        await job_queue_service.process_queue_item(
+            EntityId.from_string(queue_id),
+            EntityId.from_string(workflow_execution_id),
+            worker_id=worker_id
+        )
+        return {"success": True, "queue_id": queue_id, "workflow_execution_id": workflow_execution_id}
+
+    except Exception as e:
+        logger.error(
+            "Failed to start queue item processing",
+            queue_id=queue_id,
+            worker_id=worker_id,
+            error=str(e)
+        )
+
+        if isinstance(e, NotFoundException):
+            raise HTTPException(status_code=404, detail=str(e))
+        elif isinstance(e, ValueError):
+            # Not queued, or leased to another worker
+            raise HTTPException(status_code=409, detail=str(e))
+        else:
+            raise HTTPException(status_code=500, detail="Failed to start queue item processing")
+
+
 @router.get("/metrics/{queue_id}", response_model=JobQueueMetricsDTO)
-@measure_http_request("/queue/metrics")
 async def get_queue_item_metrics(
     queue_id: str,
     current_user=Depends(get_current_user),
@@ -9,7 +9,6 @@ import structlog
 
 from jobhire.shared.domain.types import EntityId
 from jobhire.shared.infrastructure.security import get_current_user, require_permission, Permission
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
 
 from jobhire.domains.job.application.services import JobSearchService
 from jobhire.shared.infrastructure.container import get_job_search_service, get_user_profile_service
@@ -26,7 +25,6 @@ router = APIRouter(prefix="/jobs", tags=["🔍 Job Search"])
 
 
 @router.post("/search", response_model=JobSearchResultDTO)
-@measure_http_request("/jobs/search")
 async def search_jobs(
     search_request: JobSearchRequestDTO,
     background_tasks: BackgroundTasks,
@@ -93,7 +91,6 @@ async def search_jobs(
 
 
 @router.get("/search/history", response_model=List[JobSearchResultDTO])
-@measure_http_request("/jobs/search/history")
 async def get_search_history(
     limit: int = Query(20, ge=1, le=100),
     include_failed: bool = Query(False),
@@ -122,7 +119,6 @@ async def get_search_history(
 
 
 @router.post("/search/{search_id}/cancel")
-@measure_http_request("/jobs/search/cancel")
 async def cancel_search(
     search_id: str,
     reason: str = "User requested cancellation",
@@ -151,7 +147,6 @@ async def cancel_search(
 
 
 @router.post("/search/{search_id}/retry", response_model=JobSearchResultDTO)
-@measure_http_request("/jobs/search/retry")
 async def retry_search(
     search_id: str,
     current_user=Depends(get_current_user),
@@ -178,7 +173,6 @@ async def retry_search(
 
 
 @router.get("/preferences")
-@measure_http_request("/jobs/preferences")
 async def get_search_preferences(
     current_user=Depends(get_current_user),
     user_service: UserProfileService = Depends(get_user_profile_service)
@@ -203,7 +197,6 @@ async def get_search_preferences(
 
 
 @router.put("/preferences")
-@measure_http_request("/jobs/preferences")
 async def update_search_preferences(
     preferences_update: SearchPreferencesUpdateDTO,
     current_user=Depends(get_current_user),
@@ -235,7 +228,6 @@ async def update_search_preferences(
 
 
 @router.get("/configuration")
-@measure_http_request("/jobs/configuration")
 async def get_search_configuration(
     current_user=Depends(get_current_user),
     user_service: UserProfileService = Depends(get_user_profile_service)
@@ -260,7 +252,6 @@ async def get_search_configuration(
 
 
 @router.put("/configuration")
-@measure_http_request("/jobs/configuration")
 async def update_search_configuration(
     config_update: SearchConfigurationUpdateDTO,
     current_user=Depends(get_current_user),
@@ -292,7 +283,6 @@ async def update_search_configuration(
 
 
 @router.post("/search/automated")
-@measure_http_request("/jobs/search/automated")
 async def start_automated_search(
     current_user=Depends(get_current_user),
     user_service: UserProfileService = Depends(get_user_profile_service),
@@ -328,7 +318,6 @@ async def start_automated_search(
 
 
 @router.post("/search/automated/stop")
-@measure_http_request("/jobs/search/automated/stop")
 async def stop_automated_search(
     current_user=Depends(get_current_user),
     user_service: UserProfileService = Depends(get_user_profile_service)
@@ -361,7 +350,6 @@ async def stop_automated_search(
 
 
 @router.get("/analytics")
-@measure_http_request("/jobs/analytics")
 async def get_search_analytics(
     days: int = Query(30, ge=1, le=365),
     current_user=Depends(get_current_user),
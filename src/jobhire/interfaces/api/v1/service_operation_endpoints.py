@@ -10,7 +10,6 @@ import structlog
 
 from jobhire.shared.domain.types import EntityId
 from jobhire.shared.infrastructure.security import get_current_user, require_permission, Permission
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
 from jobhire.shared.application.exceptions import BusinessRuleException, NotFoundException
 
 from jobhire.domains.user.application.services import UserProfileService
@@ -26,7 +25,6 @@ router = APIRouter(prefix="/users", tags=["🔧 Service Operations"])
 
 
 @router.get("/{user_id}/service/status")
-@measure_http_request("/users/service/status")
 async def get_service_status(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
@@ -68,7 +66,6 @@ async def get_service_status(
 
 
 @router.post("/{user_id}/service/pause")
-@measure_http_request("/users/service/pause")
 async def pause_service(
     user_id: str = Path(..., description="User ID"),
     reason: Dict[str, Any] = None,
@@ -124,7 +121,6 @@ async def pause_service(
 
 
 @router.post("/{user_id}/service/resume")
-@measure_http_request("/users/service/resume")
 async def resume_service(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
@@ -176,7 +172,6 @@ async def resume_service(
 
 
 @router.put("/{user_id}/service/toggle")
-@measure_http_request("/users/service/toggle")
 async def toggle_service(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
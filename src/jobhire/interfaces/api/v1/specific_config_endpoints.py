@@ -11,7 +11,6 @@ from pydantic import BaseModel, Field
 
 from jobhire.shared.domain.types import EntityId
 from jobhire.shared.infrastructure.security import get_current_user, require_permission, Permission
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
 from jobhire.shared.application.exceptions import BusinessRuleException, NotFoundException
 
 from jobhire.domains.user.application.services import UserProfileService
@@ -48,7 +47,6 @@ class NotificationUpdate(BaseModel):
 
 # Match Level Configuration
 @router.put("/{user_id}/settings/match-level")
-@measure_http_request("/users/settings/match-level")
 async def update_match_level(
     match_level_data: MatchLevelUpdate,
     user_id: str = Path(..., description="User ID"),
@@ -108,7 +106,6 @@ async def update_match_level(
 
 # Document Generation Configuration
 @router.put("/{user_id}/settings/document-generation")
-@measure_http_request("/users/settings/document-generation")
 async def update_document_generation(
     document_settings: DocumentGenerationUpdate,
     user_id: str = Path(..., description="User ID"),
@@ -179,7 +176,6 @@ async def update_document_generation(
 
 # Approval Mode Configuration
 @router.put("/{user_id}/settings/approval-mode")
-@measure_http_request("/users/settings/approval-mode")
 async def update_approval_mode(
     approval_data: ApprovalModeUpdate,
     user_id: str = Path(..., description="User ID"),
@@ -239,7 +235,6 @@ async def update_approval_mode(
 
 # Individual Email Notification Endpoints
 @router.put("/{user_id}/settings/notifications/interview-invitation")
-@measure_http_request("/users/settings/notifications/interview-invitation")
 async def update_interview_invitation_notification(
     notification_data: NotificationUpdate,
     user_id: str = Path(..., description="User ID"),
@@ -254,7 +249,6 @@ async def update_interview_invitation_notification(
 
 
 @router.put("/{user_id}/settings/notifications/info-request")
-@measure_http_request("/users/settings/notifications/info-request")
 async def update_info_request_notification(
     notification_data: NotificationUpdate,
     user_id: str = Path(..., description="User ID"),
@@ -269,7 +263,6 @@ async def update_info_request_notification(
 
 
 @router.put("/{user_id}/settings/notifications/acknowledgement")
-@measure_http_request("/users/settings/notifications/acknowledgement")
 async def update_acknowledgement_notification(
     notification_data: NotificationUpdate,
     user_id: str = Path(..., description="User ID"),
@@ -284,7 +277,6 @@ async def update_acknowledgement_notification(
 
 
 @router.put("/{user_id}/settings/notifications/status-update")
-@measure_http_request("/users/settings/notifications/status-update")
 async def update_status_update_notification(
     notification_data: NotificationUpdate,
     user_id: str = Path(..., description="User ID"),
@@ -299,7 +291,6 @@ async def update_status_update_notification(
 
 
 @router.put("/{user_id}/settings/notifications/rejection")
-@measure_http_request("/users/settings/notifications/rejection")
 async def update_rejection_notification(
     notification_data: NotificationUpdate,
     user_id: str = Path(..., description="User ID"),
@@ -314,7 +305,6 @@ async def update_rejection_notification(
 
 
 @router.put("/{user_id}/settings/notifications/system")
-@measure_http_request("/users/settings/notifications/system")
 async def update_system_notification(
     notification_data: NotificationUpdate,
     user_id: str = Path(..., description="User ID"),
@@ -329,7 +319,6 @@ async def update_system_notification(
 
 
 @router.put("/{user_id}/settings/notifications/other")
-@measure_http_request("/users/settings/notifications/other")
 async def update_other_notification(
     notification_data: NotificationUpdate,
     user_id: str = Path(..., description="User ID"),
@@ -9,8 +9,6 @@ from fastapi.security import HTTPBearer
 from pydantic import BaseModel, Field, EmailStr
 import structlog
 
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
-
 
 logger = structlog.get_logger(__name__)
 security = HTTPBearer()
@@ -44,7 +42,6 @@ class UserListResponse(BaseModel):
 
 
 @router.get("/", response_model=UserListResponse)
-@measure_http_request("/users/list")
 async def list_users(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=200, description="Items per page"),
@@ -109,7 +106,6 @@ async def list_users(
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-@measure_http_request("/users/get")
 async def get_user(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(security)
@@ -142,7 +138,6 @@ async def get_user(
 
 
 @router.put("/{user_id}", response_model=UserResponse)
-@measure_http_request("/users/update")
 async def update_user(
     user_data: UserUpdate,
     user_id: str = Path(..., description="User ID"),
@@ -177,7 +172,6 @@ async def update_user(
 
 
 @router.delete("/{user_id}")
-@measure_http_request("/users/delete")
 async def delete_user(
     user_id: str = Path(..., description="User ID"),
     permanent: bool = Query(False, description="Permanently delete user"),
@@ -209,7 +203,6 @@ async def delete_user(
 
 
 @router.post("/{user_id}/activate")
-@measure_http_request("/users/activate")
 async def activate_user(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(security)
@@ -236,7 +229,6 @@ async def activate_user(
 
 
 @router.post("/{user_id}/deactivate")
-@measure_http_request("/users/deactivate")
 async def deactivate_user(
     user_id: str = Path(..., description="User ID"),
     reason: Optional[str] = Query(None, description="Deactivation reason"),
@@ -266,7 +258,6 @@ async def deactivate_user(
 
 
 @router.post("/{user_id}/upgrade")
-@measure_http_request("/users/upgrade")
 async def upgrade_user_tier(
     user_id: str = Path(..., description="User ID"),
     new_tier: str = Query(..., description="New user tier (premium, enterprise)"),
@@ -297,7 +288,6 @@ async def upgrade_user_tier(
 
 
 @router.get("/{user_id}/activity")
-@measure_http_request("/users/activity")
 async def get_user_activity(
     user_id: str = Path(..., description="User ID"),
     days: int = Query(30, ge=1, le=365, description="Number of days to retrieve"),
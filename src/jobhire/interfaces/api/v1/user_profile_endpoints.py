@@ -10,7 +10,6 @@ import structlog
 
 from jobhire.shared.domain.types import EntityId
 from jobhire.shared.infrastructure.security import get_current_user, require_permission, Permission
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
 from jobhire.shared.application.exceptions import NotFoundException
 
 from jobhire.domains.user.application.services import UserProfileService
@@ -23,7 +22,6 @@ router = APIRouter(prefix="/users", tags=["👤 User Profile"])
 
 
 @router.get("/{user_id}/profile")
-@measure_http_request("/users/profile/get")
 async def get_user_profile(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
@@ -70,7 +68,6 @@ async def get_user_profile(
 
 
 @router.get("/{user_id}/email")
-@measure_http_request("/users/email/get")
 async def get_user_email(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
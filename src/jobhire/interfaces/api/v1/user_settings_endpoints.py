@@ -10,7 +10,6 @@ import structlog
 
 from jobhire.shared.domain.types import EntityId
 from jobhire.shared.infrastructure.security import get_current_user, require_permission, Permission
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
 from jobhire.shared.application.exceptions import BusinessRuleException, NotFoundException
 
 from jobhire.domains.user.application.services import UserProfileService
@@ -29,7 +28,6 @@ router = APIRouter(prefix="/users", tags=["👤 User Settings"])
 
 @router.get("/{user_id}/settings")
 @router.get("/{user_id}/settings/all")
-@measure_http_request("/users/settings/get-all")
 async def get_all_settings(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
@@ -74,7 +72,6 @@ async def get_all_settings(
 
 
 @router.get("/{user_id}/settings/search")
-@measure_http_request("/users/settings/search/get")
 async def get_search_settings(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
@@ -112,7 +109,6 @@ async def get_search_settings(
 
 @router.put("/{user_id}/settings/search")
 @router.patch("/{user_id}/settings/search")
-@measure_http_request("/users/settings/search/update")
 async def update_search_settings(
     search_settings: Dict[str, Any],
     user_id: str = Path(..., description="User ID"),
@@ -160,7 +156,6 @@ async def update_search_settings(
 
 
 @router.get("/{user_id}/settings/application")
-@measure_http_request("/users/settings/application/get")
 async def get_application_settings(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
@@ -196,7 +191,6 @@ async def get_application_settings(
 
 @router.put("/{user_id}/settings/application")
 @router.patch("/{user_id}/settings/application")
-@measure_http_request("/users/settings/application/update")
 async def update_application_settings(
     application_settings: Dict[str, Any],
     user_id: str = Path(..., description="User ID"),
@@ -244,7 +238,6 @@ async def update_application_settings(
 
 
 @router.get("/{user_id}/settings/notifications")
-@measure_http_request("/users/settings/notifications/get")
 async def get_notification_settings(
     user_id: str = Path(..., description="User ID"),
     current_user=Depends(get_current_user),
@@ -285,7 +278,6 @@ async def get_notification_settings(
 
 @router.put("/{user_id}/settings/notifications")
 @router.patch("/{user_id}/settings/notifications")
-@measure_http_request("/users/settings/notifications/update")
 async def update_notification_settings(
     notification_settings: Dict[str, Any],
     user_id: str = Path(..., description="User ID"),
@@ -334,7 +326,6 @@ async def update_notification_settings(
 
 # Alternative endpoint using email as identifier
 @router.get("/settings")
-@measure_http_request("/users/settings/by-email")
 async def get_settings_by_email(
     email: str = Query(..., description="User email"),
     current_user=Depends(get_current_user),
@@ -364,7 +355,6 @@ async def get_settings_by_email(
 
 
 @router.put("/settings")
-@measure_http_request("/users/settings/update-by-email")
 async def update_settings_by_email(
     settings_data: Dict[str, Any],
     email: str = Query(..., description="User email"),
@@ -11,7 +11,6 @@ from pydantic import BaseModel, Field
 import hmac
 import hashlib
 
-from jobhire.shared.infrastructure.monitoring.metrics import measure_http_request
 from jobhire.shared.application.exceptions import BusinessRuleException
 
 
@@ -48,7 +47,6 @@ class ApplicationStatusChangedWebhook(BaseModel):
 
 
 @router.post("/email-received")
-@measure_http_request("/webhooks/email-received")
 async def handle_email_received(
     webhook_data: EmailReceivedWebhook,
     request: Request,
@@ -113,7 +111,6 @@ async def handle_email_received(
 
 
 @router.post("/application-status-changed")
-@measure_http_request("/webhooks/application-status-changed")
 async def handle_application_status_changed(
     webhook_data: ApplicationStatusChangedWebhook,
     request: Request,
@@ -14,25 +14,33 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client.openmetrics import exposition as openmetrics
 from starlette.responses import PlainTextResponse
 
-from .config.settings import get_settings
-from .shared.infrastructure.database import DatabaseManager
-from .shared.infrastructure.monitoring import (
+from jobhire.config.settings import get_settings
+from jobhire.shared.infrastructure.database import DatabaseManager
+from jobhire.shared.infrastructure.monitoring import (
     setup_structured_logging,
     setup_metrics,
     setup_tracing,
     setup_error_tracking
 )
-# from .shared.infrastructure.security import SecurityMiddleware  # Not used yet
-from .interfaces.api import create_api_router
-from .interfaces.api.swagger_config import (
+from jobhire.shared.infrastructure.monitoring.metrics import MetricsMiddleware
+from jobhire.shared.infrastructure.monitoring.tracing import (
+    TracingMiddleware,
+    shutdown_tracing,
+    tracing_configured
+)
+from jobhire.shared.infrastructure.unit_of_work import UnitOfWorkMiddleware
+# from jobhire.shared.infrastructure.security import SecurityMiddleware  # Not used yet
+from jobhire.interfaces.api import create_api_router
+from jobhire.interfaces.api.swagger_config import (
     get_openapi_config,
     get_swagger_ui_parameters,
     get_redoc_parameters
 )
-from .shared.infrastructure.events import EventBus
-from .shared.infrastructure.container import get_container, cleanup_container
+from jobhire.shared.infrastructure.events import EventBus
+from jobhire.shared.infrastructure.container import get_container, cleanup_container
 
 
 # Configure structured logging
@@ -48,6 +56,13 @@ async def lifespan(app: FastAPI):
 
     # Initialize core services
     try:
+        # Distributed tracing (before any database client is created, so it is instrumented).
+        # Kept when a wrapping entry point already set it up: the library instrumentations
+        # stay bound to the first provider.
+        if settings.monitoring.enable_tracing and not tracing_configured():
+            setup_tracing()
+            logger.info("Distributed tracing enabled")
+
         # Initialize dependency injection container
         container = await get_container()
         logger.info("Dependency injection container initialized")
@@ -64,8 +79,8 @@ async def lifespan(app: FastAPI):
             logger.warning("Database connection failed - running without database", error=str(e))
             database_manager = None
 
-        # Event bus
-        event_bus = EventBus()
+        # Event bus (drains the domain event outbox in the background)
+        event_bus = EventBus(container.get('outbox_dispatcher'))
         await event_bus.start()
         logger.info("Event bus started")
 
@@ -74,11 +89,6 @@ async def lifespan(app: FastAPI):
             setup_metrics()
             logger.info("Metrics collection enabled")
 
-        # Distributed tracing
-        if settings.monitoring.enable_tracing:
-            setup_tracing()
-            logger.info("Distributed tracing enabled")
-
         # Error tracking
         if settings.monitoring.sentry_dsn:
             setup_error_tracking()
@@ -112,6 +122,9 @@ async def lifespan(app: FastAPI):
         await cleanup_container()
         logger.info("Dependency injection container cleaned up")
 
+        # Flush spans still queued for export
+        shutdown_tracing()
+
         logger.info("Application shutdown completed")
 
     except Exception as e:
@@ -147,6 +160,10 @@ def create_application() -> FastAPI:
     # Security middleware (must be first) - TODO: Fix SecurityMiddleware ASGI interface
     # app.add_middleware(SecurityMiddleware)
 
+    # Request-scoped unit of work (innermost, so a 409 from a lost version race
+    # still passes through CORS and metrics)
+    app.add_middleware(UnitOfWorkMiddleware)
+
     # Trusted host middleware (for production)
     if settings.is_production:
         app.add_middleware(
@@ -166,6 +183,14 @@ def create_application() -> FastAPI:
     # Compression middleware
     app.add_middleware(GZipMiddleware, minimum_size=1000)
 
+    # Request metrics (added last so it is outermost and times the whole stack)
+    if settings.monitoring.enable_metrics:
+        app.add_middleware(MetricsMiddleware)
+
+    # Request spans (outside the metrics middleware, so slow requests get trace exemplars)
+    if settings.monitoring.enable_tracing:
+        app.add_middleware(TracingMiddleware)
+
     # Include API routes
     api_router = create_api_router()
     app.include_router(api_router, prefix="/api")
@@ -214,8 +239,13 @@ def create_application() -> FastAPI:
     # Metrics endpoint
     if settings.monitoring.enable_metrics:
         @app.get("/metrics", tags=["Monitoring"])
-        async def metrics():
-            """Prometheus metrics endpoint."""
+        async def metrics(request: Request):
+            """Prometheus metrics endpoint (OpenMetrics with exemplars when accepted)."""
+            if "application/openmetrics-text" in request.headers.get("accept", ""):
+                return PlainTextResponse(
+                    openmetrics.generate_latest(),
+                    media_type=openmetrics.CONTENT_TYPE_LATEST
+                )
             return PlainTextResponse(
                 generate_latest(),
                 media_type=CONTENT_TYPE_LATEST
@@ -9,7 +9,10 @@ from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from jobhire.config.settings import get_settings
 from jobhire.shared.infrastructure.events import DomainEventPublisher
+from jobhire.shared.infrastructure.outbox import OutboxRepository, OutboxDispatcher
 from jobhire.shared.infrastructure.database import DatabaseManager
+from jobhire.shared.infrastructure.unit_of_work import UnitOfWork, current_unit_of_work
+from jobhire.shared.infrastructure.security.encryption import EncryptionService
 
 # Domain services and repositories
 from jobhire.domains.user.infrastructure.repositories.user_repository import UserRepository
@@ -20,6 +23,10 @@ from jobhire.domains.job.infrastructure.repositories.job_queue_repository import
 from jobhire.domains.job.application.services.job_search_service import JobSearchService
 from jobhire.domains.job.application.services.job_queue_service import JobQueueService
 
+from jobhire.domains.interview.infrastructure.persistence import (
+    InterviewSessionRepository, InterviewSessionStore
+)
+
 
 logger = structlog.get_logger(__name__)
 T = TypeVar('T')
@@ -93,9 +100,31 @@ class Container:
         """Initialize infrastructure services."""
         logger.info("Initializing infrastructure services")
 
-        # Event publisher
-        event_publisher = DomainEventPublisher()
+        # Event outbox, publisher and background dispatcher
+        performance = self._settings.performance
+        outbox = OutboxRepository(
+            self._database,
+            use_transactions=self._settings.database.mongodb_transactions,
+            retention_days=performance.event_outbox_retention_days
+        )
+        await outbox.ensure_indexes()
+
+        event_publisher = DomainEventPublisher(
+            outbox=outbox,
+            handler_concurrency=performance.event_handler_concurrency
+        )
+        self._singletons['event_outbox'] = outbox
         self._singletons['event_publisher'] = event_publisher
+        self._singletons['outbox_dispatcher'] = OutboxDispatcher(
+            outbox,
+            event_publisher,
+            batch_size=performance.event_outbox_batch_size,
+            poll_interval=performance.event_outbox_poll_interval,
+            max_attempts=performance.event_outbox_max_attempts
+        )
+
+        # Field encryption for sensitive repository data
+        self._singletons['encryption_service'] = EncryptionService.from_settings(self._settings)
 
     async def _initialize_domain_services(self):
         """Initialize domain services and repositories."""
@@ -103,9 +132,10 @@ class Container:
 
         # Get shared dependencies
         event_publisher = self._singletons['event_publisher']
+        encryption_service = self._singletons['encryption_service']
 
         # User domain
-        user_repository = UserRepository(self._database)
+        user_repository = UserRepository(self._database, encryption=encryption_service)
         user_profile_service = UserProfileService(user_repository, event_publisher)
 
         self._singletons['user_repository'] = user_repository
@@ -113,7 +143,11 @@ class Container:
 
         # Job domain
         job_search_repository = JobSearchRepository(self._database)
-        job_queue_repository = JobQueueRepository(self._database)
+        job_queue_repository = JobQueueRepository(
+            self._database,
+            max_claims=self._settings.performance.job_queue_max_claims
+        )
+        await job_queue_repository.ensure_indexes()
 
         job_search_service = JobSearchService(
             job_search_repository=job_search_repository,
@@ -132,6 +166,21 @@ class Container:
         self._singletons['job_search_service'] = job_search_service
         self._singletons['job_queue_service'] = job_queue_service
 
+        # Interview domain
+        performance = self._settings.performance
+        interview_session_repository = InterviewSessionRepository(
+            self._database,
+            idle_ttl_seconds=performance.interview_session_idle_ttl
+        )
+        await interview_session_repository.ensure_indexes()
+
+        self._singletons['interview_session_repository'] = interview_session_repository
+        self._singletons['interview_session_store'] = InterviewSessionStore(
+            interview_session_repository,
+            max_sessions=performance.interview_session_cache_size,
+            idle_ttl_seconds=performance.interview_session_idle_ttl
+        )
+
     def get(self, service_name: str) -> Any:
         """Get a service by name."""
         if service_name in self._singletons:
@@ -197,6 +246,17 @@ async def get_job_queue_service() -> JobQueueService:
     return container.get('job_queue_service')
 
 
+async def get_interview_session_store() -> InterviewSessionStore:
+    """Get InterviewSessionStore dependency."""
+    container = await get_container()
+    return container.get('interview_session_store')
+
+
+async def get_unit_of_work() -> Optional[UnitOfWork]:
+    """Get the current request's UnitOfWork dependency (None outside HTTP requests)."""
+    return current_unit_of_work()
+
+
 async def get_database() -> AsyncIOMotorDatabase:
     """Get database dependency."""
     container = await get_container()
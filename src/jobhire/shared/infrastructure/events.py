@@ -3,11 +3,15 @@ Domain event infrastructure.
 """
 
 import asyncio
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Iterable, TYPE_CHECKING
 from abc import ABC, abstractmethod
 import structlog
 
 from jobhire.shared.domain.events import DomainEvent
+from jobhire.shared.infrastructure.unit_of_work import current_unit_of_work
+
+if TYPE_CHECKING:
+    from jobhire.shared.infrastructure.outbox import OutboxRepository, OutboxDispatcher
 
 logger = structlog.get_logger(__name__)
 
@@ -21,58 +25,124 @@ class EventHandler(ABC):
         pass
 
 
+def handler_name(handler: EventHandler) -> str:
+    """Stable name used to record which handlers already received an event."""
+    return f"{type(handler).__module__}.{type(handler).__qualname__}"
+
+
 class DomainEventPublisher:
-    """Domain event publisher."""
+    """
+    Domain event publisher.
+
+    With an outbox, publishing only records the events: inside a unit of work they
+    are written in the same commit as the aggregates, otherwise immediately. The
+    OutboxDispatcher delivers them to handlers in the background, so request latency
+    doesn't depend on the number of subscribers. Without an outbox, handlers run
+    inline as before.
+    """
 
-    def __init__(self):
+    def __init__(self, outbox: Optional["OutboxRepository"] = None, handler_concurrency: int = 10):
         self._handlers: Dict[str, List[EventHandler]] = {}
+        self._limits: Dict[EventHandler, asyncio.Semaphore] = {}
+        self.outbox = outbox
+        self.handler_concurrency = handler_concurrency
 
-    def subscribe(self, event_type: str, handler: EventHandler) -> None:
-        """Subscribe a handler to an event type."""
+    def subscribe(self, event_type: str, handler: EventHandler, max_concurrency: Optional[int] = None) -> None:
+        """Subscribe a handler to an event type, with at most max_concurrency deliveries in flight."""
         if event_type not in self._handlers:
             self._handlers[event_type] = []
         self._handlers[event_type].append(handler)
+        if handler not in self._limits:
+            self._limits[handler] = asyncio.Semaphore(max_concurrency or self.handler_concurrency)
 
     async def publish_events(self, events: List[DomainEvent]) -> None:
         """Publish a list of domain events."""
-        for event in events:
-            await self.publish_event(event)
+        if not events:
+            return
+
+        if self.outbox is None:
+            for event in events:
+                await self.publish_event(event)
+            return
+
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.add_events(self.outbox, events)
+        else:
+            await self.outbox.append(events)
 
     async def publish_event(self, event: DomainEvent) -> None:
-        """Publish a single domain event."""
+        """Deliver a single domain event to its handlers now."""
         event_type = type(event).__name__
 
         if event_type in self._handlers:
-            handlers = self._handlers[event_type]
-
-            # Execute all handlers concurrently
-            tasks = [handler.handle(event) for handler in handlers]
-            if tasks:
-                try:
-                    await asyncio.gather(*tasks, return_exceptions=True)
-                    logger.info("Domain event published", event_type=event_type)
-                except Exception as e:
-                    logger.error("Error publishing event", event_type=event_type, error=str(e))
+            errors = await self.dispatch(event, event_type)
+            for name, error in errors.items():
+                logger.error("Error publishing event", event_type=event_type, handler=name, error=str(error))
+            logger.info("Domain event published", event_type=event_type)
         else:
             logger.debug("No handlers for event", event_type=event_type)
 
+    def has_handlers(self, event_type: str) -> bool:
+        return bool(self._handlers.get(event_type))
+
+    def handler_names(self, event_type: str) -> List[str]:
+        return [handler_name(handler) for handler in self._handlers.get(event_type, [])]
+
+    async def dispatch(
+        self,
+        event: DomainEvent,
+        event_type: Optional[str] = None,
+        skip: Iterable[str] = ()
+    ) -> Dict[str, BaseException]:
+        """
+        Run the event's handlers concurrently, each within its concurrency limit.
+        Handlers named in skip (already delivered) are not called again. Returns the
+        failures by handler name; an empty dict means every handler succeeded.
+        """
+        skip = set(skip)
+        handlers = [
+            handler for handler in self._handlers.get(event_type or type(event).__name__, [])
+            if handler_name(handler) not in skip
+        ]
+        results = await asyncio.gather(
+            *(self._run_handler(handler, event) for handler in handlers),
+            return_exceptions=True
+        )
+        return {
+            handler_name(handler): result
+            for handler, result in zip(handlers, results)
+            if isinstance(result, BaseException)
+        }
+
+    async def _run_handler(self, handler: EventHandler, event: DomainEvent) -> None:
+        async with self._limits[handler]:
+            await handler.handle(event)
+
 
 class EventBus:
-    """Simple event bus for application events."""
+    """Application event bus; runs the outbox dispatcher when one is configured."""
 
-    def __init__(self):
+    def __init__(self, dispatcher: Optional["OutboxDispatcher"] = None):
         self._running = False
+        self.dispatcher = dispatcher
 
     async def start(self) -> None:
         """Start the event bus."""
+        if self.dispatcher is not None:
+            self.dispatcher.start()
         self._running = True
         logger.info("Event bus started")
 
     async def stop(self) -> None:
         """Stop the event bus."""
         self._running = False
+        if self.dispatcher is not None:
+            await self.dispatcher.stop()
         logger.info("Event bus stopped")
 
     async def health_check(self) -> bool:
         """Check if event bus is healthy."""
-        return self._running
\ No newline at end of file
+        if self.dispatcher is not None and not self.dispatcher.is_running:
+            return False
+        return self._running
@@ -12,6 +12,7 @@ import structlog
 from structlog.types import EventDict
 
 from jobhire.config.settings import get_settings
+from jobhire.shared.infrastructure.monitoring.tracing import get_span_id, get_trace_id
 
 
 # Context variables for request correlation
@@ -102,7 +103,7 @@ def add_correlation_id(logger: Any, method_name: str, event_dict: EventDict) ->
     """Add correlation IDs to log events."""
     request_id = request_id_var.get()
     user_id = user_id_var.get()
-    trace_id = trace_id_var.get()
+    trace_id = trace_id_var.get() or get_trace_id()
 
     if request_id:
         event_dict["request_id"] = request_id
@@ -110,6 +111,9 @@ def add_correlation_id(logger: Any, method_name: str, event_dict: EventDict) ->
         event_dict["user_id"] = user_id
     if trace_id:
         event_dict["trace_id"] = trace_id
+        span_id = get_span_id()
+        if span_id:
+            event_dict["span_id"] = span_id
 
     return event_dict
 
@@ -7,11 +7,12 @@ from typing import Dict, Any, Optional, List
 from functools import wraps
 from prometheus_client import (
     Counter, Histogram, Gauge, Summary, Info,
-    CollectorRegistry, generate_latest, CONTENT_TYPE_LATEST
+    CollectorRegistry, REGISTRY, generate_latest, CONTENT_TYPE_LATEST
 )
 import structlog
 
 from jobhire.config.settings import get_settings
+from jobhire.shared.infrastructure.monitoring.tracing import get_trace_id
 
 
 logger = structlog.get_logger(__name__)
@@ -48,6 +49,35 @@ class MetricsCollector:
             registry=self.registry
         )
 
+        # Outbound HTTP Pool Metrics
+        self.http_client_requests_in_flight = Gauge(
+            "http_client_requests_in_flight",
+            "Outbound HTTP requests holding a pool slot",
+            ["host"],
+            registry=self.registry
+        )
+
+        self.http_client_requests_waiting = Gauge(
+            "http_client_requests_waiting",
+            "Outbound HTTP requests waiting for a pool slot",
+            ["host"],
+            registry=self.registry
+        )
+
+        self.http_client_pool_utilization = Gauge(
+            "http_client_pool_utilization",
+            "Fraction of per-host outbound HTTP slots in use",
+            ["host"],
+            registry=self.registry
+        )
+
+        self.http_client_pool_wait_duration = Histogram(
+            "http_client_pool_wait_seconds",
+            "Time spent waiting for an outbound HTTP pool slot",
+            ["host"],
+            registry=self.registry
+        )
+
         # Database Metrics
         self.database_operations_total = Counter(
             "database_operations_total",
@@ -69,6 +99,13 @@ class MetricsCollector:
             registry=self.registry
         )
 
+        self.identity_map_lookups_total = Counter(
+            "identity_map_lookups_total",
+            "Aggregate lookups by ID within a unit of work (hit = database load avoided)",
+            ["result"],
+            registry=self.registry
+        )
+
         # AI Service Metrics
         self.ai_requests_total = Counter(
             "ai_requests_total",
@@ -154,6 +191,34 @@ class MetricsCollector:
             registry=self.registry
         )
 
+        # Domain Event Outbox Metrics
+        self.events_dispatched_total = Counter(
+            "events_dispatched_total",
+            "Domain event deliveries from the outbox",
+            ["event_type", "status"],
+            registry=self.registry
+        )
+
+        self.event_dispatch_delay = Histogram(
+            "event_dispatch_delay_seconds",
+            "Time from an event occurring to its delivery attempt",
+            ["event_type"],
+            buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0],
+            registry=self.registry
+        )
+
+        self.event_outbox_pending = Gauge(
+            "event_outbox_pending",
+            "Domain events waiting in the outbox",
+            registry=self.registry
+        )
+
+        self.event_outbox_lag = Gauge(
+            "event_outbox_lag_seconds",
+            "Age of the oldest undelivered domain event",
+            registry=self.registry
+        )
+
         # Error Metrics
         self.errors_total = Counter(
             "errors_total",
@@ -174,9 +239,10 @@ class MetricsCollector:
         method: str,
         endpoint: str,
         status_code: int,
-        duration: float
+        duration: float,
+        exemplar: Optional[Dict[str, str]] = None
     ):
-        """Record HTTP request metrics."""
+        """Record HTTP request metrics (endpoint should be a route template)."""
         self.http_requests_total.labels(
             method=method,
             endpoint=endpoint,
@@ -186,7 +252,25 @@ class MetricsCollector:
         self.http_request_duration.labels(
             method=method,
             endpoint=endpoint
-        ).observe(duration)
+        ).observe(duration, exemplar=exemplar)
+
+    def record_http_pool_stats(
+        self,
+        host: str,
+        in_flight: int,
+        waiting: int,
+        limit: int,
+        wait_time: Optional[float] = None
+    ):
+        """Record outbound HTTP connection pool saturation."""
+        self.http_client_requests_in_flight.labels(host=host).set(in_flight)
+        self.http_client_requests_waiting.labels(host=host).set(waiting)
+        self.http_client_pool_utilization.labels(host=host).set(
+            in_flight / limit if limit else 0.0
+        )
+
+        if wait_time is not None:
+            self.http_client_pool_wait_duration.labels(host=host).observe(wait_time)
 
     def record_database_operation(
         self,
@@ -209,6 +293,13 @@ class MetricsCollector:
             collection=collection
         ).observe(duration)
 
+    def record_identity_map_lookups(self, hits: int, loads: int):
+        """Record a unit of work's identity map hits and database loads."""
+        if hits:
+            self.identity_map_lookups_total.labels(result="hit").inc(hits)
+        if loads:
+            self.identity_map_lookups_total.labels(result="miss").inc(loads)
+
     def record_ai_request(
         self,
         provider: str,
@@ -274,6 +365,17 @@ class MetricsCollector:
         """Update queue size."""
         self.queue_size.labels(queue_name=queue_name).set(size)
 
+    def record_event_dispatch(self, event_type: str, delay: float, success: bool):
+        """Record an outbox delivery attempt."""
+        status = "success" if success else "error"
+        self.events_dispatched_total.labels(event_type=event_type, status=status).inc()
+        self.event_dispatch_delay.labels(event_type=event_type).observe(max(delay, 0.0))
+
+    def update_event_outbox_backlog(self, pending: int, lag_seconds: float):
+        """Update outbox backlog size and lag."""
+        self.event_outbox_pending.set(pending)
+        self.event_outbox_lag.set(lag_seconds)
+
     def record_error(self, error_type: str, component: str):
         """Record an error."""
         self.errors_total.labels(
@@ -289,6 +391,22 @@ class MetricsCollector:
         })
 
 
+class RegistryExporter:
+    """
+    Custom collector exposing a private registry through another one.
+
+    The global collector keeps its metrics in its own registry and is exported
+    through the default registry, so /metrics serves them alongside the legacy
+    metrics without registering each metric globally.
+    """
+
+    def __init__(self, registry: CollectorRegistry):
+        self.registry = registry
+
+    def collect(self):
+        return self.registry.collect()
+
+
 # Global metrics collector instance
 _metrics_collector: Optional[MetricsCollector] = None
 
@@ -297,7 +415,14 @@ def get_metrics_collector() -> MetricsCollector:
     """Get the global metrics collector instance."""
     global _metrics_collector
     if _metrics_collector is None:
-        _metrics_collector = MetricsCollector()
+        collector = MetricsCollector()
+        try:
+            REGISTRY.register(RegistryExporter(collector.registry))
+        except ValueError as e:
+            # This module was also imported under another name (src.jobhire vs
+            # jobhire) and that copy already exports the same metric names
+            logger.warning("Metrics already exported by another collector", error=str(e))
+        _metrics_collector = collector
     return _metrics_collector
 
 
@@ -317,42 +442,6 @@ def setup_metrics():
 
 # Decorators for automatic metrics collection
 
-def measure_http_request(endpoint: str):
-    """Decorator to measure HTTP request metrics."""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            collector = get_metrics_collector()
-            start_time = time.time()
-
-            # Extract request info (this is simplified)
-            method = kwargs.get("method", "GET")
-            status_code = 200
-
-            try:
-                collector.http_requests_in_progress.inc()
-                result = await func(*args, **kwargs)
-                return result
-            except Exception as e:
-                status_code = 500
-                collector.record_error(
-                    error_type=type(e).__name__,
-                    component="api"
-                )
-                raise
-            finally:
-                duration = time.time() - start_time
-                collector.http_requests_in_progress.dec()
-                collector.record_http_request(
-                    method=method,
-                    endpoint=endpoint,
-                    status_code=status_code,
-                    duration=duration
-                )
-        return wrapper
-    return decorator
-
-
 def measure_database_operation(operation: str, collection: str):
     """Decorator to measure database operation metrics."""
     def decorator(func):
@@ -425,44 +514,80 @@ def measure_ai_request(provider: str, model: str, operation: str):
 
 
 class MetricsMiddleware:
-    """ASGI middleware for automatic metrics collection."""
+    """
+    ASGI middleware for automatic metrics collection.
 
-    def __init__(self, app):
-        self.app = app
-        self.collector = get_metrics_collector()
+    Requests are labelled with the matched route template ("/resumes/{resume_id}"),
+    never the raw path, so label cardinality is bounded by the number of routes.
+    Requests slower than slow_threshold attach the trace ID as a histogram exemplar.
+    """
 
-    async def __call__(self, scope, receive, send):
-        if scope["type"] == "http":
-            start_time = time.time()
-            method = scope["method"]
-            path = scope["path"]
-            status_code = 200
+    UNMATCHED_ROUTE = "<unmatched>"
 
-            self.collector.http_requests_in_progress.inc()
-
-            async def send_wrapper(message):
-                nonlocal status_code
-                if message["type"] == "http.response.start":
-                    status_code = message["status"]
-                await send(message)
+    def __init__(self, app, collector: Optional[MetricsCollector] = None, slow_threshold: Optional[float] = None):
+        self.app = app
+        self.collector = collector or get_metrics_collector()
+        self.slow_threshold = (
+            slow_threshold if slow_threshold is not None
+            else get_settings().monitoring.slow_request_threshold
+        )
 
-            try:
-                await self.app(scope, receive, send_wrapper)
-            except Exception as e:
-                status_code = 500
-                self.collector.record_error(
-                    error_type=type(e).__name__,
-                    component="http"
-                )
-                raise
-            finally:
-                duration = time.time() - start_time
-                self.collector.http_requests_in_progress.dec()
-                self.collector.record_http_request(
-                    method=method,
-                    endpoint=path,
-                    status_code=status_code,
-                    duration=duration
-                )
-        else:
-            await self.app(scope, receive, send)
\ No newline at end of file
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", str(time.perf_counter() - start_time).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        self.collector.http_requests_in_progress.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            self.collector.record_error(
+                error_type=type(e).__name__,
+                component="http"
+            )
+            raise
+        finally:
+            duration = time.perf_counter() - start_time
+            self.collector.http_requests_in_progress.dec()
+
+            exemplar = None
+            if duration >= self.slow_threshold:
+                trace_id = get_trace_id() or _trace_id_from_headers(scope)
+                if trace_id:
+                    exemplar = {"trace_id": trace_id}
+
+            self.collector.record_http_request(
+                method=scope["method"],
+                endpoint=self._route_template(scope),
+                status_code=status_code,
+                duration=duration,
+                exemplar=exemplar
+            )
+
+    def _route_template(self, scope) -> str:
+        # The router stores the matched route in the shared scope
+        route = scope.get("route")
+        path = getattr(route, "path_format", None) or getattr(route, "path", None)
+        return path or self.UNMATCHED_ROUTE
+
+
+def _trace_id_from_headers(scope) -> Optional[str]:
+    """Trace ID from an incoming W3C traceparent header."""
+    for name, value in scope.get("headers", []):
+        if name == b"traceparent":
+            parts = value.decode("latin-1").split("-")
+            if len(parts) >= 2 and len(parts[1]) == 32:
+                return parts[1]
+    return None
@@ -2,42 +2,364 @@
 Distributed tracing infrastructure.
 """
 
+import importlib
 import os
-from typing import Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional, TextIO, Tuple
 import structlog
 
+from jobhire.config.settings import get_settings
+
+try:
+    from opentelemetry import context as otel_context
+    from opentelemetry import propagate, trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+        SpanExporter
+    )
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+    OPENTELEMETRY_AVAILABLE = True
+except ImportError:
+    OPENTELEMETRY_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
+TRACER_NAME = "jobhire"
+
+# Library instrumentations applied when their packages are installed
+INSTRUMENTATIONS = (
+    ("opentelemetry.instrumentation.pymongo", "PymongoInstrumentor"),  # Motor / Mongo
+    ("opentelemetry.instrumentation.asyncpg", "AsyncPGInstrumentor"),  # databases / Postgres
+)
+
+_tracer_provider = None
+_global_provider_set = False
+# Handle the "file" exporter writes to, closed when its provider is replaced or shut down
+_trace_file = None
+
 
-def setup_tracing(service_name: str = "jobhire-backend") -> None:
+def setup_tracing(
+    service_name: str = "jobhire-backend",
+    exporter: Optional["SpanExporter"] = None,
+    sampling_rate: Optional[float] = None
+):
     """
     Setup distributed tracing with OpenTelemetry.
 
-    This is a simplified version for development.
-    In production, you would configure actual tracing providers.
+    Spans go to the exporter selected by TRACE_EXPORTER: "otlp" (OTLP/HTTP to
+    OTLP_ENDPOINT, e.g. a collector or Jaeger), "file" (one JSON span per line in
+    TRACE_FILE_PATH), "console" or "none". An explicit exporter (e.g. an
+    InMemorySpanExporter in tests) replaces it and receives each span as soon as it
+    ends. Mongo and Postgres clients created afterwards are instrumented, so call
+    this before connecting. Returns the tracer provider, or None if tracing could
+    not be set up.
     """
+    global _tracer_provider, _global_provider_set, _trace_file
+
+    if not OPENTELEMETRY_AVAILABLE:
+        logger.warning("OpenTelemetry is not installed, tracing disabled", service_name=service_name)
+        return None
+
+    trace_file = None
     try:
-        # For now, just log that tracing would be set up
-        logger.info("Tracing setup initialized", service_name=service_name)
+        settings = get_settings()
+        monitoring = settings.monitoring
+        rate = monitoring.trace_sampling_rate if sampling_rate is None else sampling_rate
 
-        # In a real implementation, you would:
-        # 1. Configure OpenTelemetry SDK
-        # 2. Set up trace exporters (Jaeger, Zipkin, etc.)
-        # 3. Configure sampling strategies
-        # 4. Set up automatic instrumentation
+        provider = TracerProvider(
+            resource=Resource.create({
+                "service.name": service_name,
+                "service.version": settings.app_version,
+                "deployment.environment": settings.app_environment
+            }),
+            # Follow the caller's sampling decision, sample new traces at rate
+            sampler=ParentBased(TraceIdRatioBased(rate))
+        )
+        if exporter is not None:
+            provider.add_span_processor(SimpleSpanProcessor(exporter))
+        else:
+            configured, trace_file = _configured_exporter(monitoring)
+            if configured is not None:
+                provider.add_span_processor(BatchSpanProcessor(configured))
 
-        return None
+        if _tracer_provider is not None:
+            _tracer_provider.shutdown()
+        _close_trace_file()
+        _tracer_provider, _trace_file = provider, trace_file
+        if not _global_provider_set:
+            # The global provider can only be set once; get_tracer() follows later setups
+            trace.set_tracer_provider(provider)
+            _global_provider_set = True
+
+        _instrument_libraries(provider)
+
+        logger.info(
+            "Tracing setup initialized",
+            service_name=service_name,
+            exporter=type(exporter).__name__ if exporter is not None else monitoring.trace_exporter,
+            sampling_rate=rate
+        )
+        return provider
 
     except Exception as e:
+        if trace_file is not None and trace_file is not _trace_file:
+            trace_file.close()
         logger.warning("Failed to setup tracing", error=str(e))
         return None
 
 
+def tracing_configured() -> bool:
+    """Whether setup_tracing has installed a provider that is still exporting."""
+    return _tracer_provider is not None
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans, stop exporting and close the trace file."""
+    global _tracer_provider
+    if _tracer_provider is not None:
+        _tracer_provider.shutdown()
+        _tracer_provider = None
+    _close_trace_file()
+
+
+def _close_trace_file() -> None:
+    global _trace_file
+    if _trace_file is not None:
+        _trace_file.close()
+        _trace_file = None
+
+
+def _configured_exporter(monitoring) -> Tuple[Optional["SpanExporter"], Optional[TextIO]]:
+    """The TRACE_EXPORTER exporter and, for "file", the handle it writes to."""
+    exporter = monitoring.trace_exporter.lower()
+    if exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter(endpoint=monitoring.otlp_endpoint), None
+    if exporter == "file":
+        trace_file = open(monitoring.trace_file_path, "a", encoding="utf-8")
+        return ConsoleSpanExporter(
+            out=trace_file,
+            formatter=lambda span: span.to_json(indent=None) + os.linesep
+        ), trace_file
+    if exporter == "console":
+        return ConsoleSpanExporter(), None
+    if exporter == "none":
+        return None, None
+    raise ValueError(f"Unknown trace exporter: {monitoring.trace_exporter}")
+
+
+def _instrument_libraries(provider) -> None:
+    for module_name, class_name in INSTRUMENTATIONS:
+        try:
+            instrumentor = getattr(importlib.import_module(module_name), class_name)()
+        except ImportError:
+            logger.debug("Tracing instrumentation not installed", instrumentation=module_name)
+            continue
+        if not instrumentor.is_instrumented_by_opentelemetry:
+            instrumentor.instrument(tracer_provider=provider)
+
+
+def get_tracer(name: str = TRACER_NAME):
+    """Tracer from the configured provider (a no-op tracer until setup_tracing runs)."""
+    if _tracer_provider is not None:
+        return _tracer_provider.get_tracer(name)
+    return trace.get_tracer(name)
+
+
+@contextmanager
+def start_span(
+    name: str,
+    kind: str = "internal",
+    attributes: Optional[Dict[str, Any]] = None,
+    carrier: Optional[Any] = None
+) -> Iterator[Optional[Any]]:
+    """
+    Run a block in a span, child of the current span or of the trace context found
+    in carrier (e.g. incoming headers). Exceptions are recorded on the span. Yields
+    None when OpenTelemetry is not installed.
+    """
+    if not OPENTELEMETRY_AVAILABLE:
+        yield None
+        return
+
+    parent = extract_trace_context(carrier) if carrier is not None else None
+    with get_tracer().start_as_current_span(
+        name,
+        context=parent,
+        kind=_span_kind(kind),
+        attributes=_span_attributes(attributes or {})
+    ) as span:
+        yield span
+
+
+class OpenSpan:
+    """
+    A span that stays open across callbacks, e.g. from a Celery task_prerun signal to
+    task_postrun, or over a streamed response. Does nothing without OpenTelemetry.
+    """
+
+    def __init__(self, span: Optional[Any] = None, token: Optional[object] = None):
+        self.span = span
+        self._token = token
+
+    def set_attributes(self, **attributes: Any) -> None:
+        set_span_attributes(self.span, **attributes)
+
+    def record_exception(self, error: BaseException) -> None:
+        if self.span is not None:
+            self.span.record_exception(error)
+            set_span_error(self.span, str(error))
+
+    def end(self) -> None:
+        if self.span is None:
+            return
+        if self._token is not None:
+            otel_context.detach(self._token)
+            self._token = None
+        self.span.end()
+        self.span = None
+
+
+def begin_span(
+    name: str,
+    kind: str = "internal",
+    attributes: Optional[Dict[str, Any]] = None,
+    carrier: Optional[Any] = None,
+    activate: bool = True
+) -> OpenSpan:
+    """
+    Start a span that is ended explicitly. With activate it is the current span until
+    then; leave it inactive when the end may run in another context (async generators).
+    """
+    if not OPENTELEMETRY_AVAILABLE:
+        return OpenSpan()
+
+    parent = extract_trace_context(carrier) if carrier is not None else None
+    span = get_tracer().start_span(
+        name,
+        context=parent,
+        kind=_span_kind(kind),
+        attributes=_span_attributes(attributes or {})
+    )
+    token = otel_context.attach(trace.set_span_in_context(span)) if activate else None
+    return OpenSpan(span, token)
+
+
+def set_span_attributes(span: Optional[Any], **attributes: Any) -> None:
+    """Set attributes on a span, skipping None values."""
+    if span is not None:
+        span.set_attributes(_span_attributes(attributes))
+
+
+def set_span_error(span: Optional[Any], description: str) -> None:
+    """Mark a span as failed."""
+    if span is not None:
+        span.set_status(Status(StatusCode.ERROR, description))
+
+
 def get_trace_id() -> Optional[str]:
     """Get current trace ID if available."""
-    return None
+    if not OPENTELEMETRY_AVAILABLE:
+        return None
+    span_context = trace.get_current_span().get_span_context()
+    return format(span_context.trace_id, "032x") if span_context.is_valid else None
+
+
+def get_span_id() -> Optional[str]:
+    """Get current span ID if available."""
+    if not OPENTELEMETRY_AVAILABLE:
+        return None
+    span_context = trace.get_current_span().get_span_context()
+    return format(span_context.span_id, "016x") if span_context.is_valid else None
 
 
 def add_trace_context(**kwargs) -> None:
     """Add context to current trace."""
-    pass
\ No newline at end of file
+    if OPENTELEMETRY_AVAILABLE:
+        set_span_attributes(trace.get_current_span(), **kwargs)
+
+
+def inject_trace_context(carrier: Dict[str, str]) -> Dict[str, str]:
+    """Write the current trace context into carrier as W3C traceparent/tracestate headers."""
+    if OPENTELEMETRY_AVAILABLE:
+        propagate.inject(carrier)
+    return carrier
+
+
+def extract_trace_context(carrier: Any):
+    """
+    Trace context from W3C headers in carrier: a dict, or any object with a
+    dict-like get() such as a Celery task request.
+    """
+    if not OPENTELEMETRY_AVAILABLE:
+        return None
+    return propagate.extract(carrier)
+
+
+def _span_kind(kind: str):
+    return getattr(SpanKind, kind.upper())
+
+
+def _span_attributes(attributes: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else str(value)
+        for key, value in attributes.items()
+        if value is not None
+    }
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening a server span per HTTP request.
+
+    An incoming W3C traceparent header continues the caller's trace. Spans are named
+    after the matched route template, like the request metrics, and 5xx responses
+    mark them as failed. Added outermost, so the span is current in every other
+    middleware.
+    """
+
+    EXCLUDED_PATHS = ("/metrics", "/health/live", "/health/ready")
+
+    def __init__(self, app, excluded_paths: Optional[tuple] = None):
+        self.app = app
+        self.excluded_paths = self.EXCLUDED_PATHS if excluded_paths is None else excluded_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not OPENTELEMETRY_AVAILABLE or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        method = scope["method"]
+
+        with start_span(
+            f"HTTP {method}",
+            kind="server",
+            attributes={"http.method": method, "http.target": scope["path"], "http.scheme": scope.get("scheme")},
+            carrier=headers
+        ) as span:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    span.set_attribute("http.status_code", status_code)
+                    if status_code >= 500:
+                        set_span_error(span, f"HTTP {status_code}")
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                # The router stores the matched route in the shared scope
+                route = scope.get("route")
+                template = getattr(route, "path_format", None) or getattr(route, "path", None)
+                if template:
+                    span.update_name(f"{method} {template}")
+                    span.set_attribute("http.route", template)
@@ -0,0 +1,348 @@
+"""
+Transactional outbox for domain events.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Dict, List, Optional
+import structlog
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING
+from pymongo.errors import BulkWriteError
+
+from jobhire.shared.domain.events import DomainEvent
+from jobhire.shared.domain.base import DomainEvent as ModelDomainEvent
+from jobhire.shared.infrastructure.events import DomainEventPublisher
+from jobhire.shared.infrastructure.monitoring.metrics import MetricsCollector, get_metrics_collector
+
+logger = structlog.get_logger(__name__)
+
+DUPLICATE_KEY = 11000
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    DISPATCHING = "dispatching"
+    DISPATCHED = "dispatched"
+    DEAD = "dead"
+
+
+class OutboxRepository:
+    """
+    Outbox collection of domain events awaiting delivery.
+
+    Events are keyed by event_id, so writing the same event twice is harmless.
+    Dispatchers claim batches under a lease; an event whose dispatcher died becomes
+    claimable again when the lease expires, which gives at-least-once delivery.
+    """
+
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        collection_name: str = "event_outbox",
+        use_transactions: bool = False,
+        retention_days: int = 7
+    ):
+        self.database = database
+        self.collection = database[collection_name]
+        self.use_transactions = use_transactions
+        self.retention = timedelta(days=retention_days)
+
+    async def ensure_indexes(self) -> None:
+        """Create the claim and retention indexes."""
+        await self.collection.create_index(
+            [("status", ASCENDING), ("available_at", ASCENDING)],
+            name="claim_order"
+        )
+        await self.collection.create_index(
+            [("status", ASCENDING), ("lease_expires_at", ASCENDING)],
+            name="expired_leases"
+        )
+        # purge_at is only set once an event has been dispatched
+        await self.collection.create_index("purge_at", expireAfterSeconds=0, name="retention")
+
+    async def append(self, events: List[Any], session=None) -> None:
+        """Record events for delivery."""
+        if not events:
+            return
+
+        now = datetime.utcnow()
+        documents = [
+            {
+                "_id": str(getattr(event, "event_id", None) or uuid.uuid4()),
+                "event_type": type(event).__name__,
+                "payload": _to_document(_event_fields(event)),
+                "occurred_at": getattr(event, "occurred_at", None) or now,
+                "status": OutboxStatus.PENDING.value,
+                "available_at": now,
+                "attempts": 0,
+                "delivered_handlers": [],
+                "created_at": now
+            }
+            for event in events
+        ]
+        try:
+            await self.collection.insert_many(documents, ordered=False, session=session)
+        except BulkWriteError as e:
+            # Re-published events are already there
+            if any(error.get("code") != DUPLICATE_KEY for error in e.details.get("writeErrors", [])):
+                raise
+
+    async def claim_batch(self, dispatcher_id: str, limit: int, lease_seconds: int) -> List[Dict[str, Any]]:
+        """Lease up to limit due events, oldest first, in three round trips."""
+        now = datetime.utcnow()
+        due = {"$or": [
+            {"status": OutboxStatus.PENDING.value, "available_at": {"$lte": now}},
+            {"status": OutboxStatus.DISPATCHING.value, "lease_expires_at": {"$lte": now}}
+        ]}
+        cursor = self.collection.find(due, {"_id": 1}).sort("available_at", ASCENDING).limit(limit)
+        ids = [document["_id"] async for document in cursor]
+        if not ids:
+            return []
+
+        # The lease token tells which candidates this claim won against other dispatchers
+        lease_token = f"{dispatcher_id}:{uuid.uuid4().hex}"
+        await self.collection.update_many(
+            {"_id": {"$in": ids}, **due},
+            {
+                "$set": {
+                    "status": OutboxStatus.DISPATCHING.value,
+                    "lease_token": lease_token,
+                    "lease_expires_at": now + timedelta(seconds=lease_seconds)
+                },
+                "$inc": {"attempts": 1}
+            }
+        )
+        cursor = self.collection.find({"_id": {"$in": ids}, "lease_token": lease_token})
+        return [document async for document in cursor]
+
+    async def mark_dispatched(self, event_ids: List[str], lease_token: Optional[str] = None) -> None:
+        """Mark events as delivered to every handler."""
+        if not event_ids:
+            return
+        now = datetime.utcnow()
+        query: Dict[str, Any] = {"_id": {"$in": event_ids}}
+        if lease_token:
+            query["lease_token"] = lease_token
+        await self.collection.update_many(
+            query,
+            {
+                "$set": {
+                    "status": OutboxStatus.DISPATCHED.value,
+                    "dispatched_at": now,
+                    "purge_at": now + self.retention,
+                    "lease_token": None,
+                    "lease_expires_at": None
+                }
+            }
+        )
+
+    async def reschedule(
+        self,
+        message: Dict[str, Any],
+        delivered_handlers: List[str],
+        error: str,
+        retry_in: float,
+        dead: bool = False
+    ) -> None:
+        """Return a partly delivered event to the outbox, or park it as dead."""
+        await self.collection.update_one(
+            {"_id": message["_id"], "lease_token": message.get("lease_token")},
+            {
+                "$set": {
+                    "status": (OutboxStatus.DEAD if dead else OutboxStatus.PENDING).value,
+                    "available_at": datetime.utcnow() + timedelta(seconds=retry_in),
+                    "last_error": error,
+                    "lease_token": None,
+                    "lease_expires_at": None
+                },
+                "$addToSet": {"delivered_handlers": {"$each": delivered_handlers}}
+            }
+        )
+
+    async def backlog(self) -> Dict[str, Any]:
+        """Undelivered event count and the creation time of the oldest one."""
+        undelivered = {"status": {"$in": [OutboxStatus.PENDING.value, OutboxStatus.DISPATCHING.value]}}
+        count = await self.collection.count_documents(undelivered)
+        oldest = None
+        if count:
+            document = await self.collection.find_one(
+                undelivered, {"created_at": 1}, sort=[("available_at", ASCENDING)]
+            )
+            oldest = document["created_at"] if document else None
+        return {"pending": count, "oldest_created_at": oldest}
+
+
+class OutboxDispatcher:
+    """
+    Background task that drains the outbox in batches.
+
+    Events in a batch are delivered concurrently; the publisher caps in-flight
+    deliveries per handler. Handlers that succeeded are recorded, so a retry after a
+    partial failure only re-runs the handlers that failed. Handlers must tolerate
+    seeing an event more than once (a dispatcher can die after delivering but before
+    marking). Failed events back off exponentially and are parked as dead after
+    max_attempts.
+    """
+
+    MAX_BACKOFF_SECONDS = 300
+
+    def __init__(
+        self,
+        outbox: OutboxRepository,
+        publisher: DomainEventPublisher,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        lease_seconds: int = 60,
+        max_attempts: int = 10,
+        metrics_collector: Optional[MetricsCollector] = None
+    ):
+        self.outbox = outbox
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.metrics = metrics_collector or get_metrics_collector()
+        self.dispatcher_id = uuid.uuid4().hex[:12]
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start draining in the background."""
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Outbox dispatcher started", dispatcher_id=self.dispatcher_id)
+
+    async def stop(self) -> None:
+        """Stop draining; events of an interrupted batch are picked up after their lease."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Outbox dispatcher stopped", dispatcher_id=self.dispatcher_id)
+
+    async def _run(self) -> None:
+        while True:
+            claimed = 0
+            try:
+                claimed = await self.drain_once()
+                await self._record_backlog()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Outbox dispatch failed", error=str(e))
+                self.metrics.record_error(error_type=type(e).__name__, component="event_outbox")
+
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def drain_once(self) -> int:
+        """Claim and deliver one batch; returns how many events were claimed."""
+        batch = await self.outbox.claim_batch(self.dispatcher_id, self.batch_size, self.lease_seconds)
+        if not batch:
+            return 0
+
+        results = await asyncio.gather(*(self._deliver(message) for message in batch))
+        delivered = [message["_id"] for message, ok in zip(batch, results) if ok]
+        if delivered:
+            # One lease token per claimed batch
+            await self.outbox.mark_dispatched(delivered, batch[0].get("lease_token"))
+        return len(batch)
+
+    async def _deliver(self, message: Dict[str, Any]) -> bool:
+        event_type = message["event_type"]
+        already_delivered = message.get("delivered_handlers", [])
+
+        errors: Dict[str, BaseException] = {}
+        if self.publisher.has_handlers(event_type):
+            try:
+                event = restore_event(event_type, message["payload"])
+            except Exception as e:
+                errors = {"restore_event": e}
+            else:
+                errors = await self.publisher.dispatch(event, event_type, skip=already_delivered)
+
+        delay = (datetime.utcnow() - message["occurred_at"]).total_seconds()
+        if not errors:
+            self.metrics.record_event_dispatch(event_type, delay, success=True)
+            return True
+
+        self.metrics.record_event_dispatch(event_type, delay, success=False)
+        attempts = message.get("attempts", 1)
+        dead = attempts >= self.max_attempts
+        succeeded = [name for name in self.publisher.handler_names(event_type) if name not in errors]
+        error_summary = "; ".join(f"{name}: {error}" for name, error in errors.items())
+        logger.warning(
+            "Event delivery failed",
+            event_id=message["_id"],
+            event_type=event_type,
+            attempts=attempts,
+            dead=dead,
+            errors=error_summary
+        )
+        await self.outbox.reschedule(
+            message,
+            succeeded,
+            error_summary,
+            retry_in=min(2 ** attempts, self.MAX_BACKOFF_SECONDS),
+            dead=dead
+        )
+        return False
+
+    async def _record_backlog(self) -> None:
+        backlog = await self.outbox.backlog()
+        oldest = backlog["oldest_created_at"]
+        lag = (datetime.utcnow() - oldest).total_seconds() if oldest else 0.0
+        self.metrics.update_event_outbox_backlog(backlog["pending"], lag)
+
+
+def _event_fields(event: Any) -> Dict[str, Any]:
+    if isinstance(event, ModelDomainEvent):
+        return event.dict()
+    return {key: value for key, value in vars(event).items() if not key.startswith("_")}
+
+
+def _to_document(value: Any) -> Any:
+    """Convert event data to BSON-safe values."""
+    if isinstance(value, dict):
+        return {str(key): _to_document(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_to_document(item) for item in value]
+    if isinstance(value, Enum):
+        return value.value
+    if value is None or isinstance(value, (str, int, float, bool, datetime)):
+        return value
+    if hasattr(value, "dict"):
+        return _to_document(value.dict())
+    return str(value)
+
+
+def _event_classes() -> Dict[str, type]:
+    classes: Dict[str, type] = {}
+    pending = [DomainEvent, ModelDomainEvent]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            classes.setdefault(subclass.__name__, subclass)
+            pending.append(subclass)
+    return classes
+
+
+def restore_event(event_type: str, payload: Dict[str, Any]) -> Any:
+    """Rebuild a stored event as its original class where it is importable."""
+    event_class = _event_classes().get(event_type, DomainEvent)
+    if issubclass(event_class, ModelDomainEvent):
+        return event_class(**payload)
+
+    event = event_class.__new__(event_class)
+    event.__dict__.update(payload)
+    return event
@@ -2,13 +2,18 @@
 Base repository classes for the infrastructure layer.
 """
 
+import copy
+import json
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Optional, List, Dict, Any
+from typing import TypeVar, Generic, Optional, List, Dict, Any, Callable, Awaitable, Tuple
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
 
 from jobhire.shared.domain.types import EntityId
+from jobhire.shared.domain.exceptions import ConcurrencyException
+from jobhire.shared.infrastructure.unit_of_work import current_unit_of_work, unit_of_work as nested_unit_of_work
 
 T = TypeVar('T')
+R = TypeVar('R')
 
 
 class BaseRepository(ABC, Generic[T]):
@@ -36,18 +41,255 @@ class BaseRepository(ABC, Generic[T]):
 
 
 class BaseMongoRepository(BaseRepository[T]):
-    """Base MongoDB repository implementation."""
+    """
+    Base MongoDB repository implementation.
 
-    def __init__(self, database: AsyncIOMotorDatabase, collection_name: str, entity_class: type):
+    Repositories that implement _entity_document get change tracking: the document an
+    entity maps to is snapshotted when it is created or loaded (_attach), and
+    _save_changes writes only what differs from that snapshot, conditional on the
+    stored version. Inside a unit of work, loads go through its identity map and
+    saves are deferred until it commits.
+
+    Top-level fields listed in ENCRYPTED_FIELDS are stored as ciphertext when an
+    encryption service is given. Each one is encrypted whole (as JSON), bound to its
+    collection, field and document id, and rewritten whole when it changes.
+    """
+
+    ENCRYPTED_FIELDS: Tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        collection_name: str,
+        entity_class: type,
+        encryption=None
+    ):
         self.database = database
+        self.collection_name = collection_name
         self.collection: AsyncIOMotorCollection = database[collection_name]
         self.entity_class = entity_class
+        self.encryption = encryption
 
     async def delete_by_id(self, entity_id: EntityId) -> bool:
         """Delete entity by ID."""
+        self._forget(entity_id)
         result = await self.collection.delete_one({"_id": str(entity_id)})
         return result.deleted_count > 0
 
     def _document_to_entity(self, document: Dict[str, Any]) -> T:
         """Convert MongoDB document to entity. Override in subclasses."""
-        raise NotImplementedError("Subclasses must implement _document_to_entity")
\ No newline at end of file
+        raise NotImplementedError("Subclasses must implement _document_to_entity")
+
+    def _entity_document(self, entity: T) -> Dict[str, Any]:
+        """Convert entity to its updatable document fields, including version. Override in subclasses."""
+        raise NotImplementedError("Subclasses must implement _entity_document")
+
+    def _track(self, entity: T, versioned: bool = True) -> T:
+        """
+        Remember the entity's persisted state for change detection. versioned is
+        False for documents stored without a version field (written before
+        versioning); their first update matches on the field being absent.
+        """
+        # Deep copy so in-place edits to nested dicts and lists show up as changes
+        snapshot = copy.deepcopy(self._entity_document(entity))
+        if not versioned:
+            snapshot["version"] = None
+        entity._persisted_document = snapshot
+        return entity
+
+    def _attach(self, entity: T, versioned: bool = True) -> T:
+        """
+        Track a created or freshly loaded entity. Inside a unit of work the instance
+        already in its identity map wins, so callers share one copy per aggregate.
+        """
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            mapped = unit_of_work.attach(self.collection_name, entity)
+            if mapped is not entity:
+                return mapped
+        return self._track(entity, versioned)
+
+    def _from_unit_of_work(self, entity_id: EntityId) -> Optional[T]:
+        """Entity already loaded by the current unit of work, sparing a find_by_id round trip."""
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is None:
+            return None
+        return unit_of_work.get(self.collection_name, entity_id)
+
+    def _forget(self, entity_id: EntityId) -> None:
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.forget(self.collection_name, entity_id)
+
+    def _encrypted_fields(self) -> Tuple[str, ...]:
+        return self.ENCRYPTED_FIELDS if self.encryption is not None else ()
+
+    def _field_associated_data(self, document_id: str, field: str) -> str:
+        return f"{self.collection_name}.{field}:{document_id}"
+
+    def _encrypt_fields(self, document_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Return fields with the encrypted ones replaced by ciphertext, in one batch."""
+        names = [field for field in self._encrypted_fields() if fields.get(field) is not None]
+        if not names:
+            return fields
+        tokens = self.encryption.encrypt_many(
+            [json.dumps(fields[field], default=_json_default) for field in names],
+            [self._field_associated_data(document_id, field) for field in names]
+        )
+        return {**fields, **dict(zip(names, tokens))}
+
+    def _decrypt_documents(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Decrypt the encrypted fields of fetched documents in place, in one batch.
+        Values stored before encryption was enabled are left as they are and get
+        encrypted the next time they change.
+        """
+        fields = self._encrypted_fields()
+        if not fields:
+            return documents
+        locations = [
+            (document, field) for document in documents for field in fields
+            if self.encryption.is_encrypted(document.get(field))
+        ]
+        if not locations:
+            return documents
+        values = self.encryption.decrypt_many(
+            [document[field] for document, field in locations],
+            [self._field_associated_data(str(document["_id"]), field) for document, field in locations]
+        )
+        for (document, field), value in zip(locations, values):
+            document[field] = json.loads(value)
+        return documents
+
+    async def _save_changes(self, entity: T, touch: Optional[Dict[str, Any]] = None) -> bool:
+        """Save changed fields now, or when the current unit of work commits."""
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.register_dirty(self, entity, touch)
+            return True
+        return await self._write_changes(entity, touch)
+
+    async def _write_changes(self, entity: T, touch: Optional[Dict[str, Any]] = None, session=None) -> bool:
+        """
+        Write the fields changed since the entity was tracked.
+
+        Nested documents are updated by path and appended list items are pushed, so
+        unchanged fields are never rewritten. The update only applies if the stored
+        version is still the one that was loaded; otherwise ConcurrencyException is
+        raised and the caller should reload and retry (see retry_on_conflict). touch
+        fields (e.g. updated_at) are added only when something else changed.
+        Returns False if there was nothing to write.
+        """
+        snapshot = getattr(entity, "_persisted_document", None)
+        if snapshot is None:
+            raise ValueError(f"{type(entity).__name__} {entity.id} was not loaded for update")
+
+        stored_version = snapshot.get("version")
+        document = self._entity_document(entity)
+        excluded = {"version", *self._encrypted_fields()}
+        before = {key: value for key, value in snapshot.items() if key not in excluded}
+        after = {key: value for key, value in document.items() if key not in excluded}
+
+        update = document_changes(before, after)
+        # Ciphertexts can't be updated by path, so changed encrypted fields are replaced
+        secrets = {
+            field: document[field] for field in self._encrypted_fields()
+            if field in document and document[field] != snapshot.get(field)
+        }
+        if secrets:
+            update.setdefault("$set", {}).update(self._encrypt_fields(str(entity.id), secrets))
+        if not update:
+            return False
+
+        if entity.version == stored_version:
+            # Repository-level edits (flags, notes) don't always bump the version
+            entity.increment_version()
+        update.setdefault("$set", {}).update({**(touch or {}), "version": entity.version})
+
+        result = await self.collection.update_one(
+            {
+                "_id": str(entity.id),
+                "version": stored_version if stored_version is not None else {"$exists": False}
+            },
+            update,
+            session=session
+        )
+        if result.matched_count == 0:
+            raise ConcurrencyException(
+                f"{type(entity).__name__} {entity.id} was modified concurrently (expected version {stored_version})"
+            )
+
+        self._track(entity)
+        return True
+
+
+def document_changes(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Minimal $set/$unset/$push update turning the before document into the after one."""
+    changes: Dict[str, Dict[str, Any]] = {"$set": {}, "$unset": {}, "$push": {}}
+    _collect_changes(before, after, "", changes)
+    return {operator: fields for operator, fields in changes.items() if fields}
+
+
+def _collect_changes(
+    before: Dict[str, Any],
+    after: Dict[str, Any],
+    prefix: str,
+    changes: Dict[str, Dict[str, Any]]
+) -> None:
+    for key, value in after.items():
+        path = prefix + key
+        if key not in before:
+            changes["$set"][path] = value
+            continue
+
+        old = before[key]
+        if old == value:
+            continue
+
+        # Only descend into / append to values that are non-empty on both sides, so
+        # the stored field is known to be a document or array and not null
+        if isinstance(old, dict) and isinstance(value, dict) and old and _addressable(old) and _addressable(value):
+            _collect_changes(old, value, path + ".", changes)
+        elif isinstance(old, list) and isinstance(value, list) and old and value[:len(old)] == old:
+            changes["$push"][path] = {"$each": value[len(old):]}
+        else:
+            changes["$set"][path] = value
+
+    for key in before:
+        if key not in after:
+            changes["$unset"][prefix + key] = ""
+
+
+def _addressable(document: Dict[str, Any]) -> bool:
+    """Whether every key can be used in a dotted update path."""
+    return all(
+        isinstance(key, str) and key and "." not in key and not key.startswith("$")
+        for key in document
+    )
+
+
+def _json_default(value: Any) -> Any:
+    return value.dict() if hasattr(value, "dict") else str(value)
+
+
+async def retry_on_conflict(operation: Callable[[], Awaitable[R]], attempts: int = 3) -> R:
+    """
+    Run a load-modify-save operation, starting again from a fresh load when the save
+    loses a version race. The operation must load the entity itself.
+
+    Each attempt runs in its own unit of work that commits when the attempt ends, so
+    inside a request the conflict surfaces here rather than at the request's commit,
+    and a retry loads from the database instead of the request's identity map. The
+    saved aggregates then replace the request's copies.
+    """
+    outer = current_unit_of_work()
+    for attempt in range(1, attempts + 1):
+        try:
+            async with nested_unit_of_work() as work:
+                result = await operation()
+            if outer is not None:
+                outer.adopt(work)
+            return result
+        except ConcurrencyException:
+            if attempt == attempts:
+                raise
@@ -4,66 +4,170 @@ Encryption and decryption services.
 
 import base64
 import hashlib
+import json
+import os
 import secrets
-from typing import Tuple, Optional
+from typing import Any, Dict, List, Optional, Sequence
 import structlog
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from jobhire.config.settings import DEFAULT_SECRET_KEY
+from jobhire.shared.domain.exceptions import SecurityException
 
 logger = structlog.get_logger(__name__)
 
+TOKEN_PREFIX = "enc1"
+NONCE_SIZE = 12
 
-class EncryptionService:
-    """Service for data encryption and decryption."""
+# Environments allowed to derive the field key from SECRET_KEY instead of ENCRYPTION_KEYS
+KEY_DERIVATION_ENVIRONMENTS = ("development", "testing")
 
-    def __init__(self, secret_key: Optional[str] = None):
-        """Initialize with a secret key."""
-        if secret_key:
-            self.key = self._derive_key(secret_key)
+
+class EncryptionService:
+    """
+    Authenticated field encryption (AES-256-GCM).
+
+    Ciphertexts are self-describing strings, "enc1:<key_id>:<base64(nonce + ciphertext
+    + tag)>", so keys can be rotated: new values use the active key while any listed
+    key still decrypts. Optional associated data (e.g. "users.full_name:<id>") binds a
+    ciphertext to its place, so it can't be copied into another field or document.
+    Tampered or mismatched ciphertexts fail with SecurityException.
+    """
+
+    def __init__(
+        self,
+        secret_key: Optional[str] = None,
+        keys: Optional[Dict[str, bytes]] = None,
+        active_key_id: Optional[str] = None
+    ):
+        """Initialize with explicit keys by ID, a secret to derive one from, or a random key."""
+        if keys:
+            self._keys = dict(keys)
+        elif secret_key:
+            self._keys = {"0": self._derive_key(secret_key)}
         else:
-            self.key = secrets.token_bytes(32)
+            self._keys = {"0": AESGCM.generate_key(bit_length=256)}
+
+        self.active_key_id = active_key_id or list(self._keys)[-1]
+        if self.active_key_id not in self._keys:
+            raise ValueError(f"Active encryption key {self.active_key_id!r} is not configured")
+        for key_id, key in self._keys.items():
+            if ":" in key_id or len(key) != 32:
+                raise ValueError(f"Encryption key {key_id!r} must be 32 bytes with a colon-free ID")
+
+        self._ciphers = {key_id: AESGCM(key) for key_id, key in self._keys.items()}
+
+    @classmethod
+    def from_settings(cls, settings) -> "EncryptionService":
+        """
+        Build from Settings. ENCRYPTION_KEYS is required outside development and
+        testing, where a key may instead be derived from SECRET_KEY.
+        """
+        security_settings = settings.security
+        configured = security_settings.encryption_keys_map
+        if not configured:
+            if settings.app_environment not in KEY_DERIVATION_ENVIRONMENTS:
+                raise ValueError(f"ENCRYPTION_KEYS must be set in the {settings.app_environment} environment")
+            if security_settings.secret_key == DEFAULT_SECRET_KEY:
+                logger.warning("Field encryption key derived from the public default SECRET_KEY")
+            return cls(secret_key=security_settings.secret_key)
+        keys = {key_id: base64.b64decode(key) for key_id, key in configured.items()}
+        return cls(keys=keys, active_key_id=security_settings.encryption_active_key_id)
 
     @staticmethod
-    def _derive_key(password: str) -> bytes:
-        """Derive encryption key from password."""
-        return hashlib.pbkdf2_hmac('sha256', password.encode(), b'salt_', 100000)
-
-    def encrypt(self, data: str) -> str:
-        """Encrypt data using simple XOR encryption."""
-        try:
-            data_bytes = data.encode('utf-8')
-            encrypted = bytearray()
-
-            for i, byte in enumerate(data_bytes):
-                key_byte = self.key[i % len(self.key)]
-                encrypted.append(byte ^ key_byte)
-
-            # Add random salt for uniqueness
-            salt = secrets.token_bytes(16)
-            result = salt + bytes(encrypted)
-            return base64.b64encode(result).decode('utf-8')
+    def _derive_key(secret: str) -> bytes:
+        """Derive an encryption key from a high-entropy application secret."""
+        return HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"jobhire field encryption v1"
+        ).derive(secret.encode("utf-8"))
 
-        except Exception as e:
-            logger.error("Encryption failed", error=str(e))
-            raise
-
-    def decrypt(self, encrypted_data: str) -> str:
-        """Decrypt data."""
-        try:
-            encrypted_bytes = base64.b64decode(encrypted_data.encode('utf-8'))
-
-            # Extract salt (first 16 bytes)
-            salt = encrypted_bytes[:16]
-            actual_data = encrypted_bytes[16:]
+    @staticmethod
+    def generate_key() -> str:
+        """Generate a base64 key for ENCRYPTION_KEYS."""
+        return base64.b64encode(AESGCM.generate_key(bit_length=256)).decode("ascii")
+
+    def encrypt(self, data: str, associated_data: Optional[str] = None) -> str:
+        """Encrypt a string with the active key."""
+        return self.encrypt_many([data], associated_data)[0]
+
+    def decrypt(self, encrypted_data: str, associated_data: Optional[str] = None) -> str:
+        """Decrypt a string encrypted with any configured key."""
+        return self.decrypt_many([encrypted_data], associated_data)[0]
+
+    def encrypt_many(
+        self,
+        values: Sequence[str],
+        associated_data: Optional[Sequence[Optional[str]]] = None
+    ) -> List[str]:
+        """
+        Encrypt a batch of strings. associated_data is one value for all, or one per
+        value. Nonces come from a single urandom call and the cipher is reused.
+        """
+        associated = self._per_value(associated_data, len(values))
+        cipher = self._ciphers[self.active_key_id]
+        randomness = os.urandom(NONCE_SIZE * len(values))
+        prefix = f"{TOKEN_PREFIX}:{self.active_key_id}:"
+
+        tokens = []
+        for index, (value, aad) in enumerate(zip(values, associated)):
+            nonce = randomness[index * NONCE_SIZE:(index + 1) * NONCE_SIZE]
+            sealed = cipher.encrypt(nonce, value.encode("utf-8"), _encode_aad(aad))
+            tokens.append(prefix + base64.b64encode(nonce + sealed).decode("ascii"))
+        return tokens
+
+    def decrypt_many(
+        self,
+        tokens: Sequence[str],
+        associated_data: Optional[Sequence[Optional[str]]] = None
+    ) -> List[str]:
+        """Decrypt a batch of strings; associated_data as for encrypt_many."""
+        associated = self._per_value(associated_data, len(tokens))
+        values = []
+        for token, aad in zip(tokens, associated):
+            try:
+                prefix, key_id, payload = token.split(":", 2)
+                if prefix != TOKEN_PREFIX:
+                    raise ValueError("unknown ciphertext format")
+                raw = base64.b64decode(payload)
+                plaintext = self._ciphers[key_id].decrypt(raw[:NONCE_SIZE], raw[NONCE_SIZE:], _encode_aad(aad))
+            except KeyError:
+                raise SecurityException(f"Unknown encryption key {key_id!r}")
+            except (InvalidTag, ValueError) as e:
+                logger.warning("Decryption failed", error=type(e).__name__)
+                raise SecurityException("Decryption failed: ciphertext is invalid or was tampered with")
+            values.append(plaintext.decode("utf-8"))
+        return values
+
+    def encrypt_value(self, value: Any, associated_data: Optional[str] = None) -> str:
+        """Encrypt any JSON-serializable value."""
+        return self.encrypt(json.dumps(value, default=str), associated_data)
+
+    def decrypt_value(self, token: str, associated_data: Optional[str] = None) -> Any:
+        """Decrypt a value encrypted with encrypt_value."""
+        return json.loads(self.decrypt(token, associated_data))
 
-            decrypted = bytearray()
-            for i, byte in enumerate(actual_data):
-                key_byte = self.key[i % len(self.key)]
-                decrypted.append(byte ^ key_byte)
+    @staticmethod
+    def is_encrypted(value: Any) -> bool:
+        """Whether a stored value is a ciphertext produced by this service."""
+        return isinstance(value, str) and value.startswith(TOKEN_PREFIX + ":")
 
-            return decrypted.decode('utf-8')
+    def needs_rotation(self, token: str) -> bool:
+        """Whether a ciphertext was made with a key other than the active one."""
+        return self.is_encrypted(token) and token.split(":", 2)[1] != self.active_key_id
 
-        except Exception as e:
-            logger.error("Decryption failed", error=str(e))
-            raise
+    @staticmethod
+    def _per_value(associated_data, count: int) -> List[Optional[str]]:
+        if associated_data is None or isinstance(associated_data, str):
+            return [associated_data] * count
+        if len(associated_data) != count:
+            raise ValueError("associated_data must have one entry per value")
+        return list(associated_data)
 
     @staticmethod
     def hash_data(data: str) -> str:
@@ -80,14 +184,18 @@ class EncryptionService:
         """Generate a secure API key."""
         return f"jobhire_{secrets.token_urlsafe(32)}"
 
-    def encrypt_sensitive_field(self, value: str) -> str:
+    def encrypt_sensitive_field(self, value: str, associated_data: Optional[str] = None) -> str:
         """Encrypt a sensitive field like email or phone."""
         if not value:
             return value
-        return self.encrypt(value)
+        return self.encrypt(value, associated_data)
 
-    def decrypt_sensitive_field(self, encrypted_value: str) -> str:
+    def decrypt_sensitive_field(self, encrypted_value: str, associated_data: Optional[str] = None) -> str:
         """Decrypt a sensitive field."""
         if not encrypted_value:
             return encrypted_value
-        return self.decrypt(encrypted_value)
\ No newline at end of file
+        return self.decrypt(encrypted_value, associated_data)
+
+
+def _encode_aad(associated_data: Optional[str]) -> Optional[bytes]:
+    return associated_data.encode("utf-8") if associated_data is not None else None
@@ -2,6 +2,7 @@
 Security middleware components.
 """
 
+import math
 from typing import Callable, Optional
 from fastapi import Request, Response, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -33,10 +34,12 @@ class SecurityMiddleware:
                 client_id = self._get_client_id(request)
                 endpoint = str(request.url.path)
 
-                if not self.rate_limit_service.is_allowed(client_id, endpoint):
+                result = await self.rate_limit_service.check(client_id, endpoint)
+                if result is not None and not result.allowed:
                     return JSONResponse(
                         status_code=429,
-                        content={"detail": "Rate limit exceeded"}
+                        content={"detail": "Rate limit exceeded"},
+                        headers={"Retry-After": str(max(1, math.ceil(result.retry_after)))}
                     )
 
             # Security headers
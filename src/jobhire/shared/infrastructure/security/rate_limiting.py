@@ -1,103 +1,252 @@
 """
 Rate limiting services.
+
+Limits are enforced in Redis with atomic Lua scripts, so every API worker and Celery
+worker shares one budget per client. Keys expire on their own (PEXPIRE), so nothing
+has to scan for stale clients. When Redis is unreachable, each process falls back to
+a bounded in-memory approximation of the same algorithm.
 """
 
+import asyncio
 import time
-from typing import Dict, Optional
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+import redis.asyncio as aioredis
 import structlog
 
 logger = structlog.get_logger(__name__)
 
 
+class RateLimitAlgorithm(str, Enum):
+    """Rate limiting algorithms."""
+    SLIDING_WINDOW = "sliding_window"  # Weighted previous + current fixed window
+    TOKEN_BUCKET = "token_bucket"      # Steady refill with burst capacity
+
+
+_PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
 @dataclass
 class RateLimit:
     """Rate limit configuration."""
     requests: int
     window: int  # seconds
-    burst: Optional[int] = None
+    burst: Optional[int] = None  # Token bucket capacity (defaults to requests)
+    algorithm: RateLimitAlgorithm = RateLimitAlgorithm.SLIDING_WINDOW
+
+    @classmethod
+    def parse(cls, value: str, algorithm: RateLimitAlgorithm = RateLimitAlgorithm.SLIDING_WINDOW) -> "RateLimit":
+        """Parse Celery-style limits such as "10/m" or "5/s"."""
+        requests, _, period = value.partition("/")
+        return cls(requests=int(requests), window=_PERIODS[(period or "s")[0]], algorithm=algorithm)
 
 
 @dataclass
-class RateLimitState:
-    """Rate limit state for a client."""
-    requests: int
-    window_start: float
-    last_request: float
+class RateLimitResult:
+    """Outcome of one rate limit check."""
+    allowed: bool
+    remaining: int
+    retry_after: float  # Seconds until a request would be allowed (0 when allowed)
 
 
-class RateLimitService:
-    """In-memory rate limiting service."""
+# KEYS: current window, previous window
+# ARGV: limit, window ms, ms elapsed in current window
+# Estimated count = previous * (1 - elapsed / window) + current
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local elapsed = tonumber(ARGV[3])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local estimated = previous * (window - elapsed) / window + current
+if estimated + 1 > limit then
+    local retry = window - elapsed
+    if previous > 0 and current < limit then
+        retry = math.ceil(window - elapsed - window * (limit - current - 1) / previous)
+    end
+    return {0, 0, math.max(retry, 1)}
+end
+redis.call('INCR', KEYS[1])
+redis.call('PEXPIRE', KEYS[1], window * 2)
+return {1, math.floor(limit - estimated - 1), 0}
+"""
 
-    def __init__(self):
-        self._states: Dict[str, RateLimitState] = {}
-        self._limits: Dict[str, RateLimit] = {}
+# KEYS: bucket hash
+# ARGV: capacity, refill per ms, now ms
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate))
+return {allowed, math.floor(tokens), retry}
+"""
 
-    def configure_limit(self, key: str, limit: RateLimit) -> None:
-        """Configure rate limit for a key pattern."""
-        self._limits[key] = limit
 
-    def is_allowed(self, client_id: str, endpoint: str = "default") -> bool:
-        """Check if request is allowed."""
-        limit_key = self._get_limit_key(endpoint)
-        if limit_key not in self._limits:
-            return True  # No limit configured
+class _LocalLimiter:
+    """
+    Per-process fallback with the same algorithms.
+    State lives in an LRU bounded by max_keys, so memory stays flat however many
+    clients are seen; entries past their expiry are simply overwritten.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._states: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+
+    def hit(self, key: str, limit: RateLimit, now: float) -> RateLimitResult:
+        if limit.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
+            result, state = self._token_bucket(self._states.get(key), limit, now)
+        else:
+            result, state = self._sliding_window(self._states.get(key), limit, now)
+
+        self._states[key] = state
+        self._states.move_to_end(key)
+        if len(self._states) > self.max_keys:
+            self._states.popitem(last=False)
+        return result
 
-        limit = self._limits[limit_key]
+    @staticmethod
+    def _sliding_window(state, limit: RateLimit, now: float):
+        window_start = now - now % limit.window
+        if state is None or state[0] < window_start - limit.window:
+            previous, current = 0, 0
+        elif state[0] < window_start:
+            previous, current = state[1], 0
+        else:
+            previous, current = state[2], state[1]
+
+        elapsed = now - window_start
+        estimated = previous * (limit.window - elapsed) / limit.window + current
+        if estimated + 1 > limit.requests:
+            return RateLimitResult(False, 0, max(limit.window - elapsed, 0.001)), (window_start, current, previous)
+        return (
+            RateLimitResult(True, int(limit.requests - estimated - 1), 0),
+            (window_start, current + 1, previous)
+        )
+
+    @staticmethod
+    def _token_bucket(state, limit: RateLimit, now: float):
+        capacity = limit.burst or limit.requests
+        rate = limit.requests / limit.window
+        tokens, ts = state if state is not None else (capacity, now)
+        tokens = min(capacity, tokens + max(0.0, now - ts) * rate)
+        if tokens >= 1:
+            return RateLimitResult(True, int(tokens - 1), 0), (tokens - 1, now)
+        return RateLimitResult(False, 0, (1 - tokens) / rate), (tokens, now)
+
+
+class DistributedRateLimiter:
+    """Redis-backed limiter shared by all processes, with a local fallback."""
+
+    def __init__(
+        self,
+        redis_url: Optional[str],
+        prefix: str = "ratelimit",
+        retry_interval: float = 5.0,
+        local_max_keys: int = 10000
+    ):
+        self.redis_url = redis_url
+        self.prefix = prefix
+        self.retry_interval = retry_interval
+        self._local = _LocalLimiter(local_max_keys)
+        self._redis_down_until = 0.0
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[Any, Any, Any]]" = weakref.WeakKeyDictionary()
+
+    async def hit(self, key: str, limit: RateLimit) -> RateLimitResult:
+        """Count one request against key and report whether it is allowed."""
         now = time.time()
+        if self.redis_url and now >= self._redis_down_until:
+            try:
+                return await self._redis_hit(key, limit, now)
+            except Exception as e:
+                # Don't pay a connection timeout on every request while Redis is down
+                self._redis_down_until = now + self.retry_interval
+                logger.warning("Rate limit store unavailable, using local limits", error=str(e))
+        return self._local.hit(key, limit, now)
 
-        # Get or create state for this client
-        state_key = f"{client_id}:{limit_key}"
-        if state_key not in self._states:
-            self._states[state_key] = RateLimitState(
-                requests=0,
-                window_start=now,
-                last_request=now
-            )
+    async def _redis_hit(self, key: str, limit: RateLimit, now: float) -> RateLimitResult:
+        _, sliding_window, token_bucket = self._client()
+        now_ms = int(now * 1000)
 
-        state = self._states[state_key]
+        if limit.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
+            capacity = limit.burst or limit.requests
+            allowed, remaining, retry_ms = await token_bucket(
+                keys=[f"{self.prefix}:{{{key}}}:tb"],
+                args=[capacity, limit.requests / (limit.window * 1000), now_ms]
+            )
+        else:
+            window_ms = limit.window * 1000
+            index = now_ms // window_ms
+            # Hash tag keeps both windows in one cluster slot
+            allowed, remaining, retry_ms = await sliding_window(
+                keys=[f"{self.prefix}:{{{key}}}:{index}", f"{self.prefix}:{{{key}}}:{index - 1}"],
+                args=[limit.requests, window_ms, now_ms - index * window_ms]
+            )
 
-        # Check if we need to reset the window
-        if now - state.window_start >= limit.window:
-            state.requests = 0
-            state.window_start = now
+        return RateLimitResult(bool(allowed), int(remaining), int(retry_ms) / 1000)
 
-        # Check if request is allowed
-        if state.requests >= limit.requests:
-            logger.warning(
-                "Rate limit exceeded",
-                client_id=client_id,
-                endpoint=endpoint,
-                requests=state.requests,
-                limit=limit.requests
+    def _client(self):
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            redis = aioredis.from_url(self.redis_url, socket_connect_timeout=1, socket_timeout=1)
+            client = self._clients[loop] = (
+                redis,
+                redis.register_script(SLIDING_WINDOW_SCRIPT),
+                redis.register_script(TOKEN_BUCKET_SCRIPT)
             )
-            return False
+        return client
 
-        # Allow request and update state
-        state.requests += 1
-        state.last_request = now
-        return True
 
-    def get_remaining(self, client_id: str, endpoint: str = "default") -> Optional[int]:
-        """Get remaining requests for client."""
-        limit_key = self._get_limit_key(endpoint)
-        if limit_key not in self._limits:
-            return None
+class RateLimitService:
+    """Per-endpoint rate limits on top of the distributed limiter."""
 
-        limit = self._limits[limit_key]
-        state_key = f"{client_id}:{limit_key}"
+    def __init__(self, redis_url: Optional[str] = None, limiter: Optional[DistributedRateLimiter] = None):
+        self._limiter = limiter or DistributedRateLimiter(redis_url)
+        self._limits: Dict[str, RateLimit] = {}
 
-        if state_key not in self._states:
-            return limit.requests
+    def configure_limit(self, key: str, limit: RateLimit) -> None:
+        """Configure rate limit for a key pattern."""
+        self._limits[key] = limit
 
-        state = self._states[state_key]
-        now = time.time()
+    async def check(self, client_id: str, endpoint: str = "default") -> Optional[RateLimitResult]:
+        """Count a request; None when no limit applies."""
+        limit_key = self._get_limit_key(endpoint)
+        if limit_key not in self._limits:
+            return None  # No limit configured
 
-        # Check if window has reset
-        if now - state.window_start >= limit.window:
-            return limit.requests
+        result = await self._limiter.hit(f"{client_id}:{limit_key}", self._limits[limit_key])
+        if not result.allowed:
+            logger.warning(
+                "Rate limit exceeded",
+                client_id=client_id,
+                endpoint=endpoint,
+                limit=self._limits[limit_key].requests,
+                retry_after=result.retry_after
+            )
+        return result
 
-        return max(0, limit.requests - state.requests)
+    async def is_allowed(self, client_id: str, endpoint: str = "default") -> bool:
+        """Check if request is allowed."""
+        result = await self.check(client_id, endpoint)
+        return result is None or result.allowed
 
     def _get_limit_key(self, endpoint: str) -> str:
         """Get the limit key for an endpoint."""
@@ -106,18 +255,3 @@ class RateLimitService:
         if endpoint in self._limits:
             return endpoint
         return "default"
-
-    def cleanup_expired(self) -> None:
-        """Clean up expired rate limit states."""
-        now = time.time()
-        expired_keys = []
-
-        for key, state in self._states.items():
-            if now - state.last_request > 3600:  # 1 hour cleanup threshold
-                expired_keys.append(key)
-
-        for key in expired_keys:
-            del self._states[key]
-
-        if expired_keys:
-            logger.debug("Cleaned up expired rate limit states", count=len(expired_keys))
\ No newline at end of file
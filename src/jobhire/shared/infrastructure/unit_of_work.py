@@ -0,0 +1,230 @@
+"""
+Request-scoped unit of work with an identity map.
+"""
+
+import json
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import structlog
+
+from jobhire.shared.domain.exceptions import ConcurrencyException
+
+logger = structlog.get_logger(__name__)
+
+_current_unit_of_work: ContextVar[Optional["UnitOfWork"]] = ContextVar("unit_of_work", default=None)
+
+
+def current_unit_of_work() -> Optional["UnitOfWork"]:
+    """The open unit of work of the current request or task, if any."""
+    work = _current_unit_of_work.get()
+    return work if work is not None and not work.closed else None
+
+
+class UnitOfWork:
+    """
+    Identity map plus deferred writes for tracked Mongo aggregates.
+
+    While a unit of work is active, each aggregate is loaded at most once: find_by_id
+    returns the instance already in the map, and query results are replaced by the
+    mapped instance so callers never hold two copies of the same aggregate.
+    Repository update() calls only mark the aggregate dirty; commit() writes each
+    dirty aggregate once, as a single minimal diff, followed by the domain events
+    published meanwhile (the outbox). When the outbox is configured for Mongo
+    transactions both happen in one transaction. Inserts, deletes and bulk updates
+    are not deferred. Once closed, current_unit_of_work() no longer returns it, so
+    later saves and events in the same context are written immediately.
+    """
+
+    def __init__(self):
+        self._identity_map: Dict[Tuple[str, str], Any] = {}
+        self._dirty: Dict[Tuple[str, str], Tuple[Any, Any, Dict[str, Any]]] = {}
+        self._events: List[Tuple[Any, List[Any]]] = []
+        self.closed = False
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, collection: str, entity_id: Any) -> Optional[Any]:
+        """Mapped aggregate for a find_by_id, counting whether the load was avoided."""
+        entity = self._identity_map.get((collection, str(entity_id)))
+        if entity is None:
+            self.loads += 1
+        else:
+            self.hits += 1
+        return entity
+
+    def attach(self, collection: str, entity: Any) -> Any:
+        """
+        Add a loaded or created aggregate; returns the instance that represents it.
+        A newer stored version (e.g. after an atomic claim) replaces a mapped
+        instance that has no pending writes.
+        """
+        key = (collection, str(entity.id))
+        mapped = self._identity_map.get(key)
+        if mapped is None or (key not in self._dirty and entity.version > _stored_version(mapped)):
+            self._identity_map[key] = entity
+            return entity
+        return mapped
+
+    def adopt(self, other: "UnitOfWork") -> None:
+        """
+        Take over the aggregates a committed nested unit of work stored, replacing
+        stale copies that have no pending writes here.
+        """
+        for key, entity in other._identity_map.items():
+            if key not in self._dirty:
+                self._identity_map[key] = entity
+
+    def forget(self, collection: str, entity_id: Any) -> None:
+        """Drop a deleted aggregate."""
+        key = (collection, str(entity_id))
+        self._identity_map.pop(key, None)
+        self._dirty.pop(key, None)
+
+    def register_dirty(self, repository: Any, entity: Any, touch: Optional[Dict[str, Any]] = None) -> None:
+        """Schedule an aggregate to be written on commit."""
+        key = (repository.collection_name, str(entity.id))
+        self._identity_map.setdefault(key, entity)
+        self._dirty[key] = (repository, entity, touch or {})
+
+    def add_events(self, outbox: Any, events: List[Any]) -> None:
+        """Schedule domain events to be written to the outbox on commit."""
+        self._events.append((outbox, list(events)))
+
+    async def commit(self) -> int:
+        """Write every dirty aggregate and pending event; returns how many aggregates were written."""
+        outbox = self._events[0][0] if self._events else None
+        if outbox is not None and outbox.use_transactions:
+            async with await outbox.database.client.start_session() as session:
+                async with session.start_transaction():
+                    return await self._flush(session)
+        return await self._flush()
+
+    async def _flush(self, session=None) -> int:
+        written = 0
+        while self._dirty:
+            _, (repository, entity, touch) = self._dirty.popitem()
+            if await repository._write_changes(entity, touch, session=session):
+                written += 1
+
+        while self._events:
+            outbox, events = self._events.pop(0)
+            await outbox.append(events, session=session)
+        return written
+
+    def rollback(self) -> None:
+        """Discard pending writes and events."""
+        self._dirty.clear()
+        self._events.clear()
+
+    def close(self) -> None:
+        """Stop deferring: anything not committed yet is discarded."""
+        self.rollback()
+        self.closed = True
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "loads": self.loads,
+            "duplicate_loads_avoided": self.hits,
+            "pending_writes": len(self._dirty),
+            "pending_events": sum(len(events) for _, events in self._events)
+        }
+
+
+def _stored_version(entity: Any) -> int:
+    persisted = getattr(entity, "_persisted_document", None) or {}
+    version = persisted.get("version")
+    return entity.version if version is None else version
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """Run a block in its own unit of work, committing it if the block succeeds."""
+    work = UnitOfWork()
+    token = _current_unit_of_work.set(work)
+    try:
+        yield work
+        await work.commit()
+    finally:
+        work.close()
+        _current_unit_of_work.reset(token)
+
+
+class UnitOfWorkMiddleware:
+    """
+    ASGI middleware giving each HTTP request its own unit of work.
+
+    Pending writes are committed just before the response starts, so the client only
+    sees success once the data is stored. Error responses (status >= 400) and
+    exceptions discard them. If the commit loses a version race the response is
+    replaced by a 409 and the client can retry; any other commit failure becomes a
+    500 before a status line is sent.
+
+    The unit of work closes when the response starts. Code that runs after that
+    (FastAPI BackgroundTasks, streaming response bodies) is not part of it: its
+    saves and events are written immediately, each on its own, and their failures
+    can no longer change the response.
+    """
+
+    def __init__(self, app, collector=None):
+        self.app = app
+        self.collector = collector
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        work = UnitOfWork()
+        token = _current_unit_of_work.set(work)
+        replaced = False
+
+        async def send_wrapper(message):
+            nonlocal replaced
+            if replaced:
+                # The original response was replaced; swallow the rest of it
+                return
+            if message["type"] == "http.response.start" and not work.closed:
+                try:
+                    if message["status"] < 400:
+                        await work.commit()
+                except ConcurrencyException as e:
+                    replaced = True
+                    await self._send_error(send, 409, e.message)
+                    return
+                except Exception as e:
+                    logger.error("Unit of work commit failed", path=scope.get("path"), error=str(e))
+                    replaced = True
+                    await self._send_error(send, 500, "Failed to save changes")
+                    return
+                finally:
+                    work.close()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            work.close()
+            _current_unit_of_work.reset(token)
+            self._record(work)
+
+    @staticmethod
+    async def _send_error(send, status: int, detail: str) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    def _record(self, work: UnitOfWork) -> None:
+        if not (work.hits or work.loads):
+            return
+        if self.collector is None:
+            # Imported lazily so repositories can use the unit of work without monitoring
+            from jobhire.shared.infrastructure.monitoring.metrics import get_metrics_collector
+            self.collector = get_metrics_collector()
+        self.collector.record_identity_map_lookups(hits=work.hits, loads=work.loads)
+        logger.debug("Unit of work finished", **work.stats)
@@ -108,6 +108,87 @@ class TestJobMatchingE2E:
         print(f"✅ Job matching completed with score: {match_result['overall_score']}")
         return match_result
 
+    @pytest.mark.asyncio
+    async def test_hybrid_cascade_gates_llm_on_algorithmic_score(self, sample_job_data, sample_user_profile):
+        """Test that hybrid matching only calls the LLM for plausible matches, at a tier fitting the score"""
+
+        from app.ai.models import ModelTier
+        from app.services.job_matcher import CascadeStage
+
+        ai_analysis = {"success": True, "analysis": {"overall_score": 90, "success_probability": 0.8}, "metadata": {}}
+        counts_before = dict(job_matching_engine.cascade_counts)
+
+        async def match_with_algorithmic_score(score):
+            algo_result = {"success": True, "overall_score": score, "category_scores": {}, "success_probability": 0.5}
+            with patch.object(job_matching_engine, "_algorithmic_matching", AsyncMock(return_value=algo_result)), \
+                 patch("app.services.job_matcher.generate_job_match_analysis", AsyncMock(return_value=ai_analysis)) as ai:
+                result = await job_matching_engine.match_job_to_user(
+                    sample_job_data, sample_user_profile, MatchingStrategy.HYBRID, "premium"
+                )
+            return result, ai
+
+        result, ai = await match_with_algorithmic_score(20)
+        assert result["cascade_stage"] == CascadeStage.REJECTED and result["overall_score"] == 20
+        ai.assert_not_called()
+
+        result, ai = await match_with_algorithmic_score(55)
+        assert result["cascade_stage"] == CascadeStage.CHEAP and result["source"] == "hybrid"
+        assert ai.call_args.kwargs["model_tier"] == ModelTier.CHEAP
+
+        result, ai = await match_with_algorithmic_score(80)
+        assert result["cascade_stage"] == CascadeStage.FULL
+        assert ai.call_args.kwargs["model_tier"] is None and ai.call_args.kwargs["complexity"] == "high"
+        assert result["overall_score"] == round(90 * 0.7 + 80 * 0.3, 1)
+
+        for stage in (CascadeStage.REJECTED, CascadeStage.CHEAP, CascadeStage.FULL):
+            assert job_matching_engine.cascade_counts[stage] == counts_before[stage] + 1
+        assert 0 < job_matching_engine.cascade_stats()["llm_call_rate"] < 1
+
+        print("✅ Hybrid matching cascade passed")
+
+    def test_skill_index_bounds_free_text_and_validates_reload(self, tmp_path):
+        """Test synonym lookup, bounded free-text skill IDs and rejection of malformed data files"""
+
+        from app.services.skill_index import SkillSynonymIndex
+
+        data_file = tmp_path / "skills.json"
+        data_file.write_text(json.dumps({"javascript": ["js", "ecmascript"]}))
+        index = SkillSynonymIndex({"python": ["py"]}, data_file=str(data_file), max_free_skills=2)
+
+        assert index.skill_id(" JS ") == index.skill_id("JavaScript") >= 0
+        assert index.normalize("ECMAScript") == "javascript"
+        assert index.skill_name(index.skill_id("js")) == "javascript"
+
+        # Free-text skills share a transient ID while recent, and the table stays capped
+        cobol = index.skill_id("COBOL")
+        assert cobol < 0 and index.skill_id("cobol") == cobol and index.skill_name(cobol) == "cobol"
+        for skill in ("fortran", "pascal", "ada"):
+            index.skill_id(skill)
+        assert len(index._free_ids) == 2 and cobol not in index._free_names
+        assert index.skill_name(cobol) is None
+        assert index.skill_id("cobol") != cobol
+        assert index.normalize("Brainf*ck") == "brainf*ck" and "brainf*ck" not in index._free_ids
+
+        # Concurrent interning keeps the table capped and name lookups never raise
+        from concurrent.futures import ThreadPoolExecutor
+
+        def intern_and_lookup(worker):
+            for n in range(200):
+                skill_id = index.skill_id(f"skill-{worker}-{n}")
+                assert index.skill_name(skill_id) in (f"skill-{worker}-{n}", None)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(intern_and_lookup, range(8)))
+        assert len(index._free_ids) == len(index._free_names) == 2
+
+        # A data file that is not a dict of alias lists keeps the current table
+        for malformed in (["javascript"], {"javascript": "js"}, {"javascript": [1]}):
+            data_file.write_text(json.dumps(malformed))
+            assert index.reload() is False
+            assert index.normalize("js") == "javascript"
+
+        print("✅ Skill synonym index passed")
+
     @pytest.mark.asyncio
     async def test_ai_prompt_quality_validation(self, sample_job_data, sample_user_profile):
         """Test AI prompt quality and response validation"""
@@ -459,9 +540,592 @@ class TestJobFetchingE2E:
         
         is_valid = job_fetcher._is_valid_job(high_quality_job)
         assert is_valid is True, "High-quality job should pass validation"
-        
+
         print("✅ Job quality validation passed")
 
+    @pytest.mark.asyncio
+    async def test_keyword_extraction_respects_word_boundaries(self):
+        """Test single-pass keyword extraction across all description categories"""
+
+        description = (
+            "Senior engineer for our Google Ads jobs team: Python, Go, C++ and machine learning. "
+            "Master's degree preferred. We offer health insurance and bonuses."
+        )
+
+        skills = await job_fetcher._extract_skills_from_description(description)
+        assert skills == ["Python", "C++", "Go", "Machine Learning"]
+        assert job_fetcher._extract_benefits(description) == ["Health Insurance", "Bonus"]
+        assert await job_fetcher._extract_experience_level(description) == "senior-level"
+        # "jobs" must not be read as a "bs" degree
+        assert await job_fetcher._extract_education_requirements(description) == "masters"
+        assert await job_fetcher._extract_education_requirements("Great jobs at great labs") == "bachelor"
+
+        culture = job_matching_engine._extract_culture_signals({"description": description})
+        assert culture["collaboration"] == 1  # "team"
+        assert culture["growth"] == 1  # "learning" inside "machine learning"
+
+        print("✅ Keyword extraction passed")
+
+    @pytest.mark.asyncio
+    async def test_http_pool_reuses_client_and_caps_per_host(self):
+        """Test one pooled client per loop, the per-host concurrency cap and saturation stats"""
+
+        import httpx
+        from app.core.http_client import HTTPClientPool
+
+        pool = HTTPClientPool(max_per_host=2, http2=False)
+        active = {"now": 0, "peak": 0}
+
+        async def handler(request):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return httpx.Response(200, json={"host": request.url.host})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        pool._clients[asyncio.get_running_loop()] = client
+        assert await pool.startup() is client
+
+        responses = await asyncio.gather(
+            *(pool.get(f"https://api.example.com/jobs?page={page}") for page in range(6)),
+            pool.post("https://other.example.com/apply")
+        )
+        assert [response.status_code for response in responses] == [200] * 7
+        assert pool.client is client
+        # Two slots for api.example.com plus one request to the other host
+        assert active["peak"] == 3
+
+        stats = pool.stats()
+        assert stats["api.example.com"]["requests"] == 6
+        assert stats["api.example.com"]["in_flight"] == 0 and stats["api.example.com"]["waiting"] == 0
+        assert stats["other.example.com"]["limit"] == 2
+
+        # Open streams give their slot back once the headers arrive
+        async with pool.stream("GET", "https://api.example.com/events") as first, \
+                pool.stream("GET", "https://api.example.com/events") as second:
+            assert first.status_code == second.status_code == 200
+            assert pool.stats()["api.example.com"]["in_flight"] == 0
+            response = await asyncio.wait_for(pool.get("https://api.example.com/jobs"), timeout=1)
+            assert response.status_code == 200
+
+        await pool.shutdown()
+        assert client.is_closed
+
+        print("✅ HTTP connection pool passed")
+
+    @pytest.mark.asyncio
+    async def test_pipelined_search_backs_off_and_stops_early(self):
+        """Test concurrent page prefetch with 429 backoff and early stop at the job cap"""
+
+        import httpx
+        from app.services.job_fetcher import JobFetcher
+
+        fetcher = JobFetcher()
+        fetcher.prefetch_pages = 3
+        fetcher.rate_limiter.rate = fetcher.rate_limiter.max_rate = 1000.0
+
+        requested_pages = []
+        rate_limited = set()
+
+        async def fake_get(url, headers=None, params=None):
+            page = params["page"]
+            requested_pages.append(page)
+            request = httpx.Request("GET", url)
+            if page == 2 and page not in rate_limited:
+                rate_limited.add(page)
+                return httpx.Response(429, headers={"Retry-After": "0"}, request=request)
+            jobs = [
+                {
+                    "job_id": f"p{page}_{i}",
+                    "job_title": "Software Engineer",
+                    "employer_name": "Tech Company",
+                    "job_description": "Python and SQL engineer"
+                }
+                for i in range(10)
+            ]
+            return httpx.Response(200, json={"status": "OK", "data": jobs}, request=request)
+
+        with patch("app.services.job_fetcher.http_client_pool.get", side_effect=fake_get), \
+             patch("app.services.job_fetcher.settings.MAX_JOBS_PER_SEARCH", 25):
+            result = await fetcher.search_jobs("software engineer", num_pages=10)
+
+        ids = [job["external_id"] for job in result["jobs"]]
+        assert ids[:10] == [f"p1_{i}" for i in range(10)]
+        assert ids[10:20] == [f"p2_{i}" for i in range(10)]  # page order kept after the retry
+        assert result["search_params"]["pages_fetched"] == 3
+        assert requested_pages.count(2) == 2
+        assert max(requested_pages) == 3  # pages past the cap are never requested
+        assert fetcher.rate_limiter.rate < fetcher.rate_limiter.max_rate
+
+        print("✅ Pipelined search passed")
+
+    @pytest.mark.asyncio
+    async def test_bulk_job_ingestion_batches_and_isolates_bad_rows(self):
+        """Test multi-row job upserts: in-memory dedupe, batching and per-row fallback"""
+
+        from app.workers.job_ingestion import dedupe_jobs, job_row, match_row, upsert_jobs, insert_job_matches
+
+        statements = []
+
+        class FakeDatabase:
+            async def fetch_all(self, query, values):
+                statements.append(query)
+                external_ids = [v for k, v in values.items() if k.startswith("external_id_")]
+                if "bad" in external_ids:
+                    raise ValueError("invalid input syntax")
+                if "INSERT INTO jobs" in query:
+                    return [
+                        {"id": 100 + int(eid[1:]), "external_id": eid, "inserted": eid != "j0"}
+                        for eid in external_ids
+                    ]
+                return [{"id": i} for i, k in enumerate(values) if k.startswith("job_id_")]
+
+        jobs = [{"external_id": f"j{i}", "title": "Engineer"} for i in range(5)]
+        jobs += [{"external_id": "j1", "title": "Duplicate"}, {"external_id": "bad"}, {"title": "No id"}]
+        unique_jobs = dedupe_jobs(jobs)
+        assert [job["external_id"] for job in unique_jobs] == ["j0", "j1", "j2", "j3", "j4", "bad"]
+
+        database = FakeDatabase()
+        stored = await upsert_jobs(database, [job_row(job) for job in unique_jobs], batch_size=4)
+
+        # Batch 1 (j0-j3) in one statement; batch 2 fails and is retried row by row
+        assert len(statements) == 1 + 1 + 2
+        assert stored["j1"] == (101, True) and stored["j0"] == (100, False)
+        assert set(stored) == {"j0", "j1", "j2", "j3", "j4"}
+
+        statements.clear()
+        rows = [match_row({"overall_score": 80}, 7, job_id) for job_id, _ in stored.values()]
+        assert await insert_job_matches(database, rows, batch_size=500) == 5
+        assert len(statements) == 1 and "ON CONFLICT (user_id, job_id) DO NOTHING" in statements[0]
+
+        print("✅ Bulk job ingestion passed")
+
+    @pytest.mark.asyncio
+    async def test_trending_upserts_never_overwrite_stored_job_fields(self):
+        """Test trending defaults fill new jobs but leave values from earlier fetches alone"""
+
+        import uuid
+        from pathlib import Path
+        from databases import Database
+        from app.core.config import settings
+        from app.workers.job_ingestion import TRENDING_JOB_DEFAULTS, job_row, upsert_jobs
+
+        if not settings.TEST_DATABASE_URL:
+            pytest.skip("TEST_DATABASE_URL is not set")
+        pytest.importorskip("asyncpg")
+
+        schema = f"test_trending_upsert_{uuid.uuid4().hex[:8]}"
+        admin = Database(settings.TEST_DATABASE_URL)
+        await admin.connect()
+        await admin.execute(f"CREATE SCHEMA {schema}")
+        database = Database(settings.TEST_DATABASE_URL, server_settings={"search_path": f"{schema}, public"})
+        await database.connect()
+
+        try:
+            init_sql = Path(__file__).resolve().parent.parent / "init.sql"
+            async with database.connection() as connection:
+                await connection.raw_connection.execute(init_sql.read_text())
+
+            fetched = {
+                "external_id": "j1", "title": "Staff Engineer",
+                "remote_option": "remote", "employment_type": "contract", "experience_level": "senior-level"
+            }
+            await upsert_jobs(database, [job_row(fetched)])
+
+            trending = [
+                {"external_id": "j1", "title": "Staff Engineer (trending)"},
+                {"external_id": "j2", "title": "Data Analyst"}
+            ]
+            rows = [job_row(job, defaults=TRENDING_JOB_DEFAULTS) for job in trending]
+            stored = await upsert_jobs(database, rows, keep_stored=TRENDING_JOB_DEFAULTS)
+            assert stored["j1"][1] is False and stored["j2"][1] is True
+
+            jobs = {
+                row["external_id"]: dict(row) for row in await database.fetch_all(
+                    "SELECT external_id, title, remote_option, employment_type, experience_level FROM jobs"
+                )
+            }
+            # Fetched values survive the refetch; non-defaulted columns still refresh
+            assert jobs["j1"] == {
+                "external_id": "j1", "title": "Staff Engineer (trending)",
+                "remote_option": "remote", "employment_type": "contract", "experience_level": "senior-level"
+            }
+            assert (jobs["j2"]["remote_option"], jobs["j2"]["experience_level"]) == ("no", "mid-level")
+
+        finally:
+            await database.disconnect()
+            await admin.execute(f"DROP SCHEMA {schema} CASCADE")
+            await admin.disconnect()
+
+        print("✅ Trending job upsert passed")
+
+    @pytest.mark.asyncio
+    async def test_candidate_index_prefilters_jobs_for_matching(self):
+        """Test job term postings and top-K candidate selection"""
+
+        from app.core.config import settings
+        from app.services.job_candidates import JobCandidateIndex, job_candidate_index, TermKind
+        from app.workers.job_ingestion import replace_job_terms
+
+        job = {
+            "title": "Senior Python Developer (Remote)",
+            "required_skills": ["Python", "JS"],
+            "preferred_skills": ["javascript", "Docker"]
+        }
+        assert job_candidate_index.job_terms(job) == [
+            (TermKind.REQUIRED, "python"), (TermKind.REQUIRED, "javascript"),
+            (TermKind.PREFERRED, "docker"),
+            (TermKind.TITLE, "python"), (TermKind.TITLE, "developer")
+        ]
+
+        queries = []
+
+        class FakeTransaction:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        class FakeDatabase:
+            def __init__(self):
+                self.terms_indexed = False
+
+            def transaction(self):
+                return FakeTransaction()
+
+            async def execute(self, query, values):
+                queries.append((query, values))
+                self.terms_indexed = self.terms_indexed or "INSERT INTO job_terms" in query
+
+            async def fetch_val(self, query):
+                return self.terms_indexed
+
+            async def fetch_all(self, query, values):
+                queries.append((query, values))
+                return [{"id": 1, "title": "Python Developer", "candidate_score": 3.5}]
+
+        database = FakeDatabase()
+        profile = {"skills": ["py", "k8s"], "preferences": {"desired_positions": ["Backend Developer"]}}
+        index = JobCandidateIndex(job_candidate_index.skill_index)
+
+        # Before the backfill has written postings, matching falls back to recent jobs
+        await index.top_candidates(database, 7, profile, limit=25)
+        assert "job_terms" not in queries[0][0] and queries[0][1]["limit"] == 25
+
+        queries.clear()
+        assert await replace_job_terms(database, {1: job_candidate_index.job_terms(job), 2: []}) == 2
+        assert queries[0][1] == {"job_ids": [1, 2]}
+        assert len(queries) == 2 and "INSERT INTO job_terms" in queries[1][0]
+
+        queries.clear()
+        candidates = await index.top_candidates(database, 7, profile, limit=25)
+        query, values = queries[0]
+        assert "FROM job_terms" in query and "LIMIT :limit" in query
+        assert values["skills"] == ["python", "kubernetes"] and values["titles"] == ["backend", "developer"]
+        assert values["limit"] == 25 and candidates[0]["candidate_score"] == 3.5
+
+        # No skills or positions: recent unmatched jobs, still capped
+        queries.clear()
+        await index.top_candidates(database, 7, {})
+        assert "job_terms" not in queries[0][0] and queries[0][1]["limit"] == settings.MATCH_CANDIDATE_LIMIT
+
+        print("✅ Candidate index passed")
+
+    @pytest.mark.asyncio
+    async def test_job_terms_migration_upgrades_existing_database(self):
+        """Test 005 adds job_terms to a database created before the index, with a recent-jobs fallback"""
+
+        import uuid
+        from pathlib import Path
+        from databases import Database
+        from app.core.config import settings
+        from app.services.job_candidates import JobCandidateIndex, job_candidate_index
+        from app.workers.job_ingestion import job_row, replace_job_terms, upsert_jobs
+
+        if not settings.TEST_DATABASE_URL:
+            pytest.skip("TEST_DATABASE_URL is not set")
+        pytest.importorskip("asyncpg")
+
+        schema = f"test_job_terms_{uuid.uuid4().hex[:8]}"
+        admin = Database(settings.TEST_DATABASE_URL)
+        await admin.connect()
+        await admin.execute(f"CREATE SCHEMA {schema}")
+        database = Database(settings.TEST_DATABASE_URL, server_settings={"search_path": f"{schema}, public"})
+        await database.connect()
+
+        try:
+            root = Path(__file__).resolve().parent.parent
+            async with database.connection() as connection:
+                await connection.raw_connection.execute((root / "init.sql").read_text())
+                # A database bootstrapped before the candidate index existed
+                await connection.raw_connection.execute("DROP TABLE job_terms")
+                migration = root / "app" / "workflows" / "migrations" / "005_create_job_terms.sql"
+                for _ in range(2):  # re-running the migration is harmless
+                    await connection.raw_connection.execute(migration.read_text())
+
+            jobs = [
+                {"external_id": "old", "title": "Python Developer", "required_skills": ["Python"], "posted_date": datetime.utcnow()},
+                {"external_id": "new", "title": "Java Developer", "required_skills": ["Java"], "posted_date": datetime.utcnow()}
+            ]
+            stored = await upsert_jobs(database, [job_row(job) for job in jobs])
+            index = JobCandidateIndex(job_candidate_index.skill_index)
+            profile = {"skills": ["python"]}
+
+            # Jobs stored before the upgrade have no postings yet: they still come back
+            fallback = await index.top_candidates(database, 1, profile)
+            assert {job["external_id"] for job in fallback} == {"old", "new"}
+
+            await replace_job_terms(database, {
+                stored[job["external_id"]][0]: job_candidate_index.job_terms(job) for job in jobs
+            })
+            candidates = await index.top_candidates(database, 1, profile)
+            assert [job["external_id"] for job in candidates] == ["old"]
+
+        finally:
+            await database.disconnect()
+            await admin.execute(f"DROP SCHEMA {schema} CASCADE")
+            await admin.disconnect()
+
+        print("✅ Job terms migration passed")
+
+    @pytest.mark.asyncio
+    async def test_dashboard_stats_recount_once_then_increment(self):
+        """Test materialized dashboard counters: one $facet recount, $inc updates, recount on outside writes"""
+
+        from types import SimpleNamespace
+        from app.services.dashboard_stats import DashboardStatsService
+
+        now = datetime.utcnow()
+        aggregates = []
+
+        class FakeCursor:
+            async def to_list(self, length):
+                return [{
+                    "by_status": [{"_id": "matched", "count": 2}, {"_id": "applied", "count": 3}],
+                    "by_day": [
+                        {"_id": now.strftime("%Y-%m-%d"), "count": 2},
+                        {"_id": (now - timedelta(days=10)).strftime("%Y-%m-%d"), "count": 3}
+                    ],
+                    "response_time": []
+                }]
+
+        class FakeApplications:
+            def __init__(self):
+                self.docs = {}
+
+            def aggregate(self, pipeline):
+                aggregates.append(pipeline)
+                return FakeCursor()
+
+            async def insert_one(self, doc):
+                doc["_id"] = f"a{len(self.docs) + 1}"
+                self.docs[doc["_id"]] = doc
+                return SimpleNamespace(inserted_id=doc["_id"])
+
+            async def find_one_and_update(self, query, update, projection=None, return_document=None):
+                doc = self.docs.get(query["_id"])
+                if doc is None or doc["user_id"] != query["user_id"]:
+                    return None
+                before = dict(doc)
+                doc.update(update["$set"])
+                return before
+
+            async def create_index(self, keys, name=None):
+                return name
+
+            async def find_one(self, query, projection=None):
+                since = query["updated_at"]["$gt"]
+                return next((
+                    doc for doc in self.docs.values()
+                    if doc["user_id"] == query["user_id"] and doc["updated_at"] > since
+                ), None)
+
+        class FakeStats:
+            def __init__(self):
+                self.docs = {}
+
+            async def find_one(self, query):
+                return self.docs.get(query["_id"])
+
+            async def replace_one(self, query, doc, upsert=False):
+                self.docs[query["_id"]] = doc
+
+            async def update_one(self, query, update):
+                doc = self.docs.get(query["_id"])
+                if doc is None:
+                    return
+                for path, amount in update["$inc"].items():
+                    target = doc
+                    *parents, key = path.split(".")
+                    for parent in parents:
+                        target = target.setdefault(parent, {})
+                    target[key] = target.get(key, 0) + amount
+                doc.update(update["$set"])
+
+        class FakeDatabase:
+            applications = FakeApplications()
+            stats = FakeStats()
+
+            def __getitem__(self, name):
+                assert name == "user_stats"
+                return self.stats
+
+        db = FakeDatabase()
+        service = DashboardStatsService(max_age_seconds=3600)
+
+        stats = await service.get_stats(db, "u1")
+        assert len(aggregates) == 1 and "$facet" in aggregates[0][1]
+        assert service.summary(stats) == {"preview": 2, "queue": 0, "completed": 3}
+
+        await service.record_application_created(db, "u1", "matched")
+        await service.record_status_change(db, "u1", "applied", "interview",
+                                           applied_at=now - timedelta(days=4), changed_at=now)
+
+        stats = await service.get_stats(db, "u1")
+        assert len(aggregates) == 1  # Served from the counters
+        assert service.summary(stats) == {"preview": 3, "queue": 0, "completed": 2}
+        figures = service.application_stats(stats, now=now)
+        assert figures["totalApplications"] == 6 and figures["thisWeek"] == 3 and figures["thisMonth"] == 6
+        assert figures["responseRate"] == 50 and figures["averageResponseTime"] == 4
+
+        # Writers going through the service move the counters with the documents
+        application_id = await service.create_application(db, {"user_id": "u1", "status": "pending"})
+        assert await service.update_application_status(db, "u1", application_id, "applied") is True
+        assert await service.update_application_status(db, "u2", application_id, "rejected") is False
+        assert db.applications.docs[application_id]["applied_at"] is not None
+        stats = await service.get_stats(db, "u1")
+        assert len(aggregates) == 1
+        assert service.summary(stats) == {"preview": 3, "queue": 0, "completed": 3}
+        assert service.application_stats(stats)["totalApplications"] == 7
+
+        # A status change written outside the service shows up on the next read, not after max_age
+        db.applications.docs[application_id].update(status="interview", updated_at=datetime.utcnow())
+        await service.get_stats(db, "u1")
+        assert len(aggregates) == 2
+
+        # New queue items add their match score to the running average
+        from app.services import user_management_service as queue_module
+
+        executed = []
+        with patch.object(queue_module.database, "execute", AsyncMock(side_effect=lambda q, v: executed.append((q, v)))):
+            await queue_module.UserManagementService()._adjust_queue_statistics("u1", None, "queued", match_score=82.5)
+        query, values = executed[0]
+        assert "match_score_sum = match_score_sum + :match_score" in query and "match_score_count + 1" in query
+        assert values == {"user_id": "u1", "match_score": 82.5}
+
+        # Stale documents are recounted
+        db.stats.docs["u1"]["refreshed_at"] = now - timedelta(hours=2)
+        await service.get_stats(db, "u1")
+        assert len(aggregates) == 3
+
+        print("✅ Dashboard stats passed")
+
+    @pytest.mark.asyncio
+    async def test_v1_matching_projects_fields_and_bulk_upserts(self, monkeypatch):
+        """Test v1 job matching reads projected fields over Motor and saves matches in one bulk_write"""
+
+        import sys
+        from types import ModuleType, SimpleNamespace
+        from bson import ObjectId
+
+        # The route is called directly, so the JWT dependency is never resolved
+        security = ModuleType("app.core.security")
+        security.get_current_user = lambda: None
+        monkeypatch.setitem(sys.modules, "app.core.security", security)
+        monkeypatch.delitem(sys.modules, "app.api.v1.endpoints.matching", raising=False)
+        from app.api.v1.endpoints import matching
+        from app.core.mongodb import Collections
+
+        user_id, job_ids = ObjectId(), [ObjectId() for _ in range(3)]
+        calls = []
+
+        class FakeCursor:
+            def __init__(self, documents):
+                self.documents = documents
+
+            def limit(self, count):
+                calls.append(("limit", count))
+                return self
+
+            async def to_list(self, length):
+                return self.documents[:length]
+
+        class FakeCollection:
+            def __init__(self, name):
+                self.name = name
+
+            async def find_one(self, query, projection=None):
+                calls.append((self.name, "find_one", projection))
+                return {"_id": user_id, "job_preferences": {
+                    "desired_positions": ["backend engineer"], "skills": ["Python"], "remote_preference": "remote"
+                }, "onboarding": {"years_of_experience": 5}}
+
+            def find(self, query, projection=None):
+                calls.append((self.name, "find", projection))
+                titles = ["Backend Engineer", "Senior Backend Engineer", "Chef"]
+                return FakeCursor([
+                    {"_id": job_id, "title": title, "skills_required": ["python"], "remote_type": "remote"}
+                    for job_id, title in zip(job_ids, titles)
+                ])
+
+            async def bulk_write(self, requests, ordered=True):
+                calls.append((self.name, "bulk_write", requests, ordered))
+                return SimpleNamespace(upserted_count=len(requests))
+
+        db = {name: FakeCollection(name) for name in (Collections.USERS, Collections.JOBS, Collections.JOB_MATCHES)}
+        response = await matching.get_matched_jobs(min_score=80, limit=10, current_user={"id": str(user_id)}, db=db)
+
+        assert [match.job_id for match in response.matches] == [str(job_ids[0]), str(job_ids[1])]
+        assert (Collections.USERS, "find_one", matching.USER_MATCH_PROJECTION) in calls
+        assert (Collections.JOBS, "find", matching.JOB_MATCH_PROJECTION) in calls
+        assert "description" not in matching.JOB_MATCH_PROJECTION
+
+        writes = [call for call in calls if call[1] == "bulk_write"]
+        assert len(writes) == 1 and writes[0][3] is False
+        upserts = writes[0][2]
+        assert [op._filter for op in upserts] == [{"user_id": user_id, "job_id": job_id} for job_id in job_ids[:2]]
+        assert all(op._upsert and op._doc["$set"]["status"] == "pending" for op in upserts)
+
+        print("✅ v1 job matching passed")
+
+    @pytest.mark.asyncio
+    async def test_search_cache_coalesces_and_serves_stale(self):
+        """Test request coalescing, stale-while-revalidate and compressed round trips"""
+
+        from app.core.cache import TwoTierCache
+
+        cache = TwoTierCache("test_search", ttl=60, stale_ttl=60, compress_min_bytes=16)
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"jobs": [{"external_id": str(len(calls)), "posted_date": datetime(2024, 1, 15)}]}
+
+        results = await asyncio.gather(*[cache.get_or_fetch("q", fetch) for _ in range(5)])
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+        # Expired but within the stale window: old value returned, one refresh in background
+        cache._local["q"].fresh_until = 0
+        stale = await cache.get_or_fetch("q", fetch)
+        assert stale["jobs"][0]["external_id"] == "1"
+        await asyncio.sleep(0.05)
+        assert len(calls) == 2
+        assert (await cache.get_or_fetch("q", fetch))["jobs"][0]["external_id"] == "2"
+
+        payload = cache._serialize(cache._local["q"])
+        assert payload[:1] == b"\x01"
+        assert cache._deserialize(payload).value["jobs"][0]["posted_date"] == datetime(2024, 1, 15)
+
+        stats = cache.stats()
+        assert stats["misses"] == 1 and stats["coalesced"] == 4 and stats["stale_hits"] == 1
+        assert stats["hit_ratio"] > 0.8
+
+        print("✅ Search cache passed")
+
 
 class TestAIQualityValidation:
     """Test AI output quality and consistency"""
@@ -505,6 +1169,172 @@ class TestAIQualityValidation:
         
         print(f"✅ AI consistency test passed. Scores: {scores}")
 
+    @pytest.mark.asyncio
+    async def test_llm_response_cache_reuses_identical_prompts(self, tmp_path):
+        """Test content-addressed response caching, bypass and savings counters"""
+
+        from app.ai.models import AIModelManager
+        from app.ai.response_cache import LLMResponseCache, SQLiteResponseBackend
+
+        manager = AIModelManager()
+        manager.response_cache = LLMResponseCache(SQLiteResponseBackend(str(tmp_path / "llm.sqlite3")))
+        generated = AsyncMock(return_value={"text": "match score 87", "model": "m", "provider": "openai"})
+
+        with patch.object(manager, "_generate_openai_response", generated):
+            first = await manager.generate_response("prompt", {}, "balanced", "openai", 0.2, operation="job_matching")
+            second = await manager.generate_response("prompt", {}, "balanced", "openai", 0.2, operation="job_matching")
+            warmer = await manager.generate_response("prompt", {}, "balanced", "openai", 0.7)
+            bypassed = await manager.generate_response("prompt", {}, "balanced", "openai", 0.2, bypass_cache=True)
+
+        assert generated.await_count == 3  # second call served from cache
+        assert first["metadata"]["cache_hit"] is False
+        assert second["metadata"]["cache_hit"] is True
+        assert second["response"] == first["response"]
+        assert second["metadata"]["cost_usd"] == 0.0
+        assert second["metadata"]["cost_saved_usd"] == first["metadata"]["cost_usd"] > 0
+        assert warmer["metadata"]["cache_hit"] is False  # temperature is part of the key
+        assert bypassed["metadata"]["cache_hit"] is False
+        assert bypassed["metadata"]["cache_hits"] == 1
+
+        print("✅ LLM response cache passed")
+
+    @pytest.mark.asyncio
+    async def test_async_replicate_client_backoff_and_streaming(self):
+        """Test async Replicate predictions: backoff polling, tier limits and SSE streaming"""
+
+        import httpx
+        from contextlib import asynccontextmanager
+        from app.ai.replicate_client import AsyncReplicateClient, ReplicateError
+
+        client = AsyncReplicateClient("token", tier_concurrency={"cheap": 2}, poll_initial_interval=0.001)
+        polls = []
+        cancelled = []
+        in_flight = {"now": 0, "peak": 0}
+        request = httpx.Request("GET", "https://api.replicate.com")
+
+        class FakePool:
+            async def post(self, url, headers=None, json=None, timeout=None):
+                if url.endswith("/cancel"):
+                    cancelled.append(url)
+                    return httpx.Response(200, json={"status": "canceled"}, request=request)
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+                assert url.endswith("/predictions") and json["version"] == "abc"
+                body = {"id": f"p{len(polls)}", "status": "starting", "urls": {"stream": "https://stream/p"}}
+                return httpx.Response(201, json=body, request=request)
+
+            async def get(self, url, headers=None, timeout=None):
+                polls.append(url)
+                status = "succeeded" if len(polls) % 3 == 0 else "processing"
+                body = {"id": url.rsplit("/", 1)[-1], "status": status, "output": ["Hello", " world"]}
+                if status == "succeeded":
+                    in_flight["now"] -= 1
+                return httpx.Response(200, json=body, request=request)
+
+            @asynccontextmanager
+            async def stream(self, method, url, headers=None, timeout=None):
+                sse = b"event: output\ndata: Dear\n\nevent: output\ndata:  Hiring\n\nevent: done\ndata: {}\n\n"
+                yield httpx.Response(200, content=sse, request=request)
+
+        with patch("app.ai.replicate_client.http_client_pool", FakePool()):
+            outputs = await asyncio.gather(*[
+                client.run("meta/llama:abc", {"prompt": "hi"}, tier="cheap") for _ in range(4)
+            ])
+            tokens = [token async for token in client.stream("meta/llama:abc", {"prompt": "hi"})]
+
+        assert outputs == [["Hello", " world"]] * 4
+        assert in_flight["peak"] <= 2  # per-tier concurrency limit
+        assert tokens == ["Dear", " Hiring"]
+
+        # A prediction that outlives the timeout is cancelled upstream before giving up
+        with patch("app.ai.replicate_client.http_client_pool", FakePool()):
+            with pytest.raises(ReplicateError, match="timed out"):
+                await client.wait({"id": "slow", "status": "processing"}, timeout=0.0001)
+        assert cancelled == ["https://api.replicate.com/v1/predictions/slow/cancel"]
+
+        print("✅ Async Replicate client passed")
+
+    def test_replicate_webhook_signature_fails_closed(self):
+        """Test webhook signature checks: valid, tampered, stale, malformed and unconfigured"""
+
+        import base64
+        import hashlib
+        import hmac
+        import time
+        from app.ai.replicate_client import AsyncReplicateClient
+
+        key = b"replicate-signing-key"
+        client = AsyncReplicateClient("token", webhook_secret="whsec_" + base64.b64encode(key).decode())
+        body = b'{"id": "p1", "status": "succeeded"}'
+
+        def signed_headers(timestamp, payload=body):
+            signed = f"msg_1.{timestamp}.".encode() + payload
+            signature = base64.b64encode(hmac.new(key, signed, hashlib.sha256).digest()).decode()
+            return {"webhook-id": "msg_1", "webhook-timestamp": str(timestamp), "webhook-signature": f"v1,{signature}"}
+
+        now = int(time.time())
+        assert client.verify_webhook(body, signed_headers(now))
+        assert not client.verify_webhook(body + b" ", signed_headers(now))
+        assert not client.verify_webhook(body, signed_headers(now - 600))  # replayed
+        assert not client.verify_webhook(body, {**signed_headers(now), "webhook-timestamp": "yesterday"})
+
+        assert not AsyncReplicateClient("token", webhook_secret="whsec_not*base64").verify_webhook(body, signed_headers(now))
+        assert not AsyncReplicateClient("token").verify_webhook(body, signed_headers(now))
+
+        print("✅ Replicate webhook verification passed")
+
+    @pytest.mark.asyncio
+    async def test_streamed_cover_letter_validates_after_last_token(self):
+        """Test cover letter streaming: tokens first, quality report in the final event"""
+
+        from app.ai.models import ai_model_manager, stream_cover_letter
+        from app.api.streaming import format_sse
+
+        letter = {
+            "cover_letter": "Dear Hiring Manager, " + "I build reliable Python services. " * 10,
+            "key_points_highlighted": ["Python"],
+            "keywords_included": ["Python"],
+            "customization_score": 80
+        }
+        text = json.dumps(letter)
+
+        async def fake_stream(*args, **kwargs):
+            for i in range(0, len(text), 40):
+                yield text[i:i + 40]
+
+        job = {"title": "Backend Engineer", "company": {"name": "TechCorp"}, "description": "Python"}
+        with patch.object(ai_model_manager.response_cache, "backend", None), \
+             patch.object(ai_model_manager, "_stream_replicate_response", fake_stream):
+            events = [event async for event in stream_cover_letter(job, {"skills": ["Python"]})]
+
+        tokens = [event for event in events if event["type"] == "token"]
+        assert len(tokens) > 1 and "".join(t["text"] for t in tokens) == text
+        assert events[-1]["type"] == "done"
+        assert events[-1]["cover_letter"] == letter
+        assert events[-1]["quality"]["validation_passed"]
+        assert events[-1]["metadata"]["time_to_first_token"] is not None
+        assert format_sse("token", {"text": "a\nb"}) == 'event: token\ndata: {"text": "a\\nb"}\n\n'
+
+        # The matching API streams the same events as SSE on the model picked for the user's tier
+        from app.api.endpoints import matching
+        from app.ai.models import ModelTier
+
+        context = {"job_data": job, "user_profile": {"skills": ["Python"]}, "company_research": {}, "user_tier": "free"}
+        request = matching.CoverLetterRequest(user_id=1, job_id="job-1")
+        with patch.object(ai_model_manager.response_cache, "backend", None), \
+             patch.object(ai_model_manager, "_stream_replicate_response", fake_stream), \
+             patch.object(matching, "_load_cover_letter_context", AsyncMock(return_value=context)), \
+             patch.object(ai_model_manager, "select_optimal_model", wraps=ai_model_manager.select_optimal_model) as select:
+            response = await matching.stream_cover_letter_endpoint(request)
+            body = "".join([chunk async for chunk in response.body_iterator])
+
+        assert response.media_type == "text/event-stream"
+        assert body.count("event: token") == len(tokens) and "event: done" in body
+        select.assert_called_once_with("cover_letter", "free")
+        assert ai_model_manager.select_optimal_model("interview", "premium", "high") == (ModelTier.PREMIUM, "replicate")
+
+        print("✅ Cover letter streaming passed")
+
     @pytest.mark.asyncio
     async def test_prompt_validation(self):
         """Test prompt input validation"""
@@ -584,6 +1414,76 @@ class TestPerformanceAndScaling:
         
         print(f"✅ Batch processing: {len(jobs)} jobs in {processing_time:.2f}s")
 
+    @pytest.mark.asyncio
+    async def test_vectorized_batch_matches_scalar_scoring(self):
+        """Test vectorized batch scoring returns the same results as per-pair matching"""
+
+        jobs = [
+            {
+                "external_id": f"job_{i}",
+                "description": ["Innovative team focused on growth", "Stable enterprise, earn up to $1M", ""][i % 3],
+                "required_skills": [["Python", "React"], ["JS", "AWS", "k8s"], []][i % 3],
+                "preferred_skills": [["Docker"], [], ["Go"]][i % 3],
+                "experience_level": ["entry-level", "senior-level", "mid-level"][i % 3],
+                "education_requirements": ["bachelor", "masters", "doctorate"][i % 3],
+                "location": [{"city": "San Francisco", "state": "CA"}, {"city": "Austin", "state": "TX"}, {}][i % 3],
+                "remote_option": ["no", "hybrid", "full"][i % 3],
+                "salary_min": [100000, None, 150000][i % 3],
+                "salary_max": [150000, 120000, None][i % 3]
+            }
+            for i in range(9)
+        ]
+
+        user_profiles = [
+            {
+                "id": 1,
+                "skills": ["Python", "javascript", "Docker"],
+                "experience_years": 6,
+                "education": {"degrees": [{"level": "masters"}]},
+                "preferences": {
+                    "salary_target": 140000,
+                    "remote_preference": "remote_only",
+                    "location": {"city": "san francisco", "state": "ca"},
+                    "culture_preferences": {"innovation": 1, "growth": 0.5}
+                }
+            },
+            {
+                "id": 2,
+                "skills": ["Go"],
+                "experience_years": 1,
+                "preferences": {"salary_minimum": 130000}
+            }
+        ]
+
+        batch_results = await job_matching_engine.batch_match_users(jobs, user_profiles)
+
+        assert len(batch_results) == len(user_profiles)
+        for user_profile, user_results in zip(user_profiles, batch_results):
+            assert len(user_results) == len(jobs)
+            scores = [result["overall_score"] for result in user_results]
+            assert scores == sorted(scores, reverse=True)
+
+            expected = sorted(
+                [await job_matching_engine._algorithmic_matching(job, user_profile) for job in jobs],
+                key=lambda x: x["overall_score"],
+                reverse=True
+            )
+            for vectorized, scalar in zip(user_results, expected):
+                vectorized = {k: v for k, v in vectorized.items() if k != "metadata"}
+                assert vectorized == scalar
+
+        # Threshold filtering only materializes qualifying pairs
+        filtered = await job_matching_engine.batch_match_users(jobs, user_profiles, min_score=60)
+        for user_results in filtered:
+            assert all(result["overall_score"] >= 60 for result in user_results)
+
+        # A malformed job is dropped on its own instead of failing the whole batch
+        malformed = {"external_id": "broken", "required_skills": 42}
+        isolated = await job_matching_engine.batch_match_jobs(
+            jobs[:3] + [malformed], user_profiles[0], strategy=MatchingStrategy.ALGORITHMIC
+        )
+        assert len(isolated) == 3 and all(result["success"] for result in isolated)
+
     @pytest.mark.asyncio
     async def test_concurrent_processing(self):
         """Test concurrent request handling"""
@@ -614,6 +1514,1361 @@ class TestPerformanceAndScaling:
         
         print("✅ Concurrent processing test passed")
 
+    @pytest.mark.asyncio
+    async def test_blob_store_streams_dedupes_and_serves_ranges(self, tmp_path):
+        """Test chunked uploads into content-addressed storage and ranged reads"""
+
+        import hashlib
+        from app.core.blob_store import (
+            BlobStore, LocalBlobBackend, BlobRangeError, BlobTooLargeError, parse_byte_range
+        )
+
+        store = BlobStore(LocalBlobBackend(str(tmp_path), chunk_size=4), chunk_size=4)
+        content = b"%PDF-1.7 resume body " * 10
+
+        async def chunks(data, size=7):
+            for i in range(0, len(data), size):
+                yield data[i:i + size]
+
+        first = await store.put_stream(chunks(content))
+        second = await store.put_stream(chunks(content, size=3))
+        assert first.digest == hashlib.sha256(content).hexdigest() and first.size == len(content)
+        assert first.created and not second.created
+        assert not list((tmp_path / "tmp").iterdir())  # Spool files moved or removed
+
+        async def read(start=0, end=None):
+            return b"".join([chunk async for chunk in store.open(first.digest, start, end)])
+
+        assert await read() == content
+        assert await read(5, 14) == content[5:15]
+
+        assert parse_byte_range("bytes=5-14", len(content)) == (5, 14)
+        assert parse_byte_range("bytes=-10", len(content)) == (len(content) - 10, len(content) - 1)
+        assert parse_byte_range("bytes=0-5,10-15", len(content)) is None
+        with pytest.raises(BlobRangeError):
+            parse_byte_range(f"bytes={len(content)}-", len(content))
+
+        with pytest.raises(BlobTooLargeError):
+            await store.put_stream(chunks(b"x" * 100), max_size=50)
+        assert not list((tmp_path / "tmp").iterdir())
+
+        print("✅ Blob store passed")
+
+    def test_request_metrics_use_route_templates(self, monkeypatch):
+        """Test HTTP metrics are labelled by route template, once per request"""
+
+        from pathlib import Path
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from prometheus_client import CollectorRegistry
+        from prometheus_client.openmetrics.exposition import generate_latest
+
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.infrastructure.monitoring.metrics import MetricsCollector, MetricsMiddleware
+
+        collector = MetricsCollector(CollectorRegistry())
+        app = FastAPI()
+
+        @app.get("/resumes/{resume_id:int}")
+        async def get_resume(resume_id: int):
+            return {"id": resume_id}
+
+        app.add_middleware(MetricsMiddleware, collector=collector, slow_threshold=0.0)
+        client = TestClient(app)
+        traceparent = "00-" + "a" * 32 + "-" + "b" * 16 + "-01"
+
+        for resume_id in range(5):
+            response = client.get(f"/resumes/{resume_id}", headers={"traceparent": traceparent})
+            assert "x-process-time" in response.headers
+        assert client.get("/unknown/123").status_code == 404
+
+        exposition = generate_latest(collector.registry).decode()
+        assert 'http_requests_total{endpoint="/resumes/{resume_id}",method="GET",status_code="200"} 5.0' in exposition
+        assert 'endpoint="<unmatched>"' in exposition
+        assert "/resumes/0" not in exposition and "/unknown/123" not in exposition
+        assert 'trace_id="' + "a" * 32 + '"' in exposition
+
+        print("✅ Request metrics passed")
+
+    def test_global_metrics_export_once_under_both_import_paths(self, monkeypatch):
+        """Test the global collector's private registry is exported once, however it is imported"""
+
+        import importlib.util
+        import sys
+        from pathlib import Path
+        from prometheus_client import REGISTRY, generate_latest
+
+        src = Path(__file__).resolve().parent.parent / "src"
+        monkeypatch.syspath_prepend(str(src))
+        from jobhire.shared.infrastructure.monitoring import metrics
+
+        collector = metrics.get_metrics_collector()
+        assert metrics.get_metrics_collector() is collector
+        assert collector.registry is not REGISTRY
+
+        # app/main.py used to load the module a second time as src.jobhire...
+        path = src / "jobhire" / "shared" / "infrastructure" / "monitoring" / "metrics.py"
+        spec = importlib.util.spec_from_file_location("src.jobhire.shared.infrastructure.monitoring.metrics", path)
+        second = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, spec.name, second)
+        spec.loader.exec_module(second)
+        second.get_metrics_collector()
+
+        collector.record_http_request("POST", "/export-test", 201, 0.01)
+        exposition = generate_latest(REGISTRY).decode()
+        assert 'http_requests_total{endpoint="/export-test",method="POST",status_code="201"} 1.0' in exposition
+        assert exposition.count("# TYPE http_requests_total counter") == 1
+
+        print("✅ Global metrics export passed")
+
+    @pytest.mark.asyncio
+    async def test_repository_saves_only_changed_fields(self, monkeypatch):
+        """Test tracked repositories write minimal diffs guarded by version"""
+
+        from pathlib import Path
+        from types import SimpleNamespace
+
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.domain.exceptions import ConcurrencyException
+        from jobhire.shared.infrastructure.repositories import BaseMongoRepository
+
+        class Profile:
+            def __init__(self):
+                self.id = "profile-1"
+                self.version = 1
+                self.settings = {"auto_apply": False, "threshold": 0.8}
+                self.history = ["created"]
+
+            def increment_version(self):
+                self.version += 1
+
+        class ProfileRepository(BaseMongoRepository):
+            async def create(self, entity): pass
+            async def update(self, entity): await self._save_changes(entity)
+            async def find_by_id(self, entity_id): pass
+
+            def _entity_document(self, profile):
+                return {"settings": profile.settings, "history": profile.history, "version": profile.version}
+
+        stored = {"version": 1}
+        updates = []
+
+        async def update_one(query, update, session=None):
+            updates.append((query, update))
+            matched = query["version"] == stored["version"]
+            if matched:
+                stored["version"] = update["$set"]["version"]
+            return SimpleNamespace(matched_count=int(matched))
+
+        collection = SimpleNamespace(update_one=update_one)
+        repository = ProfileRepository({"profiles": collection}, "profiles", Profile)
+        profile = repository._track(Profile())
+
+        assert await repository._save_changes(profile) is False
+        assert updates == []
+
+        profile.settings["auto_apply"] = True
+        profile.history.append("auto_apply_enabled")
+        assert await repository._save_changes(profile, touch={"updated_at": "now"}) is True
+        assert updates[-1] == (
+            {"_id": "profile-1", "version": 1},
+            {
+                "$set": {"settings.auto_apply": True, "updated_at": "now", "version": 2},
+                "$push": {"history": {"$each": ["auto_apply_enabled"]}}
+            }
+        )
+
+        # Another writer got there first
+        stale = repository._track(Profile())
+        stale.settings["threshold"] = 0.9
+        with pytest.raises(ConcurrencyException):
+            await repository._save_changes(stale)
+
+        print("✅ Repository change tracking passed")
+
+    @pytest.mark.asyncio
+    async def test_repository_updates_documents_stored_without_version(self, monkeypatch):
+        """Test documents written before versioning can be updated, once, under the version guard"""
+
+        from pathlib import Path
+        from types import SimpleNamespace
+
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.domain.exceptions import ConcurrencyException
+        from jobhire.shared.infrastructure.repositories import BaseMongoRepository
+
+        class Account:
+            def __init__(self, document):
+                self.id = document["_id"]
+                self.full_name = document["full_name"]
+                self.user_tier = document.get("user_tier", "free")
+                # Same default as UserRepository for documents without a version
+                self.version = document.get("version", 1)
+
+            def increment_version(self):
+                self.version += 1
+
+        class AccountRepository(BaseMongoRepository):
+            async def create(self, entity): pass
+            async def update(self, entity): await self._save_changes(entity)
+            async def find_by_id(self, entity_id):
+                return self._document_to_entity(dict(self.collection.document))
+
+            def _document_to_entity(self, document):
+                return self._attach(Account(document), versioned="version" in document)
+
+            def _entity_document(self, entity):
+                return {"full_name": entity.full_name, "user_tier": entity.user_tier, "version": entity.version}
+
+        class FakeUserCollection:
+            def __init__(self, document):
+                self.document = document
+                self.filters = []
+
+            async def update_one(self, query, update, session=None):
+                self.filters.append(query)
+                expected = query["version"]
+                if isinstance(expected, dict):
+                    matched = ("version" in self.document) == expected["$exists"]
+                else:
+                    matched = self.document.get("version") == expected
+                if not matched:
+                    return SimpleNamespace(matched_count=0)
+                self.document.update(update.get("$set", {}))
+                return SimpleNamespace(matched_count=1)
+
+        collection = FakeUserCollection({"_id": "user-1", "full_name": "Old Name"})
+        repository = AccountRepository({"users": collection}, "users", Account)
+
+        account = await repository.find_by_id("user-1")
+        stale = await repository.find_by_id("user-1")
+
+        account.full_name = "New Name"
+        await repository.update(account)
+        assert collection.filters[-1]["version"] == {"$exists": False}
+        assert collection.document["full_name"] == "New Name" and collection.document["version"] == 1
+
+        # From now on the document is versioned like any other
+        account.user_tier = "pro"
+        await repository.update(account)
+        assert collection.filters[-1]["version"] == 1 and collection.document["version"] == 2
+
+        # A second copy loaded before the first write has lost the race
+        stale.full_name = "Other Name"
+        with pytest.raises(ConcurrencyException):
+            await repository.update(stale)
+        assert collection.document["full_name"] == "New Name"
+
+        print("✅ Version-less documents passed")
+
+    def test_field_encryption_detects_tampering_and_rotates_keys(self, monkeypatch):
+        """Test AES-GCM field encryption: tampering, misplaced ciphertexts, key rotation and key settings"""
+
+        from pathlib import Path
+        from types import SimpleNamespace
+
+        pytest.importorskip("cryptography")
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.config.settings import DEFAULT_SECRET_KEY
+        from jobhire.shared.domain.exceptions import SecurityException
+        from jobhire.shared.infrastructure.security.encryption import EncryptionService
+
+        service = EncryptionService(keys={"k1": b"1" * 32})
+        token = service.encrypt("Ada Lovelace", "users.full_name:user-1")
+        assert token.startswith("enc1:k1:") and "Ada" not in token
+        assert service.decrypt(token, "users.full_name:user-1") == "Ada Lovelace"
+        assert service.encrypt("Ada Lovelace", "users.full_name:user-1") != token  # Fresh nonce
+
+        # Flipped ciphertext bits and ciphertexts moved to another field or document are rejected
+        prefix, key_id, payload = token.split(":", 2)
+        tampered = f"{prefix}:{key_id}:{payload[:-4]}{'AAAA' if payload[-4:] != 'AAAA' else 'BBBB'}"
+        for bad_token, associated_data in (
+            (tampered, "users.full_name:user-1"),
+            (token, "users.full_name:user-2"),
+            (token, "users.email:user-1"),
+            ("enc1:k1:not base64!", "users.full_name:user-1")
+        ):
+            with pytest.raises(SecurityException):
+                service.decrypt(bad_token, associated_data)
+
+        # Rotation: new values use the active key, old ones still decrypt until rewritten
+        rotated = EncryptionService(keys={"k1": b"1" * 32, "k2": b"2" * 32})
+        assert rotated.active_key_id == "k2"
+        assert rotated.decrypt(token, "users.full_name:user-1") == "Ada Lovelace"
+        assert rotated.needs_rotation(token)
+        assert not rotated.needs_rotation(rotated.encrypt("Ada Lovelace"))
+        with pytest.raises(SecurityException):
+            EncryptionService(keys={"k2": b"2" * 32}).decrypt(token, "users.full_name:user-1")
+        with pytest.raises(ValueError):
+            EncryptionService(keys={"k1": b"short"})
+
+        # ENCRYPTION_KEYS is required outside development and testing
+        def settings(environment, encryption_keys=None, secret_key="a-long-random-secret"):
+            return SimpleNamespace(
+                app_environment=environment,
+                security=SimpleNamespace(
+                    secret_key=secret_key,
+                    encryption_keys_map=dict(entry.split(":", 1) for entry in encryption_keys or []),
+                    encryption_active_key_id=None
+                )
+            )
+
+        for environment in ("production", "staging"):
+            with pytest.raises(ValueError, match="ENCRYPTION_KEYS"):
+                EncryptionService.from_settings(settings(environment, secret_key=DEFAULT_SECRET_KEY))
+        configured = EncryptionService.from_settings(
+            settings("production", [f"k1:{EncryptionService.generate_key()}", f"k2:{EncryptionService.generate_key()}"])
+        )
+        assert configured.active_key_id == "k2"
+        derived = EncryptionService.from_settings(settings("development"))
+        assert EncryptionService.from_settings(settings("development")).decrypt(derived.encrypt("x")) == "x"
+
+        print("✅ Field encryption passed")
+
+    @pytest.mark.asyncio
+    async def test_repositories_encrypt_fields_and_replace_them_whole(self, monkeypatch):
+        """Test ENCRYPTED_FIELDS are stored as ciphertext, decrypted on load and rewritten only when changed"""
+
+        from pathlib import Path
+        from types import SimpleNamespace
+
+        pytest.importorskip("cryptography")
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.domain.types import EntityId, EmailAddress
+        from jobhire.shared.domain.exceptions import SecurityException
+        from jobhire.shared.infrastructure.repositories import BaseMongoRepository
+        from jobhire.shared.infrastructure.security.encryption import EncryptionService
+        from jobhire.domains.user.domain.entities.user import User
+        from jobhire.domains.user.infrastructure.repositories.user_repository import UserRepository
+
+        class FakeCollection:
+            def __init__(self):
+                self.documents = {}
+                self.updates = []
+
+            async def insert_one(self, document):
+                self.documents[document["_id"]] = dict(document)
+
+            async def update_one(self, query, update, session=None):
+                self.updates.append(update)
+                document = self.documents[query["_id"]]
+                if document.get("version") != query["version"]:
+                    return SimpleNamespace(matched_count=0)
+                document.update(update.get("$set", {}))
+                return SimpleNamespace(matched_count=1)
+
+        encryption = EncryptionService(keys={"k1": b"1" * 32})
+
+        # UserRepository: name and application configuration encrypted, email searchable
+        users = FakeCollection()
+        user_repository = UserRepository({"users": users}, encryption=encryption)
+        user = User(EntityId.generate(), EmailAddress(value="ada@example.com"), "hash")
+        user.full_name = "Ada Lovelace"
+        user.application_configuration = {"auto_apply": True, "daily_limit": 10}
+        await user_repository.create(user)
+
+        stored = users.documents[str(user.id)]
+        assert encryption.is_encrypted(stored["full_name"])
+        assert encryption.is_encrypted(stored["application_configuration"])
+        assert not encryption.is_encrypted(stored["email"])
+        loaded = user_repository._decrypt_documents([dict(stored)])[0]
+        assert loaded["full_name"] == "Ada Lovelace"
+        assert loaded["application_configuration"] == {"auto_apply": True, "daily_limit": 10}
+
+        # A nested change replaces the whole ciphertext; the unchanged name is not rewritten
+        name_token = stored["full_name"]
+        user.application_configuration["daily_limit"] = 5
+        await user_repository.update(user)
+        changed = users.updates[-1]["$set"]
+        assert set(changed) == {"application_configuration", "updated_at", "version"}
+        assert encryption.is_encrypted(changed["application_configuration"])
+        assert stored["full_name"] == name_token
+        assert user_repository._decrypt_documents([dict(stored)])[0]["application_configuration"]["daily_limit"] == 5
+
+        # Ciphertexts are bound to their document
+        other = dict(stored, _id=str(EntityId.generate()))
+        with pytest.raises(SecurityException):
+            user_repository._decrypt_documents([other])
+
+        # BaseMongoRepository: values stored before encryption load as-is and are encrypted once changed
+        class Note:
+            def __init__(self, document):
+                self.id = document["_id"]
+                self.title = document["title"]
+                self.body = document["body"]
+                self.version = document.get("version", 1)
+
+            def increment_version(self):
+                self.version += 1
+
+        class NoteRepository(BaseMongoRepository):
+            ENCRYPTED_FIELDS = ("body",)
+
+            async def create(self, entity): pass
+            async def update(self, entity): await self._save_changes(entity)
+            async def find_by_id(self, entity_id):
+                document = dict(self.collection.documents[entity_id])
+                return self._document_to_entity(self._decrypt_documents([document])[0])
+
+            def _document_to_entity(self, document):
+                return self._attach(Note(document))
+
+            def _entity_document(self, entity):
+                return {"title": entity.title, "body": entity.body, "version": entity.version}
+
+        notes = FakeCollection()
+        notes.documents["note-1"] = {"_id": "note-1", "title": "Plan", "body": {"steps": ["apply"]}, "version": 1}
+        note_repository = NoteRepository({"notes": notes}, "notes", Note, encryption=encryption)
+
+        note = await note_repository.find_by_id("note-1")
+        assert note.body == {"steps": ["apply"]}
+        note.title = "Plan B"
+        await note_repository.update(note)
+        assert notes.updates[-1]["$set"]["title"] == "Plan B" and "body" not in notes.updates[-1]["$set"]
+        assert notes.documents["note-1"]["body"] == {"steps": ["apply"]}
+
+        note.body["steps"].append("interview")
+        await note_repository.update(note)
+        assert encryption.is_encrypted(notes.documents["note-1"]["body"])
+        assert (await note_repository.find_by_id("note-1")).body == {"steps": ["apply", "interview"]}
+
+        print("✅ Repository field encryption passed")
+
+    @pytest.mark.asyncio
+    async def test_legacy_user_readers_decrypt_shared_documents(self, monkeypatch):
+        """Test documents written by UserRepository read back as plaintext through the legacy users path"""
+
+        from pathlib import Path
+
+        pytest.importorskip("cryptography")
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.domain.types import EntityId, EmailAddress
+        from jobhire.shared.infrastructure.security.encryption import EncryptionService
+        from jobhire.domains.user.domain.entities.user import User
+        from jobhire.domains.user.infrastructure.repositories.user_repository import UserRepository
+        from app.core import mongodb as legacy_mongodb
+
+        class FakeCollection:
+            def __init__(self):
+                self.documents = {}
+
+            async def insert_one(self, document):
+                self.documents[document["_id"]] = dict(document)
+
+        # Both trees share the users collection and the encryption keys
+        encryption = EncryptionService(keys={"k1": b"1" * 32})
+        monkeypatch.setattr(legacy_mongodb, "_user_field_encryption", encryption)
+
+        users = FakeCollection()
+        user = User(EntityId.generate(), EmailAddress(value="ada@example.com"), "hash")
+        user.full_name = "Ada Lovelace"
+        user.application_configuration = {"auto_apply": True}
+        await UserRepository({"users": users}, encryption=encryption).create(user)
+        stored = users.documents[str(user.id)]
+        assert encryption.is_encrypted(stored["full_name"])
+
+        legacy = legacy_mongodb.decrypt_user_document(stored)
+        assert legacy["full_name"] == "Ada Lovelace"
+        assert legacy["application_configuration"] == {"auto_apply": True}
+        assert legacy["email"] == stored["email"]
+        assert encryption.is_encrypted(stored["full_name"])
+
+        # Documents written by the legacy tree are plaintext and pass through untouched
+        plain = {"_id": "legacy-1", "email": "grace@example.com", "full_name": "Grace Hopper"}
+        assert legacy_mongodb.decrypt_user_document(plain) is plain
+
+        # The Beanie model decrypts on load
+        try:
+            from app.models.mongodb_models import User as LegacyUser
+        except ImportError:
+            pass
+        else:
+            assert LegacyUser.model_validate(stored).full_name == "Ada Lovelace"
+
+        print("✅ Legacy user decryption passed")
+
+    @pytest.mark.asyncio
+    async def test_job_queue_leases_expire_and_dead_letter(self, monkeypatch):
+        """Test queue claims: exclusive leases, expiry back to the queue and dead-lettering"""
+
+        from pathlib import Path
+        from types import SimpleNamespace
+
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.domain.types import EntityId
+        from jobhire.domains.job.domain.entities.job_queue import JobQueue, QueueStatus
+        from jobhire.domains.job.infrastructure.repositories.job_queue_repository import JobQueueRepository
+        from jobhire.domains.job.application.services.job_queue_service import JobQueueService
+
+        def matches(document, query):
+            for key, condition in query.items():
+                if key == "$or":
+                    if not any(matches(document, branch) for branch in condition):
+                        return False
+                    continue
+                value = document.get(key)
+                if not isinstance(condition, dict):
+                    if value != condition:
+                        return False
+                    continue
+                for op, operand in condition.items():
+                    if op == "$not" and matches(document, {key: operand}):
+                        return False
+                    if op == "$lte" and not (value is not None and value <= operand):
+                        return False
+                    if op == "$gte" and not (value is not None and value >= operand):
+                        return False
+            return True
+
+        def apply(document, update):
+            document.update(update.get("$set", {}))
+            for key, step in update.get("$inc", {}).items():
+                document[key] = document.get(key, 0) + step
+
+        class FakeQueueCollection:
+            def __init__(self):
+                self.documents = {}
+
+            async def insert_one(self, document):
+                self.documents[document["_id"]] = dict(document)
+
+            async def find_one_and_update(self, query, update, sort=None, return_document=None):
+                for document in self.documents.values():
+                    if matches(document, query):
+                        apply(document, update)
+                        return dict(document)
+                return None
+
+            async def update_many(self, query, update):
+                hits = [document for document in self.documents.values() if matches(document, query)]
+                for document in hits:
+                    apply(document, update)
+                return SimpleNamespace(modified_count=len(hits))
+
+            async def update_one(self, query, update, session=None):
+                hits = [document for document in self.documents.values() if matches(document, query)][:1]
+                for document in hits:
+                    apply(document, update)
+                return SimpleNamespace(matched_count=len(hits), modified_count=len(hits))
+
+            async def find_one(self, query):
+                return next((dict(document) for document in self.documents.values() if matches(document, query)), None)
+
+        class FakePublisher:
+            def __init__(self):
+                self.events = []
+
+            async def publish_events(self, events):
+                self.events.extend(events)
+
+        collection = FakeQueueCollection()
+        repository = JobQueueRepository({"job_queues": collection}, max_claims=2)
+        publisher = FakePublisher()
+        service = JobQueueService(repository, user_repository=None, event_publisher=publisher)
+        item = JobQueue(EntityId.generate(), EntityId.generate(), "job-1", {"title": "Engineer"})
+        await repository.create(item)
+        stored = collection.documents[str(item.id)]
+
+        first = await service.claim_for_processing("worker-a", limit=5, visibility_timeout=60)
+        assert [claimed.id for claimed in first] == [item.id]
+        assert stored["lease_owner"] == "worker-a" and stored["claim_count"] == 1
+
+        # Only the lease holder can start the claimed item, and only once
+        workflow_id = EntityId.generate()
+        with pytest.raises(ValueError):
+            await service.process_queue_item(item.id, workflow_id, worker_id="worker-b")
+        await service.process_queue_item(item.id, workflow_id, worker_id="worker-a")
+        assert stored["workflow_execution_id"] == str(workflow_id) and stored["status"] == QueueStatus.PROCESSING.value
+        assert [type(event).__name__ for event in publisher.events] == ["JobProcessingStartedEvent"]
+        with pytest.raises(ValueError):
+            await service.process_queue_item(item.id, EntityId.generate(), worker_id="worker-a")
+        # Leased items are invisible to other workers, and only the holder can renew
+        assert await repository.claim_ready_for_processing("worker-b") == []
+        assert await repository.extend_lease(item.id, "worker-b") is False
+        assert await repository.extend_lease(item.id, "worker-a") is True
+
+        # worker-a crashes: once the lease expires the item is handed out again
+        stored["lease_expires_at"] = datetime.utcnow() - timedelta(seconds=1)
+        second = await repository.claim_ready_for_processing("worker-b")
+        assert len(second) == 1 and stored["lease_owner"] == "worker-b" and stored["claim_count"] == 2
+        assert stored["workflow_execution_id"] is None
+
+        # After max_claims unfinished claims the item is failed instead of claimed again
+        stored["lease_expires_at"] = datetime.utcnow() - timedelta(seconds=1)
+        assert await repository.claim_ready_for_processing("worker-c") == []
+        assert stored["status"] == QueueStatus.FAILED.value and stored["lease_owner"] is None
+        assert "Dead-lettered after 2" in stored["processing_error"]
+
+        print("✅ Job queue leasing passed")
+
+    @pytest.mark.asyncio
+    async def test_queue_claims_skip_locked_rows_and_reap_expired_leases(self, monkeypatch):
+        """Test processors claim disjoint queue rows, renew their leases and lose them on expiry"""
+
+        import uuid
+        from pathlib import Path
+        from databases import Database
+        from app.core.config import settings
+        from app.models.user_settings import QueueItemRequest
+        from app.services import user_management_service as service_module
+
+        if not settings.TEST_DATABASE_URL:
+            pytest.skip("TEST_DATABASE_URL is not set")
+        asyncpg = pytest.importorskip("asyncpg")
+
+        # Throwaway schema so the migrations run from scratch
+        schema = f"test_queue_leases_{uuid.uuid4().hex[:8]}"
+        server_settings = {"search_path": f"{schema}, public"}
+        admin = Database(settings.TEST_DATABASE_URL)
+        await admin.connect()
+        await admin.execute(f"CREATE SCHEMA {schema}")
+        database = Database(settings.TEST_DATABASE_URL, server_settings=server_settings)
+        await database.connect()
+        locker = await asyncpg.connect(settings.TEST_DATABASE_URL, server_settings=server_settings)
+
+        try:
+            migrations = Path(__file__).resolve().parent.parent / "app" / "workflows" / "migrations"
+            async with database.connection() as connection:
+                for migration in sorted(migrations.glob("*.sql")):
+                    if migration.name == "005_create_job_terms.sql":
+                        continue  # needs the jobs table from init.sql
+                    await connection.raw_connection.execute(migration.read_text())
+
+            monkeypatch.setattr(service_module, "database", database)
+            service = service_module.UserManagementService()
+            user_id = "user-1"
+            await database.execute(
+                "INSERT INTO user_search_settings (user_id, search_status) VALUES (:user_id, 'active')",
+                {"user_id": user_id}
+            )
+            await database.execute("INSERT INTO user_queue_stats (user_id) VALUES (:user_id)", {"user_id": user_id})
+            for job in range(3):
+                added = await service.add_to_queue(user_id, QueueItemRequest(job_id=f"job-{job}", job_data={}))
+                assert added["success"]
+
+            async def stats():
+                return dict(await database.fetch_one(
+                    "SELECT queued, processing, completed, failed FROM user_queue_stats WHERE user_id = :user_id",
+                    {"user_id": user_id}
+                ))
+
+            # A row locked by another transaction is skipped, not waited on
+            locker_tx = locker.transaction()
+            await locker_tx.start()
+            locked_id = await locker.fetchval(
+                "SELECT id FROM user_queues WHERE job_id = 'job-0' FOR UPDATE"
+            )
+            claimed_a = await asyncio.wait_for(service.claim_queue_items("worker-a", limit=3), timeout=5)
+            await locker_tx.rollback()
+            assert len(claimed_a) == 2 and locked_id not in [item["id"] for item in claimed_a]
+            assert all(item["lease_owner"] == "worker-a" and item["attempts"] == 1 for item in claimed_a)
+
+            claimed_b = await service.claim_queue_items("worker-b", limit=3)
+            assert [item["id"] for item in claimed_b] == [locked_id]
+            assert await service.claim_queue_items("worker-c", limit=3) == []
+            assert await stats() == {"queued": 0, "processing": 3, "completed": 0, "failed": 0}
+
+            # Only the lease owner can renew
+            ids_a = [item["id"] for item in claimed_a]
+            assert await service.renew_queue_leases("worker-a", ids_a) == 2
+            assert await service.renew_queue_leases("worker-b", ids_a) == 0
+
+            # worker-a stalls: its expired leases go back to the queue and it loses the items
+            expire = "UPDATE user_queues SET lease_expires_at = NOW() - INTERVAL '1 second' WHERE lease_owner = :owner"
+            await database.execute(expire, {"owner": "worker-a"})
+            assert await service.reap_expired_queue_leases(max_attempts=2) == 2
+            assert await service.finish_queue_item(user_id, str(ids_a[0]), "worker-a", {"status": "completed"}) is False
+            assert await stats() == {"queued": 2, "processing": 1, "completed": 0, "failed": 0}
+
+            claimed_c = await service.claim_queue_items("worker-c", limit=3)
+            assert sorted(item["id"] for item in claimed_c) == sorted(ids_a)
+            assert all(item["attempts"] == 2 for item in claimed_c)
+
+            # Out of attempts: the next expiry fails the items instead of re-queueing them
+            await database.execute(expire, {"owner": "worker-c"})
+            assert await service.reap_expired_queue_leases(max_attempts=2) == 2
+            failed = await database.fetch_all(
+                "SELECT status, processing_error, lease_owner FROM user_queues WHERE id = ANY(CAST(:ids AS UUID[]))",
+                {"ids": ids_a}
+            )
+            assert all(row["status"] == "failed" and row["lease_owner"] is None for row in failed)
+            assert all(row["processing_error"] == "Processing lease expired 2 times" for row in failed)
+
+            # The holder of a live lease finishes normally
+            assert await service.finish_queue_item(user_id, str(locked_id), "worker-b", {"status": "completed"}) is True
+            assert await stats() == {"queued": 0, "processing": 0, "completed": 1, "failed": 2}
+
+        finally:
+            await locker.close()
+            await database.disconnect()
+            await admin.execute(f"DROP SCHEMA {schema} CASCADE")
+            await admin.disconnect()
+
+        print("✅ Queue lease claiming passed")
+
+    @pytest.mark.asyncio
+    async def test_interview_sessions_push_deltas_and_reject_concurrent_saves(self, monkeypatch):
+        """Test interview session saves append only new messages, and the cache hands out copies"""
+
+        from pathlib import Path
+        from types import SimpleNamespace
+
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.domain.types import EntityId
+        from jobhire.shared.domain.exceptions import ConcurrencyException
+        from jobhire.domains.interview.domain.entities.interview_session import InterviewSession
+        from jobhire.domains.interview.infrastructure.persistence import (
+            InterviewSessionRepository, InterviewSessionStore
+        )
+
+        class FakeSessionCollection:
+            def __init__(self):
+                self.documents = {}
+                self.updates = []
+                self.full_loads = 0
+
+            async def insert_one(self, document):
+                self.documents[document["_id"]] = dict(document)
+
+            async def update_one(self, query, update):
+                self.updates.append(update)
+                document = self.documents.get(query["_id"])
+                if document is None or document.get("version") != query["version"]:
+                    return SimpleNamespace(matched_count=0)
+                document.update(update["$set"])
+                if "$push" in update:
+                    document["messages"] = document["messages"] + update["$push"]["messages"]["$each"]
+                return SimpleNamespace(matched_count=1)
+
+            async def find_one(self, query, projection=None):
+                document = self.documents.get(query["_id"])
+                if document is None:
+                    return None
+                if projection is None:
+                    self.full_loads += 1
+                    return dict(document)
+                return {key: document[key] for key in projection if key in document}
+
+        collection = FakeSessionCollection()
+        repository = InterviewSessionRepository({"interview_sessions": collection})
+        store = InterviewSessionStore(repository, max_sessions=2)
+
+        session = InterviewSession(EntityId.generate(), EntityId.generate(), "Backend engineer")
+        session_id = str(session.id)
+        await store.add(session)
+        assert collection.documents[session_id]["messages"] == []
+
+        # Saves $push only the messages added since the last save
+        request = await store.get(session_id)
+        request.start_interview("Welcome", total_questions=3)
+        request.ask_question("Tell me about yourself")
+        await store.save(request)
+        assert [m["content"] for m in collection.updates[-1]["$push"]["messages"]["$each"]] == [
+            "Welcome", "Tell me about yourself"
+        ]
+        request = await store.get(session_id)
+        request.answer_question("I build APIs")
+        await store.save(request)
+        assert [m["content"] for m in collection.updates[-1]["$push"]["messages"]["$each"]] == ["I build APIs"]
+        assert len(collection.documents[session_id]["messages"]) == 3
+        assert "messages" not in collection.updates[-1]["$set"]
+        assert collection.full_loads == 0
+
+        # Concurrent requests get separate copies; the second save is a conflict (409)
+        first = await store.get(session_id)
+        second = await store.get(session_id)
+        assert first is not second and first.messages is not second.messages
+        first.add_ai_response("Good answer")
+        second.add_ai_response("Could be more specific")
+        await store.save(first)
+        with pytest.raises(ConcurrencyException):
+            await store.save(second)
+        stored = collection.documents[session_id]
+        assert [m["content"] for m in stored["messages"]][-1] == "Good answer" and len(stored["messages"]) == 4
+
+        # The conflict dropped the cached entry; a request that fails before saving
+        # leaves the reloaded copy untouched
+        abandoned = await store.get(session_id)
+        assert collection.full_loads == 1
+        abandoned.add_ai_response("never saved")
+        reloaded = await store.get(session_id)
+        assert len(reloaded.messages) == 4 and collection.full_loads == 1
+
+        # Bounded LRU: the least recently used session is evicted and reloaded from Mongo
+        for _ in range(2):
+            await store.add(InterviewSession(EntityId.generate(), EntityId.generate(), "Data engineer"))
+        assert session_id not in store._sessions
+        assert len((await store.get(session_id)).messages) == 4
+        assert collection.full_loads == 2
+
+        print("✅ Interview session store passed")
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_falls_back_locally_when_redis_is_down(self, monkeypatch):
+        """Test the distributed limiter's Redis keys and its local fallback while Redis is down"""
+
+        from pathlib import Path
+
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.infrastructure.security import rate_limiting
+        from jobhire.shared.infrastructure.security.rate_limiting import (
+            DistributedRateLimiter, RateLimit, RateLimitAlgorithm
+        )
+
+        clock = {"now": 1000.0}
+        monkeypatch.setattr(rate_limiting.time, "time", lambda: clock["now"])
+
+        calls = []
+        redis_up = {"value": True}
+
+        def script(name):
+            async def run(keys, args):
+                calls.append((name, keys, args))
+                if not redis_up["value"]:
+                    raise ConnectionError("redis down")
+                return [1, 4, 0]
+            return run
+
+        limiter = DistributedRateLimiter("redis://redis:6379/0", retry_interval=5.0)
+        monkeypatch.setattr(limiter, "_client", lambda: (None, script("sw"), script("tb")))
+        window = RateLimit(requests=3, window=60)
+        bucket = RateLimit(requests=2, window=4, algorithm=RateLimitAlgorithm.TOKEN_BUCKET)
+
+        # Redis up: both windows of the sliding counter share one hash tag, in ms
+        assert (await limiter.hit("user-1", window)).allowed
+        name, keys, args = calls[-1]
+        assert name == "sw" and keys == ["ratelimit:{user-1}:16", "ratelimit:{user-1}:15"]
+        assert args == [3, 60000, 40000]
+        assert (await limiter.hit("user-1", bucket)).allowed
+        name, keys, args = calls[-1]
+        assert name == "tb" and keys == ["ratelimit:{user-1}:tb"] and args == [2, 2 / 4000, 1000000]
+
+        # Redis down: local sliding window enforces the same limit
+        redis_up["value"] = False
+        results = [await limiter.hit("user-2", window) for _ in range(4)]
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert results[-1].retry_after == pytest.approx(20.0)
+        # Only the first failure paid for a Redis round trip
+        assert len(calls) == 3
+
+        # Local token bucket: burst of 2, then one token every 2 seconds
+        assert [(await limiter.hit("user-3", bucket)).allowed for _ in range(3)] == [True, True, False]
+        clock["now"] += 2
+        assert (await limiter.hit("user-3", bucket)).allowed
+
+        # After retry_interval Redis is tried again and used once it answers
+        redis_up["value"] = True
+        clock["now"] += 3
+        assert (await limiter.hit("user-2", window)).allowed
+        assert len(calls) == 4
+
+        # Local state stays bounded by local_max_keys
+        small = DistributedRateLimiter(None, local_max_keys=2)
+        for key in ("a", "b", "c"):
+            await small.hit(key, window)
+        assert list(small._local._states) == ["b", "c"]
+
+        print("✅ Rate limiter fallback passed")
+
+    def test_unit_of_work_loads_once_and_flushes_once(self, monkeypatch):
+        """Test a request loads each aggregate once and writes it once before responding"""
+
+        from pathlib import Path
+        from types import SimpleNamespace
+        from fastapi import BackgroundTasks, FastAPI
+        from fastapi.testclient import TestClient
+        from prometheus_client import CollectorRegistry
+
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.infrastructure.monitoring.metrics import MetricsCollector
+        from jobhire.shared.infrastructure.repositories import BaseMongoRepository, retry_on_conflict
+        from jobhire.shared.infrastructure.unit_of_work import UnitOfWorkMiddleware
+
+        class Account:
+            def __init__(self, document):
+                self.id = document["_id"]
+                self.version = document["version"]
+                self.flags = dict(document["flags"])
+
+            def increment_version(self):
+                self.version += 1
+
+        class AccountRepository(BaseMongoRepository):
+            async def create(self, entity): pass
+            async def update(self, entity): await self._save_changes(entity)
+
+            async def find_by_id(self, entity_id):
+                cached = self._from_unit_of_work(entity_id)
+                if cached is not None:
+                    return cached
+                return self._attach(Account(await self.collection.find_one({"_id": entity_id})))
+
+            def _entity_document(self, account):
+                return {"flags": account.flags, "version": account.version}
+
+        stored = {"_id": "acct-1", "version": 1, "flags": {"beta": False, "digest": True}}
+        writes = []
+
+        async def find_one(query):
+            writes.append("load")
+            return dict(stored, flags=dict(stored["flags"]))
+
+        async def update_one(query, update, session=None):
+            writes.append(update)
+            matched = query["version"] == stored["version"]
+            if matched:
+                stored["version"] = update["$set"]["version"]
+            return SimpleNamespace(matched_count=int(matched))
+
+        repository = AccountRepository(
+            {"accounts": SimpleNamespace(find_one=find_one, update_one=update_one)}, "accounts", Account
+        )
+        collector = MetricsCollector(CollectorRegistry())
+        app = FastAPI()
+
+        @app.post("/accounts/{account_id}/flags")
+        async def save_flags(account_id: str):
+            profile = await repository.find_by_id(account_id)
+            profile.flags["beta"] = True
+            await repository.update(profile)
+
+            settings = await repository.find_by_id(account_id)
+            assert settings is profile
+            settings.flags["digest"] = False
+            await repository.update(settings)
+            assert writes == ["load"]
+            return {"saved": True}
+
+        @app.post("/accounts/{account_id}/beta")
+        async def enable_beta(account_id: str):
+            stale = await repository.find_by_id(account_id)
+
+            async def enable():
+                account = await repository.find_by_id(account_id)
+                account.flags["beta"] = True
+                await repository.update(account)
+                return account
+
+            saved = await retry_on_conflict(enable)
+            # The request's identity map now serves the stored copy
+            assert saved is not stale and await repository.find_by_id(account_id) is saved
+            return {"version": saved.version}
+
+        @app.post("/accounts/{account_id}/digest")
+        async def disable_digest_later(account_id: str, background_tasks: BackgroundTasks):
+            account = await repository.find_by_id(account_id)
+
+            async def disable_digest():
+                account.flags["digest"] = False
+                await repository.update(account)
+
+            background_tasks.add_task(disable_digest)
+            return {"scheduled": True}
+
+        app.add_middleware(UnitOfWorkMiddleware, collector=collector)
+        client = TestClient(app)
+
+        assert client.post("/accounts/acct-1/flags").status_code == 200
+        assert writes == ["load", {"$set": {"flags.beta": True, "flags.digest": False, "version": 2}}]
+        assert collector.identity_map_lookups_total.labels(result="hit")._value.get() == 1
+
+        # A concurrent writer bumps the version between load and commit
+        writes.clear()
+        stored["flags"]["beta"] = False
+        original_find_one = find_one
+
+        async def racing_find_one(query):
+            document = await original_find_one(query)
+            stored["version"] += 1
+            return document
+
+        repository.collection.find_one = racing_find_one
+        response = client.post("/accounts/acct-1/flags")
+        assert response.status_code == 409 and "modified concurrently" in response.json()["detail"]
+
+        # retry_on_conflict sees the conflict itself and retries from a fresh load,
+        # not from the request's stale copy
+        writes.clear()
+        races = {"left": 2}
+
+        async def twice_racing_find_one(query):
+            document = await original_find_one(query)
+            if races["left"]:
+                races["left"] -= 1
+                stored["version"] += 1
+            return document
+
+        repository.collection.find_one = twice_racing_find_one
+        version = stored["version"]
+        response = client.post("/accounts/acct-1/beta")
+        assert response.status_code == 200 and response.json() == {"version": version + 3}
+        assert writes.count("load") == 3 and stored["version"] == version + 3
+
+        # Background tasks run after the commit: their saves are written, not dropped
+        writes.clear()
+        version = stored["version"]
+        assert client.post("/accounts/acct-1/digest").status_code == 200
+        assert writes == ["load", {"$set": {"flags.digest": False, "version": version + 1}}]
+
+        # Other commit failures become a 500 instead of a success status
+        async def failing_update_one(query, update, session=None):
+            raise RuntimeError("primary stepped down")
+
+        repository.collection.update_one = failing_update_one
+        writes.clear()
+        response = client.post("/accounts/acct-1/flags")
+        assert response.status_code == 500 and response.json() == {"detail": "Failed to save changes"}
+
+        print("✅ Unit of work passed")
+
+    @pytest.mark.asyncio
+    async def test_events_go_through_outbox_with_at_least_once_delivery(self, monkeypatch):
+        """Test events are stored on commit and delivered in batches, retrying only failed handlers"""
+
+        from pathlib import Path
+        from prometheus_client import CollectorRegistry
+
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.domain.events import DomainEvent
+        from jobhire.shared.infrastructure.events import DomainEventPublisher, EventHandler
+        from jobhire.shared.infrastructure.monitoring.metrics import MetricsCollector
+        from jobhire.shared.infrastructure.outbox import OutboxDispatcher
+        from jobhire.shared.infrastructure.unit_of_work import unit_of_work
+
+        class ApplicationSubmittedForOutboxTest(DomainEvent):
+            pass
+
+        class InMemoryOutbox:
+            use_transactions = False
+
+            def __init__(self):
+                self.messages = {}
+
+            async def append(self, events, session=None):
+                for event in events:
+                    self.messages.setdefault(event.event_id, {
+                        "_id": event.event_id, "event_type": type(event).__name__,
+                        "payload": dict(vars(event)), "occurred_at": event.occurred_at,
+                        "status": "pending", "attempts": 0, "delivered_handlers": []
+                    })
+
+            async def claim_batch(self, dispatcher_id, limit, lease_seconds):
+                batch = [m for m in self.messages.values() if m["status"] == "pending"][:limit]
+                for message in batch:
+                    message.update(status="dispatching", lease_token=dispatcher_id, attempts=message["attempts"] + 1)
+                return [dict(message) for message in batch]
+
+            async def mark_dispatched(self, event_ids, lease_token=None):
+                for event_id in event_ids:
+                    self.messages[event_id]["status"] = "dispatched"
+
+            async def reschedule(self, message, delivered_handlers, error, retry_in, dead=False):
+                stored = self.messages[message["_id"]]
+                stored["status"] = "dead" if dead else "pending"
+                stored["delivered_handlers"] = sorted(set(stored["delivered_handlers"]) | set(delivered_handlers))
+
+        class AuditHandler(EventHandler):
+            def __init__(self):
+                self.seen, self.in_flight, self.max_in_flight = [], 0, 0
+
+            async def handle(self, event):
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+                self.seen.append(event.event_data["application_id"])
+
+        class FlakyWebhookHandler(EventHandler):
+            def __init__(self):
+                self.calls = 0
+
+            async def handle(self, event):
+                self.calls += 1
+                if self.calls == 1:
+                    raise RuntimeError("webhook timed out")
+
+        outbox = InMemoryOutbox()
+        publisher = DomainEventPublisher(outbox=outbox)
+        audit, webhook = AuditHandler(), FlakyWebhookHandler()
+        publisher.subscribe("ApplicationSubmittedForOutboxTest", audit, max_concurrency=1)
+        publisher.subscribe("ApplicationSubmittedForOutboxTest", webhook)
+
+        async with unit_of_work():
+            await publisher.publish_events([
+                ApplicationSubmittedForOutboxTest({"application_id": i}) for i in range(3)
+            ])
+            # Nothing is stored or delivered until the unit of work commits
+            assert outbox.messages == {} and audit.seen == []
+        assert len(outbox.messages) == 3
+
+        collector = MetricsCollector(CollectorRegistry())
+        dispatcher = OutboxDispatcher(outbox, publisher, batch_size=10, metrics_collector=collector)
+
+        assert await dispatcher.drain_once() == 3
+        assert sorted(audit.seen) == [0, 1, 2] and audit.max_in_flight == 1
+        statuses = sorted(m["status"] for m in outbox.messages.values())
+        assert statuses == ["dispatched", "dispatched", "pending"]
+
+        # The retry only re-runs the handler that failed
+        assert await dispatcher.drain_once() == 1
+        assert len(audit.seen) == 3 and webhook.calls == 4
+        assert all(m["status"] == "dispatched" for m in outbox.messages.values())
+        assert collector.events_dispatched_total.labels(
+            event_type="ApplicationSubmittedForOutboxTest", status="error"
+        )._value.get() == 1
+
+        print("✅ Event outbox passed")
+
+    def test_traces_continue_across_requests_tasks_and_logs(self, monkeypatch):
+        """Test request spans continue incoming traces and propagate through task headers"""
+
+        from pathlib import Path
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.infrastructure.monitoring.logging import add_correlation_id
+        from jobhire.shared.infrastructure.monitoring.tracing import (
+            TracingMiddleware,
+            begin_span,
+            get_trace_id,
+            inject_trace_context,
+            setup_tracing,
+            shutdown_tracing,
+            start_span
+        )
+
+        exporter = InMemorySpanExporter()
+        assert setup_tracing("jobhire-test", exporter=exporter, sampling_rate=1.0) is not None
+
+        app = FastAPI()
+        task_headers = {}
+        log_event = {}
+
+        @app.get("/matching/{job_id}")
+        async def analyze(job_id: str):
+            with start_span("mongo.find", kind="client"):
+                pass
+            # What the before_task_publish signal does when a task is queued
+            inject_trace_context(task_headers)
+            log_event.update(add_correlation_id(None, "info", {}))
+            return {"trace_id": get_trace_id()}
+
+        app.add_middleware(TracingMiddleware)
+        traceparent = "00-" + "a" * 32 + "-" + "b" * 16 + "-01"
+        response = TestClient(app).get("/matching/42", headers={"traceparent": traceparent})
+
+        assert response.json()["trace_id"] == "a" * 32
+        assert log_event["trace_id"] == "a" * 32 and len(log_event["span_id"]) == 16
+
+        # The worker continues the trace from the task message headers
+        task_span = begin_span("celery.task analyze", kind="consumer", carrier=dict(task_headers))
+        task_span.end()
+        shutdown_tracing()
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        server = spans["GET /matching/{job_id}"]
+        assert server.attributes["http.route"] == "/matching/{job_id}"
+        assert server.attributes["http.status_code"] == 200
+        assert server.context.trace_id == int("a" * 32, 16)
+        assert server.parent.span_id == int("b" * 16, 16)
+        assert spans["mongo.find"].parent.span_id == server.context.span_id
+        task = spans["celery.task analyze"]
+        assert task.context.trace_id == server.context.trace_id
+        assert task.parent.span_id == server.context.span_id
+
+        print("✅ Tracing passed")
+
+    def test_celery_signal_handlers_trace_tasks(self, monkeypatch):
+        """Test the Celery signal handlers carry the trace into task spans and record failures"""
+
+        from pathlib import Path
+        from types import SimpleNamespace
+
+        pytest.importorskip("opentelemetry.sdk")
+        pytest.importorskip("celery")
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        from opentelemetry.trace import StatusCode
+
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.infrastructure.monitoring.tracing import setup_tracing, shutdown_tracing, start_span
+        from app.workers.celery_app import (
+            end_task_span,
+            propagate_trace_context,
+            record_task_failure,
+            start_task_span
+        )
+
+        class TaskRequest(dict):
+            """Celery keeps custom message headers on the request, read through get()"""
+
+        exporter = InMemorySpanExporter()
+        assert setup_tracing("jobhire-test", exporter=exporter, sampling_rate=1.0) is not None
+
+        # before_task_publish: the publisher's context goes into the message headers
+        headers = {}
+        with start_span("api.request"):
+            propagate_trace_context(headers=headers)
+        assert "traceparent" in headers
+
+        def run(task_id, exception=None):
+            request = TaskRequest(headers)
+            request.retries = 1
+            request.delivery_info = {"routing_key": "applications"}
+            task = SimpleNamespace(name="app.workers.apply", request=request)
+            start_task_span(task_id=task_id, task=task)
+            if exception is not None:
+                record_task_failure(task_id=task_id, exception=exception)
+            end_task_span(task_id=task_id, state="FAILURE" if exception else "SUCCESS")
+
+        run("task-1")
+        run("task-2", RuntimeError("portal timed out"))
+        shutdown_tracing()
+
+        spans = exporter.get_finished_spans()
+        publisher = next(span for span in spans if span.name == "api.request")
+        tasks = {span.attributes["celery.task_id"]: span for span in spans if span.name == "celery.task app.workers.apply"}
+        assert set(tasks) == {"task-1", "task-2"}
+        for span in tasks.values():
+            assert span.context.trace_id == publisher.context.trace_id
+            assert span.parent.span_id == publisher.context.span_id
+            assert span.attributes["celery.retries"] == 1
+            assert span.attributes["messaging.destination"] == "applications"
+        assert tasks["task-1"].attributes["celery.state"] == "SUCCESS"
+        assert tasks["task-1"].status.status_code != StatusCode.ERROR
+        assert tasks["task-2"].attributes["celery.state"] == "FAILURE"
+        assert tasks["task-2"].status.status_code == StatusCode.ERROR
+        assert tasks["task-2"].events[0].name == "exception"
+
+        print("✅ Celery task tracing passed")
+
+    @pytest.mark.asyncio
+    async def test_workflow_nodes_and_llm_calls_are_traced(self, monkeypatch):
+        """Test workflow nodes and LLM calls report spans with state, token and cost attributes"""
+
+        from pathlib import Path
+
+        pytest.importorskip("opentelemetry.sdk")
+        pytest.importorskip("langgraph")
+        pytest.importorskip("langchain_openai")  # imported by the app.workflows package
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        from opentelemetry.trace import StatusCode
+
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.shared.infrastructure.monitoring.tracing import setup_tracing, shutdown_tracing
+        from app.core.tracing import traced_llm_call
+        from app.workflows.base import BaseWorkflow
+
+        exporter = InMemorySpanExporter()
+        assert setup_tracing("jobhire-test", exporter=exporter, sampling_rate=1.0) is not None
+
+        metadata = {
+            "provider": "replicate",
+            "tier": "balanced",
+            "model": "meta/llama",
+            "cache_hit": False,
+            "estimated_tokens": 420,
+            "cost_usd": 0.0063
+        }
+
+        @traced_llm_call("llm.generate")
+        async def generate(prompt, operation=None):
+            if prompt == "fail":
+                return {"success": False, "error": "rate limited", "metadata": metadata}
+            return {"success": True, "content": "Dear hiring manager", "metadata": metadata}
+
+        @traced_llm_call("llm.stream")
+        async def stream(prompt, operation=None):
+            yield {"type": "token", "content": "Dear"}
+            yield {"type": "done", "metadata": dict(metadata, estimated_tokens=99)}
+
+        class ApplyWorkflow(BaseWorkflow):
+            async def analyze(self, state):
+                await generate("analyze", operation="job_analysis")
+                return {**state, "analysis_results": {"score": 0.9}}
+
+            async def submit(self, state):
+                await generate("fail", operation="submission")
+                return await self.add_error(state, "Portal rejected the application", "submit")
+
+        workflow = ApplyWorkflow()
+        state = await workflow.initialize_state(workflow_id="wf-1", user_id="user-1", job_id="job-1", user_tier="pro")
+        state = await workflow.traced_node("analyze", workflow.analyze)(state)
+        await workflow.traced_node("submit", workflow.submit)(state)
+        events = [event async for event in stream("letter", operation="cover_letter")]
+        assert events[-1]["type"] == "done"
+        shutdown_tracing()
+
+        spans = exporter.get_finished_spans()
+        by_name = {}
+        for span in spans:
+            by_name.setdefault(span.name, []).append(span)
+
+        analyze = by_name["workflow.node analyze"][0]
+        assert analyze.attributes["workflow.name"] == "ApplyWorkflow"
+        assert analyze.attributes["workflow.id"] == "wf-1"
+        assert analyze.attributes["workflow.node"] == "analyze"
+        assert analyze.attributes["user.tier"] == "pro"
+        assert analyze.status.status_code != StatusCode.ERROR
+        submit = by_name["workflow.node submit"][0]
+        assert submit.status.status_code == StatusCode.ERROR
+        assert submit.status.description == "Portal rejected the application"
+
+        succeeded, failed = sorted(by_name["llm.generate"], key=lambda span: span.attributes["llm.operation"])
+        assert succeeded.attributes["llm.operation"] == "job_analysis"
+        assert succeeded.parent.span_id == analyze.context.span_id
+        assert succeeded.attributes["llm.model"] == "meta/llama"
+        assert succeeded.attributes["llm.tokens.estimated"] == 420
+        assert succeeded.attributes["llm.cost_usd"] == pytest.approx(0.0063)
+        assert succeeded.status.status_code != StatusCode.ERROR
+        assert failed.parent.span_id == submit.context.span_id
+        assert failed.attributes["llm.error"] == "rate limited"
+        assert failed.status.status_code == StatusCode.ERROR
+
+        streamed = by_name["llm.stream"][0]
+        assert streamed.attributes["llm.operation"] == "cover_letter"
+        assert streamed.attributes["llm.tokens.estimated"] == 99
+
+        print("✅ Workflow and LLM tracing passed")
+
+    def test_file_trace_exporter_closes_its_file(self, monkeypatch, tmp_path):
+        """Test the file exporter writes one span per line and its file is closed on shutdown"""
+
+        import json
+        from pathlib import Path
+
+        pytest.importorskip("opentelemetry.sdk")
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parent.parent / "src"))
+        from jobhire.config.settings import get_settings
+        from jobhire.shared.infrastructure.monitoring import tracing
+
+        monitoring = get_settings().monitoring
+        monkeypatch.setattr(monitoring, "trace_exporter", "file")
+        monkeypatch.setattr(monitoring, "trace_file_path", str(tmp_path / "spans.jsonl"))
+
+        assert tracing.setup_tracing("jobhire-test", sampling_rate=1.0) is not None
+        first_file = tracing._trace_file
+        with tracing.start_span("first"):
+            pass
+
+        # Setting up again flushes and closes the previous file
+        monkeypatch.setattr(monitoring, "trace_file_path", str(tmp_path / "spans-2.jsonl"))
+        assert tracing.setup_tracing("jobhire-test", sampling_rate=1.0) is not None
+        assert first_file.closed
+        second_file = tracing._trace_file
+        with tracing.start_span("second"):
+            pass
+        tracing.shutdown_tracing()
+
+        assert second_file.closed and tracing._trace_file is None
+        assert [json.loads(line)["name"] for line in (tmp_path / "spans.jsonl").read_text().splitlines()] == ["first"]
+        assert [json.loads(line)["name"] for line in (tmp_path / "spans-2.jsonl").read_text().splitlines()] == ["second"]
+
+        print("✅ File trace exporter passed")
+
 
 @pytest.mark.asyncio
 async def test_complete_e2e_workflow():